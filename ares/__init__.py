@@ -1,10 +1,19 @@
+"""
+Blade v13 — add-on ARES
+Enregistrement paresseux :
+- `import ares` n'importe ni bpy ni les modules lourds (pas d'effet disque),
+- MODULES déclare les modules UI ; register() les importe (sans reload) et
+  appelle leur register(), les opérateurs n'importent leur backend qu'au
+  premier execute(),
+- budget de démarrage : tools/bench_startup.py.
+"""
+import importlib
+import sys
 from contextlib import suppress
 
 __version__ = '13.0.0-test3a'
 __all__ = []
 
-import importlib  # keep imports at top (ruff E402)
-
 bl_info = {
     "name":        "ARES",
     "author":      "Adrien",
@@ -15,21 +24,42 @@ bl_info = {
     "category":    "Render",
 }
 
-# --- Shim legacy: allow `from ares import link_object` ---
-try:
-    from .modules.render_bg.turntable_rig import _link_only_to_collection as link_object
-except Exception:
-    link_object = None
-try:
-    from .modules.render_bg.turntable_rig import _add_circle_path as make_curve_circle
-except Exception:
-    make_curve_circle = None
+# Modules enregistrés, dans l'ordre (désenregistrés en ordre inverse)
+MODULES = (
+    "ares.ui.background_modal",
+    "ares.ui.panel_render_bg",
+    "ares.ui.panel_tools",
+)
+
+# --- Shim legacy: allow `from ares import link_object` (chargé à la demande) ---
+_LEGACY = {
+    "link_object": ("ares.modules.render_bg.turntable_rig", "_link_only_to_collection"),
+    "make_curve_circle": ("ares.modules.render_bg.turntable_rig", "_add_circle_path"),
+}
+
+_registered: list = []
+
+
+def __getattr__(name):
+    if name in _LEGACY:
+        module, attr = _LEGACY[name]
+        try:
+            value = getattr(importlib.import_module(module), attr)
+        except Exception:
+            value = None
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _safe_register(mod):
     if hasattr(mod, "register"):
         try:
             mod.register()
+            return True
         except Exception as e:
             print("[ARES] register() failed in", getattr(mod, "__name__", mod), ":", e)
+    return False
 
 def _safe_unregister(mod):
     if hasattr(mod, "unregister"):
@@ -39,46 +69,21 @@ def _safe_unregister(mod):
             print("[ARES] unregister() failed in", getattr(mod, "__name__", mod), ":", e)
 
 def register():
-    # UI
-    try:
-        from .ui import panel_render_bg as panel_render_bg
-        importlib.reload(panel_render_bg)
-        _safe_register(panel_render_bg)
-    except Exception as e:
-        print("[ARES] UI register failed:", e)
-
-    # Rig (just ensure import works)
-    try:
-        from .modules.render_bg import turntable_rig as turntable_rig
-        importlib.reload(turntable_rig)
-    except Exception as e:
-        print("[ARES] rig load failed:", e)
-
-def unregister():
-    try:
-        from .ui import panel_render_bg as panel_render_bg
-        _safe_unregister(panel_render_bg)
-    except Exception as e:
-        print("[ARES] UI unregister failed:", e)
-try:
-    _prev_register = register  # type: ignore[name-defined]
-    _prev_unregister = unregister  # type: ignore[name-defined]
-except Exception:
-    _prev_register = None
-    _prev_unregister = None
-
-def register():
-    if _prev_register:
-            with suppress(Exception):
-                _prev_register()
-    with suppress(Exception):
-        from ares.ui import panel_tools
-        panel_tools.register()
+    for name in MODULES:
+        try:
+            mod = importlib.import_module(name)
+        except Exception as e:
+            print("[ARES] load failed:", name, ":", e)
+            continue
+        if mod not in _registered and _safe_register(mod):
+            _registered.append(mod)
 
 def unregister():
-    with suppress(Exception):
-        from ares.ui import panel_tools
-        panel_tools.unregister()
-    if _prev_unregister:
-            with suppress(Exception):
-                _prev_unregister()
+    while _registered:
+        mod = _registered.pop()
+        with suppress(Exception):
+            _safe_unregister(mod)
+    # handler load_post posé par helpers.lifecycle à son premier usage
+    lifecycle = sys.modules.get("ares.helpers.lifecycle")
+    if lifecycle is not None:
+        _safe_unregister(lifecycle)
@@ -0,0 +1,187 @@
+"""
+Blade v13 — blender.autotune
+Calibration des samples avant un rendu :
+- quelques frames représentatives rendues à basse résolution pour chaque
+  candidat (samples x denoise OIDN CPU si Cycles ; EEVEE : samples seuls),
+- comparées à une référence haute qualité (SSIM/PSNR, ares.core.quality)
+  et/ou au budget temps par frame,
+- décision mise en cache par empreinte (objet, matériaux, moteur, caméra, plage).
+Les réglages de la scène sont restaurés après calibration.
+"""
+from __future__ import annotations
+
+import contextlib
+import tempfile
+import time
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from ares.core.quality import (
+    QualityTarget,
+    Trial,
+    TuningCache,
+    meets,
+    pick,
+    psnr,
+    representative_frames,
+    ssim,
+)
+
+CANDIDATES = (4, 8, 16, 32, 64, 128, 256)
+
+
+def sampling_settings(engine: str, samples: int, denoise: bool = False) -> dict:
+    """Preset samples + débruitage (Cycles : OIDN sur CPU) pour blender.capabilities."""
+    if engine.startswith("BLENDER_EEVEE"):
+        return {"eevee": {"taa_render_samples": int(samples)}}
+    if engine != "CYCLES":
+        return {}
+    cycles = {"samples": int(samples), "use_adaptive_sampling": True,
+              "use_denoising": bool(denoise)}
+    if denoise:
+        cycles["denoiser"] = "OPENIMAGEDENOISE"
+        cycles["denoising_use_gpu"] = False  # Blender 4.1+ (ignoré avant)
+    return {"cycles": cycles}
+
+
+def apply_sampling(scene: bpy.types.Scene, samples: int, denoise: bool = False) -> None:
+    from ares.blender.capabilities import apply_settings
+
+    apply_settings(scene, sampling_settings(scene.render.engine, samples, denoise))
+
+
+def _sampling_keys() -> dict[str, set[str]]:
+    """Réglages que sampling_settings peut écrire, par bloc de la scène (eevee, cycles)."""
+    keys: dict[str, set[str]] = {}
+    for engine in ("BLENDER_EEVEE", "CYCLES"):
+        for block, values in sampling_settings(engine, 1, denoise=True).items():
+            keys.setdefault(block, set()).update(values)
+    return keys
+
+
+@contextlib.contextmanager
+def _preserved(scene):
+    r = scene.render
+    sampling = {}
+    for block, keys in _sampling_keys().items():
+        owner = getattr(scene, block, None)
+        if owner is not None:
+            sampling[block] = {k: getattr(owner, k) for k in keys if hasattr(owner, k)}
+    saved = {
+        "filepath": r.filepath,
+        "fmt": r.image_settings.file_format,
+        "mode": r.image_settings.color_mode,
+        "depth": r.image_settings.color_depth,
+        "pct": r.resolution_percentage,
+        "frame": scene.frame_current,
+    }
+    try:
+        yield
+    finally:
+        r.filepath = saved["filepath"]
+        r.image_settings.file_format = saved["fmt"]
+        r.image_settings.color_mode = saved["mode"]
+        r.image_settings.color_depth = saved["depth"]
+        r.resolution_percentage = saved["pct"]
+        scene.frame_set(saved["frame"])
+        for block, values in sampling.items():  # débruiteur, adaptatif... compris
+            owner = getattr(scene, block)
+            for key, value in values.items():
+                with contextlib.suppress(Exception):
+                    setattr(owner, key, value)
+
+
+def _render_frame(scene, frame: int, path: Path) -> tuple[np.ndarray, float]:
+    scene.frame_set(frame)
+    scene.render.filepath = str(path)
+    t0 = time.perf_counter()
+    bpy.ops.render.render(write_still=True)
+    elapsed = time.perf_counter() - t0
+    img = bpy.data.images.load(str(path))
+    try:
+        w, h = img.size
+        px = np.empty(w * h * 4, dtype=np.float32)
+        img.pixels.foreach_get(px)
+    finally:
+        bpy.data.images.remove(img)
+    return px.reshape(h, w, 4), elapsed
+
+
+def calibrate(
+    scene: bpy.types.Scene,
+    obj: bpy.types.Object,
+    target: QualityTarget | None = None,
+    candidates=CANDIDATES,
+    denoise=(False, True),
+    reference_samples: int | None = None,
+    frames: int = 3,
+    scale: int = 50,
+    cache: TuningCache | bool = True,
+) -> Trial:
+    """Réglage le moins cher qui atteint `target` (voir core.quality.pick)."""
+    from ares.blender.fingerprint import render_fingerprint
+
+    target = target or QualityTarget()
+    candidates = sorted({int(c) for c in candidates})
+    options = tuple(dict.fromkeys(bool(d) for d in denoise)) if (
+        scene.render.engine == "CYCLES") else (False,)
+    picks = representative_frames(scene.frame_start, scene.frame_end, frames)
+    reference_samples = reference_samples or candidates[-1] * 4
+
+    store = TuningCache() if cache is True else (cache or None)
+    key = render_fingerprint(obj, target, {
+        "candidates": candidates, "denoise": options, "frames": picks,
+        "reference": reference_samples, "scale": scale,
+        "res": (scene.render.resolution_x, scene.render.resolution_y),
+        "camera": scene.camera.name if scene.camera else None,
+    }, scene=scene)
+    if store is not None:
+        hit = store.get(key)
+        if hit is not None:
+            return hit
+
+    trials: list[Trial] = []
+    with _preserved(scene), tempfile.TemporaryDirectory(prefix="ares_tune_") as tmp:
+        r = scene.render
+        r.resolution_percentage = int(scale)
+        r.image_settings.file_format = "PNG"
+        r.image_settings.color_mode = "RGB"
+        r.image_settings.color_depth = "16"
+        tmp = Path(tmp)
+
+        refs = []
+        if target.needs_reference:
+            apply_sampling(scene, reference_samples, denoise=False)
+            refs = [_render_frame(scene, f, tmp / f"ref_{f}.png")[0] for f in picks]
+
+        for samples in candidates:
+            level = []
+            for dn in options:
+                apply_sampling(scene, samples, dn)
+                scores, times = [], []
+                for i, f in enumerate(picks):
+                    img, dt = _render_frame(scene, f, tmp / f"s{samples}_{int(dn)}_{f}.png")
+                    times.append(dt)
+                    if refs:
+                        scores.append((ssim(img, refs[i]), psnr(img, refs[i])))
+                level.append(Trial(
+                    samples=samples, denoise=dn, seconds=float(np.mean(times)),
+                    ssim=min((s for s, _ in scores), default=1.0),
+                    psnr=min((p for _, p in scores), default=float("inf")),
+                ))
+            trials += level
+            print("[ARES] autotune:", ", ".join(
+                f"{t.samples}{'+dn' if t.denoise else ''} ssim={t.ssim:.4f} {t.seconds:.2f}s"
+                for t in level))
+            if target.needs_reference and any(meets(t, target) for t in level):
+                break  # plus de samples = plus cher
+            budget = target.max_frame_seconds
+            if budget is not None and all(t.seconds > budget for t in level):
+                break
+
+    best = pick(trials, target)
+    if store is not None:
+        store.put(key, best)
+    return best
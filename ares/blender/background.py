@@ -0,0 +1,170 @@
+"""
+Blade v13 — blender.background
+Rendu d'animation non bloquant :
+- snapshot .blend (copie) rendu par un Blender enfant, la session reste libre,
+- vidéo : séquence PNG <sortie>_frames/frame_####.png puis MP4 assemblé à la
+  fin (ffmpeg, sinon VSE) ; image : frames écrites au chemin de la scène,
+- progression lue sur disque (ares.core.render_progress), plusieurs rendus
+  simultanés possibles,
+- annulation : l'enfant est arrêté, les frames terminées sont conservées
+  (vidéo : <sortie>_partial.mp4 si ffmpeg est disponible).
+"""
+from __future__ import annotations
+
+import shutil
+import subprocess
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import bpy
+
+from ares.core.blender_proc import blender_cmd, spawn_blender
+from ares.core.ffmpeg import encode_sequence, find_ffmpeg
+from ares.core.render_progress import Progress, completed, scan
+
+RUNNING, DONE, FAILED, CANCELLED = "running", "done", "failed", "cancelled"
+
+
+@dataclass
+class BackgroundRender:
+    id: str
+    scene: str
+    output: Path  # MP4 final, ou motif de la séquence
+    frames: list[Path]  # un fichier attendu par frame
+    movie: bool
+    fps: int
+    start: int
+    workdir: Path  # snapshot + log
+    proc: subprocess.Popen
+    started: float = field(default_factory=time.monotonic)
+    state: str = RUNNING
+    result: Path | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.proc.poll() is None
+
+    @property
+    def log(self) -> Path:
+        return self.workdir / "render.log"
+
+    def progress(self) -> Progress:
+        return scan(self.frames, time.monotonic() - self.started, self.running)
+
+    def wait(self, timeout: float | None = None) -> int:
+        return self.proc.wait(timeout)
+
+    def finish(self) -> Path:
+        """À appeler une fois l'enfant terminé : assemble le MP4 et nettoie."""
+        from ares.blender.render import AresRenderError
+
+        if self.state != RUNNING:
+            return self.result
+        rc = self.proc.wait()
+        done = completed(self.frames, running=False)
+        if rc != 0 or len(done) != len(self.frames):
+            self.state = FAILED
+            _forget(self)
+            raise AresRenderError(
+                f"Rendu d'arrière-plan en échec (rc={rc}, {len(done)}/{len(self.frames)} "
+                f"frames, log: {self.log})"
+            )
+        if self.movie:
+            scene = bpy.data.scenes.get(self.scene) or bpy.context.scene
+            from ares.blender.resume import assemble_mp4
+
+            self.result = assemble_mp4(scene, done, self.output)
+        else:
+            self.result = self.output
+        self.state = DONE
+        _forget(self)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+        return self.result
+
+    def cancel(self) -> list[Path]:
+        """Arrête l'enfant ; retourne les frames terminées (conservées sur disque)."""
+        if self.state != RUNNING:
+            return []
+        was_running = self.running
+        if was_running:
+            self.proc.terminate()
+            try:
+                self.proc.wait(10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        done = completed(self.frames, running=False)
+        if was_running and done:
+            done.pop().unlink(missing_ok=True)  # a pu être coupée en pleine écriture
+        self.state = CANCELLED
+        if self.movie and done and find_ffmpeg() is not None:
+            partial_mp4 = self.output.with_name(self.output.stem + "_partial.mp4")
+            try:
+                self.result = encode_sequence(
+                    done[0].parent / "frame_%04d.png", partial_mp4, fps=self.fps, start=self.start
+                )
+            except Exception as e:
+                print(f"[ARES] background: MP4 partiel non assemblé ({e})")
+        _forget(self)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+        return done
+
+
+_jobs: dict[str, BackgroundRender] = {}
+
+
+def jobs() -> list[BackgroundRender]:
+    """Rendus d'arrière-plan en cours (ordre de lancement)."""
+    return list(_jobs.values())
+
+
+def get_job(job_id: str) -> BackgroundRender | None:
+    return _jobs.get(job_id)
+
+
+def _forget(job: BackgroundRender) -> None:
+    _jobs.pop(job.id, None)
+
+
+def start_background_render(
+    scene=None,
+    output: str | Path | None = None,
+    threads: int | None = None,
+) -> BackgroundRender:
+    """Lance frame_start..frame_end de `scene` dans un Blender enfant (non bloquant)."""
+    scene = scene or bpy.context.scene
+    r = scene.render
+    target = Path(bpy.path.abspath(str(output) if output else r.filepath)).resolve()
+    start, end = scene.frame_start, scene.frame_end
+    movie = r.is_movie_format
+
+    if movie:
+        folder = target.with_name(target.stem + "_frames")
+        folder.mkdir(parents=True, exist_ok=True)
+        frames = [folder / f"frame_{f:04d}.png" for f in range(start, end + 1)]
+        fmt = ("-o", folder / "frame_####", "-F", "PNG", "-x", 1)
+    else:
+        frames = [Path(bpy.path.abspath(r.frame_path(frame=f))).resolve()
+                  for f in range(start, end + 1)]
+        frames[0].parent.mkdir(parents=True, exist_ok=True)
+        fmt = ("-o", target)
+    for p in frames:  # restes d'un rendu précédent : fausseraient la progression
+        p.unlink(missing_ok=True)
+
+    workdir = Path(tempfile.mkdtemp(prefix="ares_bg_"))
+    snapshot = workdir / "snapshot.blend"
+    bpy.ops.wm.save_as_mainfile(filepath=str(snapshot), copy=True, check_existing=False)
+
+    args = ("-t", threads) if threads else ()
+    cmd = blender_cmd(*args, *fmt, "-s", start, "-e", end, "-a", blend=snapshot)
+    job = BackgroundRender(
+        id=uuid.uuid4().hex[:8], scene=scene.name, output=target, frames=frames,
+        movie=movie, fps=r.fps, start=start, workdir=workdir,
+        proc=spawn_blender(cmd, log_path=workdir / "render.log"),
+    )
+    _jobs[job.id] = job
+    print(f"[ARES] background: {job.id} lancé ({len(frames)} frames -> {target})")
+    return job
@@ -0,0 +1,151 @@
+"""
+Blade v13 — blender.capabilities
+- profile() : moteurs + propriétés modifiables (render, image_settings, ffmpeg,
+  eevee, cycles), sondés une fois par build et mis en cache disque,
+- select_engine() : premier moteur disponible, écrit seulement s'il change,
+- apply_settings() : preset imbriqué {"render": {...}, "eevee": {...}} appliqué
+  en un passage, sans écrire les valeurs déjà en place ni les propriétés absentes.
+"""
+from __future__ import annotations
+
+import contextlib
+
+import bpy
+
+from ares.core.capabilities import (
+    ENGINE_ORDER,
+    MISSING,
+    EngineProfile,
+    flatten,
+    load_profile,
+    profile_path,
+    same,
+    save_profile,
+)
+
+# groupe du profil -> struct RNA
+GROUPS = {
+    "render": "RenderSettings",
+    "image_settings": "ImageFormatSettings",
+    "ffmpeg": "FFmpegSettings",
+    "eevee": "SceneEEVEE",
+    "cycles": "CyclesRenderSettings",
+}
+_GROUP_OF = {struct: group for group, struct in GROUPS.items()}
+
+_profile: dict[str, EngineProfile] = {}
+
+
+def build_id() -> str:
+    h = bpy.app.build_hash
+    h = h.decode("ascii", "ignore") if isinstance(h, bytes) else str(h)
+    return f"{bpy.app.version_string}-{h}"
+
+
+def _enum_items(prop) -> tuple[str, ...] | None:
+    if prop.type != "ENUM" or prop.is_enum_flag:
+        return None
+    items = tuple(i.identifier for i in prop.enum_items)
+    return items or None  # items dynamiques : non vérifiables statiquement
+
+
+def _writable(rna) -> dict[str, tuple[str, ...] | None]:
+    return {
+        p.identifier: _enum_items(p)
+        for p in rna.properties
+        if p.identifier != "rna_type" and not p.is_readonly
+    }
+
+
+def probe() -> tuple[EngineProfile, bool]:
+    """Sonde la build courante ; le booléen indique si tous les groupes ont été trouvés."""
+    props, complete = {}, True
+    for group, struct in GROUPS.items():
+        cls = getattr(bpy.types, struct, None)
+        if cls is None:  # ex. add-on Cycles désactivé
+            complete = False
+            continue
+        props[group] = _writable(cls.bl_rna)
+    engines = bpy.types.RenderSettings.bl_rna.properties["engine"].enum_items
+    prof = EngineProfile(
+        build=build_id(), engines=tuple(e.identifier for e in engines), props=props
+    )
+    return prof, complete
+
+
+def profile(refresh: bool = False) -> EngineProfile:
+    """Profil de la build courante (mémoire, puis disque, puis sondage)."""
+    build = build_id()
+    if not refresh and build in _profile:
+        return _profile[build]
+    path = profile_path(build)
+    prof = None if refresh else load_profile(path, build)
+    if prof is None:
+        prof, complete = probe()
+        if complete:  # un profil partiel ne doit pas survivre à l'activation de Cycles
+            with contextlib.suppress(OSError):
+                save_profile(path, prof)
+    _profile[build] = prof
+    return prof
+
+
+def select_engine(scene=None, order=ENGINE_ORDER) -> str | None:
+    scene = scene or bpy.context.scene
+    engine = profile().pick_engine(order)
+    if engine is not None and scene.render.engine != engine:
+        scene.render.engine = engine
+    return engine
+
+
+def _known(owner, prop: str, value, prof: EngineProfile) -> bool:
+    group = _GROUP_OF.get(owner.bl_rna.identifier)
+    if group is not None and group in prof.props:
+        return prof.accepts(group, prop, value)
+    rna = owner.bl_rna.properties.get(prop)
+    if rna is None or rna.is_readonly:
+        return False
+    items = _enum_items(rna)
+    return items is None or value in items
+
+
+def apply_settings(root, preset: dict, prof: EngineProfile | None = None) -> dict:
+    """Applique `preset` (chemins d'attributs depuis `root`, en général la scène).
+
+    Retourne {"changed": {"render.fps": 25, ...}, "skipped": ["eevee.use_bloom", ...]}.
+    """
+    prof = prof or profile()
+    owners: dict[tuple[str, ...], object] = {}
+
+    def owner(path):
+        key = path[:-1]
+        if key not in owners:
+            obj = root
+            for name in key:
+                obj = getattr(obj, name, None)
+                if obj is None:
+                    break
+            owners[key] = obj
+        return owners[key]
+
+    def read(path):
+        obj = owner(path)
+        if obj is None or not hasattr(obj, "bl_rna"):
+            return MISSING
+        return getattr(obj, path[-1], MISSING)
+
+    changed, skipped = {}, []
+    for path, value in flatten(preset).items():
+        # lu au moment d'écrire : une écriture précédente (file_format) peut en modifier d'autres
+        if same(read(path), value):
+            continue
+        obj, prop, dotted = owner(path), path[-1], ".".join(path)
+        if obj is None or not hasattr(obj, "bl_rna") or not _known(obj, prop, value, prof):
+            skipped.append(dotted)
+            continue
+        try:
+            setattr(obj, prop, value)
+        except (TypeError, ValueError, AttributeError):
+            skipped.append(dotted)
+            continue
+        changed[dotted] = value
+    return {"changed": changed, "skipped": skipped}
@@ -0,0 +1,65 @@
+"""
+Blade v13 — blender.deliverables
+Une passe de rendu, plusieurs livrables :
+- l'animation est rendue une seule fois en séquence PNG reprenable
+  (<sortie>_frames/, ares.blender.resume),
+- les livrables déclarés (render_output.deliverables, ares.config) sont
+  encodés en parallèle depuis ces frames (ares.core.deliverables),
+- sans ffmpeg : MP4 assemblé par Blender et poster seulement, les autres
+  livrables sont signalés comme ignorés.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+
+import bpy
+
+from ares.blender.resume import assemble_mp4, render_sequence
+from ares.blender.trace import active, trace_render
+from ares.core.deliverables import output_path, produce
+from ares.core.ffmpeg import find_ffmpeg
+
+
+def _fallback(scene, frames: list[Path], base: Path, specs: Sequence) -> dict[str, Path]:
+    done = [s for s in specs if s.kind in ("mp4", "poster")]
+    skipped = [s.kind for s in specs if s not in done]
+    if skipped:
+        print(f"[ARES] deliverables: ffmpeg introuvable, ignorés : {', '.join(skipped)}")
+    posters = [s for s in done if s.kind == "poster"]  # simples copies de frames
+    out = produce(frames, base, scene.render.fps, posters, start=scene.frame_start, exe="ffmpeg")
+    for s in done:
+        if s.kind == "mp4":
+            mp4 = output_path(base, "mp4", s.suffix)
+            out[mp4.name] = assemble_mp4(scene, frames, mp4)
+    return out
+
+
+def render_deliverables(
+    scene=None,
+    deliverables: Sequence | None = None,
+    workers: int | None = None,
+    extra: dict | None = None,
+) -> dict[str, Path]:
+    """Rend la scène une fois puis produit chaque livrable ; {nom de fichier -> chemin}.
+
+    deliverables : specs (kind/options/suffix), par défaut celles de la config.
+    Les noms de sortie dérivent de scene.render.filepath (extension ignorée).
+    """
+    scene = scene or bpy.context.scene
+    if deliverables is None:
+        from ares.config import get
+
+        deliverables = get().output.deliverables
+    r = scene.render
+    target = Path(bpy.path.abspath(r.filepath)).resolve()
+    base = target.with_name(target.stem.rstrip("#_") or "render")
+    with trace_render("deliverables", scene, target):
+        frames = render_sequence(scene, base.with_name(base.name + "_frames"), extra)
+        if find_ffmpeg() is None:
+            return _fallback(scene, frames, base, deliverables)
+        with active().phase("encode"):
+            out = produce(frames, base, r.fps / r.fps_base, deliverables,
+                          start=scene.frame_start, workers=workers)
+    print(f"[ARES] deliverables: {len(frames)} frames -> {', '.join(out)}")
+    return out
@@ -0,0 +1,216 @@
+"""
+Blade v13 — blender.fingerprint
+Empreinte stable des entrées d'un rendu (clé de ares.core.cache) :
+- maillage évalué de la cible (modifiers inclus) lu en bloc via foreach_get,
+- matériaux : arbre de nodes, propriétés RNA des nodes (blend_type, rampes,
+  courbes...), valeurs des sockets non liés, images (fichier, taille,
+  données packées ou pixels modifiés), groupes de nodes,
+- éclairage : monde (nodes inclus) et lumières visibles de la scène,
+- champs du RenderPreset / OrbitSpec, moteur, version de Blender.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, is_dataclass
+
+import bpy
+import numpy as np
+
+
+def _feed_array(h, coll, attr: str, n: int, dtype) -> None:
+    buf = np.empty(n, dtype=dtype)
+    coll.foreach_get(attr, buf)
+    h.update(buf.tobytes())
+
+
+def hash_mesh(h, obj: bpy.types.Object) -> None:
+    """Géométrie évaluée (après modifiers) + matrix_world."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    ob_eval = obj.evaluated_get(depsgraph)
+    mw = np.array(ob_eval.matrix_world, dtype=np.float64)
+    h.update(mw.tobytes())
+    mesh = ob_eval.to_mesh()
+    if mesh is None:
+        h.update(f"{obj.type}:nomesh".encode())
+        return
+    try:
+        hash_mesh_data(h, mesh)
+    finally:
+        ob_eval.to_mesh_clear()
+
+
+def hash_mesh_data(h, mesh: bpy.types.Mesh) -> None:
+    """Buffers d'un maillage (sommets, topologie, matériaux, smooth, UV) lus en bloc."""
+    h.update(f"v{len(mesh.vertices)}l{len(mesh.loops)}p{len(mesh.polygons)}".encode())
+    _feed_array(h, mesh.vertices, "co", len(mesh.vertices) * 3, np.float32)
+    _feed_array(h, mesh.loops, "vertex_index", len(mesh.loops), np.int32)
+    _feed_array(h, mesh.polygons, "loop_total", len(mesh.polygons), np.int32)
+    _feed_array(h, mesh.polygons, "material_index", len(mesh.polygons), np.int32)
+    _feed_array(h, mesh.polygons, "use_smooth", len(mesh.polygons), np.bool_)
+    for uv in mesh.uv_layers:
+        _feed_array(h, uv.data, "uv", len(mesh.loops) * 2, np.float32)
+
+
+def _rounded(val):
+    if val is None or isinstance(val, str):
+        return val
+    try:
+        return [round(float(v), 6) for v in val]
+    except (TypeError, ValueError):
+        return round(val, 6) if isinstance(val, float) else str(val)
+
+
+def _socket_value(sock):
+    return _rounded(getattr(sock, "default_value", None))
+
+
+# propriétés communes à tous les nodes (placement, UI, sockets) : hors empreinte
+_NODE_BASE = {p.identifier for p in bpy.types.Node.bl_rna.properties} - {"mute"}
+# propriétés de tout datablock (users, session_uid, tag...) : variables d'une session à l'autre
+_ID_BASE = {p.identifier for p in bpy.types.ID.bl_rna.properties}
+_DEPTH = 3
+
+
+def image_signature(img: bpy.types.Image | None) -> dict:
+    """Fichier (chemin, taille, date), données packées ou pixels modifiés, réglages."""
+    if img is None:
+        return {}
+    sig = {
+        "name": img.name,
+        "source": img.source,
+        "size": list(img.size),
+        "colorspace": img.colorspace_settings.name,
+        "alpha": img.alpha_mode,
+    }
+    if img.source == "GENERATED":
+        sig["generated"] = [img.generated_type, img.generated_width, img.generated_height,
+                            _rounded(img.generated_color)]
+    if img.packed_file is not None:
+        sig["packed"] = hashlib.sha256(bytes(img.packed_file.data)).hexdigest()
+    elif img.filepath:
+        path = bpy.path.abspath(img.filepath, library=img.library)
+        sig["file"] = path
+        try:
+            st = os.stat(path)
+            sig["stat"] = [st.st_size, st.st_mtime_ns]
+        except OSError:
+            sig["stat"] = None
+    if img.is_dirty and img.has_data:  # retouché en mémoire, pas encore enregistré
+        buf = np.empty(len(img.pixels), dtype=np.float32)
+        img.pixels.foreach_get(buf)
+        sig["pixels"] = hashlib.sha256(buf.tobytes()).hexdigest()
+    return sig
+
+
+def _pointer(value, depth: int, seen: set):
+    if value is None:
+        return None
+    if isinstance(value, bpy.types.Image):
+        return image_signature(value)
+    if isinstance(value, bpy.types.NodeTree):
+        return tree_signature(value, seen)
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    return _rna(value, depth - 1, seen) if depth > 0 else None
+
+
+def _rna(struct, depth: int = _DEPTH, seen: set | None = None, skip=()) -> dict:
+    """Propriétés RNA de `struct` (pointeurs et collections suivis sur `depth` niveaux)."""
+    seen = set() if seen is None else seen
+    out = {}
+    for prop in struct.bl_rna.properties:
+        key = prop.identifier
+        if key == "rna_type" or key in skip:
+            continue
+        value = getattr(struct, key, None)
+        if prop.type == "POINTER":
+            out[key] = _pointer(value, depth, seen)
+        elif prop.type == "COLLECTION":
+            out[key] = [_rna(v, depth - 1, seen) for v in value] if depth > 0 else len(value)
+        elif prop.type == "ENUM" and prop.is_enum_flag:
+            out[key] = sorted(value)
+        else:
+            out[key] = _rounded(value)
+    return out
+
+
+def tree_signature(nt: bpy.types.NodeTree | None, seen: set | None = None) -> dict:
+    """Nodes (type, propriétés, sockets non liés) et liens ; groupes suivis une fois."""
+    if nt is None:
+        return {}
+    seen = set() if seen is None else seen
+    if nt.name in seen:
+        return {"group": nt.name}
+    seen.add(nt.name)
+    nodes = sorted(
+        (
+            n.bl_idname,
+            n.name,
+            json.dumps(_rna(n, seen=seen, skip=_NODE_BASE), sort_keys=True, default=str),
+            [(s.identifier, _socket_value(s)) for s in n.inputs if not s.is_linked],
+        )
+        for n in nt.nodes
+    )
+    links = sorted(
+        (lk.from_node.name, lk.from_socket.identifier, lk.to_node.name, lk.to_socket.identifier)
+        for lk in nt.links
+    )
+    return {"nodes": nodes, "links": links}
+
+
+def material_signature(mat: bpy.types.Material | None) -> dict:
+    if mat is None:
+        return {}
+    sig = {"name": mat.name, "diffuse": _rounded(mat.diffuse_color)}
+    if mat.use_nodes and mat.node_tree is not None:
+        sig.update(tree_signature(mat.node_tree))
+    return sig
+
+
+def world_signature(world: bpy.types.World | None) -> dict:
+    if world is None:
+        return {}
+    sig = {"name": world.name, "color": _rounded(world.color)}
+    if world.use_nodes and world.node_tree is not None:
+        sig.update(tree_signature(world.node_tree))
+    return sig
+
+
+def lights_signature(scene: bpy.types.Scene) -> list:
+    """Lumières visibles au rendu : données (type, énergie, taille...) et placement."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    out = []
+    for ob in scene.objects:
+        if ob.type != "LIGHT" or ob.hide_render:
+            continue
+        light = ob.data
+        sig = _rna(light, depth=1, skip=_ID_BASE | {"node_tree", "animation_data", "cycles"})
+        if light.use_nodes and light.node_tree is not None:
+            sig["nodes"] = tree_signature(light.node_tree)
+        mw = ob.evaluated_get(depsgraph).matrix_world
+        sig["matrix"] = [_rounded(row) for row in mw]
+        out.append((ob.name, json.dumps(sig, sort_keys=True, default=str)))
+    return sorted(out)
+
+
+def _plain(value):
+    return asdict(value) if is_dataclass(value) else value
+
+
+def render_fingerprint(obj: bpy.types.Object, *parts, scene: bpy.types.Scene | None = None) -> str:
+    """Clé hex stable : cible + matériaux + éclairage + `parts` + moteur/version."""
+    scene = scene or bpy.context.scene
+    h = hashlib.sha256()
+    meta = {
+        "blender": bpy.app.version_string,
+        "engine": scene.render.engine,
+        "materials": [material_signature(s.material) for s in obj.material_slots],
+        "world": world_signature(scene.world),
+        "lights": lights_signature(scene),
+        "parts": [_plain(p) for p in parts],
+    }
+    h.update(json.dumps(meta, sort_keys=True, default=str).encode("utf-8"))
+    hash_mesh(h, obj)
+    return h.hexdigest()
@@ -0,0 +1,203 @@
+"""
+Blade v13 — blender.progressive
+Turntable progressif piloté par config/turntable_presets.yaml :
+- FAST rendu tout de suite (Blender enfant sur un snapshot, la scène de
+  l'utilisateur n'est pas modifiée), chemin retourné dès qu'il est publié,
+- NORMAL puis FULL rendus par un Blender d'arrière-plan ; chaque palier
+  remplace la sortie en place (os.replace) à la fin de son rendu,
+- si l'objet, son mesh ou ses matériaux changent (depsgraph), ou si un
+  nouveau rendu vise la même sortie, les paliers restants sont annulés.
+Exécuté aussi comme script enfant :
+    blender -b snapshot.blend -P ares/blender/progressive.py -- '<payload json>'
+"""
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ares.core import progressive as state
+from ares.core.blender_proc import blender_cmd, child_env, spawn_blender
+
+SCRIPT = Path(__file__).resolve()
+
+
+@dataclass
+class ProgressiveRender:
+    output: Path
+    token: str
+    workdir: Path
+    watched: set = field(default_factory=set)
+    proc: subprocess.Popen | None = None
+
+    @property
+    def tier(self) -> str | None:
+        """Dernier palier publié dans `output`."""
+        return state.read_state(state.state_path(self.output)).get("tier")
+
+    def done(self) -> bool:
+        return self.proc is None or self.proc.poll() is not None
+
+    def wait(self, timeout: float | None = None) -> str | None:
+        if self.proc is not None:
+            self.proc.wait(timeout)
+        return self.tier
+
+    def cancel(self) -> None:
+        if state.is_current(self.output, self.token):
+            state.cancel(self.output)
+        if self.proc is not None and self.proc.poll() is None:
+            self.proc.terminate()
+
+
+_active: dict[str, ProgressiveRender] = {}
+
+
+def _id_key(idb) -> tuple[str, str]:
+    return (idb.bl_rna.identifier, idb.name)
+
+
+def _watch_set(obj) -> set:
+    ids = {_id_key(obj)}
+    if obj.data is not None:
+        ids.add(_id_key(obj.data))
+    ids |= {_id_key(s.material) for s in obj.material_slots if s.material is not None}
+    return ids
+
+
+def _on_depsgraph(scene, depsgraph):
+    changed = {
+        _id_key(u.id.original) for u in depsgraph.updates
+        if u.is_updated_geometry or u.is_updated_transform or u.is_updated_shading
+    }
+    for key, job in list(_active.items()):
+        if job.done():
+            del _active[key]
+        elif job.watched & changed:
+            print(f"[ARES] progressive: entrées modifiées, paliers annulés ({job.output.name})")
+            job.cancel()
+            del _active[key]
+    if not _active:
+        _set_watch(False)
+
+
+def _set_watch(on: bool) -> None:
+    import bpy
+
+    handlers = bpy.app.handlers.depsgraph_update_post
+    if on and _on_depsgraph not in handlers:
+        handlers.append(_on_depsgraph)
+    elif not on and _on_depsgraph in handlers:
+        handlers.remove(_on_depsgraph)
+
+
+def _load_tiers(tiers) -> list[dict]:
+    from ares.jobs.spec import load_preset
+
+    return state.plan({t: load_preset(t) for t in tiers}, tiers)
+
+
+def _child_cmd(snapshot: Path, payload: dict) -> list[str]:
+    return blender_cmd(
+        "--python-exit-code", 1,
+        blend=snapshot, script=SCRIPT, script_args=[json.dumps(payload)],
+    )
+
+
+def render_progressive(
+    obj,
+    output: str | Path | None = None,
+    tiers=state.TIERS,
+    res: tuple[int, int] = (1280, 720),
+    watch: bool = True,
+) -> ProgressiveRender:
+    """Publie le premier palier (bloquant) puis lance les suivants en arrière-plan.
+
+    Le rayon des presets n'est pas utilisé : le cadrage est celui de
+    ares.blender.render.render_turntable (calculé depuis l'objet).
+    """
+    import bpy
+
+    from ares.blender.render import AresRenderError, _get_output_path
+
+    if obj is None:
+        raise AresRenderError("No active object to render")
+    out = Path(bpy.path.abspath(str(output))) if output else _get_output_path(
+        obj.name.replace(" ", "_"), is_video=True
+    )
+    out = out.resolve()
+    previous = _active.pop(str(out), None)
+    if previous is not None:
+        previous.cancel()
+
+    steps = _load_tiers(tiers)
+    token = state.start(out)
+    root = out.parent / f".{out.stem}.progressive"
+    for stale in root.glob("*"):  # demandes précédentes (ignoré si encore ouvert)
+        shutil.rmtree(stale, ignore_errors=True)
+    workdir = root / token[:12]
+    workdir.mkdir(parents=True)
+    snapshot = workdir / "snapshot.blend"
+    bpy.ops.wm.save_as_mainfile(filepath=str(snapshot), copy=True, check_existing=False)
+
+    base = {"obj": obj.name, "output": str(out), "token": token, "workdir": str(workdir),
+            "res": list(res)}
+    first, rest = steps[:1], steps[1:]
+    with open(workdir / f"{first[0]['tier']}.log", "w", encoding="utf-8") as log:
+        rc = subprocess.run(
+            _child_cmd(snapshot, {**base, "tiers": first}),
+            env=child_env(), stdout=log, stderr=subprocess.STDOUT, check=False,
+        ).returncode
+    if rc != 0 or state.read_state(state.state_path(out)).get("tier") != first[0]["tier"]:
+        raise AresRenderError(f"Palier {first[0]['tier']} en échec (logs: {workdir})")
+
+    job = ProgressiveRender(output=out, token=token, workdir=workdir, watched=_watch_set(obj))
+    if rest:
+        job.proc = spawn_blender(
+            _child_cmd(snapshot, {**base, "tiers": rest}), log_path=workdir / "background.log"
+        )
+        if watch and not bpy.app.background:
+            _active[str(out)] = job
+            _set_watch(True)
+    return job
+
+
+# ---------- côté enfant ----------
+
+def run_tiers(payload: dict) -> None:
+    import bpy
+
+    from ares.blender.render import RenderPreset, render_turntable
+
+    out, token = Path(payload["output"]), payload["token"]
+    res_x, res_y = payload.get("res", (1280, 720))
+    obj = bpy.data.objects[payload["obj"]]
+    for step in payload["tiers"]:
+        tier = step["tier"]
+        if not state.is_current(out, token):
+            print(f"[ARES] progressive: {tier} annulé")
+            return
+        preset = RenderPreset(res_x=int(res_x), res_y=int(res_y), fps=int(step.get("fps", 24)),
+                              samples=int(step.get("samples", 64)))
+        rendered = render_turntable(obj, preset, seconds=float(step.get("seconds", 4)),
+                                    out_dir=Path(payload["workdir"]) / tier)
+        if state.publish(out, token, tier, rendered):
+            print(f"[ARES] progressive: {tier} publié -> {out}")
+        else:
+            print(f"[ARES] progressive: {tier} non publié (annulé ou dépassé)")
+
+
+def main(argv: list[str]) -> int:
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    if not args:
+        print("[ARES] progressive: payload manquant")
+        return 2
+    run_tiers(json.loads(args[0]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -1,11 +1,19 @@
+from __future__ import annotations
+
 import math
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, replace
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import bpy
 
 from ares.modules.turntable.api import compute_orbit_for_object
 
+if TYPE_CHECKING:  # options opt-in : modules importés dans les branches qui s'en servent
+    from ares.core.cache import RenderCache
+    from ares.core.quality import QualityTarget
+
 
 @dataclass(frozen=True)
 class RenderPreset:
@@ -13,80 +21,151 @@ class RenderPreset:
     res_y: int = 720
     fps: int = 25
     samples: int = 64
+    denoise: bool = False  # Cycles : OIDN sur CPU
     codec: str = "H264"  # H264 | PNG_SEQ
+    engine: str | None = None  # None : premier moteur disponible (RENDER_ENGINES)
+
+
+# propriétaires (ares.helpers.lifecycle) : caméra réutilisée, pivot recréé à chaque rendu
+CAMERA_JOB = "turntable_camera"
+ORBIT_JOB = "turntable_orbit"
+
 
 class AresRenderError(RuntimeError):
     ...
 
 def _ensure_scene_setup(preset: RenderPreset):
+    """Moteur + réglages du preset ; seules les valeurs qui changent sont écrites."""
+    from ares.blender.autotune import sampling_settings
+    from ares.blender.capabilities import apply_settings, select_engine
+    from ares.core.capabilities import RENDER_ENGINES
+
     scene = bpy.context.scene
+    select_engine(scene, (preset.engine,) if preset.engine else RENDER_ENGINES)
 
-    # --- choose engine robustly ---
-    enum_prop = bpy.types.RenderSettings.bl_rna.properties["engine"].enum_items
-    engines = {e.identifier for e in enum_prop}
-    if "BLENDER_EEVEE" in engines:
-        scene.render.engine = "BLENDER_EEVEE"
-    elif "BLENDER_EEVEE_NEXT" in engines:
-        scene.render.engine = "BLENDER_EEVEE_NEXT"
-    else:
-        scene.render.engine = "CYCLES"
-
-    # samples (robuste)
-    if scene.render.engine.startswith("BLENDER_EEVEE"):
-        from contextlib import suppress
-        with suppress(Exception):
-            scene.eevee.taa_render_samples = preset.samples
-    elif scene.render.engine == "CYCLES":
-        scene.cycles.samples = preset.samples
-        scene.cycles.use_adaptive_sampling = True
-
-    # --- resolution & fps ---
-    scene.render.resolution_x = preset.res_x
-    scene.render.resolution_y = preset.res_y
-    scene.render.fps = preset.fps
-
-    # --- output format ---
+    render = {"resolution_x": preset.res_x, "resolution_y": preset.res_y, "fps": preset.fps}
     if preset.codec == "H264":
-        scene.render.image_settings.file_format = "FFMPEG"
-        scene.render.ffmpeg.format = "MPEG4"
-        scene.render.ffmpeg.codec = "H264"
-        scene.render.ffmpeg.constant_rate_factor = "MEDIUM"
-        scene.render.ffmpeg.gopsize = preset.fps * 2
-        scene.render.ffmpeg.max_b_frames = 2
+        render["image_settings"] = {"file_format": "FFMPEG"}
+        render["ffmpeg"] = {
+            "format": "MPEG4",
+            "codec": "H264",
+            "constant_rate_factor": "MEDIUM",
+            "gopsize": preset.fps * 2,
+            "max_b_frames": 2,
+        }
     else:
-        scene.render.image_settings.file_format = "PNG"
-def _get_output_path(obj_name: str, is_video: bool) -> Path:
+        render["image_settings"] = {"file_format": "PNG"}
+    apply_settings(scene, {
+        "render": render,
+        **sampling_settings(scene.render.engine, preset.samples, preset.denoise),
+    })
+
+def _get_output_path(obj_name: str, is_video: bool, out_dir: Path | None = None) -> Path:
     from ares.core.paths import ROOT
-    out_dir = ROOT / "renders" / "turntable"
+    out_dir = Path(out_dir) if out_dir is not None else ROOT / "renders" / "turntable"
     out_dir.mkdir(parents=True, exist_ok=True)
     ext = ".mp4" if is_video else "_####.png"
     return out_dir / f"{obj_name}{ext}"
 
-def render_turntable(obj, preset: RenderPreset | None = None, seconds: int = 8) -> Path:
-    """Crée une caméra orbit, anime 0->360°, rend en mp4 (par défaut)."""
+def render_turntable(
+    obj,
+    preset: RenderPreset | None = None,
+    seconds: int = 8,
+    shards: int = 1,
+    out_dir: Path | None = None,
+    cache: RenderCache | bool = False,
+    resumable: bool = False,
+    autotune: QualityTarget | bool = False,
+    background: bool = False,
+    stream: bool = False,
+    deliverables: Sequence | bool = False,
+    symmetry: bool = False,
+):
+    """Crée une caméra orbit, anime 0->360°, rend en mp4 (par défaut).
+
+    shards > 1 : la plage de frames est répartie sur N Blender headless
+    (voir ares.blender.shard) ; le chemin retourné est identique.
+    cache : True (store par défaut) ou RenderCache ; un hit évite le rendu (mp4 seulement,
+    ignoré avec background et deliverables).
+    resumable : séquence PNG + manifest de reprise (ares.blender.resume), prioritaire sur shards.
+    autotune : True (QualityTarget par défaut) ou QualityTarget ; samples/débruitage
+    calibrés avant le rendu (ares.blender.autotune), `preset.samples` est alors ignoré.
+    background : rendu par un Blender enfant (ares.blender.background) ; retourne
+    tout de suite le BackgroundRender (progression, annulation, finish()). Sans cache.
+    stream : frames envoyées en flux à un ffmpeg externe pendant le rendu
+    (ares.blender.stream, mp4 seulement) ; writer de Blender si ffmpeg est absent.
+    deliverables : True (liste de la config) ou specs ; une seule passe de rendu, tous
+    les livrables encodés ensuite (ares.blender.deliverables). Retourne le mp4 s'il
+    en fait partie, sinon le premier livrable. Sans cache.
+    symmetry : (opt-in) si la scène a une symétrie de rotation d'ordre N autour de
+    l'axe d'orbite (géométrie et instances, matériaux, lumières fixes ;
+    ares.blender.symmetry), seul le secteur 360/N est rendu et les autres
+    frames le réutilisent. L'orbite boucle
+    alors sans frame dupliquée (360° à la frame suivant la dernière). Rendu local
+    seulement (ni background, ni shards, ni stream, ni deliverables).
+    ARES_TRACE=1 : temps par frame et par phase dans reports/ (ares.blender.trace).
+    """
     if obj is None:
         raise AresRenderError("No active object to render")
 
     preset = preset or RenderPreset()
+    target = None
+    if autotune:
+        from ares.core.quality import QualityTarget
+        target = QualityTarget() if autotune is True else autotune
     _ensure_scene_setup(preset)
 
     scene = bpy.context.scene
     obj_name = (obj.name or "Object").replace(" ", "_")
     video = (preset.codec == "H264")
-    out_path = _get_output_path(obj_name, is_video=video)
+    out_path = _get_output_path(obj_name, is_video=video, out_dir=out_dir)
     scene.render.filepath = str(out_path)
 
-    # Cam + empty pivot
+    spec = compute_orbit_for_object(obj)
+    total_frames = max(1, int(preset.fps * seconds))
     cam = next((o for o in scene.objects if o.type == "CAMERA"), None)
+
+    # Symétrie : secteur unique rendu, frames restantes réutilisées
+    order = 1
+    if symmetry and not (background or stream or deliverables or shards > 1):
+        from ares.blender.symmetry import analyze
+        from ares.core.symmetry import usable_order
+        sym = analyze(scene, obj.location, rig=(cam,))
+        order = usable_order(sym.order, total_frames)
+        if order == 1:
+            print(f"[ARES] symmetry: pas de réutilisation ({sym.reason or 'ordre incompatible'})")
+    period = total_frames if order > 1 else total_frames - 1
+
+    # Cache adressé par contenu (sortie vidéo mono-fichier uniquement)
+    key = None
+    if video:
+        from ares.core.cache import RenderCache, detach
+        cache = RenderCache() if cache is True else (cache or None)
+        if cache is not None and not (deliverables or background):
+            from ares.blender.fingerprint import render_fingerprint
+            tune = asdict(target) if target is not None else None
+            parts = {"frames": total_frames, "autotune": tune}
+            if order > 1:
+                parts["symmetry"] = order
+            key = render_fingerprint(obj, preset, spec, parts, scene=scene)
+            if cache.get(key, out_path):
+                return out_path
+        # une sortie issue d'un hit est un hard-link vers le store : ne pas la réécrire
+        detach(out_path)
+
+    # Cam (réutilisée) + empty pivot (celui du rendu précédent est supprimé)
+    from ares.helpers.lifecycle import new, release, tag
+    release(ORBIT_JOB, purge=False, any_session=True)
     if cam is None:
-        cam_data = bpy.data.cameras.new("AresCam")
-        cam = bpy.data.objects.new("AresCam", cam_data)
+        cam = tag(bpy.data.objects.new("AresCam", new("cameras", "AresCam", job=CAMERA_JOB)),
+                  CAMERA_JOB)
         scene.collection.objects.link(cam)
-    empty = bpy.data.objects.new("AresOrbit", None)
+    if scene.camera is None:
+        scene.camera = cam
+    empty = new("objects", "AresOrbit", None, job=ORBIT_JOB)
     scene.collection.objects.link(empty)
 
     # Position/parenting
-    spec = compute_orbit_for_object(obj)
     cam.data.lens_unit = "FOV"
     cam.data.angle = math.radians(spec.fov_deg)
 
@@ -109,20 +188,58 @@ def render_turntable(obj, preset: RenderPreset | None = None, seconds: int = 8)
     c.up_axis = "UP_Y"
 
     # Animation orbit
-    total_frames = max(1, int(preset.fps * seconds))
     scene.frame_start = 1
     scene.frame_end = total_frames
     empty.rotation_euler = (0.0, 0.0, math.radians(0))
     empty.keyframe_insert(data_path="rotation_euler", frame=1)
     empty.rotation_euler = (0.0, 0.0, math.radians(360))
-    empty.keyframe_insert(data_path="rotation_euler", frame=total_frames)
+    empty.keyframe_insert(data_path="rotation_euler", frame=1 + period)
 
     # Interpolation linéaire
     if empty.animation_data and empty.animation_data.action:
+        tag(empty.animation_data.action, ORBIT_JOB)
         for fcu in empty.animation_data.action.fcurves:
             for kp in fcu.keyframe_points:
                 kp.interpolation = "LINEAR"
 
+    # Calibration des samples (cadrage et animation en place)
+    if target is not None:
+        from ares.blender.autotune import calibrate
+        trial = calibrate(scene, obj, target)
+        preset = replace(preset, samples=trial.samples, denoise=trial.denoise)
+        _ensure_scene_setup(preset)
+        scene.render.filepath = str(out_path)
+        print(f"[ARES] autotune: samples={trial.samples} denoise={trial.denoise}")
+
     # Rendu
-    bpy.ops.render.render(animation=True)
-    return Path(scene.render.filepath)
+    if background:
+        from ares.blender.background import start_background_render
+        return start_background_render(scene, output=out_path)
+    from ares.blender.trace import trace_render
+    with trace_render("turntable", scene, out_path):
+        if deliverables:
+            from ares.blender.deliverables import render_deliverables
+            specs = None if deliverables is True else deliverables
+            extra = {"preset": asdict(preset), "orbit": asdict(spec)}
+            outputs = render_deliverables(scene, specs, extra=extra)
+            return outputs.get(out_path.name) or next(iter(outputs.values()), out_path)
+        if order > 1:
+            from ares.blender.symmetry import render_symmetric
+            extra = {"preset": asdict(preset), "orbit": asdict(spec), "symmetry": order}
+            result = render_symmetric(scene, period, order, extra=extra)
+        elif resumable:
+            from ares.blender.resume import render_animation_resumable
+            extra = {"preset": asdict(preset), "orbit": asdict(spec)}
+            result = render_animation_resumable(scene, extra=extra)
+        elif shards > 1:
+            from ares.blender.shard import render_sharded
+            result = render_sharded(scene, shards)
+        elif stream and video:
+            from ares.blender.stream import render_animation_streamed
+            result = render_animation_streamed(scene)
+        else:
+            bpy.ops.render.render(animation=True)
+            result = Path(scene.render.filepath)
+    if key is not None:
+        cache.put(key, result)
+    return result
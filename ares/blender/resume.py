@@ -0,0 +1,151 @@
+"""
+Blade v13 — blender.resume
+Rendu d'animation reprenable :
+- rend dans une séquence PNG intermédiaire (<sortie>_frames/frame_####.png),
+- chaque frame écrite est enregistrée dans un manifest (ares.core.checkpoint),
+- au redémarrage, les frames déjà faites et vérifiées sont sautées
+  (use_overwrite=False), les fichiers partiels sont supprimés,
+- le MP4 final n'est assemblé qu'une fois la séquence complète.
+"""
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+
+import bpy
+
+from ares.blender.render import AresRenderError
+from ares.blender.trace import active, trace_render
+from ares.core.checkpoint import FrameCheckpoint
+from ares.core.ffmpeg import encode_sequence, find_ffmpeg
+from ares.helpers.lifecycle import new
+
+ASSEMBLE_JOB = "mp4_assemble"  # scène VSE temporaire (helpers.lifecycle)
+
+
+def _settings_signature(scene: bpy.types.Scene, extra: dict | None) -> dict:
+    r = scene.render
+    sig = {
+        "res": [r.resolution_x, r.resolution_y, r.resolution_percentage],
+        "fps": [r.fps, r.fps_base],
+        "frames": [scene.frame_start, scene.frame_end, scene.frame_step],
+        "engine": r.engine,
+        "camera": scene.camera.name if scene.camera else None,
+        "view_transform": scene.view_settings.view_transform,
+    }
+    with contextlib.suppress(Exception):
+        sig["samples"] = (
+            scene.cycles.samples if r.engine == "CYCLES" else scene.eevee.taa_render_samples
+        )
+    if extra:
+        sig["extra"] = extra
+    return sig
+
+
+def _assemble_with_blender(scene: bpy.types.Scene, frames: list[Path], out: Path) -> None:
+    """Fallback sans ffmpeg externe : strip image dans le VSE d'une scène temporaire."""
+    tmp = new("scenes", "ARES_Assemble", job=ASSEMBLE_JOB)
+    try:
+        r, src = tmp.render, scene.render
+        r.resolution_x, r.resolution_y = src.resolution_x, src.resolution_y
+        r.resolution_percentage = src.resolution_percentage
+        r.fps, r.fps_base = src.fps, src.fps_base
+        r.image_settings.file_format = "FFMPEG"
+        r.ffmpeg.format = "MPEG4"
+        r.ffmpeg.codec = "H264"
+        r.ffmpeg.constant_rate_factor = "HIGH"
+        r.filepath = str(out)
+
+        se = tmp.sequence_editor_create()
+        strips = getattr(se, "strips", None) or se.sequences
+        strip = strips.new_image(
+            name="frames", filepath=str(frames[0]), channel=1, frame_start=1
+        )
+        for f in frames[1:]:
+            strip.elements.append(f.name)
+        tmp.frame_start, tmp.frame_end = 1, len(frames)
+        bpy.ops.render.render(animation=True, scene=tmp.name)
+    finally:
+        bpy.data.scenes.remove(tmp)
+
+
+def assemble_mp4(scene: bpy.types.Scene, frames: list[Path], out: Path) -> Path:
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with active().phase("encode"):
+        if find_ffmpeg() is not None:
+            pattern = frames[0].parent / "frame_%04d.png"
+            return encode_sequence(pattern, out, fps=scene.render.fps, start=scene.frame_start)
+        _assemble_with_blender(scene, frames, out)
+    return out
+
+
+def render_animation_resumable(scene: bpy.types.Scene, extra: dict | None = None) -> Path:
+    """Rend frame_start..frame_end en reprenant là où un rendu précédent s'est arrêté.
+
+    Sortie vidéo (FFMPEG) : séquence intermédiaire puis MP4 assemblé.
+    Sortie image : les frames sont écrites directement au chemin de la scène.
+    `extra` entre dans la signature des réglages (ex: preset/orbit).
+    """
+    with trace_render("resume", scene):
+        return _render_resumable(scene, extra)
+
+
+def _render_resumable(scene: bpy.types.Scene, extra: dict | None) -> Path:
+    target = Path(bpy.path.abspath(scene.render.filepath)).resolve()
+    if scene.render.is_movie_format:
+        frames = render_sequence(scene, target.with_name(target.stem + "_frames"), extra)
+        return assemble_mp4(scene, frames, target)
+    # dossier partagé avec d'autres séquences : un manifest par sortie
+    manifest = target.stem.rstrip("#_") + ".checkpoint.json"
+    _render_checkpointed(scene, target.parent, manifest, extra)
+    return target
+
+
+def render_sequence(scene: bpy.types.Scene, folder: Path, extra: dict | None = None) -> list[Path]:
+    """Séquence PNG reprenable `folder/frame_####.png` ; retourne les frames dans l'ordre."""
+    r = scene.render
+    prev = (r.image_settings.file_format, r.filepath)
+    r.image_settings.file_format = "PNG"
+    r.filepath = str(folder / "frame_####.png")
+    try:
+        return _render_checkpointed(scene, folder, "checkpoint.json", extra)
+    finally:
+        r.image_settings.file_format, r.filepath = prev
+
+
+def _render_checkpointed(
+    scene: bpy.types.Scene, folder: Path, manifest: str, extra: dict | None
+) -> list[Path]:
+    r = scene.render
+    ckpt = FrameCheckpoint(folder, _settings_signature(scene, extra), name=manifest)
+    start, end = scene.frame_start, scene.frame_end
+    prev = (r.use_overwrite, r.use_placeholder)
+
+    def _on_write(scn, *_args):
+        if scn == scene:
+            ckpt.mark(scn.frame_current, scn.render.frame_path(frame=scn.frame_current))
+
+    try:
+        done = ckpt.verify()
+        # fichiers non vérifiés (rendu interrompu pendant l'écriture) : à refaire
+        for f in range(start, end + 1):
+            p = Path(r.frame_path(frame=f))
+            if f not in done and p.exists():
+                p.unlink()
+        todo = ckpt.missing(start, end)
+        print(f"[ARES] resume: {len(done)} frames OK, {len(todo)} à rendre ({folder})")
+        if todo:
+            r.use_overwrite = False
+            r.use_placeholder = False
+            bpy.app.handlers.render_write.append(_on_write)
+            try:
+                bpy.ops.render.render(animation=True, scene=scene.name)
+            finally:
+                bpy.app.handlers.render_write.remove(_on_write)
+    finally:
+        r.use_overwrite, r.use_placeholder = prev
+
+    missing = ckpt.missing(start, end)
+    if missing:
+        raise AresRenderError(f"Rendu incomplet: {len(missing)} frames manquantes {missing[:5]}")
+    return ckpt.files(start, end)
@@ -0,0 +1,88 @@
+"""
+Blade v13 — blender.shard
+- Découpe frame_start..frame_end en N tranches contiguës et rend chaque tranche
+  dans son propre Blender headless (même scène, même preset : snapshot .blend).
+- Vidéo : un segment MP4 par tranche, puis concat ffmpeg en stream-copy.
+- Séquence d'images : chaque enfant écrit directement ses frames (rien à joindre).
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from ares.core.blender_proc import blender_cmd, spawn_blender
+from ares.core.ffmpeg import concat_segments, find_ffmpeg
+
+
+def split_frames(frame_start: int, frame_end: int, shards: int) -> list[tuple[int, int]]:
+    """Tranches contiguës et inclusives, tailles équilibrées (écart max 1 frame)."""
+    total = frame_end - frame_start + 1
+    if total <= 0:
+        return []
+    shards = max(1, min(int(shards), total))
+    base, extra = divmod(total, shards)
+    chunks, cur = [], frame_start
+    for i in range(shards):
+        size = base + (1 if i < extra else 0)
+        chunks.append((cur, cur + size - 1))
+        cur += size
+    return chunks
+
+
+def render_sharded(scene, shards: int, threads: int | None = None) -> Path:
+    """Rend l'animation de `scene` sur `shards` process Blender parallèles.
+
+    Retourne le même chemin que le rendu mono-process (scene.render.filepath).
+    """
+    import bpy
+
+    from ares.blender.render import AresRenderError
+    from ares.blender.trace import active
+
+    r = scene.render
+    out_path = Path(bpy.path.abspath(r.filepath)).resolve()
+    video = r.is_movie_format
+    if video and find_ffmpeg() is None:
+        # pas de concat possible : on reste sur le chemin mono-process
+        print("[ARES] ffmpeg introuvable -> rendu non shardé")
+        bpy.ops.render.render(animation=True)
+        return Path(r.filepath)
+
+    chunks = split_frames(scene.frame_start, scene.frame_end, shards)
+    threads = threads or max(1, (os.cpu_count() or 1) // max(1, len(chunks)))
+
+    tmp = Path(tempfile.mkdtemp(prefix="ares_shard_"))
+    try:
+        snapshot = tmp / "snapshot.blend"
+        bpy.ops.wm.save_as_mainfile(filepath=str(snapshot), copy=True, check_existing=False)
+
+        procs, segments = [], []
+        for i, (start, end) in enumerate(chunks):
+            target = tmp / f"seg_{i:03d}{out_path.suffix}" if video else out_path
+            segments.append(target)
+            cmd = blender_cmd(
+                "-t", threads, "-o", target, "-s", start, "-e", end, "-a",
+                blend=snapshot,
+            )
+            procs.append(spawn_blender(cmd, log_path=tmp / f"seg_{i:03d}.log"))
+
+        with active().phase("shards"):  # enfants : pas de handlers, temps global seul
+            failed = [i for i, p in enumerate(procs) if p.wait() != 0]
+        if failed:
+            logs = ", ".join(str(tmp / f"seg_{i:03d}.log") for i in failed)
+            raise AresRenderError(f"Shards en échec: {failed} (logs: {logs})")
+
+        if video:
+            missing = [s for s in segments if not s.exists()]
+            if missing:
+                raise AresRenderError(f"Segments manquants: {missing}")
+            with active().phase("encode"):
+                concat_segments(segments, out_path)
+    except Exception:
+        # on garde tmp (snapshot + logs) pour le diagnostic
+        print(f"[ARES] shard: fichiers conservés dans {tmp}")
+        raise
+    shutil.rmtree(tmp, ignore_errors=True)
+    return Path(r.filepath)
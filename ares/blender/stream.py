@@ -0,0 +1,195 @@
+"""
+Blade v13 — blender.stream
+Rendu d'animation encodé en flux (sortie vidéo, sans séquence PNG) :
+- chaque frame est rendue sans écriture disque, ses pixels sont lus sur le
+  Viewer du compositor (vue convertie en espace d'affichage par un nœud
+  Convert Colorspace) dans un buffer réutilisé,
+- les frames partent en RGBA brut vers un ffmpeg externe (core.ffmpeg.
+  RawVideoEncoder) : l'encodage tourne pendant le rendu de la frame suivante,
+  file bornée (contre-pression si ffmpeg est plus lent que le rendu),
+- repli sur le writer FFMPEG de Blender si ffmpeg est absent, si la sortie
+  n'est pas une vidéo, ou si la gestion couleur n'est pas reproductible
+  (look, exposition, gamma, courbes, écran non sRGB).
+"""
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from ares.blender.trace import active, trace_render
+from ares.core.ffmpeg import RawVideoEncoder, find_ffmpeg, rawvideo_cmd
+from ares.helpers.lifecycle import new
+
+VIEWER_IMAGE = "Viewer Node"
+NODE_PREFIX = "ARES_Stream"
+PROBE_JOB = "stream_probe"  # groupe temporaire de _color_spaces (helpers.lifecycle)
+
+# view transform -> espace d'affichage équivalent (config OCIO de Blender)
+DISPLAY_SPACES = {
+    "Standard": ("sRGB",),
+    "AgX": ("AgX Base sRGB",),
+    "Filmic": ("Filmic sRGB",),
+    "Khronos PBR Neutral": ("Khronos PBR Neutral sRGB",),
+}
+SCENE_LINEAR = ("Linear Rec.709", "Linear")
+
+
+_spaces: set[str] | None = None
+
+
+def _color_spaces() -> set[str]:
+    """Espaces proposés par Convert Colorspace (nœud temporaire, lu une fois)."""
+    global _spaces
+    if _spaces is None:
+        group = new("node_groups", f"{NODE_PREFIX}_Probe", "CompositorNodeTree", job=PROBE_JOB)
+        try:
+            node = group.nodes.new("CompositorNodeConvertColorSpace")
+            prop = node.bl_rna.properties["to_color_space"]
+            _spaces = {i.identifier for i in prop.enum_items}
+        finally:
+            bpy.data.node_groups.remove(group)
+    return _spaces
+
+
+def _spaces_for(scene) -> tuple[str, str] | None:
+    """(espace linéaire de la scène, espace d'affichage de la vue) ou None."""
+    spaces = _color_spaces()
+    wanted = DISPLAY_SPACES.get(scene.view_settings.view_transform, ())
+    to_space = next((s for s in wanted if s in spaces), None)
+    from_space = next((s for s in SCENE_LINEAR if s in spaces), None)
+    return (from_space, to_space) if to_space and from_space else None
+
+
+def _plain_color_management(scene) -> bool:
+    vs, ds = scene.view_settings, scene.display_settings
+    return (
+        ds.display_device == "sRGB" and vs.look in ("None", "")
+        and vs.exposure == 0.0 and vs.gamma == 1.0 and not vs.use_curve_mapping
+    )
+
+
+def why_not_stream(scene) -> str | None:
+    """Raison du repli sur le writer de Blender, None si le flux est possible."""
+    if not scene.render.is_movie_format:
+        return "sortie non vidéo"
+    if find_ffmpeg() is None:
+        return "ffmpeg introuvable"
+    if not hasattr(scene, "node_tree"):
+        return "compositor sans node_tree"
+    if _spaces_for(scene) is None:
+        return f"view transform {scene.view_settings.view_transform} non géré"
+    if not _plain_color_management(scene):
+        return "gestion couleur non standard (look/exposition/gamma/courbes)"
+    return None
+
+
+@contextlib.contextmanager
+def _viewer_tap(scene):
+    """Viewer branché sur la sortie du compositor (ou les Render Layers), puis retiré."""
+    prev = (scene.use_nodes, scene.render.use_compositing)
+    scene.use_nodes = scene.render.use_compositing = True
+    tree = scene.node_tree
+    added = []
+    try:
+        source = None
+        comp = next((n for n in tree.nodes if n.type == "COMPOSITE"), None)
+        if comp is not None and comp.inputs[0].is_linked:
+            source = comp.inputs[0].links[0].from_socket
+        if source is None:
+            rl = tree.nodes.new("CompositorNodeRLayers")
+            rl.name = f"{NODE_PREFIX}_RL"
+            added.append(rl)
+            source = rl.outputs["Image"]
+
+        cs = tree.nodes.new("CompositorNodeConvertColorSpace")
+        cs.name = f"{NODE_PREFIX}_CS"
+        added.append(cs)
+        cs.from_color_space, cs.to_color_space = _spaces_for(scene)
+
+        viewer = tree.nodes.new("CompositorNodeViewer")
+        viewer.name = f"{NODE_PREFIX}_Viewer"
+        added.append(viewer)
+        tree.links.new(source, cs.inputs[0])
+        tree.links.new(cs.outputs[0], viewer.inputs[0])
+        tree.nodes.active = viewer
+        yield
+    finally:
+        for node in added:
+            with contextlib.suppress(ReferenceError, RuntimeError):
+                tree.nodes.remove(node)
+        scene.use_nodes, scene.render.use_compositing = prev
+
+
+class _FrameGrabber:
+    """Pixels du Viewer -> RGBA 8 bits, buffers float/uint8 alloués une fois."""
+
+    def __init__(self):
+        self.size: tuple[int, int] | None = None
+        self._f32: np.ndarray | None = None
+
+    def grab(self) -> np.ndarray:
+        img = bpy.data.images[VIEWER_IMAGE]
+        w, h = img.size
+        if self._f32 is None or self.size != (w, h):
+            self.size = (w, h)
+            self._f32 = np.empty(w * h * 4, dtype=np.float32)
+        img.pixels.foreach_get(self._f32)
+        np.multiply(self._f32, 255.0, out=self._f32)
+        np.add(self._f32, 0.5, out=self._f32)
+        np.clip(self._f32, 0.0, 255.0, out=self._f32)
+        return self._f32
+
+    @staticmethod
+    def into(buf: bytearray, pixels: np.ndarray) -> None:
+        np.copyto(np.frombuffer(buf, dtype=np.uint8), pixels, casting="unsafe")
+
+
+def render_animation_streamed(scene=None, crf: int = 20, depth: int = 3) -> Path:
+    """Rend frame_start..frame_end vers scene.render.filepath (MP4 H.264) en flux.
+
+    depth : frames en attente d'encodage au plus (mémoire = depth x W x H x 4 octets).
+    """
+    scene = scene or bpy.context.scene
+    r = scene.render
+    out = Path(bpy.path.abspath(r.filepath))
+    reason = why_not_stream(scene)
+    if reason is not None:
+        print(f"[ARES] stream: {reason} -> writer de Blender")
+        bpy.ops.render.render(animation=True, scene=scene.name)
+        return Path(r.filepath)
+
+    if not out.suffix:
+        out = out.with_suffix(".mp4")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    frame_prev = scene.frame_current
+    grabber, encoder = _FrameGrabber(), None
+    with trace_render("stream", scene, out), _viewer_tap(scene):
+        try:
+            for f in range(scene.frame_start, scene.frame_end + 1, scene.frame_step):
+                scene.frame_set(f)
+                bpy.ops.render.render(write_still=False, scene=scene.name)
+                pixels = grabber.grab()
+                if encoder is None:
+                    w, h = grabber.size
+                    fps = r.fps / r.fps_base
+                    cmd = rawvideo_cmd(out, w, h, fps, crf=crf, flip=True)
+                    encoder = RawVideoEncoder(cmd, w * h * 4, depth=depth)
+                buf = encoder.acquire()  # bloque si ffmpeg a `depth` frames de retard
+                grabber.into(buf, pixels)
+                encoder.submit(buf)
+            if encoder is not None:
+                with active().phase("encode"):
+                    encoder.close()
+        except BaseException:
+            if encoder is not None:
+                encoder.abort()
+            raise
+        finally:
+            scene.frame_set(frame_prev)
+    if encoder is not None:
+        print(f"[ARES] stream: {encoder.frames} frames -> {out} "
+              f"(attente encodeur {encoder.wait_seconds:.1f}s)")
+    return out
@@ -0,0 +1,216 @@
+"""
+Blade v13 — blender.symmetry
+Réutilisation de frames pour les orbites d'objets à symétrie de rotation :
+- analyse de la scène autour de l'axe d'orbite, instance par instance
+  (depsgraph.object_instances : instances de collection, particules,
+  Geometry Nodes comprises) : géométrie évaluée (sommets + centres de faces
+  étiquetés par matériau, foreach_get, lue une fois par objet source),
+  lumières fixes (position, direction, réglages) ; les lumières du rig
+  (enfants de la caméra/du pivot) tournent avec la vue et restent valides,
+- refus prudent : textures (matériaux, world), objets animés hors rig,
+- rendu du seul secteur unique (360/N), frames restantes en hard-link
+  (copie sinon) vers la frame équivalente, MP4 assemblé ensuite.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+import bpy
+import numpy as np
+
+from ares.blender.fingerprint import material_signature
+from ares.blender.resume import assemble_mp4, render_sequence
+from ares.core.cache import _atomic_place
+from ares.core.symmetry import MAX_ORDER, TOLERANCE, Symmetry, frame_sources, rotation_order
+
+GEOMETRY = {"MESH", "CURVE", "SURFACE", "META", "FONT"}
+LIGHT_FIELDS = ("type", "color", "energy", "shadow_soft_size", "angle",
+                "spot_size", "spot_blend", "shape", "size", "size_y")
+
+
+def _in_rig(obj, rig: set) -> bool:
+    while obj is not None:
+        if obj in rig:
+            return True
+        obj = obj.parent
+    return False
+
+
+def _textured(tree) -> bool:
+    return tree is not None and any(n.type.startswith("TEX_") for n in tree.nodes)
+
+
+def _local_geometry(ob_eval, label_of) -> tuple[np.ndarray, np.ndarray]:
+    """Sommets (étiquette 0) et centres de faces (étiquette du matériau), repère local."""
+    mesh = ob_eval.to_mesh()
+    if mesh is None:
+        return np.empty((0, 3)), np.empty(0, dtype=np.int64)
+    try:
+        nv, npoly = len(mesh.vertices), len(mesh.polygons)
+        co = np.empty(nv * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", co)
+        centers = np.empty(npoly * 3, dtype=np.float64)
+        mesh.polygons.foreach_get("center", centers)
+        mat_index = np.empty(npoly, dtype=np.int64)
+        mesh.polygons.foreach_get("material_index", mat_index)
+        slots = [label_of(s.material) for s in ob_eval.material_slots] or [label_of(None)]
+        labels = np.concatenate((
+            np.zeros(nv, dtype=np.int64),
+            np.asarray(slots, dtype=np.int64)[np.clip(mat_index, 0, len(slots) - 1)],
+        ))
+    finally:
+        ob_eval.to_mesh_clear()
+    return np.concatenate((co.reshape(-1, 3), centers.reshape(-1, 3))), labels
+
+
+def _world(local: np.ndarray, matrix) -> np.ndarray:
+    mw = np.array(matrix, dtype=np.float64)
+    return local @ mw[:3, :3].T + mw[:3, 3]
+
+
+def _light_signature(light) -> str:
+    values = {}
+    for name in LIGHT_FIELDS:
+        v = getattr(light, name, None)
+        if v is not None:
+            values[name] = v if isinstance(v, str) else np.round(np.array(v, float), 6).tolist()
+    return json.dumps(values, sort_keys=True)
+
+
+def _light_points(light, matrix, center, reach: float) -> np.ndarray:
+    """Repères d'une lumière fixe : ce qui change l'éclairage si on la tourne."""
+    mw = np.array(matrix, dtype=np.float64)
+    forward, side = mw[:3, 2] * -1.0, mw[:3, 0].copy()
+    forward /= np.linalg.norm(forward) or 1.0
+    side /= np.linalg.norm(side) or 1.0
+    if light.type == "SUN":  # direction seule
+        return np.array([center[0], center[1], 0.0]) + forward * reach
+    pos = mw[:3, 3]
+    if light.type == "POINT":
+        return pos[None, :]
+    if light.type == "AREA" and light.shape != "DISK":  # rectangle : orientation comprise
+        return np.array([pos, pos + forward * reach, pos + side * reach])
+    return np.array([pos, pos + forward * reach])
+
+
+def analyze(
+    scene: bpy.types.Scene,
+    center: Sequence[float],
+    rig: Iterable = (),
+    max_order: int = MAX_ORDER,
+    tol: float = TOLERANCE,
+) -> Symmetry:
+    """Ordre N de symétrie de la scène autour de l'axe Z passant par `center`.
+
+    rig : objets qui tournent avec la caméra (caméra, pivot) ; leurs enfants
+    (lumières attachées à la caméra...) sont ignorés de l'analyse.
+    """
+    rig = {o for o in rig if o is not None}
+    center = (float(center[0]), float(center[1]))
+    world = scene.world
+    if world is not None and world.use_nodes and _textured(world.node_tree):
+        return Symmetry(reason="world texturé (HDRI/ciel/texture)")
+
+    labels: dict[str, int] = {}
+
+    def label_of(mat) -> int:
+        return labels.setdefault(json.dumps(material_signature(mat), sort_keys=True),
+                                 len(labels) + 1)
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    points, tags, lights = [], [], []
+    local: dict[tuple[int, int], tuple[np.ndarray, np.ndarray]] = {}
+    checked: set[str] = set()
+    for inst in depsgraph.object_instances:
+        ob_eval = inst.object
+        # source de l'instance (objet de bpy.data) et instanceur éventuel
+        sources = [ob_eval.original]
+        if inst.is_instance and inst.parent is not None:
+            sources.append(inst.parent.original)
+        if any(o.hide_render or _in_rig(o, rig) for o in sources):
+            continue
+        if ob_eval.type not in GEOMETRY and ob_eval.type != "LIGHT":
+            continue
+        if (not inst.is_instance and ob_eval.is_instancer
+                and not ob_eval.original.show_instancer_for_render):
+            continue  # émetteur / porteur d'instances masqué au rendu
+        for o in sources:
+            if o.name in checked:
+                continue
+            checked.add(o.name)
+            anim = o.animation_data
+            if anim is not None and (anim.action is not None or len(anim.drivers)):
+                return Symmetry(reason=f"objet animé : {o.name}")
+        if ob_eval.type == "LIGHT":
+            lights.append((ob_eval.data, inst.matrix_world.copy()))
+            continue
+        key = (ob_eval.as_pointer(), ob_eval.data.as_pointer())
+        if key not in local:
+            for slot in ob_eval.material_slots:
+                mat = slot.material
+                if mat is not None and mat.use_nodes and _textured(mat.node_tree):
+                    return Symmetry(reason=f"matériau texturé : {mat.name}")
+            local[key] = _local_geometry(ob_eval, label_of)
+        pts, lab = local[key]
+        points.append(_world(pts, inst.matrix_world))
+        tags.append(lab)
+
+    pts = np.concatenate(points) if points else np.empty((0, 3))
+    reach = max(float(np.ptp(pts, axis=0).max()) if len(pts) else 0.0, 1.0)
+    offset = len(labels) + 1
+    light_labels: dict[str, int] = {}
+    for light, matrix in lights:
+        tag = offset + light_labels.setdefault(_light_signature(light), len(light_labels))
+        lp = _light_points(light, matrix, center, reach).reshape(-1, 3)
+        points.append(lp)
+        tags.append(np.full(len(lp), tag, dtype=np.int64))
+    if not points:
+        return Symmetry(reason="scène vide")
+
+    order = rotation_order(
+        np.concatenate(points), np.concatenate(tags), center=center,
+        max_order=max_order, tol=tol,
+    )
+    details = {"points": int(sum(len(p) for p in points)), "lights": len(lights)}
+    if order > 1:
+        return Symmetry(order, details=details)
+    return Symmetry(reason="aucune symétrie (géométrie, matériaux ou lumières fixes)",
+                    details=details)
+
+
+def render_symmetric(
+    scene: bpy.types.Scene, period: int, order: int, extra: dict | None = None
+) -> Path:
+    """Rend le premier secteur de frame_start..frame_end, complète le reste par réutilisation.
+
+    period : frames par tour (la vue de frame_start + period est celle de frame_start).
+    Sortie vidéo : séquence reprenable (ares.blender.resume) puis MP4 assemblé.
+    """
+    r = scene.render
+    start, end = scene.frame_start, scene.frame_end
+    sources = frame_sources(start, end, period, order)
+    target = Path(bpy.path.abspath(r.filepath)).resolve()
+    movie = r.is_movie_format
+    folder = target.with_name(target.stem + "_frames")
+    rendered = min(sources, default=end + 1) - start
+    print(f"[ARES] symmetry: ordre {order}, {rendered} frames rendues, {len(sources)} réutilisées")
+
+    scene.frame_end = start + rendered - 1
+    try:
+        if movie:
+            render_sequence(scene, folder, extra)
+        else:
+            bpy.ops.render.render(animation=True, scene=scene.name)
+    finally:
+        scene.frame_end = end
+
+    def path(f: int) -> Path:
+        return folder / f"frame_{f:04d}.png" if movie else Path(r.frame_path(frame=f))
+
+    for f, src in sources.items():
+        _atomic_place(path(src), path(f), link=True)
+    if not movie:
+        return target
+    return assemble_mp4(scene, [path(f) for f in range(start, end + 1)], target)
@@ -0,0 +1,141 @@
+"""
+Blade v13 — blender.trace
+Instrumentation par frame des rendus ares (ARES_TRACE=1) :
+- trace_render(label) entoure un point d'entrée de rendu : handlers
+  frame_change_pre/post et render_init/pre/post/write/complete/cancel posés
+  le temps du bloc, puis rapport JSON-lines (ares.core.render_trace) et
+  résumé imprimé,
+- réentrant : un trace_render imbriqué réutilise la trace en cours,
+- tracer.phase("encode") mesure une étape hors frames (assemblage MP4...),
+- désactivé : aucun handler posé, un simple test de variable d'environnement.
+"""
+from __future__ import annotations
+
+import contextlib
+import time
+from pathlib import Path
+
+import bpy
+
+from ares.core.render_trace import (
+    FrameTimeline,
+    enabled,
+    format_summary,
+    peak_rss_mb,
+    write_report,
+)
+
+
+class _NullTracer:
+    timeline = None
+    report = None
+
+    def phase(self, name: str):
+        return contextlib.nullcontext()
+
+
+NULL = _NullTracer()
+
+
+class Tracer:
+    def __init__(self, label: str, scene=None):
+        self.timeline = FrameTimeline(label)
+        self.scene = scene
+        self.report: Path | None = None
+        self._handlers = [
+            ("frame_change_pre", self._on_event("frame_change_pre")),
+            ("frame_change_post", self._on_event("frame_change_post")),
+            ("render_init", self._on_init),
+            ("render_pre", self._on_event("render_pre")),
+            ("render_post", self._on_event("render_post")),
+            ("render_write", self._on_write),
+            ("render_complete", self._on_end),
+            ("render_cancel", self._on_end),
+        ]
+
+    # --- handlers -----------------------------------------------------------
+    def _ours(self, scene) -> bool:
+        # scène temporaire (assemblage VSE...) : comptée dans sa phase, pas en frames
+        return self.scene is None or scene == self.scene
+
+    def _on_event(self, name: str):
+        def handler(scene, *_args):
+            if self._ours(scene):
+                self.timeline.event(name, scene.frame_current)
+        return handler
+
+    def _on_init(self, scene, *_args):
+        if self._ours(scene):
+            self.timeline.begin_pass()
+
+    def _on_write(self, scene, *_args):
+        if not self._ours(scene):
+            return
+        rec = self.timeline.event("render_write", scene.frame_current)
+        if rec is None:
+            return
+        rec["peak_rss_mb"] = peak_rss_mb()
+        r = scene.render
+        if not r.is_movie_format:
+            with contextlib.suppress(OSError):
+                path = Path(bpy.path.abspath(r.frame_path(frame=scene.frame_current)))
+                rec["bytes"] = path.stat().st_size
+
+    def _on_end(self, scene, *_args):
+        if self._ours(scene):
+            self.timeline.end_pass()
+
+    # --- cycle de vie -------------------------------------------------------
+    def install(self) -> None:
+        for name, fn in self._handlers:
+            getattr(bpy.app.handlers, name).append(fn)
+
+    def uninstall(self) -> None:
+        for name, fn in self._handlers:
+            with contextlib.suppress(ValueError):
+                getattr(bpy.app.handlers, name).remove(fn)
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timeline.add_phase(name, time.perf_counter() - t0)
+
+    def close(self, output: str | Path | None = None) -> Path:
+        scene = self.scene or bpy.context.scene
+        target = Path(bpy.path.abspath(str(output) if output else scene.render.filepath))
+        if target.is_file():
+            self.timeline.output_bytes = target.stat().st_size
+        self.report = write_report(self.timeline)
+        print(format_summary(self.timeline.summary()) + f" • {self.report}")
+        return self.report
+
+
+_active: Tracer | None = None
+
+
+def active() -> Tracer | _NullTracer:
+    """Trace en cours (NULL hors trace_render ou si désactivé)."""
+    return _active or NULL
+
+
+@contextlib.contextmanager
+def trace_render(label: str, scene=None, output: str | Path | None = None):
+    """Trace les frames rendues dans le bloc si ARES_TRACE est actif."""
+    global _active
+    if _active is not None or not enabled():
+        yield active()
+        return
+    tracer = _active = Tracer(label, scene)
+    tracer.install()
+    try:
+        yield tracer
+    finally:
+        tracer.uninstall()
+        _active = None
+        try:
+            tracer.close(output)
+        except Exception as e:  # le rapport ne doit jamais faire échouer un rendu
+            print(f"[ARES] trace: rapport non écrit ({e})")
@@ -0,0 +1,18 @@
+# Blade v13 — config (config/*.yaml fusionnés, validés, compilés et mis en cache)
+from .loader import clear, deep_merge, get, load
+from .schema import (
+    Config,
+    ConfigError,
+    Deliverable,
+    EeveeConfig,
+    ExportProfile,
+    OutputConfig,
+    Resolution,
+    TurntablePreset,
+)
+
+__all__ = [
+    "get", "load", "clear", "deep_merge",
+    "Config", "ConfigError", "OutputConfig", "EeveeConfig", "Resolution", "TurntablePreset",
+    "Deliverable", "ExportProfile",
+]
@@ -0,0 +1,185 @@
+"""
+Blade v13 — config.loader
+Chargement de config/*.yaml en une fois :
+- `<nom>_defaults.yaml` puis `<nom>_overrides.yaml` fusionnés (deep merge) dans
+  la section `<nom>` ; les autres fichiers donnent la section `<stem>`,
+- forme fusionnée mise en cache JSON (renders/.cache/config/) avec mtime/taille
+  et sha256 des sources : pas de parsing YAML tant que rien ne change
+  (Blender n'embarque pas PyYAML : il lit ce cache),
+- Config compilée gardée en mémoire par dossier ; get() ne fait que des stat().
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+
+from .schema import DEFAULTS, Config, ConfigError
+
+CACHE_VERSION = 1
+_SUFFIXES = ("_defaults", "_overrides")
+
+_compiled: dict[str, tuple] = {}  # dossier -> (mtime, fichiers, stamp, Config)
+
+
+def default_config_dir() -> Path:
+    env = os.environ.get("ARES_CONFIG_DIR")
+    if env:
+        return Path(env)
+    from ares.core.paths import ROOT
+
+    return ROOT / "config"
+
+
+def default_cache_dir() -> Path:
+    env = os.environ.get("ARES_CONFIG_CACHE")
+    if env:
+        return Path(env)
+    from ares.core.paths import ROOT
+
+    return ROOT / "renders" / ".cache" / "config"
+
+
+def deep_merge(base: Mapping, override: Mapping) -> dict:
+    """Fusion récursive : les mappings se combinent, le reste est remplacé."""
+    out = dict(base)
+    for key, value in override.items():
+        if isinstance(value, Mapping) and isinstance(out.get(key), Mapping):
+            out[key] = deep_merge(out[key], value)
+        else:
+            out[key] = value
+    return out
+
+
+def section_of(path: Path) -> tuple[str, int]:
+    """(section, rang) : defaults (0) avant fichier seul (1) avant overrides (2)."""
+    stem = path.stem
+    for rank, suffix in ((0, _SUFFIXES[0]), (2, _SUFFIXES[1])):
+        if stem.endswith(suffix):
+            return stem[: -len(suffix)], rank
+    return stem, 1
+
+
+def _sources(config_dir: Path) -> list[Path]:
+    files = list(config_dir.glob("*.yaml")) + list(config_dir.glob("*.yml"))
+    return sorted(files, key=lambda p: (*section_of(p), p.name))
+
+
+def _stamp(files: list[Path]) -> tuple:
+    out = []
+    for p in files:
+        st = p.stat()
+        out.append((p.name, st.st_mtime_ns, st.st_size))
+    return tuple(out)
+
+
+def _digest(files: list[Path]) -> str:
+    h = hashlib.sha256()
+    for p in files:
+        h.update(p.name.encode("utf-8") + b"\0")
+        h.update(p.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _parse(files: list[Path]) -> dict:
+    import yaml  # type: ignore
+
+    sections: dict = {}
+    for p in files:
+        with open(p, encoding="utf-8-sig") as f:
+            data = yaml.safe_load(f) or {}
+        if not isinstance(data, Mapping):
+            raise ConfigError(f"{p.name}: mapping attendu à la racine")
+        name, _ = section_of(p)
+        sections[name] = deep_merge(sections.get(name, {}), data)
+    return sections
+
+
+def cache_path(config_dir: Path, cache_dir: Path | None = None) -> Path:
+    key = hashlib.sha256(str(Path(config_dir).resolve()).encode("utf-8")).hexdigest()[:12]
+    return (cache_dir or default_cache_dir()) / f"config-{key}.json"
+
+
+def _read_cache(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if data.get("version") == CACHE_VERSION else {}
+
+
+def _write_cache(path: Path, stamp: tuple, digest: str, sections: dict) -> None:
+    payload = {"version": CACHE_VERSION, "stamp": [list(s) for s in stamp],
+               "digest": digest, "sections": sections}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache facultatif (dossier en lecture seule...)
+
+
+def load(config_dir: str | os.PathLike | None = None, cache_dir=None) -> Config:
+    """Compile la config de `config_dir` (sans cache mémoire ; voir get())."""
+    config_dir = Path(config_dir) if config_dir is not None else default_config_dir()
+    files = _sources(config_dir) if config_dir.is_dir() else []
+    if not files:
+        return Config.compile(DEFAULTS, digest="defaults", sources=())
+    stamp = _stamp(files)
+    names = [p.name for p in files]
+
+    cpath = cache_path(config_dir, Path(cache_dir) if cache_dir is not None else None)
+    cached = _read_cache(cpath)
+    if cached and tuple(tuple(s) for s in cached["stamp"]) == stamp:
+        return Config.compile(cached["sections"], cached["digest"], names)
+
+    digest = _digest(files)
+    if cached and cached.get("digest") == digest:  # touché mais identique
+        _write_cache(cpath, stamp, digest, cached["sections"])
+        return Config.compile(cached["sections"], digest, names)
+
+    try:
+        sections = _parse(files)
+    except ImportError:
+        if cached:
+            print(f"[ARES] config: PyYAML absent, cache périmé utilisé ({cpath.name})")
+            return Config.compile(cached["sections"], cached["digest"], names)
+        print("[ARES] config: PyYAML absent et aucun cache, valeurs embarquées")
+        return Config.compile(DEFAULTS, digest="defaults", sources=())
+    sections = deep_merge(DEFAULTS, sections)
+    config = Config.compile(sections, digest, names)  # valide avant de mettre en cache
+    _write_cache(cpath, stamp, digest, sections)
+    return config
+
+
+def get(config_dir: str | os.PathLike | None = None) -> Config:
+    """Config compilée, recompilée seulement si le dossier ou un fichier a changé.
+
+    Un appel sans changement coûte quelques stat() (pas de glob ni de parsing).
+    """
+    config_dir = Path(config_dir) if config_dir is not None else default_config_dir()
+    key = os.fspath(config_dir)
+    try:
+        dir_mtime = config_dir.stat().st_mtime_ns  # ajout/suppression de fichier
+    except OSError:
+        dir_mtime = None
+    hit = _compiled.get(key)
+    if hit is not None and hit[0] == dir_mtime:
+        try:
+            if _stamp(hit[1]) == hit[2]:
+                return hit[3]
+        except OSError:
+            pass
+    files = _sources(config_dir) if dir_mtime is not None else []
+    stamp = _stamp(files)
+    config = load(config_dir)
+    _compiled[key] = (dir_mtime, files, stamp, config)
+    return config
+
+
+def clear() -> None:
+    _compiled.clear()
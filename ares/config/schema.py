@@ -0,0 +1,355 @@
+"""
+Blade v13 — config.schema
+Objets figés issus de config/*.yaml (après fusion defaults + overrides) :
+- TurntablePreset, ExportProfile, Resolution, Deliverable, OutputConfig,
+  EeveeConfig, Config,
+- freeze() : dict -> MappingProxyType, list -> tuple (récursif),
+- DEFAULTS : valeurs embarquées si aucun fichier ni cache n'est lisible.
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+
+from ares.core.deliverables import KINDS, output_path
+
+EMPTY: Mapping = MappingProxyType({})
+
+
+def _empty() -> Mapping:
+    return EMPTY
+
+DEFAULTS = {
+    "render_output": {
+        "format": "FFMPEG",
+        "filepath": "//renders/out.mp4",
+        "use_file_extension": True,
+        "ffmpeg": {"format": "MPEG4", "codec": "H264", "audio_codec": "AAC",
+                   "ffmpeg_preset": "GOOD", "constant_rate_factor": "MEDIUM"},
+        "video": {"bitrate": 8000, "maxrate": 12000, "gopsize": 12},
+        "audio": {"use_audio": True, "audio_mixrate": 48000, "audio_channels": "STEREO",
+                  "audio_bitrate": 192},
+        "deliverables": [{"kind": "mp4"}, {"kind": "poster", "frame": "first"}],
+    },
+    "turntable_presets": {
+        "FAST": {"seconds": 0.75, "fps": 24, "radius": 2.2, "samples": 16},
+        "NORMAL": {"seconds": 2.0, "fps": 24, "radius": 2.5, "samples": 32},
+        "FULL": {"seconds": 4.0, "fps": 24, "radius": 3.0, "samples": 64},
+    },
+    "export_profiles": {
+        "FULL": {"lods": [1.0], "lod_mode": "files", "compression": "none"},
+    },
+}
+
+_BASE = Path("out")  # nom de base fictif : détection des sorties en double
+
+# Enums RNA dont les identifiants sont des nombres écrits en texte
+_ENUM_SIZES = {"shadow_cube_size", "shadow_cascade_size", "shadow_pool_size"}
+
+LOD_MODES = ("files", "msft_lod")
+COMPRESSIONS = ("none", "draco", "meshopt")
+
+
+class ConfigError(ValueError):
+    """Config invalide (section, clé et valeur fautives dans le message)."""
+
+
+def freeze(value):
+    if isinstance(value, Mapping):
+        return MappingProxyType({str(k): freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Inverse de freeze() (dict/list modifiables, sérialisables en JSON)."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _section(data: Mapping, key: str, where: str) -> Mapping:
+    value = data.get(key) or {}
+    if not isinstance(value, Mapping):
+        raise ConfigError(f"{where}.{key}: mapping attendu, reçu {type(value).__name__}")
+    return value
+
+
+def _number(data: Mapping, key: str, kind, where: str, default=None):
+    value = data.get(key, default)
+    if value is None:
+        raise ConfigError(f"{where}.{key}: valeur manquante")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ConfigError(f"{where}.{key}: nombre attendu, reçu {value!r}")
+    if value <= 0:
+        raise ConfigError(f"{where}.{key}: doit être > 0 (reçu {value!r})")
+    return kind(value)
+
+
+@dataclass(frozen=True)
+class TurntablePreset:
+    seconds: float
+    fps: int
+    radius: float
+    samples: int
+
+    @classmethod
+    def parse(cls, data: Mapping, where: str) -> TurntablePreset:
+        return cls(
+            seconds=_number(data, "seconds", float, where),
+            fps=_number(data, "fps", int, where),
+            radius=_number(data, "radius", float, where),
+            samples=_number(data, "samples", int, where),
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class ExportProfile:
+    lods: tuple[float, ...] = (1.0,)  # ratio de triangles par LOD, décroissant
+    lod_mode: str = "files"  # files : <nom>_LOD<n>.glb ; msft_lod : un .glb (MSFT_lod)
+    compression: str = "none"  # none | draco (exporteur Blender) | meshopt (gltfpack)
+    draco_level: int = 6
+    texture_max: int | None = None  # côté max des textures en px (None : inchangées)
+    coverage: tuple[float, ...] | None = None  # MSFT_screencoverage (None : déduit des lods)
+
+    @classmethod
+    def parse(cls, data: Mapping, where: str) -> ExportProfile:
+        lods = data.get("lods", [1.0])
+        if not isinstance(lods, (list, tuple)) or not lods:
+            raise ConfigError(f"{where}.lods: liste de ratios attendue, reçu {lods!r}")
+        lods = tuple(_number({"lods": r}, "lods", float, where) for r in lods)
+        if any(r > 1 for r in lods) or any(b >= a for a, b in zip(lods, lods[1:], strict=False)):
+            raise ConfigError(f"{where}.lods: ratios dans ]0, 1] et décroissants ({lods!r})")
+        lod_mode = str(data.get("lod_mode", "files"))
+        if lod_mode not in LOD_MODES:
+            raise ConfigError(f"{where}.lod_mode: {lod_mode!r} inconnu (dispo : {LOD_MODES})")
+        compression = str(data.get("compression", "none"))
+        if compression not in COMPRESSIONS:
+            raise ConfigError(
+                f"{where}.compression: {compression!r} inconnu (dispo : {COMPRESSIONS})"
+            )
+        level = data.get("draco_level", 6)
+        if isinstance(level, bool) or not isinstance(level, int) or not 0 <= level <= 10:
+            raise ConfigError(f"{where}.draco_level: entier de 0 à 10 attendu, reçu {level!r}")
+        texture_max = data.get("texture_max")
+        if texture_max is not None:
+            texture_max = _number(data, "texture_max", int, where)
+        coverage = data.get("coverage")
+        if coverage is not None:
+            if not isinstance(coverage, (list, tuple)) or len(coverage) != len(lods):
+                raise ConfigError(f"{where}.coverage: une valeur par LOD attendue ({coverage!r})")
+            coverage = tuple(float(c) for c in coverage)
+        return cls(lods=lods, lod_mode=lod_mode, compression=compression, draco_level=level,
+                   texture_max=texture_max, coverage=coverage)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class Resolution:
+    x: int
+    y: int
+    percent: int = 100
+
+
+# (livrable, option) -> bornes entières incluses ; les autres options : nombre > 0
+OPTION_RANGES = {
+    ("mp4", "crf"): (0, 51),  # libx264, 0 : sans perte
+    ("webm", "crf"): (0, 63),  # libvpx-vp9
+    ("webp", "quality"): (0, 100),
+}
+
+
+@dataclass(frozen=True)
+class Deliverable:
+    kind: str  # clé de ares.core.deliverables.KINDS
+    options: Mapping = field(default_factory=_empty)
+    suffix: str | None = None  # None : suffixe par défaut du kind
+
+    @classmethod
+    def parse(cls, data, where: str) -> Deliverable:
+        if isinstance(data, str):
+            data = {"kind": data}
+        if not isinstance(data, Mapping):
+            raise ConfigError(f"{where}: mapping ou nom attendu, reçu {data!r}")
+        kind = str(data.get("kind", ""))
+        if kind not in KINDS:
+            raise ConfigError(f"{where}.kind: {kind!r} inconnu (dispo : {sorted(KINDS)})")
+        allowed = KINDS[kind][2]
+        options = {k: v for k, v in data.items() if k not in ("kind", "suffix")}
+        unknown = sorted(set(options) - set(allowed))
+        if unknown:
+            raise ConfigError(f"{where}: options {unknown} non gérées par {kind} ({allowed})")
+        for key, value in options.items():
+            bounds = OPTION_RANGES.get((kind, key))
+            if bounds is not None:
+                lo, hi = bounds
+                if isinstance(value, bool) or not isinstance(value, int) or not lo <= value <= hi:
+                    raise ConfigError(
+                        f"{where}.{key}: entier de {lo} à {hi} attendu, reçu {value!r}"
+                    )
+            elif key != "frame":
+                _number(options, key, type(value), where)
+            elif value not in ("first", "middle", "last") and not (
+                isinstance(value, int) and not isinstance(value, bool) and value >= 0
+            ):
+                raise ConfigError(f"{where}.frame: index >= 0 ou first/middle/last ({value!r})")
+        suffix = data.get("suffix")
+        return cls(kind=kind, options=freeze(options),
+                   suffix=None if suffix is None else str(suffix))
+
+
+@dataclass(frozen=True)
+class OutputConfig:
+    format: str = "FFMPEG"
+    filepath: str = "//renders/out.mp4"
+    use_file_extension: bool = True
+    ffmpeg: Mapping = field(default_factory=_empty)
+    video: Mapping = field(default_factory=_empty)
+    audio: Mapping = field(default_factory=_empty)
+    resolution: Resolution | None = None
+    fps: int | None = None
+    deliverables: tuple[Deliverable, ...] = ()
+
+    @classmethod
+    def parse(cls, data: Mapping, where: str = "render_output") -> OutputConfig:
+        res = None
+        block = _section(data, "resolution", where)
+        if block:
+            name = str(block.get("preset", "HD"))
+            chosen = _section(block, name, f"{where}.resolution")
+            if not chosen:
+                raise ConfigError(f"{where}.resolution.preset: {name!r} non défini")
+            w = f"{where}.resolution.{name}"
+            res = Resolution(
+                x=_number(chosen, "x", int, w),
+                y=_number(chosen, "y", int, w),
+                percent=_number(chosen, "percent", int, w, 100),
+            )
+        fps = _number(data, "fps", int, where) if data.get("fps") is not None else None
+        items = data.get("deliverables") or ()
+        if isinstance(items, (str, Mapping)) or not isinstance(items, (list, tuple)):
+            raise ConfigError(f"{where}.deliverables: liste attendue, reçu {items!r}")
+        deliverables = tuple(
+            Deliverable.parse(d, f"{where}.deliverables[{i}]") for i, d in enumerate(items)
+        )
+        names = [output_path(_BASE, d.kind, d.suffix).name for d in deliverables]
+        clash = sorted({n for n in names if names.count(n) > 1})
+        if clash:
+            raise ConfigError(f"{where}.deliverables: sorties en double {clash} (voir `suffix`)")
+        return cls(
+            format=str(data.get("format", "FFMPEG")),
+            filepath=str(data.get("filepath", "//renders/out.mp4")),
+            use_file_extension=bool(data.get("use_file_extension", True)),
+            ffmpeg=freeze(_section(data, "ffmpeg", where)),
+            video=freeze(_section(data, "video", where)),
+            audio=freeze(_section(data, "audio", where)),
+            resolution=res,
+            fps=fps,
+            deliverables=deliverables,
+        )
+
+    def render_settings(self) -> dict:
+        """Sous-arbre `render` pour blender.capabilities.apply_settings (hors filepath)."""
+        ff = dict(self.ffmpeg)
+        ff.update(self.video)  # bitrate/maxrate/gopsize : propriétés FFmpegSettings
+        if self.audio.get("use_audio", True):
+            for k in ("audio_mixrate", "audio_channels", "audio_bitrate"):
+                if k in self.audio:
+                    ff[k] = self.audio[k]
+        else:
+            ff["audio_codec"] = "NONE"
+        out = {
+            "image_settings": {"file_format": self.format},
+            "use_file_extension": self.use_file_extension,
+            "ffmpeg": ff,
+        }
+        if self.resolution is not None:
+            out["resolution_x"] = self.resolution.x
+            out["resolution_y"] = self.resolution.y
+            out["resolution_percentage"] = self.resolution.percent
+        if self.fps is not None:
+            out["fps"] = self.fps
+        return out
+
+
+@dataclass(frozen=True)
+class EeveeConfig:
+    eevee: Mapping = field(default_factory=_empty)
+    color_management: Mapping = field(default_factory=_empty)
+    world_defaults: Mapping = field(default_factory=_empty)
+
+    @classmethod
+    def parse(cls, data: Mapping, where: str = "render_eevee") -> EeveeConfig:
+        eevee = {
+            k: str(v) if k in _ENUM_SIZES and isinstance(v, int) else v
+            for k, v in _section(data, "eevee", where).items()
+        }
+        return cls(
+            eevee=freeze(eevee),
+            color_management=freeze(_section(data, "color_management", where)),
+            world_defaults=freeze(_section(data, "world_defaults", where)),
+        )
+
+    def scene_settings(self) -> dict:
+        """Preset scène pour blender.capabilities.apply_settings."""
+        return {"eevee": dict(self.eevee), "view_settings": dict(self.color_management)}
+
+
+@dataclass(frozen=True)
+class Config:
+    output: OutputConfig
+    eevee: EeveeConfig
+    turntable: Mapping  # nom -> TurntablePreset
+    exports: Mapping = field(default_factory=_empty)  # nom -> ExportProfile
+    sections: Mapping = field(default_factory=_empty)  # sections fusionnées, y c. non typées
+    digest: str = ""
+    sources: tuple[str, ...] = ()
+
+    @classmethod
+    def compile(cls, sections: Mapping, digest: str = "", sources=()) -> Config:
+        presets = _section(sections, "turntable_presets", "config")
+        turntable = {
+            str(name).upper(): TurntablePreset.parse(
+                _section(presets, name, "turntable_presets"), f"turntable_presets.{name}"
+            )
+            for name in presets
+        }
+        profiles = _section(sections, "export_profiles", "config")
+        exports = {
+            str(name).upper(): ExportProfile.parse(
+                _section(profiles, name, "export_profiles"), f"export_profiles.{name}"
+            )
+            for name in profiles
+        }
+        return cls(
+            output=OutputConfig.parse(_section(sections, "render_output", "config")),
+            eevee=EeveeConfig.parse(_section(sections, "render_eevee", "config")),
+            turntable=MappingProxyType(turntable),
+            exports=MappingProxyType(exports),
+            sections=freeze(sections),
+            digest=digest,
+            sources=tuple(sources),
+        )
+
+    def preset(self, name: str) -> TurntablePreset:
+        key = name.upper()
+        if key not in self.turntable:
+            raise KeyError(f"Preset inconnu: {name!r} (dispo: {sorted(self.turntable)})")
+        return self.turntable[key]
+
+    def export_profile(self, name: str) -> ExportProfile:
+        key = name.upper()
+        if key not in self.exports:
+            raise KeyError(f"Profil d'export inconnu: {name!r} (dispo: {sorted(self.exports)})")
+        return self.exports[key]
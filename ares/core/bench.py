@@ -0,0 +1,157 @@
+"""
+Blade v13 — core.bench
+Résultats de benchmark et comparaison à une baseline (pas de bpy ici) :
+- empreinte d'environnement (machine, OS, Python, Blender, commit),
+- statistiques par workload (médiane, moyenne, écart-type),
+- régression = current plus lent que la baseline de façon significative
+  (Mann-Whitney U exact, unilatéral, p < alpha) ET d'au moins `threshold`
+  en médiane : ni bruit ni écart négligeable ne sont signalés.
+Stockage : reports/bench/ (run_<date>.json, baseline.json).
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Sequence
+from functools import cache
+from pathlib import Path
+
+from ares.core.paths import ROOT
+
+# champs d'empreinte qui rendent deux runs incomparables s'ils diffèrent
+COMPARABLE_KEYS = ("machine", "system", "cpu_count", "blender", "engine", "device")
+
+
+def default_bench_dir() -> Path:
+    return Path(os.environ.get("ARES_BENCH_DIR") or ROOT / "reports" / "bench")
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def fingerprint(**extra) -> dict:
+    """Empreinte de l'environnement ; `extra` : blender, engine, device..."""
+    from ares import __version__
+
+    return {
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "ares": __version__,
+        "commit": _git_commit(),
+        **extra,
+    }
+
+
+def summarize(runs: Sequence[float]) -> dict:
+    runs = [float(r) for r in runs]
+    return {
+        "runs": runs,
+        "median": statistics.median(runs),
+        "mean": statistics.fmean(runs),
+        "stdev": statistics.stdev(runs) if len(runs) > 1 else 0.0,
+        "min": min(runs),
+    }
+
+
+@cache
+def _u_counts(m: int, n: int) -> tuple[int, ...]:
+    """Nombre d'arrangements par valeur de U (paires b > a), m valeurs a, n valeurs b."""
+    if m == 0 or n == 0:
+        return (1,)
+    # le plus grand élément est un b (il dépasse les m a) ou un a
+    with_b, with_a = _u_counts(m, n - 1), _u_counts(m - 1, n)
+    counts = [0] * (m * n + 1)
+    for u, c in enumerate(with_b):
+        counts[u + m] += c
+    for u, c in enumerate(with_a):
+        counts[u] += c
+    return tuple(counts)
+
+
+def mann_whitney(a: Sequence[float], b: Sequence[float]) -> tuple[float, float]:
+    """p-values exactes (unilatérales) : (b > a, b < a). Ex-aequo comptés 1/2."""
+    m, n = len(a), len(b)
+    if not m or not n:
+        return 1.0, 1.0
+    u = sum((y > x) + 0.5 * (y == x) for x in a for y in b)
+    counts = _u_counts(m, n)
+    total = sum(counts)
+    greater = sum(c for k, c in enumerate(counts) if k >= u) / total
+    less = sum(c for k, c in enumerate(counts) if k <= u) / total
+    return greater, less
+
+
+def comparable(baseline: dict, current: dict) -> list[str]:
+    """Champs d'empreinte qui diffèrent (liste vide : comparaison valable)."""
+    fa, fb = baseline.get("fingerprint", {}), current.get("fingerprint", {})
+    return [k for k in COMPARABLE_KEYS if fa.get(k) != fb.get(k)]
+
+
+def compare(baseline: dict, current: dict, alpha: float = 0.05,
+            threshold: float = 0.05) -> list[dict]:
+    """Une ligne par workload : status regression | improvement | ok | new | missing."""
+    base, cur = baseline.get("results", {}), current.get("results", {})
+    rows = []
+    for name in list(cur) + [k for k in base if k not in cur]:
+        row = {"name": name, "base": None, "median": None, "ratio": None, "p": None}
+        if name not in base:
+            rows.append(dict(row, median=cur[name]["median"], status="new"))
+            continue
+        if name not in cur:
+            rows.append(dict(row, base=base[name]["median"], status="missing"))
+            continue
+        b, c = base[name], cur[name]
+        ratio = c["median"] / b["median"] if b["median"] else float("inf")
+        slower, faster = mann_whitney(b["runs"], c["runs"])
+        status = "ok"
+        if slower < alpha and ratio >= 1 + threshold:
+            status = "regression"
+        elif faster < alpha and ratio <= 1 - threshold:
+            status = "improvement"
+        rows.append(dict(
+            row, base=b["median"], median=c["median"], ratio=round(ratio, 4),
+            p=round(slower if ratio >= 1 else faster, 5), status=status,
+        ))
+    return rows
+
+
+def format_table(rows: Sequence[dict]) -> str:
+    def cell(v, fmt):
+        return "-" if v is None else format(v, fmt)
+
+    lines = [f"{'workload':<20} {'base':>10} {'current':>10} {'ratio':>7} {'p':>8}  status"]
+    for r in rows:
+        lines.append(
+            f"{r['name']:<20} {cell(r['base'], '.4f'):>10} {cell(r['median'], '.4f'):>10} "
+            f"{cell(r['ratio'], '.3f'):>7} {cell(r['p'], '.4f'):>8}  {r['status']}"
+        )
+    return "\n".join(lines)
+
+
+def load_results(path: str | os.PathLike) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def save_results(results: dict, folder: str | os.PathLike | None = None,
+                 name: str | None = None) -> Path:
+    folder = Path(folder or default_bench_dir())
+    folder.mkdir(parents=True, exist_ok=True)
+    path = folder / (name or f"run_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    return path
@@ -0,0 +1,81 @@
+"""
+Blade v13 — core.blender_proc
+- Localise l'exécutable Blender et construit/lance des process headless (-b).
+- Pas d'import bpy au niveau module : utilisable hors Blender (queue, tests, CI).
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+
+def find_blender() -> str | None:
+    """BLENDER_EXE > bpy.app.binary_path (si on tourne dans Blender) > PATH."""
+    exe = os.environ.get("BLENDER_EXE")
+    if exe and Path(exe).is_file():
+        return exe
+    bpy = sys.modules.get("bpy")
+    binary = getattr(getattr(bpy, "app", None), "binary_path", "") if bpy else ""
+    if binary and Path(binary).is_file():
+        return binary
+    return shutil.which("blender")
+
+
+def blender_cmd(
+    *args,
+    blend: str | os.PathLike | None = None,
+    script: str | os.PathLike | None = None,
+    script_args: Sequence = (),
+    factory_startup: bool = False,
+    exe: str | None = None,
+) -> list[str]:
+    """Construit `blender -b [--factory-startup] [file.blend] <args> [-P script -- script_args]`.
+
+    L'ordre compte : Blender traite ses arguments séquentiellement (le .blend
+    doit précéder -o/-s/-e/-a).
+    """
+    exe = exe or find_blender()
+    if exe is None:
+        raise FileNotFoundError("Blender introuvable. Renseigne BLENDER_EXE ou ajoute-le au PATH.")
+    cmd = [exe, "-b", "-noaudio"]
+    if factory_startup:
+        cmd.append("--factory-startup")
+    if blend is not None:
+        cmd.append(str(blend))
+    cmd += [str(a) for a in args]
+    if script is not None:
+        cmd += ["-P", str(script)]
+    if script_args:
+        cmd += ["--", *(str(a) for a in script_args)]
+    return cmd
+
+
+def child_env(extra: dict | None = None) -> dict:
+    """Environnement du process enfant : la racine du repo est ajoutée au PYTHONPATH."""
+    from ares.core.paths import ROOT
+
+    env = dict(os.environ)
+    parts = [str(ROOT)] + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p]
+    env["PYTHONPATH"] = os.pathsep.join(dict.fromkeys(parts))
+    if extra:
+        env.update({k: str(v) for k, v in extra.items()})
+    return env
+
+
+def spawn_blender(
+    cmd: Sequence[str], *, log_path: Path | None = None, **popen_kw
+) -> subprocess.Popen:
+    """Lance un Blender headless ; stdout/stderr vers `log_path` si fourni."""
+    popen_kw.setdefault("env", child_env())
+    if log_path is None:
+        return subprocess.Popen(list(cmd), **popen_kw)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    # l'enfant hérite du descripteur : on peut fermer le nôtre dès le spawn
+    with open(log_path, "w", encoding="utf-8") as log:
+        popen_kw.setdefault("stdout", log)
+        popen_kw.setdefault("stderr", subprocess.STDOUT)
+        return subprocess.Popen(list(cmd), **popen_kw)
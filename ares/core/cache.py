@@ -0,0 +1,183 @@
+"""
+Blade v13 — core.cache
+- Store adressé par contenu pour les rendus : clé = empreinte des entrées
+  (voir ares.blender.fingerprint), valeur = fichier de sortie.
+- Écritures atomiques (tmp + os.replace), quota en octets, éviction LRU.
+- Un hit matérialise la sortie par hard-link (copie en fallback).
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_QUOTA = 10 * 1024**3  # 10 Gio
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+    quota: int
+
+
+def _default_root() -> Path:
+    from ares.core.paths import ROOT
+
+    return Path(os.environ.get("ARES_RENDER_CACHE") or ROOT / "renders" / ".cache")
+
+
+def _default_quota() -> int:
+    mb = os.environ.get("ARES_RENDER_CACHE_QUOTA_MB")
+    return int(float(mb) * 1024 * 1024) if mb else DEFAULT_QUOTA
+
+
+def _atomic_place(src: Path, dest: Path, link: bool) -> None:
+    """Place `src` en `dest` sans jamais exposer un fichier partiel."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp_", suffix=dest.suffix, dir=dest.parent)
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        tmp.unlink()
+        if link:
+            try:
+                os.link(src, tmp)
+            except OSError:
+                shutil.copy2(src, tmp)
+        else:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def detach(path: str | os.PathLike) -> None:
+    """Supprime `path` s'il partage son inode (hard-link) : un rendu ne doit
+    jamais réécrire en place un objet du cache."""
+    p = Path(path)
+    try:
+        if p.stat().st_nlink > 1:
+            p.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class RenderCache:
+    def __init__(self, root: str | Path | None = None, quota_bytes: int | None = None):
+        self.root = Path(root) if root is not None else _default_root()
+        self.quota = int(quota_bytes) if quota_bytes is not None else _default_quota()
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            str(self.root / "index.sqlite"), isolation_level=None, timeout=30
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _object_path(self, key: str, name: str) -> Path:
+        return self.root / "objects" / key[:2] / name
+
+    def _bump(self, stat: str, n: int = 1) -> None:
+        self._db.execute(
+            "INSERT INTO stats (name, value) VALUES (?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (stat, n),
+        )
+
+    def _drop(self, key: str, name: str) -> None:
+        self._db.execute("DELETE FROM entries WHERE key=?", (key,))
+        self._object_path(key, name).unlink(missing_ok=True)
+
+    def get(self, key: str, dest: str | os.PathLike, link: bool = True) -> bool:
+        """Hit : matérialise l'objet en `dest` et retourne True ; sinon False."""
+        row = self._db.execute("SELECT name, size FROM entries WHERE key=?", (key,)).fetchone()
+        if row is not None:
+            name, size = row
+            obj = self._object_path(key, name)
+            if obj.is_file() and obj.stat().st_size == size:
+                _atomic_place(obj, Path(dest), link=link)
+                self._db.execute(
+                    "UPDATE entries SET last_access=?, hits=hits+1 WHERE key=?",
+                    (time.time(), key),
+                )
+                self._bump("hits")
+                return True
+            self._drop(key, name)  # objet absent ou altéré
+        self._bump("misses")
+        return False
+
+    def put(self, key: str, src: str | os.PathLike) -> Path:
+        """Copie `src` dans le store (atomique), puis applique le quota."""
+        src = Path(src)
+        name = key + src.suffix
+        obj = self._object_path(key, name)
+        _atomic_place(src, obj, link=False)
+        now, size = time.time(), obj.stat().st_size
+        self._db.execute(
+            "INSERT INTO entries (key, name, size, created, last_access) VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(key) DO UPDATE SET name=excluded.name, size=excluded.size,"
+            " last_access=excluded.last_access",
+            (key, name, size, now, now),
+        )
+        self.evict(keep=key)
+        return obj
+
+    def evict(self, keep: str | None = None) -> int:
+        """Évince les entrées les moins récemment utilisées jusqu'à respecter le quota."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        evicted = 0
+        if total <= self.quota:
+            return 0
+        rows = self._db.execute(
+            "SELECT key, name, size FROM entries ORDER BY last_access, created"
+        ).fetchall()
+        for key, name, size in rows:
+            if total <= self.quota:
+                break
+            if key == keep:
+                continue
+            self._drop(key, name)
+            total -= size
+            evicted += 1
+        if evicted:
+            self._bump("evictions", evicted)
+        return evicted
+
+    def stats(self) -> CacheStats:
+        counters = dict(self._db.execute("SELECT name, value FROM stats").fetchall())
+        n, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        return CacheStats(
+            hits=counters.get("hits", 0),
+            misses=counters.get("misses", 0),
+            evictions=counters.get("evictions", 0),
+            entries=n,
+            bytes=size,
+            quota=self.quota,
+        )
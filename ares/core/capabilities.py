@@ -0,0 +1,127 @@
+"""
+Blade v13 — core.capabilities
+Profil des capacités d'une build Blender (partie sans bpy) :
+- moteurs disponibles + propriétés modifiables des groupes (eevee, cycles,
+  ffmpeg...) avec leurs valeurs d'enum, sondé une fois par build,
+- cache disque JSON (renders/.cache/capabilities/<build>.json),
+- diff d'un preset imbriqué contre les valeurs courantes : seules les
+  propriétés qui changent sont écrites (chaque écriture RNA tague le depsgraph).
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Ordres de préférence (le premier disponible gagne)
+ENGINE_ORDER = ("BLENDER_EEVEE", "BLENDER_EEVEE_NEXT", "BLENDER_WORKBENCH", "CYCLES")
+RENDER_ENGINES = ("BLENDER_EEVEE", "BLENDER_EEVEE_NEXT", "CYCLES")
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    build: str
+    engines: tuple[str, ...]
+    # groupe -> propriété -> valeurs d'enum (None : pas un enum / items dynamiques)
+    props: dict[str, dict[str, tuple[str, ...] | None]] = field(default_factory=dict)
+
+    def pick_engine(self, order=ENGINE_ORDER) -> str | None:
+        return next((e for e in order if e in self.engines), None)
+
+    def has(self, group: str, prop: str) -> bool:
+        return prop in self.props.get(group, {})
+
+    def accepts(self, group: str, prop: str, value) -> bool:
+        """Propriété connue et, pour un enum statique, valeur parmi ses items."""
+        if not self.has(group, prop):
+            return False
+        items = self.props[group][prop]
+        return items is None or value in items
+
+    def to_dict(self) -> dict:
+        return {
+            "build": self.build,
+            "engines": list(self.engines),
+            "props": {g: {p: list(v) if v is not None else None for p, v in ps.items()}
+                      for g, ps in self.props.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> EngineProfile:
+        return cls(
+            build=str(data["build"]),
+            engines=tuple(data["engines"]),
+            props={g: {p: tuple(v) if v is not None else None for p, v in ps.items()}
+                   for g, ps in data.get("props", {}).items()},
+        )
+
+
+def default_profile_dir() -> Path:
+    env = os.environ.get("ARES_CAPABILITIES_CACHE")
+    if env:
+        return Path(env)
+    from ares.core.paths import ROOT
+
+    return ROOT / "renders" / ".cache" / "capabilities"
+
+
+def profile_path(build: str, root: str | os.PathLike | None = None) -> Path:
+    root = Path(root) if root is not None else default_profile_dir()
+    return root / (re.sub(r"[^A-Za-z0-9._-]+", "_", build) + ".json")
+
+
+def load_profile(path: str | os.PathLike, build: str | None = None) -> EngineProfile | None:
+    """Profil en cache, ou None si absent/illisible/d'une autre build."""
+    try:
+        prof = EngineProfile.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return prof if build is None or prof.build == build else None
+
+
+def save_profile(path: str | os.PathLike, profile: EngineProfile) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(profile.to_dict(), indent=1, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def flatten(preset: Mapping, prefix: tuple[str, ...] = ()) -> dict[tuple[str, ...], object]:
+    """{"render": {"ffmpeg": {"codec": "H264"}}} -> {("render", "ffmpeg", "codec"): "H264"}.
+    L'ordre d'insertion est conservé (ex. file_format avant ffmpeg)."""
+    flat = {}
+    for key, value in preset.items():
+        path = (*prefix, str(key))
+        if isinstance(value, Mapping):
+            flat.update(flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def same(current, wanted, tol: float = 1e-6) -> bool:
+    """Égalité tolérante (flottants RNA en simple précision, vecteurs/couleurs)."""
+    if current is MISSING:
+        return False
+    if isinstance(wanted, (list, tuple)):
+        try:
+            cur = tuple(current)
+        except TypeError:
+            return False
+        if len(cur) != len(wanted):
+            return False
+        return all(same(c, w, tol) for c, w in zip(cur, wanted, strict=True))
+    if isinstance(wanted, float) or isinstance(current, float):
+        try:
+            return math.isclose(float(current), float(wanted), rel_tol=tol, abs_tol=tol)
+        except (TypeError, ValueError):
+            return False
+    return current == wanted
+
@@ -0,0 +1,79 @@
+"""
+Blade v13 — core.checkpoint
+Manifest de reprise pour les rendus image par image :
+- chaque frame écrite est enregistrée (fichier, taille, digest) dans checkpoint.json,
+- à la reprise, seules les frames présentes ET vérifiées sont conservées,
+- si les réglages de rendu changent, le manifest repart de zéro.
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST = "checkpoint.json"
+
+
+def file_digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class FrameCheckpoint:
+    def __init__(self, folder: str | os.PathLike, settings: dict, name: str = MANIFEST):
+        self.folder = Path(folder)
+        self.path = self.folder / name
+        self.settings = json.loads(json.dumps(settings, sort_keys=True, default=str))
+        self.frames: dict[int, dict] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        if data.get("settings") == self.settings:
+            self.frames = {int(k): v for k, v in data.get("frames", {}).items()}
+
+    def _save(self) -> None:
+        self.folder.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "settings": self.settings,
+            "frames": {str(k): v for k, v in sorted(self.frames.items())},
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def mark(self, frame: int, file: str | os.PathLike) -> None:
+        p = Path(file)
+        self.frames[int(frame)] = {
+            "file": os.path.relpath(p, self.folder),
+            "size": p.stat().st_size,
+            "digest": file_digest(p),
+        }
+        self._save()
+
+    def _valid(self, entry: dict) -> bool:
+        p = self.folder / entry["file"]
+        try:
+            return p.stat().st_size == entry["size"] and file_digest(p) == entry["digest"]
+        except OSError:
+            return False
+
+    def verify(self) -> set[int]:
+        """Ne garde que les frames dont le fichier est intact ; retourne leurs numéros."""
+        bad = [f for f, e in self.frames.items() if not self._valid(e)]
+        for f in bad:
+            del self.frames[f]
+        if bad:
+            self._save()
+        return set(self.frames)
+
+    def missing(self, start: int, end: int) -> list[int]:
+        return [f for f in range(start, end + 1) if f not in self.frames]
+
+    def files(self, start: int, end: int) -> list[Path]:
+        return [self.folder / self.frames[f]["file"] for f in range(start, end + 1)]
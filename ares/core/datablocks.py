@@ -0,0 +1,46 @@
+"""
+Blade v13 — core.datablocks
+Rapport de fuite de datablocks (pas de bpy ici) :
+- snapshots = compte par collection de bpy.data (objects, meshes, actions...)
+  pris avant puis après chaque appel répété,
+- croissance par appel, fuite = collection qui grossit à chaque appel.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+
+
+def growth(snapshots: Sequence[Mapping[str, int]]) -> dict[str, list[int]]:
+    """Écart par appel pour chaque collection qui a varié au moins une fois."""
+    names = sorted({k for snap in snapshots for k in snap})
+    out = {}
+    for name in names:
+        pairs = zip(snapshots, snapshots[1:], strict=False)
+        deltas = [b.get(name, 0) - a.get(name, 0) for a, b in pairs]
+        if any(deltas):
+            out[name] = deltas
+    return out
+
+
+def leaks(snapshots: Sequence[Mapping[str, int]]) -> dict[str, int]:
+    """{collection: croissance totale} pour celles qui grossissent à chaque appel."""
+    return {
+        name: sum(deltas)
+        for name, deltas in growth(snapshots).items()
+        if all(d > 0 for d in deltas)
+    }
+
+
+def format_report(snapshots: Sequence[Mapping[str, int]]) -> str:
+    rows = growth(snapshots)
+    if not rows:
+        return f"aucune croissance de bpy.data sur {len(snapshots) - 1} appels"
+    leaking = leaks(snapshots)
+    lines = [f"{'collection':<16} {'avant':>7} {'après':>7}  par appel"]
+    for name, deltas in rows.items():
+        flag = "  FUITE" if name in leaking else ""
+        lines.append(
+            f"{name:<16} {snapshots[0].get(name, 0):>7} {snapshots[-1].get(name, 0):>7}  "
+            + " ".join(f"{d:+d}" for d in deltas) + flag
+        )
+    return "\n".join(lines)
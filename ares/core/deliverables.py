@@ -0,0 +1,192 @@
+"""
+Blade v13 — core.deliverables
+Plusieurs livrables tirés d'une seule séquence de frames rendue :
+- vidéo H.264 (mp4), WebM (VP9), aperçu animé GIF/WebP, poster (copie d'une
+  frame, aucun re-rendu), planche contact, atlas sprite-sheet (+ JSON pour les
+  viewers de rotation web),
+- un process ffmpeg par livrable, lancés en parallèle (`workers` au plus),
+- liste déclarée dans render_output (clé `deliverables`, ares.config).
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+import shutil
+import struct
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ares.core.ffmpeg import _run, find_ffmpeg
+
+# kind -> suffixe du nom de base, extension, options acceptées
+KINDS: dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "mp4": ("", ".mp4", ("crf",)),
+    "webm": ("", ".webm", ("crf",)),
+    "gif": ("_preview", ".gif", ("fps", "width")),
+    "webp": ("_preview", ".webp", ("fps", "width", "quality")),
+    "poster": ("_poster", ".png", ("frame",)),
+    "contact_sheet": ("_contact", ".jpg", ("columns", "count", "width")),
+    "sprite_sheet": ("_sprites", ".jpg", ("columns", "count", "width")),
+}
+
+
+@dataclass
+class Job:
+    kind: str
+    output: Path
+    cmd: list[str] | None = None  # ffmpeg
+    copy: Path | None = None  # poster : simple copie de frame
+    meta: dict | None = None  # JSON écrit à côté (sprite sheet)
+    extra: list[Path] = field(default_factory=list)
+
+
+def output_path(base: Path, kind: str, suffix: str | None = None) -> Path:
+    default_suffix, ext, _ = KINDS[kind]
+    return base.with_name(base.stem + (default_suffix if suffix is None else suffix) + ext)
+
+
+def png_size(path: Path) -> tuple[int, int]:
+    """(largeur, hauteur) lues dans l'en-tête IHDR du PNG."""
+    with open(path, "rb") as f:
+        head = f.read(24)
+    if head[:8] != b"\x89PNG\r\n\x1a\n":
+        raise ValueError(f"pas un PNG : {path}")
+    return struct.unpack(">II", head[16:24])
+
+
+def _even(v: float) -> int:
+    return max(2, int(round(v / 2)) * 2)
+
+
+def _pick(n: int, count: int) -> tuple[int, int]:
+    """(pas, nombre de frames retenues) pour échantillonner `count` frames sur `n`."""
+    step = max(1, math.ceil(n / max(1, count)))
+    return step, math.ceil(n / step)
+
+
+def _poster_index(frame, n: int) -> int:
+    if frame in (None, "first"):
+        return 0
+    if frame == "middle":
+        return n // 2
+    if frame == "last":
+        return n - 1
+    return min(max(0, int(frame)), n - 1)
+
+
+def plan(
+    kind: str,
+    options: Mapping,
+    frames: Sequence[Path],
+    base: Path,
+    fps: float,
+    start: int = 1,
+    exe: str = "ffmpeg",
+    suffix: str | None = None,
+) -> Job:
+    """Commande (ou copie) produisant un livrable depuis frames (frame_%04d.png)."""
+    if kind not in KINDS:
+        raise ValueError(f"livrable inconnu : {kind!r} (dispo : {sorted(KINDS)})")
+    out = output_path(base, kind, suffix)
+    n = len(frames)
+    if kind == "poster":
+        src = frames[_poster_index(options.get("frame"), n)]
+        return Job(kind, out.with_suffix(src.suffix), copy=src)
+
+    pattern = frames[0].parent / "frame_%04d.png"
+    head = [exe, "-y", "-loglevel", "error",
+            "-framerate", str(fps), "-start_number", str(start), "-i", str(pattern)]
+    if kind == "mp4":
+        tail = ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-c:v", "libx264",
+                "-pix_fmt", "yuv420p", "-crf", str(options.get("crf", 20)),
+                "-movflags", "+faststart"]
+    elif kind == "webm":
+        tail = ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-c:v", "libvpx-vp9",
+                "-crf", str(options.get("crf", 32)), "-b:v", "0", "-pix_fmt", "yuv420p",
+                "-row-mt", "1"]
+    elif kind == "gif":
+        scale = f"fps={options.get('fps', 12)},scale={options.get('width', 480)}:-1:flags=lanczos"
+        tail = ["-vf", f"{scale},split[a][b];[a]palettegen[p];[b][p]paletteuse", "-loop", "0"]
+    elif kind == "webp":
+        scale = f"fps={options.get('fps', 12)},scale={options.get('width', 480)}:-1:flags=lanczos"
+        tail = ["-vf", scale, "-c:v", "libwebp", "-lossless", "0",
+                "-q:v", str(options.get("quality", 75)), "-loop", "0"]
+    else:  # contact_sheet / sprite_sheet : frames échantillonnées, tuilées en une image
+        sprite = kind == "sprite_sheet"
+        w, h = png_size(frames[0])
+        count = int(options.get("count", 36 if sprite else 12))
+        cols = int(options.get("columns", 6 if sprite else 4))
+        step, kept = _pick(n, count)
+        cols = min(cols, kept)
+        rows = math.ceil(kept / cols)
+        cell_w = _even(options.get("width", 256 if sprite else 320))
+        cell_h = _even(cell_w * h / w)
+        vf = (f"select='not(mod(n\\,{step}))',scale={cell_w}:{cell_h}:flags=lanczos,"
+              f"tile={cols}x{rows}")
+        tail = ["-vf", vf, "-frames:v", "1", "-update", "1", "-q:v", "3"]
+        if sprite:
+            meta = {
+                "image": out.name, "frames": kept, "columns": cols, "rows": rows,
+                "frame_width": cell_w, "frame_height": cell_h, "step": step,
+                "fps": fps / step,
+            }
+            return Job(kind, out, cmd=head + tail + [str(out)], meta=meta,
+                       extra=[out.with_suffix(".json")])
+    return Job(kind, out, cmd=head + tail + [str(out)])
+
+
+def _execute(job: Job) -> Path:
+    job.output.parent.mkdir(parents=True, exist_ok=True)
+    if job.copy is not None:
+        shutil.copyfile(job.copy, job.output)
+        return job.output
+    _run(job.cmd)
+    if job.meta is not None:
+        job.extra[0].write_text(json.dumps(job.meta, indent=2), encoding="utf-8")
+    return job.output
+
+
+def produce(
+    frames: Sequence[Path],
+    base: str | os.PathLike,
+    fps: float,
+    specs: Sequence,
+    start: int = 1,
+    workers: int | None = None,
+    exe: str | None = None,
+) -> dict[str, Path]:
+    """Livrables `specs` (objets avec kind/options/suffix) en parallèle.
+
+    Retourne {nom de fichier -> chemin}. Lève RuntimeError si un encodeur échoue
+    (les autres livrables sont tout de même produits).
+    """
+    if not frames:
+        raise ValueError("aucune frame à livrer")
+    base = Path(base)
+    exe = exe or find_ffmpeg()
+    jobs = [
+        plan(s.kind, s.options, frames, base, fps, start=start, exe=exe or "ffmpeg",
+             suffix=s.suffix)
+        for s in specs
+    ]
+    if not jobs:
+        return {}
+    if exe is None and any(j.cmd for j in jobs):
+        raise FileNotFoundError("ffmpeg introuvable (ARES_FFMPEG ou PATH)")
+    workers = workers or min(len(jobs), max(1, (os.cpu_count() or 2) // 2))
+    results: dict[str, Path] = {}
+    errors = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:  # un ffmpeg (process) par tâche
+        futures = {pool.submit(_execute, j): j for j in jobs}
+        for fut, job in futures.items():
+            try:
+                results[job.output.name] = fut.result()
+            except Exception as e:
+                errors.append(f"{job.kind} ({job.output.name}): {e}")
+    if errors:
+        raise RuntimeError("livrables en échec : " + " ; ".join(errors))
+    return results
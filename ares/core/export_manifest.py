@@ -0,0 +1,63 @@
+"""
+Blade v13 — core.export_manifest
+Exports incrémentaux :
+- manifest (.ares_exports.json, dans le dossier de sortie) : fichier ->
+  empreinte de l'objet source + taille du fichier écrit,
+- un export est à jour si l'empreinte est identique et le fichier intact,
+- répartition des exports sur N workers (plus gros d'abord, worker le moins
+  chargé).
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+import heapq
+import json
+import os
+from collections.abc import Sequence
+from pathlib import Path
+
+MANIFEST = ".ares_exports.json"
+
+
+class ExportManifest:
+    def __init__(self, folder: str | os.PathLike, name: str = MANIFEST):
+        self.folder = Path(folder)
+        self.path = self.folder / name
+        try:
+            self.entries: dict[str, dict] = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def _key(self, out: str | os.PathLike) -> str:
+        return os.path.relpath(Path(out), self.folder)
+
+    def current(self, out: str | os.PathLike, digest: str) -> bool:
+        """True si `out` a été écrit depuis une source d'empreinte `digest` et n'a pas bougé."""
+        entry = self.entries.get(self._key(out))
+        if not entry or entry.get("digest") != digest:
+            return False
+        try:
+            return Path(out).stat().st_size == entry["size"]
+        except OSError:
+            return False
+
+    def record(self, out: str | os.PathLike, digest: str) -> None:
+        self.entries[self._key(out)] = {"digest": digest, "size": Path(out).stat().st_size}
+
+    def save(self) -> None:
+        self.folder.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.entries, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def partition(weights: Sequence[float], workers: int) -> list[list[int]]:
+    """Indices répartis sur `workers` lots de charge proche (LPT glouton)."""
+    workers = max(1, min(int(workers), len(weights)))
+    heap = [(0.0, i) for i in range(workers)]
+    lots: list[list[int]] = [[] for _ in range(workers)]
+    for idx in sorted(range(len(weights)), key=lambda i: -weights[i]):
+        load, w = heapq.heappop(heap)
+        lots[w].append(idx)
+        heapq.heappush(heap, (load + weights[idx], w))
+    return [sorted(lot) for lot in lots if lot]
@@ -0,0 +1,192 @@
+"""
+Blade v13 — core.ffmpeg
+- Localise un `ffmpeg` externe et fournit les opérations sans ré-encodage (concat).
+- RawVideoEncoder : frames brutes RGBA poussées sur le stdin d'un ffmpeg par un
+  thread d'écriture (file bornée, buffers réutilisés, contre-pression).
+- Pas de bpy ici : ce module sert aussi bien dans Blender que hors Blender.
+"""
+from __future__ import annotations
+
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+
+def find_ffmpeg() -> str | None:
+    """ARES_FFMPEG > PATH."""
+    exe = os.environ.get("ARES_FFMPEG")
+    if exe and Path(exe).is_file():
+        return exe
+    return shutil.which("ffmpeg")
+
+
+def _run(cmd: Sequence[str]) -> None:
+    proc = subprocess.run(list(cmd), capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = (proc.stderr or "").strip().splitlines()[-5:]
+        raise RuntimeError(f"ffmpeg a échoué ({proc.returncode}): " + " | ".join(tail))
+
+
+def concat_segments(segments: Sequence[Path], out_path: Path, exe: str | None = None) -> Path:
+    """Concatène des segments (même codec/paramètres) en stream-copy : aucun ré-encodage."""
+    exe = exe or find_ffmpeg()
+    if exe is None:
+        raise FileNotFoundError("ffmpeg introuvable (ARES_FFMPEG ou PATH)")
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="ares_concat_") as tmp:
+        listing = Path(tmp) / "segments.txt"
+        # format du demuxer concat : une ligne `file '<path>'`, quotes échappées
+        lines = ["file '{}'".format(str(Path(s).resolve()).replace("'", r"'\''")) for s in segments]
+        listing.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        _run([
+            exe, "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", str(listing),
+            "-c", "copy", "-movflags", "+faststart",
+            str(out_path),
+        ])
+    return out_path
+
+
+def encode_sequence(
+    pattern: str | os.PathLike,
+    out_path: Path,
+    fps: int,
+    start: int = 1,
+    crf: int = 20,
+    exe: str | None = None,
+) -> Path:
+    """Encode une séquence d'images (`frame_%04d.png`) en MP4 H.264."""
+    exe = exe or find_ffmpeg()
+    if exe is None:
+        raise FileNotFoundError("ffmpeg introuvable (ARES_FFMPEG ou PATH)")
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    _run([
+        exe, "-y", "-loglevel", "error",
+        "-framerate", str(fps), "-start_number", str(start), "-i", str(pattern),
+        # yuv420p impose des dimensions paires
+        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+        "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", str(crf),
+        "-movflags", "+faststart",
+        str(out_path),
+    ])
+    return out_path
+
+
+def rawvideo_cmd(
+    out_path: Path,
+    width: int,
+    height: int,
+    fps: float,
+    crf: int = 20,
+    flip: bool = False,
+    exe: str | None = None,
+) -> list[str]:
+    """ffmpeg lisant du RGBA 8 bits brut sur stdin ; flip : lignes de bas en haut (Blender)."""
+    exe = exe or find_ffmpeg()
+    if exe is None:
+        raise FileNotFoundError("ffmpeg introuvable (ARES_FFMPEG ou PATH)")
+    vf = ("vflip," if flip else "") + "pad=ceil(iw/2)*2:ceil(ih/2)*2"
+    return [
+        exe, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps),
+        "-i", "-",
+        "-vf", vf,
+        "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", str(crf),
+        "-movflags", "+faststart",
+        str(out_path),
+    ]
+
+
+class RawVideoEncoder:
+    """Pousse des frames de `frame_size` octets vers `cmd` (stdin) sans bloquer le rendu.
+
+    acquire() -> buffer libre (bloque si `depth` frames sont déjà en attente :
+    contre-pression), le remplir, puis submit(buffer). close() attend la fin de
+    l'encodage et lève RuntimeError si ffmpeg a échoué.
+    """
+
+    def __init__(self, cmd: Sequence[str], frame_size: int, depth: int = 3):
+        self.frame_size = frame_size
+        self.frames = 0
+        self.wait_seconds = 0.0  # temps passé bloqué sur la contre-pression
+        self._free: queue.Queue = queue.Queue()
+        for _ in range(max(1, depth)):
+            self._free.put(bytearray(frame_size))
+        self._ready: queue.Queue = queue.Queue()
+        self._error: BaseException | None = None
+        self._proc = subprocess.Popen(
+            list(cmd), stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+        )
+        self._thread = threading.Thread(target=self._pump, name="ares-encoder", daemon=True)
+        self._thread.start()
+
+    def _pump(self) -> None:
+        stdin = self._proc.stdin
+        while (buf := self._ready.get()) is not None:
+            try:
+                if self._error is None:
+                    stdin.write(buf)
+            except OSError as e:  # ffmpeg mort : on vide la file sans écrire
+                self._error = e
+            finally:
+                self._free.put(buf)
+        try:
+            stdin.close()
+        except OSError as e:
+            self._error = self._error or e
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(f"ffmpeg (stdin) : {self._error}")
+
+    def acquire(self) -> bytearray:
+        self._check()
+        t0 = time.perf_counter()
+        buf = self._free.get()
+        self.wait_seconds += time.perf_counter() - t0
+        return buf
+
+    def submit(self, buf: bytearray) -> None:
+        if len(buf) != self.frame_size:
+            raise ValueError(f"frame de {len(buf)} octets, {self.frame_size} attendus")
+        self._ready.put(buf)
+        self.frames += 1
+        time.sleep(0)  # laisse le thread d'écriture démarrer avant le rendu suivant
+
+    def write(self, data) -> None:
+        buf = self.acquire()
+        buf[:] = data
+        self.submit(buf)
+
+    def close(self) -> None:
+        self._ready.put(None)
+        self._thread.join()
+        stderr = self._proc.stderr.read().decode(errors="replace") if self._proc.stderr else ""
+        rc = self._proc.wait()
+        if rc != 0:
+            tail = stderr.strip().splitlines()[-5:]
+            raise RuntimeError(f"ffmpeg a échoué ({rc}): " + " | ".join(tail))
+        self._check()
+
+    def abort(self) -> None:
+        self._ready.put(None)
+        self._proc.kill()
+        self._thread.join()
+        self._proc.wait()
+
+    def __enter__(self) -> RawVideoEncoder:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
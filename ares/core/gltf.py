@@ -0,0 +1,162 @@
+"""
+Blade v13 — core.gltf
+Post-traitement de fichiers .glb (pas de bpy ici) :
+- lecture / écriture du conteneur GLB (chunk JSON + chunk BIN),
+- noms de nœuds / images réécrits dans le JSON (copies d'export -> sources),
+- MSFT_lod : les nœuds <nom>_LOD1..n deviennent les LOD du nœud <nom>
+  (retirés de la scène, seuils MSFT_screencoverage en extras),
+- compression meshopt par gltfpack (meshoptimizer) en process externe :
+  ARES_GLTFPACK ou PATH,
+- rapport taille / triangles par fichier et par LOD.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import struct
+import subprocess
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+MAGIC = 0x46546C67  # "glTF"
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+LOD_SUFFIX = "_LOD"
+
+
+def read_glb(path: str | os.PathLike) -> tuple[dict, bytes]:
+    data = Path(path).read_bytes()
+    magic, version, length = struct.unpack_from("<III", data, 0)
+    if magic != MAGIC or version != 2:
+        raise ValueError(f"pas un GLB 2.0 : {path}")
+    gltf, binary, offset = None, b"", 12
+    while offset < length:
+        size, kind = struct.unpack_from("<II", data, offset)
+        chunk = data[offset + 8: offset + 8 + size]
+        if kind == CHUNK_JSON:
+            gltf = json.loads(chunk.decode("utf-8"))
+        elif kind == CHUNK_BIN:
+            binary = bytes(chunk)
+        offset += 8 + size
+    if gltf is None:
+        raise ValueError(f"chunk JSON absent : {path}")
+    return gltf, binary
+
+
+def _pad(chunk: bytes, fill: bytes) -> bytes:
+    return chunk + fill * (-len(chunk) % 4)
+
+
+def write_glb(path: str | os.PathLike, gltf: Mapping, binary: bytes = b"") -> Path:
+    body = _pad(json.dumps(gltf, separators=(",", ":")).encode("utf-8"), b" ")
+    chunks = struct.pack("<II", len(body), CHUNK_JSON) + body
+    if binary:
+        binary = _pad(binary, b"\0")
+        chunks += struct.pack("<II", len(binary), CHUNK_BIN) + binary
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(struct.pack("<III", MAGIC, 2, 12 + len(chunks)) + chunks)
+    os.replace(tmp, path)
+    return path
+
+
+def lod_name(base: str, level: int) -> str:
+    return base if level == 0 else f"{base}{LOD_SUFFIX}{level}"
+
+
+def lod_paths(out: str | os.PathLike, count: int) -> list[Path]:
+    """Fichiers du mode `files` : <nom>.glb, <nom>_LOD1.glb, ..."""
+    out = Path(out)
+    return [out.with_name(lod_name(out.stem, k) + out.suffix) for k in range(count)]
+
+
+def default_coverage(ratios: Sequence[float]) -> list[float]:
+    """Seuil de couverture écran par LOD : moitié du ratio du LOD suivant, 0 pour le dernier."""
+    return [round(r / 2, 4) for r in ratios[1:]] + [0.0]
+
+
+def rename(gltf: dict, kind: str, names: Mapping[str, str]) -> dict:
+    """Renomme les entrées `kind` (nodes, images...) : {nom exporté -> nom final}."""
+    for item in gltf.get(kind, []):
+        name = names.get(item.get("name"))
+        if name is not None:
+            item["name"] = name
+    return gltf
+
+
+def add_msft_lod(
+    gltf: dict, chains: Mapping[str, int], coverage: Sequence[float] | None = None
+) -> dict:
+    """chains : {nom du nœud LOD0 -> nombre de LOD} ; modifie et retourne `gltf`."""
+    nodes = gltf.get("nodes", [])
+    index = {n.get("name"): i for i, n in enumerate(nodes)}
+    hidden = set()
+    for base, count in chains.items():
+        if base not in index:
+            raise KeyError(f"nœud glTF introuvable : {base!r}")
+        ids = [index[lod_name(base, k)] for k in range(1, count) if lod_name(base, k) in index]
+        if not ids:
+            continue
+        node = nodes[index[base]]
+        node.setdefault("extensions", {})["MSFT_lod"] = {"ids": ids}
+        if coverage:
+            node.setdefault("extras", {})["MSFT_screencoverage"] = list(coverage[: len(ids) + 1])
+        hidden.update(ids)
+    if not hidden:
+        return gltf
+    # les LOD ne sont référencés que par l'extension, plus par la scène
+    for scene in gltf.get("scenes", []):
+        scene["nodes"] = [i for i in scene.get("nodes", []) if i not in hidden]
+    for node in nodes:
+        if "children" in node:
+            node["children"] = [i for i in node["children"] if i not in hidden]
+            if not node["children"]:
+                del node["children"]
+    used = gltf.setdefault("extensionsUsed", [])
+    if "MSFT_lod" not in used:
+        used.append("MSFT_lod")
+    return gltf
+
+
+def find_gltfpack() -> str | None:
+    exe = os.environ.get("ARES_GLTFPACK")
+    if exe and Path(exe).is_file():
+        return exe
+    return shutil.which("gltfpack")
+
+
+def gltfpack_cmd(
+    src: str | os.PathLike, dst: str | os.PathLike, exe: str = "gltfpack"
+) -> list[str]:
+    """Compression meshopt ; noms de nœuds, matériaux et extras conservés (MSFT_lod après)."""
+    return [exe, "-i", str(src), "-o", str(dst), "-cc", "-kn", "-km", "-ke"]
+
+
+def meshopt_compress(path: str | os.PathLike, exe: str | None = None) -> Path:
+    """Recompresse `path` en place (EXT_meshopt_compression)."""
+    exe = exe or find_gltfpack()
+    if exe is None:
+        raise FileNotFoundError("gltfpack introuvable (ARES_GLTFPACK ou PATH)")
+    path = Path(path)
+    tmp = path.with_name(path.stem + ".meshopt" + path.suffix)
+    proc = subprocess.run(gltfpack_cmd(path, tmp, exe), capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = (proc.stderr or "").strip().splitlines()[-5:]
+        raise RuntimeError(f"gltfpack a échoué ({proc.returncode}): " + " | ".join(tail))
+    os.replace(tmp, path)
+    return path
+
+
+def format_report(rows: Sequence[Mapping]) -> str:
+    """rows : {object, file, lod, ratio, triangles, bytes} ; bytes à 0 si .glb déjà compté."""
+    lines = [f"{'object':<24} {'lod':>3} {'ratio':>6} {'triangles':>10} {'size KB':>9}  file"]
+    for r in rows:
+        size = f"{r['bytes'] / 1024:>9.1f}" if r["bytes"] else " " * 9
+        lines.append(
+            f"{r['object']:<24} {r['lod']:>3} {r['ratio']:>6.2f} {r['triangles']:>10} "
+            f"{size}  {r['file']}"
+        )
+    total = sum(r["bytes"] for r in rows)
+    lines.append(f"{'total':<24} {'':>3} {'':>6} {'':>10} {total / 1024:>9.1f}")
+    return "\n".join(lines)
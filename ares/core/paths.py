@@ -4,5 +4,4 @@ ROOT = Path(__file__).resolve().parents[2]
 DIST = ROOT / "dist"
 SUMMARY = ROOT / "summary"
 
-DIST.mkdir(exist_ok=True, parents=True)
-SUMMARY.mkdir(exist_ok=True, parents=True)
+# Pas de mkdir à l'import : les appelants créent leurs dossiers au moment d'écrire.
@@ -0,0 +1,118 @@
+"""
+Blade v13 — core.progressive
+État d'un rendu progressif (FAST -> NORMAL -> FULL) partagé entre l'hôte et
+les Blender d'arrière-plan, via un petit fichier JSON à côté de la sortie :
+- token : identifie la demande en cours ; le changer annule les paliers restants,
+- tier : dernier palier publié ; un palier n'écrase jamais un palier supérieur,
+- publication par os.replace (atomique sur un même volume) ; lecture du token,
+  remplacement et mise à jour de l'état sous un fichier verrou (<état>.lock),
+  comme start/cancel : un palier annulé ne peut plus écraser un plus récent.
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+
+TIERS = ("FAST", "NORMAL", "FULL")
+STATE_SUFFIX = ".progressive.json"
+CANCELLED = "cancelled"
+LOCK_TIMEOUT = 30.0  # s d'attente max du verrou
+LOCK_STALE = 60.0  # verrou plus vieux : détenteur mort, repris
+
+
+def tier_rank(tier: str | None) -> int:
+    return TIERS.index(tier) if tier in TIERS else -1
+
+
+def state_path(output: str | os.PathLike) -> Path:
+    out = Path(output)
+    return out.with_name(out.name + STATE_SUFFIX)
+
+
+def read_state(path: Path) -> dict:
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_state(path: Path, state: dict) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(state, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+@contextlib.contextmanager
+def locked(path: Path, timeout: float = LOCK_TIMEOUT) -> Iterator[None]:
+    """Verrou inter-process sur `path` (fichier <path>.lock créé en exclusif)."""
+    lock = Path(path).with_name(Path(path).name + ".lock")
+    lock.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            with contextlib.suppress(OSError):
+                if time.time() - lock.stat().st_mtime > LOCK_STALE:
+                    lock.unlink()
+                    continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"verrou occupé : {lock}") from None
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        with contextlib.suppress(OSError):
+            lock.unlink()
+
+
+def start(output: str | os.PathLike) -> str:
+    """Nouvelle demande : nouveau token (les enfants de l'ancienne s'arrêtent)."""
+    token = uuid.uuid4().hex
+    path = state_path(output)
+    with locked(path):
+        write_state(path, {"token": token, "tier": None})
+    return token
+
+
+def cancel(output: str | os.PathLike) -> None:
+    path = state_path(output)
+    with locked(path):
+        state = read_state(path)
+        if state:
+            write_state(path, {**state, "token": CANCELLED})
+
+
+def is_current(output: str | os.PathLike, token: str) -> bool:
+    return read_state(state_path(output)).get("token") == token
+
+
+def publish(output: str | os.PathLike, token: str, tier: str, rendered: str | os.PathLike) -> bool:
+    """Remplace `output` par `rendered` si la demande est toujours courante et que
+    `tier` est au-dessus du palier déjà publié. Retourne True si publié."""
+    path = state_path(output)
+    with locked(path):
+        state = read_state(path)
+        if state.get("token") != token or tier_rank(tier) <= tier_rank(state.get("tier")):
+            return False
+        os.replace(rendered, output)
+        write_state(path, {**state, "tier": tier})
+    return True
+
+
+def plan(presets: dict, tiers=TIERS) -> list[dict]:
+    """[{"tier": "FAST", **réglages}, ...] dans l'ordre de qualité croissante."""
+    ordered = sorted(tiers, key=tier_rank)
+    missing = [t for t in ordered if t not in presets]
+    if missing:
+        raise KeyError(f"Paliers absents des presets: {missing}")
+    return [{"tier": t, **presets[t]} for t in ordered]
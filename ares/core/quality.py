@@ -0,0 +1,155 @@
+"""
+Blade v13 — core.quality
+Calibration du nombre de samples (partie sans bpy) :
+- SSIM (fenêtre gaussienne 11x11, σ=1.5) et PSNR vectorisés NumPy, sur la luminance,
+- choix du réglage le moins cher qui atteint la cible qualité, ou du meilleur
+  qui tient dans le budget temps par frame,
+- cache JSON des décisions par empreinte de scène.
+"""
+from __future__ import annotations
+
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import numpy as np
+
+_LUMA = np.array([0.2126, 0.7152, 0.0722])
+
+
+@dataclass(frozen=True)
+class QualityTarget:
+    min_ssim: float | None = 0.98
+    min_psnr: float | None = None
+    max_frame_seconds: float | None = None  # budget temps par frame (calibration)
+
+    @property
+    def needs_reference(self) -> bool:
+        return self.min_ssim is not None or self.min_psnr is not None
+
+
+@dataclass(frozen=True)
+class Trial:
+    samples: int
+    denoise: bool
+    seconds: float  # temps moyen par frame
+    ssim: float = 1.0
+    psnr: float = math.inf
+
+
+def _luma(img) -> np.ndarray:
+    a = np.asarray(img, dtype=np.float64)
+    if a.ndim == 3:
+        a = a[..., :3] @ _LUMA if a.shape[-1] >= 3 else a[..., 0]
+    return a
+
+
+def psnr(a, b, peak: float = 1.0) -> float:
+    x, y = _luma(a), _luma(b)
+    mse = float(np.mean((x - y) ** 2))
+    return math.inf if mse == 0.0 else 10.0 * math.log10(peak * peak / mse)
+
+
+def _gaussian(size: int, sigma: float) -> np.ndarray:
+    r = np.arange(size) - (size - 1) / 2.0
+    k = np.exp(-(r * r) / (2.0 * sigma * sigma))
+    return k / k.sum()
+
+
+def _blur(x: np.ndarray, k: np.ndarray) -> np.ndarray:
+    """Convolution séparable 'valid' (sliding_window_view + produit matriciel)."""
+    win = np.lib.stride_tricks.sliding_window_view
+    x = win(x, len(k), axis=0) @ k
+    return win(x, len(k), axis=1) @ k
+
+
+def ssim(a, b, peak: float = 1.0, window: int = 11, sigma: float = 1.5) -> float:
+    """SSIM moyen (Wang et al. 2004) sur la luminance."""
+    x, y = _luma(a), _luma(b)
+    if x.shape != y.shape:
+        raise ValueError(f"Tailles différentes: {x.shape} vs {y.shape}")
+    size = min(window, *x.shape)
+    size -= (size + 1) % 2  # impair
+    k = _gaussian(size, sigma)
+    c1, c2 = (0.01 * peak) ** 2, (0.03 * peak) ** 2
+    mx, my = _blur(x, k), _blur(y, k)
+    sxx = _blur(x * x, k) - mx * mx
+    syy = _blur(y * y, k) - my * my
+    sxy = _blur(x * y, k) - mx * my
+    num = (2.0 * mx * my + c1) * (2.0 * sxy + c2)
+    den = (mx * mx + my * my + c1) * (sxx + syy + c2)
+    return float(np.mean(num / den))
+
+
+def representative_frames(start: int, end: int, count: int = 3) -> list[int]:
+    """Frames réparties sur la plage (début, milieu, ...) sans doublon."""
+    if end < start:
+        return [start]
+    count = max(1, min(int(count), end - start + 1))
+    if count == 1:
+        return [(start + end) // 2]
+    return sorted({round(start + (end - start) * i / (count - 1)) for i in range(count)})
+
+
+def meets(trial: Trial, target: QualityTarget) -> bool:
+    if target.min_ssim is not None and trial.ssim < target.min_ssim:
+        return False
+    if target.min_psnr is not None and trial.psnr < target.min_psnr:
+        return False
+    return target.max_frame_seconds is None or trial.seconds <= target.max_frame_seconds
+
+
+def pick(trials: list[Trial], target: QualityTarget) -> Trial:
+    """Cible qualité : le plus rapide qui la tient. Budget seul : la meilleure qualité
+    dans le budget. Rien ne passe : meilleure qualité (qualité) ou plus rapide (budget)."""
+    if not trials:
+        raise ValueError("Aucun essai de calibration")
+    ok = [t for t in trials if meets(t, target)]
+
+    def quality(t: Trial):
+        return (t.ssim, t.psnr, -t.seconds)
+
+    if target.needs_reference:
+        return min(ok, key=lambda t: (t.seconds, t.samples)) if ok else max(trials, key=quality)
+    return max(ok, key=quality) if ok else min(trials, key=lambda t: t.seconds)
+
+
+def default_tuning_path() -> Path:
+    env = os.environ.get("ARES_TUNING_CACHE")
+    if env:
+        return Path(env)
+    from ares.core.paths import ROOT
+
+    return ROOT / "renders" / ".cache" / "sample_tuning.json"
+
+
+class TuningCache:
+    """Décisions de calibration {empreinte: Trial} dans un fichier JSON."""
+
+    def __init__(self, path: str | os.PathLike | None = None):
+        self.path = Path(path) if path is not None else default_tuning_path()
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Trial | None:
+        data = self._load().get(key)
+        if not data:
+            return None
+        try:
+            return Trial(**data)
+        except TypeError:
+            return None
+
+    def put(self, key: str, trial: Trial) -> None:
+        data = self._load()
+        data[key] = asdict(trial)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, indent=1, sort_keys=True, default=str), encoding="utf-8")
+        os.replace(tmp, self.path)
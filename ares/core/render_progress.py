@@ -0,0 +1,61 @@
+"""
+Blade v13 — core.render_progress
+Progression d'un rendu d'animation fait par un Blender enfant, lue sur disque :
+- une frame est faite quand son fichier existe (non vide) ; tant que l'enfant
+  tourne, la dernière frame présente peut être en cours d'écriture : ignorée,
+- ETA = temps moyen par frame faite x frames restantes,
+- frames récupérables après annulation (séquence contiguë ou non).
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class Progress:
+    total: int
+    done: int
+    elapsed: float
+    last_frame: Path | None = None  # dernière frame complète (aperçu)
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def eta(self) -> float | None:
+        if self.done == 0:
+            return None
+        return self.elapsed / self.done * (self.total - self.done)
+
+    def describe(self) -> str:
+        eta = "ETA --" if self.eta is None else f"ETA {format_duration(self.eta)}"
+        return f"{self.done}/{self.total} frames ({self.fraction:.0%}) • {eta}"
+
+
+def format_duration(seconds: float) -> str:
+    s = max(0, int(round(seconds)))
+    h, rem = divmod(s, 3600)
+    m, s = divmod(rem, 60)
+    if h:
+        return f"{h}h{m:02d}m"
+    return f"{m}m{s:02d}s" if m else f"{s}s"
+
+
+def completed(paths: Sequence[Path], running: bool) -> list[Path]:
+    """Fichiers de frame terminés, dans l'ordre des frames."""
+    present = [p for p in paths if p.is_file() and p.stat().st_size > 0]
+    if running and present:
+        present = present[:-1]  # possiblement en cours d'écriture
+    return present
+
+
+def scan(paths: Sequence[Path], elapsed: float, running: bool) -> Progress:
+    done = completed(paths, running)
+    return Progress(
+        total=len(paths), done=len(done), elapsed=elapsed,
+        last_frame=done[-1] if done else None,
+    )
@@ -0,0 +1,155 @@
+"""
+Blade v13 — core.render_trace
+Instrumentation des rendus, partie sans bpy :
+- FrameTimeline reçoit les évènements des handlers (frame_change_pre/post,
+  render_pre/post/write) ; l'intervalle qui se termine sur un évènement est
+  compté dans la phase que cet évènement clôt (eval, render, write), le reste
+  en `other`,
+- phases hors frames (encode...) via add_phase(),
+- rapport JSON-lines (une ligne par frame + une ligne summary) sous reports/.
+Activation : ARES_TRACE=1 (lu à chaque rendu) ; dossier : ARES_TRACE_DIR.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from ares.core.paths import ROOT
+
+# évènement -> phase qu'il clôt
+CLOSES = {"frame_change_post": "eval", "render_post": "render", "render_write": "write"}
+PHASES = ("eval", "render", "write", "other")
+
+
+def enabled() -> bool:
+    return os.environ.get("ARES_TRACE", "").lower() in ("1", "true", "yes", "on")
+
+
+def default_report_dir() -> Path:
+    return Path(os.environ.get("ARES_TRACE_DIR") or ROOT / "reports")
+
+
+def peak_rss_mb() -> float | None:
+    """Pic mémoire (RSS) du process courant, en Mo ; None si indisponible."""
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                (name, ctypes.c_size_t) for name in (
+                    "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                    "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                    "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage",
+                )
+            ]
+
+        c = _Counters()
+        c.cb = ctypes.sizeof(c)
+        proc = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(proc, ctypes.byref(c), c.cb):
+            return None
+        return c.PeakWorkingSetSize / 2**20
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 1024  # octets / Ko
+
+
+class FrameTimeline:
+    def __init__(self, label: str = "render", clock=time.perf_counter):
+        self.label = label
+        self.clock = clock
+        self.started = clock()
+        self.frames: dict[tuple[int, int], dict] = {}  # (passe, frame) -> record
+        self.extra: dict[str, float] = {}  # phases hors frames, en secondes
+        self.output_bytes: int | None = None
+        self.passes = 0
+        self._last: float | None = None
+
+    def begin_pass(self, t: float | None = None) -> None:
+        """Début d'un rendu (render_init) : le temps d'avant n'est pas compté."""
+        self.passes += 1
+        self._last = self.clock() if t is None else t
+
+    def end_pass(self) -> None:
+        self._last = None
+
+    def event(self, name: str, frame: int, t: float | None = None) -> dict | None:
+        if self._last is None:  # hors d'un rendu (ex: retour à la frame d'origine)
+            return None
+        t = self.clock() if t is None else t
+        key = (self.passes, int(frame))
+        rec = self.frames.get(key)
+        if rec is None:
+            rec = self.frames[key] = {
+                "pass": self.passes, "frame": int(frame), "phases": dict.fromkeys(PHASES, 0.0),
+            }
+        rec["phases"][CLOSES.get(name, "other")] += t - self._last
+        self._last = t
+        return rec
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.extra[name] = self.extra.get(name, 0.0) + seconds
+
+    def records(self) -> list[dict]:
+        out = []
+        for rec in self.frames.values():
+            r = dict(rec, phases={k: round(v, 6) for k, v in rec["phases"].items()})
+            r["wall"] = round(sum(rec["phases"].values()), 6)
+            out.append(r)
+        return out
+
+    def summary(self) -> dict:
+        recs = self.records()
+        n = len(recs)
+        mean = {p: (sum(r["phases"][p] for r in recs) / n if n else 0.0) for p in PHASES}
+        slowest = max(recs, key=lambda r: r["wall"], default=None)
+        peaks = [r["peak_rss_mb"] for r in recs if r.get("peak_rss_mb") is not None]
+        sizes = [r["bytes"] for r in recs if r.get("bytes") is not None]
+        return {
+            "label": self.label,
+            "frames": n,
+            "total": round(self.clock() - self.started, 6),
+            "frame_wall": round(sum(r["wall"] for r in recs), 6),
+            "mean": {k: round(v, 6) for k, v in mean.items()},
+            "slowest": {"frame": slowest["frame"], "wall": slowest["wall"]} if slowest else None,
+            "extra": {k: round(v, 6) for k, v in self.extra.items()},
+            "peak_rss_mb": round(max(peaks), 1) if peaks else None,
+            "frame_bytes": sum(sizes) if sizes else None,
+            "output_bytes": self.output_bytes,
+        }
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.0f}ms"
+
+
+def format_summary(s: dict) -> str:
+    phases = " / ".join(f"{p} {_ms(s['mean'][p])}" for p in PHASES if s["mean"][p] > 0)
+    parts = [f"{s['frames']} frames", f"{s['total']:.1f}s", (phases or "-") + " par frame"]
+    parts += [f"{k} {v:.1f}s" for k, v in s["extra"].items()]
+    if s["peak_rss_mb"] is not None:
+        parts.append(f"pic mémoire {s['peak_rss_mb']:.0f} Mo")
+    size = s["output_bytes"] if s["output_bytes"] is not None else s["frame_bytes"]
+    if size is not None:
+        parts.append(f"sortie {size / 2**20:.1f} Mo")
+    return f"[ARES] trace {s['label']}: " + " • ".join(parts)
+
+
+def write_report(timeline: FrameTimeline, folder: Path | None = None) -> Path:
+    """reports/render_trace_<label>_<date>.jsonl ; retourne le chemin."""
+    folder = Path(folder or default_report_dir())
+    folder.mkdir(parents=True, exist_ok=True)
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    path = folder / f"render_trace_{timeline.label}_{stamp}.jsonl"
+    with open(path, "w", encoding="utf-8") as f:
+        for rec in timeline.records():
+            f.write(json.dumps(rec) + "\n")
+        f.write(json.dumps({"summary": timeline.summary()}) + "\n")
+    return path
@@ -0,0 +1,109 @@
+"""
+Blade v13 — core.symmetry
+Symétrie de rotation d'ordre N autour de l'axe d'orbite (Z) :
+- nuage de points étiquetés (sommets, centres de faces par matériau,
+  repères de lumières) invariant par rotation de 360/N degrés, à une
+  tolérance près (relative à l'étendue du nuage), vectorisé numpy,
+- plan de réutilisation : seules les frames du secteur unique sont rendues,
+  les autres reprennent la frame équivalente du premier secteur.
+Pas de bpy ici.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import product
+
+import numpy as np
+
+MAX_ORDER = 12
+TOLERANCE = 1e-4  # fraction de l'étendue du nuage
+
+
+@dataclass(frozen=True)
+class Symmetry:
+    order: int = 1  # 1 : aucune symétrie exploitable
+    reason: str | None = None  # pourquoi l'ordre vaut 1
+    details: dict = field(default_factory=dict)
+
+
+def _keys(cells: np.ndarray, labels: np.ndarray, lo: np.ndarray, dims: np.ndarray) -> np.ndarray:
+    """Une clé entière par (cellule, étiquette) ; cellules décalées de `lo`, bornées par `dims`."""
+    c = cells - lo
+    return ((labels * dims[0] + c[:, 0]) * dims[1] + c[:, 1]) * dims[2] + c[:, 2]
+
+
+def is_invariant(
+    points: np.ndarray,
+    labels: np.ndarray,
+    angle: float,
+    center: Sequence[float] = (0.0, 0.0),
+    tol: float = TOLERANCE,
+) -> bool:
+    """True si la rotation de `angle` (rad, axe Z passant par `center`) envoie chaque
+    point sur un point de même étiquette, à `tol` x étendue près."""
+    if len(points) == 0:
+        return True
+    pts = np.asarray(points, dtype=np.float64)
+    labels = np.asarray(labels, dtype=np.int64)
+    cx, cy = center
+    extent = float(np.ptp(pts, axis=0).max()) or 1.0
+    cell = tol * extent
+
+    c, s = math.cos(angle), math.sin(angle)
+    x, y = pts[:, 0] - cx, pts[:, 1] - cy
+    rotated = np.column_stack((c * x - s * y + cx, s * x + c * y + cy, pts[:, 2]))
+
+    base = np.floor(pts / cell).astype(np.int64)
+    moved = np.floor(rotated / cell).astype(np.int64)
+    lo = np.minimum(base.min(axis=0), moved.min(axis=0)) - 1
+    dims = np.maximum(base.max(axis=0), moved.max(axis=0)) - lo + 2
+    if float(np.prod(dims.astype(np.float64))) * (labels.max() + 1) >= 2**62:
+        return False  # grille trop fine pour des clés int64 : refus prudent
+    known = np.unique(_keys(base, labels, lo, dims))
+    found = np.zeros(len(pts), dtype=bool)
+    # un voisin à moins d'une cellule diffère d'au plus 1 par axe
+    for offset in product((-1, 0, 1), repeat=3):
+        todo = ~found
+        if not todo.any():
+            break
+        keys = _keys(moved[todo] + np.array(offset), labels[todo], lo, dims)
+        found[np.flatnonzero(todo)[np.isin(keys, known)]] = True
+    return bool(found.all())
+
+
+def rotation_order(
+    points: np.ndarray,
+    labels: np.ndarray | None = None,
+    center: Sequence[float] = (0.0, 0.0),
+    max_order: int = MAX_ORDER,
+    tol: float = TOLERANCE,
+) -> int:
+    """Plus grand N <= max_order tel que le nuage soit invariant par rotation de 360/N."""
+    pts = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    labels = np.zeros(len(pts), dtype=np.int64) if labels is None else np.asarray(labels)
+    for n in range(max_order, 1, -1):
+        if is_invariant(pts, labels, 2 * math.pi / n, center, tol):
+            return n
+    return 1
+
+
+def usable_order(order: int, period: int) -> int:
+    """Plus grand diviseur de `order` qui découpe `period` frames en secteurs entiers."""
+    for n in range(order, 1, -1):
+        if order % n == 0 and period % n == 0:
+            return n
+    return 1
+
+
+def frame_sources(start: int, end: int, period: int, order: int) -> dict[int, int]:
+    """{frame -> frame rendue équivalente} pour les frames hors du premier secteur.
+
+    period : frames par tour complet (frame start + period = même vue que start).
+    """
+    n = usable_order(order, period)
+    if n <= 1:
+        return {}
+    step = period // n
+    return {f: start + (f - start) % step for f in range(start + step, end + 1)}
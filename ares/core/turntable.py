@@ -24,9 +24,11 @@ except Exception:  # pragma: no cover
 # ---------------------------------------------------------------------------
 def _ensure_collection(name: str = "ARES_Turntable"):
     import bpy
+
+    from ares.helpers.lifecycle import tag
     coll = bpy.data.collections.get(name)
     if not coll:
-        coll = bpy.data.collections.new(name)
+        coll = tag(bpy.data.collections.new(name))
         # link au root de la scène si nécessaire
         root = bpy.context.scene.collection
         if coll.name not in [c.name for c in root.children]:
@@ -49,13 +51,15 @@ def _link_only_to_collection(obj, collection):
 
 def _make_curve_circle(name: str = "TT_Path", radius: float = 3.0):
     import bpy
+
+    from ares.helpers.lifecycle import tag
     # Réutilise si existe
     obj = bpy.data.objects.get(name)
     if obj and obj.type == "CURVE":
         obj.data.dimensions = "3D"
         return obj
 
-    crv = bpy.data.curves.new(name + "_Curve", type="CURVE")
+    crv = tag(bpy.data.curves.new(name + "_Curve", type="CURVE"))
     crv.dimensions = "3D"
     spl = crv.splines.new("NURBS")
     spl.points.add(7)  # total 8 points
@@ -73,7 +77,7 @@ def _make_curve_circle(name: str = "TT_Path", radius: float = 3.0):
         spl.points[i].co = (x * radius, y * radius, 0.0, 1.0)
     spl.use_cyclic_u = True
 
-    obj = bpy.data.objects.new(name, crv)
+    obj = tag(bpy.data.objects.new(name, crv))
     bpy.context.scene.collection.objects.link(obj)
     return obj
 
@@ -124,12 +128,15 @@ def render_turntable(
     mp4_path: str = "renders/turntable.mp4",
     samples: int | None = None,
     preset: RenderPreset | None = None,
+    shards: int = 1,
+    background: bool = False,
 ):
     """Wrapper stable qui délègue à la vraie implémentation de render_turntable.
 
     - ps / samples sont repris du preset si fournis.
     - preset.res_x / preset.res_y sont ignorés ici si l'impl réelle ne les supporte pas,
       mais on garde ce type pour compat UI.
+    - background=True : retourne le BackgroundRender (ares.blender.background).
     """
     # Harmonisation des paramètres depuis le preset éventuel
     if preset is not None:
@@ -152,6 +159,8 @@ def render_turntable(
         fps=fps,
         mp4_path=mp4_path,
         samples=samples,
+        shards=shards,
+        background=background,
     )
 
 
@@ -1,10 +1,18 @@
 ﻿# Blade v13 — helpers
 from .engine import select_engine
-from .materials import assign_material, ensure_material
+from .materials import (
+    assign_bulk,
+    assign_material,
+    ensure_material,
+    get_material,
+    set_variant,
+    variant_material,
+)
 from .objects import create_cube, create_mesh_object, link_object, safe_set
 
 __all__ = [
     "select_engine",
-    "ensure_material", "assign_material",
+    "ensure_material", "assign_material", "assign_bulk", "get_material",
+    "variant_material", "set_variant",
     "link_object", "create_mesh_object", "safe_set", "create_cube",
 ]
@@ -0,0 +1,206 @@
+"""
+Blade v13 — helpers.lifecycle
+Propriété des datablocks créés par ares :
+- chaque datablock créé est marqué (propriété custom ares_owner =
+  "<session>:<job>") ; `job()` fixe le job courant,
+- registre (collection, nom) par propriétaire, tenu à jour par tag() :
+  owned()/release() ne parcourent que les datablocks marqués ; un seul
+  balayage de bpy.data par fichier chargé (marques des sessions passées),
+  handler load_post posé au premier balayage, retiré par unregister(),
+- release(job) supprime les données d'un job en un seul
+  bpy.data.batch_remove, puis purge les orphelins (option),
+- leak_report(fn) : croissance de bpy.data sur des appels répétés
+  (ares.core.datablocks).
+"""
+from __future__ import annotations
+
+import contextlib
+import uuid
+from collections.abc import Callable, Iterator
+
+import bpy
+
+from ares.core.datablocks import format_report, leaks
+
+OWNER_PROP = "ares_owner"
+SESSION = uuid.uuid4().hex[:8]
+DEFAULT_JOB = "session"
+
+# id_type -> collection de bpy.data quand ce n'est pas id_type.lower() + "s"
+_KINDS = {
+    "MESH": "meshes", "NODETREE": "node_groups", "LIGHT_PROBE": "lightprobes",
+    "BRUSH": "brushes", "GREASEPENCIL": "grease_pencils", "CACHEFILE": "cache_files",
+    "PAINTCURVE": "paint_curves", "CURVES": "hair_curves", "LIBRARY": "libraries",
+}
+
+_jobs: list[str] = []
+_registry: dict[str, set[tuple[str, str]]] | None = None  # owner -> {(collection, nom)}
+
+
+def _collections() -> list[str]:
+    """Collections d'ID de bpy.data (objects, meshes, cameras, actions...)."""
+    return [
+        p.identifier for p in bpy.data.bl_rna.properties
+        if p.type == "COLLECTION" and p.identifier not in ("window_managers", "workspaces",
+                                                            "screens", "libraries")
+    ]
+
+
+def _kind(idblock) -> str:
+    return _KINDS.get(idblock.id_type, idblock.id_type.lower() + "s")
+
+
+def _index() -> dict[str, set[tuple[str, str]]]:
+    """Registre des datablocks marqués ; construit par un balayage au premier besoin."""
+    global _registry
+    if _registry is None:
+        _install()
+        _registry = {}
+        for kind in _collections():
+            for idblock in getattr(bpy.data, kind):
+                value = idblock.get(OWNER_PROP)
+                if isinstance(value, str) and idblock.library is None:
+                    _registry.setdefault(value, set()).add((kind, idblock.name))
+    return _registry
+
+
+@bpy.app.handlers.persistent
+def _reset_registry(*_args) -> None:
+    """Nouveau fichier chargé : registre reconstruit au prochain owned()/release()."""
+    global _registry
+    _registry = None
+
+
+def _handlers() -> list:
+    return [h for h in bpy.app.handlers.load_post
+            if getattr(h, "__name__", "") == "_reset_registry"]
+
+
+def _install() -> None:
+    if not _handlers():
+        bpy.app.handlers.load_post.append(_reset_registry)
+
+
+def unregister() -> None:
+    """Retire le handler load_post (appelé par ares.unregister) ; registre oublié."""
+    global _registry
+    for h in _handlers():
+        bpy.app.handlers.load_post.remove(h)
+    _registry = None
+
+
+def current_job() -> str:
+    return _jobs[-1] if _jobs else DEFAULT_JOB
+
+
+def owner(job: str | None = None) -> str:
+    return f"{SESSION}:{job or current_job()}"
+
+
+@contextlib.contextmanager
+def job(name: str, release_on_exit: bool = False) -> Iterator[str]:
+    """Datablocks marqués `name` (via tag/new) le temps du bloc."""
+    _jobs.append(name)
+    try:
+        yield owner(name)
+    finally:
+        _jobs.pop()
+        if release_on_exit:
+            release(name)
+
+
+def tag(idblock, job: str | None = None):
+    """Marque `idblock` comme appartenant au job (courant par défaut) ; le retourne."""
+    if idblock is not None:
+        value = idblock[OWNER_PROP] = owner(job)
+        if _registry is not None:  # sinon le balayage initial le trouvera
+            _registry.setdefault(value, set()).add((_kind(idblock), idblock.name))
+    return idblock
+
+
+def new(kind: str, name: str, *args, job: str | None = None):
+    """bpy.data.<kind>.new(name, *args) marqué : new("cameras", "TT_Camera")."""
+    return tag(getattr(bpy.data, kind).new(name, *args), job)
+
+
+def owned(job: str | None = None, any_session: bool = False) -> list:
+    """Datablocks marqués pour `job` (None : tous ceux de la session).
+
+    Lu dans le registre : un datablock marqué puis renommé n'y est retrouvé
+    qu'après rescan().
+    """
+    def match(value: str) -> bool:
+        session, _, name = value.partition(":")
+        if job is not None and name != job:
+            return False
+        return any_session or session == SESSION
+
+    found = []
+    registry = _index()
+    for value in [v for v in registry if match(v)]:
+        alive = set()
+        for kind, name in registry[value]:
+            idblock = getattr(bpy.data, kind, {}).get(name)
+            if idblock is None or idblock.library is not None:
+                continue
+            if idblock.get(OWNER_PROP) == value:
+                found.append(idblock)
+                alive.add((kind, name))
+        if alive:
+            registry[value] = alive
+        else:
+            del registry[value]
+    return found
+
+
+def rescan() -> None:
+    """Reconstruit le registre (datablocks marqués renommés ou créés hors tag())."""
+    _reset_registry()
+
+
+def purge_orphans() -> int:
+    """Supprime les datablocks locaux sans utilisateur (hors fake user), récursivement."""
+    try:
+        return bpy.data.orphans_purge(do_local_ids=True, do_linked_ids=False, do_recursive=True)
+    except (AttributeError, TypeError):
+        removed = 0
+        while True:
+            dead = [
+                i for kind in _collections() for i in getattr(bpy.data, kind)
+                if i.users == 0 and not i.use_fake_user and i.library is None
+            ]
+            if not dead:
+                return removed
+            bpy.data.batch_remove(dead)
+            removed += len(dead)
+
+
+def release(job: str | None = None, purge: bool = True, any_session: bool = False) -> int:
+    """Supprime les datablocks du job (un batch_remove) ; purge : orphelins ensuite.
+
+    Retourne le nombre de datablocks supprimés. purge vide tous les orphelins
+    locaux (comme File > Clean Up), pas seulement ceux du job.
+    """
+    ids = owned(job, any_session=any_session)
+    if ids:
+        gone = {(_kind(i), i.name) for i in ids}
+        bpy.data.batch_remove(ids)
+        for value in list(_index()):
+            _registry[value] -= gone
+            if not _registry[value]:
+                del _registry[value]
+    return len(ids) + (purge_orphans() if purge else 0)
+
+
+def snapshot() -> dict[str, int]:
+    return {kind: len(getattr(bpy.data, kind)) for kind in _collections()}
+
+
+def leak_report(fn: Callable[[], object], repeats: int = 3) -> dict[str, int]:
+    """Appelle `fn` `repeats` fois, affiche la croissance de bpy.data ; retourne les fuites."""
+    snaps = [snapshot()]
+    for _ in range(repeats):
+        fn()
+        snaps.append(snapshot())
+    print("[ARES] leak report\n" + format_report(snaps))
+    return leaks(snaps)
@@ -1,20 +1,108 @@
+"""
+Blade v13 — helpers.materials
+- Registre nom -> Material (lookup O(1), revalidé si le datablock a disparu).
+- Assignation unitaire ou en bloc (une écriture par mesh distinct).
+- Matériau « variant » : couleur/roughness/metallic lues dans des attributs
+  d'objet ou d'instance (nœud Attribute INSTANCER) -> un seul shader pour
+  des milliers d'objets colorés.
+"""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
+
 import bpy
 
+from .lifecycle import tag
+
+_registry: dict[str, bpy.types.Material] = {}
+
+# paramètre -> (entrée du Principled, attribut par défaut)
+VARIANT_INPUTS = {
+    "base_color": ("Base Color", "ares_color"),
+    "roughness": ("Roughness", "ares_roughness"),
+    "metallic": ("Metallic", "ares_metallic"),
+}
+VARIANT_MATERIAL = "ARES_Variant_Mat"
+
+
+def get_material(name: str, build: Callable[[str], bpy.types.Material] | None = None):
+    """Material `name` depuis le registre ; créé par `build(name)` (ou vide) s'il manque."""
+    mat = _registry.get(name)
+    if mat is not None:
+        try:
+            if mat.name == name:
+                return mat
+        except ReferenceError:  # supprimé depuis (undo, reload, remove)
+            pass
+    mat = bpy.data.materials.get(name)
+    if mat is None:
+        mat = tag(build(name) if build is not None else bpy.data.materials.new(name))
+    _registry[name] = mat
+    return mat
+
+
+def forget(name: str | None = None) -> None:
+    """Vide le registre (tout, ou une entrée)."""
+    if name is None:
+        _registry.clear()
+    else:
+        _registry.pop(name, None)
+
 
 def ensure_material(name: str) -> bpy.types.Material:
-    mat = bpy.data.materials.get(name) or bpy.data.materials.new(name)
+    mat = get_material(name)
     if not mat.use_nodes:
         mat.use_nodes = True
     return mat
 
 
-def assign_material(obj: bpy.types.Object, mat: bpy.types.Material):
+def assign_material(obj: bpy.types.Object, mat: bpy.types.Material, slot: int | None = None):
+    """Ajoute `mat` aux slots de l'objet, ou le place dans le slot `slot`."""
     data = getattr(obj, "data", None)
     mats = getattr(data, "materials", None)
-    if mats is not None and mat.name not in [m.name for m in mats]:
-        mats.append(mat)
+    if mats is None:
+        return
+    if slot is None:
+        if mat.name not in mats:
+            mats.append(mat)
+        return
+    while len(mats) <= slot:
+        mats.append(None)
+    mats[slot] = mat
+
+
+def assign_bulk(objects: Iterable[bpy.types.Object], mat: bpy.types.Material,
+                slot: int = 0, link: str = "DATA") -> int:
+    """Assigne `mat` au slot `slot` de tous les objets ; retourne le nombre d'écritures.
+
+    link="DATA" : une écriture par mesh distinct (meshes partagés = une seule fois).
+    link="OBJECT" : slot porté par chaque objet, le mesh n'est pas modifié.
+    """
+    done: set[int] = set()
+    writes = 0
+    for obj in objects:
+        data = getattr(obj, "data", None)
+        mats = getattr(data, "materials", None)
+        if mats is None:
+            continue
+        if link == "OBJECT":
+            while len(mats) <= slot:
+                mats.append(None)
+            s = obj.material_slots[slot]
+            s.link = "OBJECT"
+            s.material = mat
+            writes += 1
+            continue
+        key = data.as_pointer()
+        if key in done:  # mesh partagé déjà traité
+            continue
+        done.add(key)
+        while len(mats) <= slot:
+            mats.append(None)
+        if mats[slot] != mat:
+            mats[slot] = mat
+            writes += 1
+    return writes
 
 
 def create_principled_setup(mat: bpy.types.Material):
@@ -29,3 +117,58 @@ def create_principled_setup(mat: bpy.types.Material):
     )
     if not has_link:
         nt.links.new(bsdf.outputs.get("BSDF"), out.inputs.get("Surface"))
+
+
+# ---------- matériau variant ----------
+
+def _build_variant(name: str, attrs: dict, defaults: dict) -> bpy.types.Material:
+    mat = bpy.data.materials.new(name)
+    mat.use_nodes = True
+    nt = mat.node_tree
+    bsdf = next(n for n in nt.nodes if n.type == "BSDF_PRINCIPLED")
+    for i, (param, (socket, attr_name)) in enumerate(VARIANT_INPUTS.items()):
+        target = bsdf.inputs[socket]
+        if param in defaults:
+            target.default_value = defaults[param]
+        attr = nt.nodes.new("ShaderNodeAttribute")
+        # INSTANCER : attribut de l'instanceur (GN, particules), sinon de l'objet lui-même
+        attr.attribute_type = "INSTANCER"
+        attr.attribute_name = attrs.get(param, attr_name)
+        attr.location = (-500, 200 - 220 * i)
+        # attribut absent -> Alpha = 0 : on garde la valeur par défaut du socket
+        mix = nt.nodes.new("ShaderNodeMix")
+        mix.data_type = "RGBA" if param == "base_color" else "FLOAT"
+        mix.location = (-250, 200 - 220 * i)
+        sock_a, sock_b, out = (
+            (mix.inputs[6], mix.inputs[7], mix.outputs[2]) if param == "base_color"
+            else (mix.inputs[2], mix.inputs[3], mix.outputs[0])
+        )
+        sock_a.default_value = target.default_value
+        nt.links.new(attr.outputs["Alpha"], mix.inputs["Factor"])
+        nt.links.new(attr.outputs["Color" if param == "base_color" else "Fac"], sock_b)
+        nt.links.new(out, target)
+    mat["ares_variant"] = True
+    return mat
+
+
+def variant_material(name: str = VARIANT_MATERIAL, attrs: dict | None = None,
+                     **defaults) -> bpy.types.Material:
+    """Matériau partagé dont les paramètres viennent d'attributs.
+
+    attrs : renomme les attributs lus, ex. {"base_color": "color"} pour un
+    attribut d'instance Geometry Nodes. defaults : base_color=(r,g,b,a), roughness=...
+    """
+    attrs = attrs or {}
+    return get_material(name, lambda n: _build_variant(n, attrs, defaults))
+
+
+def set_variant(obj: bpy.types.Object, base_color=None, roughness=None, metallic=None) -> None:
+    """Valeurs lues par variant_material (propriétés custom de l'objet)."""
+    if base_color is not None:
+        rgba = tuple(base_color) + (1.0,) * (4 - len(base_color))
+        obj[VARIANT_INPUTS["base_color"][1]] = rgba
+        obj.color = rgba  # couleur viewport (Solid > Object)
+    if roughness is not None:
+        obj[VARIANT_INPUTS["roughness"][1]] = float(roughness)
+    if metallic is not None:
+        obj[VARIANT_INPUTS["metallic"][1]] = float(metallic)
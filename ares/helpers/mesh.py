@@ -0,0 +1,98 @@
+"""
+Blade v13 — helpers.mesh
+Construction de maillages à partir de tableaux NumPy :
+- vertices/loops/polygons.add + foreach_set (aucun tuple Python par sommet),
+- UV, normales custom, material_index et smooth en un appel chacun,
+- entrée directe des MeshArrays de modules.gen.parametric.
+"""
+from __future__ import annotations
+
+import contextlib
+
+import bpy
+import numpy as np
+
+from ares.modules.gen.parametric import MeshArrays
+
+from .lifecycle import tag
+from .objects import link_object
+
+
+def _flat(a, dtype) -> np.ndarray:
+    return np.ascontiguousarray(a, dtype=dtype).reshape(-1)
+
+
+def build_mesh(
+    name: str,
+    verts,
+    loop_verts=None,
+    loop_totals=None,
+    *,
+    uvs=None,
+    normals=None,
+    material_indices=None,
+    smooth=None,
+    uv_name: str = "UVMap",
+    validate: bool = False,
+) -> bpy.types.Mesh:
+    """Maillage depuis des tableaux : verts (n,3), loop_verts (L,), loop_totals (P,).
+
+    uvs : (L,2) par loop. normals : (n,3) par sommet ou (L,3) par loop.
+    material_indices : (P,) ou scalaire. smooth : bool ou (P,) bool.
+    """
+    verts = _flat(verts, np.float32)
+    me = tag(bpy.data.meshes.new(name))
+    me.vertices.add(len(verts) // 3)
+    me.vertices.foreach_set("co", verts)
+    if loop_verts is None or loop_totals is None or not len(loop_totals):
+        me.update()
+        return me
+
+    loops = _flat(loop_verts, np.int32)
+    totals = _flat(loop_totals, np.int32)
+    starts = np.zeros(len(totals), dtype=np.int32)
+    np.cumsum(totals[:-1], out=starts[1:])
+    me.loops.add(len(loops))
+    me.loops.foreach_set("vertex_index", loops)
+    me.polygons.add(len(totals))
+    me.polygons.foreach_set("loop_start", starts)
+    with contextlib.suppress(AttributeError, TypeError, RuntimeError):
+        me.polygons.foreach_set("loop_total", totals)  # lecture seule depuis Blender 4.0
+
+    if material_indices is not None:
+        mi = np.broadcast_to(np.asarray(material_indices, dtype=np.int32), totals.shape)
+        me.polygons.foreach_set("material_index", _flat(mi, np.int32))
+    if smooth is not None:
+        sm = np.broadcast_to(np.asarray(smooth, dtype=bool), totals.shape)
+        me.polygons.foreach_set("use_smooth", _flat(sm, bool))
+
+    me.update(calc_edges=True)
+
+    if uvs is not None:
+        layer = me.uv_layers.new(name=uv_name)
+        layer.data.foreach_set("uv", _flat(uvs, np.float32))
+    if normals is not None:
+        n = np.asarray(normals, dtype=np.float32).reshape(-1, 3)
+        if hasattr(me, "use_auto_smooth"):  # < 4.1 : requis pour les normales custom
+            me.use_auto_smooth = True
+        if len(n) == len(me.vertices):
+            me.normals_split_custom_set_from_vertices(n)
+        else:
+            me.normals_split_custom_set(n)
+    if validate:
+        me.validate(clean_customdata=False)
+    return me
+
+
+def mesh_from_arrays(name: str, arrays: MeshArrays, **kw) -> bpy.types.Mesh:
+    kw.setdefault("uvs", arrays.uvs)
+    return build_mesh(name, arrays.verts, arrays.loop_verts, arrays.loop_totals, **kw)
+
+
+def create_object_from_arrays(
+    name: str, arrays: MeshArrays, collection=None, **kw
+) -> bpy.types.Object:
+    """Objet lié à la scène (ou `collection`) pour des MeshArrays."""
+    obj = tag(bpy.data.objects.new(name, mesh_from_arrays(name + "_Mesh", arrays, **kw)))
+    link_object(obj, collection=collection)
+    return obj
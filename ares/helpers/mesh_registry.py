@@ -0,0 +1,191 @@
+"""
+Blade v13 — helpers.mesh_registry
+Maillages partagés entre objets :
+- primitives : même (type, paramètres) -> même datablock ; la clé est stockée en
+  propriété custom (ares_mesh_key) et retrouvée après rechargement du .blend,
+- dedupe_meshes : hash des buffers (foreach_get) puis user_remap des doublons,
+- collect : supprime les maillages du registre restés sans utilisateur.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+
+import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+
+from ares.blender.fingerprint import hash_mesh_data
+
+from .lifecycle import tag
+
+KEY_PROP = "ares_mesh_key"
+
+_index: dict[str, str] = {}  # clé -> nom du mesh
+_state = {"scanned": False}
+
+# type d'attribut -> (propriété foreach, composantes, dtype)
+_ATTR_LAYOUT = {
+    "FLOAT": ("value", 1, np.float32),
+    "INT": ("value", 1, np.int32),
+    "INT8": ("value", 1, np.int32),
+    "INT32_2D": ("value", 2, np.int32),
+    "BOOLEAN": ("value", 1, np.bool_),
+    "FLOAT2": ("vector", 2, np.float32),
+    "FLOAT_VECTOR": ("vector", 3, np.float32),
+    "FLOAT_COLOR": ("color", 4, np.float32),
+    "BYTE_COLOR": ("color", 4, np.float32),
+    "QUATERNION": ("value", 4, np.float32),
+}
+
+
+def _norm(v):
+    if isinstance(v, float):
+        return round(v, 6)
+    if isinstance(v, (tuple, list)):
+        return [_norm(x) for x in v]
+    return v
+
+
+def primitive_key(kind: str, **params) -> str:
+    """Clé stable : primitive_key("cube", size=1.0) -> 'cube:{"size":1.0}'."""
+    norm = {k: _norm(v) for k, v in params.items()}
+    return f"{kind}:" + json.dumps(norm, sort_keys=True, separators=(",", ":"))
+
+
+@persistent
+def _on_load(_dummy=None):
+    _index.clear()
+    _state["scanned"] = False
+
+
+def _scan() -> None:
+    if _on_load not in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.append(_on_load)
+    for me in bpy.data.meshes:
+        key = me.get(KEY_PROP)
+        if key:
+            _index.setdefault(key, me.name)
+    _state["scanned"] = True
+
+
+def _lookup(key: str) -> bpy.types.Mesh | None:
+    if not _state["scanned"]:
+        _scan()
+    name = _index.get(key)
+    me = bpy.data.meshes.get(name) if name else None
+    if me is not None and me.get(KEY_PROP) == key:
+        return me
+    _index.pop(key, None)
+    return None
+
+
+def shared_mesh(key: str, build: Callable[[], bpy.types.Mesh]) -> bpy.types.Mesh:
+    """Mesh enregistré sous `key`, construit par `build()` au premier appel."""
+    me = _lookup(key)
+    if me is None:
+        me = build()
+        me[KEY_PROP] = key
+        _index[key] = me.name
+    return me
+
+
+def make_single_user(obj: bpy.types.Object) -> bpy.types.Mesh:
+    """Copie privée du mesh partagé de `obj` (avant édition)."""
+    me = obj.data
+    if me.users > 1 or me.get(KEY_PROP):
+        me = tag(me.copy())
+        me.pop(KEY_PROP, None)
+        obj.data = me
+    return me
+
+
+def collect() -> int:
+    """Supprime les maillages du registre à 0 utilisateur ; retourne le nombre libéré."""
+    dead = [me for me in bpy.data.meshes if me.users == 0 and me.get(KEY_PROP)]
+    for me in dead:
+        _index.pop(me[KEY_PROP], None)
+    if dead:
+        bpy.data.batch_remove(dead)
+    for key, name in list(_index.items()):
+        if bpy.data.meshes.get(name) is None:
+            del _index[key]
+    return len(dead)
+
+
+def stats() -> dict:
+    live = [bpy.data.meshes.get(n) for n in _index.values()]
+    live = [me for me in live if me is not None]
+    return {"entries": len(live), "users": sum(me.users for me in live)}
+
+
+# ---------- dédoublonnage par contenu ----------
+
+def _header(me: bpy.types.Mesh) -> tuple:
+    """Filtre bon marché avant de hasher : tailles, slots, noms d'attributs."""
+    return (
+        len(me.vertices), len(me.edges), len(me.loops), len(me.polygons),
+        tuple(m.name if m else "" for m in me.materials),
+        tuple(sorted((a.name, a.domain, a.data_type) for a in me.attributes)),
+    )
+
+
+def mesh_digest(me: bpy.types.Mesh) -> bytes:
+    h = hashlib.blake2b(digest_size=20)
+    hash_mesh_data(h, me)
+    buf = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", buf)
+    h.update(buf.tobytes())
+    for attr in sorted(me.attributes, key=lambda a: a.name):
+        layout = _ATTR_LAYOUT.get(attr.data_type)
+        if layout is None:
+            h.update(f"{attr.name}:{attr.data_type}".encode())
+            continue
+        prop, comps, dtype = layout
+        buf = np.empty(len(attr.data) * comps, dtype=dtype)
+        attr.data.foreach_get(prop, buf)
+        h.update(attr.name.encode())
+        h.update(buf.tobytes())
+    if getattr(me, "has_custom_normals", False):
+        buf = np.empty(len(me.loops) * 3, dtype=np.float32)
+        me.loops.foreach_get("normal", buf)
+        h.update(buf.tobytes())
+    return h.digest()
+
+
+def dedupe_meshes(meshes: Iterable[bpy.types.Mesh] | None = None, remove: bool = True) -> dict:
+    """Remappe les maillages identiques sur un seul datablock.
+
+    Ignorés : meshes liés (library), à shape keys, ou portés par un objet à
+    vertex groups (les poids ne sont pas lisibles en bloc).
+    Retourne {nom remplacé: nom conservé}.
+    """
+    weighted = {ob.data.name for ob in bpy.data.objects if ob.type == "MESH" and ob.vertex_groups}
+    groups: dict[tuple, list] = defaultdict(list)
+    for me in (bpy.data.meshes if meshes is None else meshes):
+        if me.users and me.library is None and me.shape_keys is None and me.name not in weighted:
+            groups[_header(me)].append(me)
+
+    remap: dict[str, str] = {}
+    orphans = []
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        by_digest: dict[bytes, list] = defaultdict(list)
+        for me in group:
+            by_digest[mesh_digest(me)].append(me)
+        for dups in by_digest.values():
+            keep = max(dups, key=lambda m: (m.get(KEY_PROP) is not None, m.users))
+            for me in dups:
+                if me is keep:
+                    continue
+                remap[me.name] = keep.name
+                me.user_remap(keep)
+                orphans.append(me)
+    if remove:
+        dead = [me for me in orphans if me.users == 0]
+        if dead:
+            bpy.data.batch_remove(dead)
+    return remap
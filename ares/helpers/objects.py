@@ -1,6 +1,8 @@
 ﻿# Blade v13 — helpers.objects (patch: create_cube)
 import bpy
 
+from .lifecycle import tag
+
 
 def safe_set(obj, prop, value):
     try:
@@ -21,16 +23,46 @@ def link_object(obj, collection=None):
     return True
 
 def create_mesh_object(name="Object", verts=(), edges=(), faces=(), collection=None):
-    mesh = bpy.data.meshes.new(name + "_Mesh")
-    mesh.from_pydata(list(verts), list(edges), list(faces))
-    mesh.update()
-    obj = bpy.data.objects.new(name, mesh)
+    if len(edges):
+        # arêtes libres : from_pydata reste le plus simple
+        mesh = tag(bpy.data.meshes.new(name + "_Mesh"))
+        mesh.from_pydata(list(verts), list(edges), list(faces))
+        mesh.update()
+    else:
+        from ares.modules.gen.parametric import faces_to_loops
+
+        from .mesh import build_mesh
+        mesh = build_mesh(name + "_Mesh", verts, *faces_to_loops(faces))
+    obj = tag(bpy.data.objects.new(name, mesh))
     link_object(obj, collection=collection)
     return obj
 
-def create_cube(name="Cube", size=1.0, collection=None):
+def _cube_geometry(size):
     s = float(size) * 0.5
     v = [(-s,-s,-s), ( s,-s,-s), ( s, s,-s), (-s, s,-s),
          (-s,-s, s), ( s,-s, s), ( s, s, s), (-s, s, s)]
     f = [(0,1,2,3),(4,5,6,7),(0,1,5,4),(2,3,7,6),(1,2,6,5),(0,3,7,4)]
-    return create_mesh_object(name=name, verts=v, edges=[], faces=f, collection=collection)
+    return v, f
+
+def create_cube(name="Cube", size=1.0, collection=None, shared=False):
+    """shared=True : un seul mesh par taille (voir helpers.mesh_registry).
+
+    À réserver aux objets dont les matériaux passent par des slots OBJECT
+    (assign_bulk(link="OBJECT")) : un matériau DATA irait sur tous les cubes.
+    """
+    if not shared:
+        v, f = _cube_geometry(size)
+        return create_mesh_object(name=name, verts=v, edges=[], faces=f, collection=collection)
+    from ares.modules.gen.parametric import faces_to_loops
+
+    from .mesh import build_mesh
+    from .mesh_registry import primitive_key, shared_mesh
+
+    def build():
+        v, f = _cube_geometry(size)
+        return build_mesh(f"Cube_{float(size):g}_Mesh", v, *faces_to_loops(f))
+
+    mesh = shared_mesh(primitive_key("cube", size=float(size)), build)
+    obj = tag(bpy.data.objects.new(name, mesh))
+    link_object(obj, collection=collection)
+    return obj
@@ -0,0 +1,11 @@
+# Blade v13 — jobs (queue persistante de rendus headless)
+from .pool import WorkerPool
+from .queue import DONE, FAILED, QUEUED, RUNNING, Job, JobQueue
+from .runner import LauncherBusy, Scheduler
+from .spec import JobSpec, load_preset
+
+__all__ = [
+    "JobSpec", "load_preset",
+    "Job", "JobQueue", "QUEUED", "RUNNING", "DONE", "FAILED",
+    "Scheduler", "LauncherBusy", "WorkerPool",
+]
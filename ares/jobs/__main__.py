@@ -0,0 +1,71 @@
+"""
+Blade v13 — CLI jobs
+    python -m ares.jobs submit asset.blend renders/asset.mp4 --preset FAST --priority 5
+    python -m ares.jobs run --workers 4
+    python -m ares.jobs run --workers 4 --warm --max-jobs 50 --max-rss-mb 4096
+    python -m ares.jobs status
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+from .pool import WorkerPool
+from .queue import JobQueue
+from .runner import Scheduler
+from .spec import JobSpec
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m ares.jobs")
+    ap.add_argument("--db", default=None, help="fichier SQLite (défaut: ARES_JOBS_DB)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    s = sub.add_parser("submit")
+    s.add_argument("target")
+    s.add_argument("output")
+    s.add_argument("--preset", default="NORMAL")
+    s.add_argument("--obj", default=None)
+    s.add_argument("--priority", type=int, default=0)
+    s.add_argument("--max-attempts", type=int, default=3)
+
+    r = sub.add_parser("run")
+    r.add_argument("--workers", type=int, default=2)
+    r.add_argument(
+        "--forever", action="store_true", help="ne pas s'arrêter quand la queue est vide"
+    )
+    r.add_argument("--warm", action="store_true", help="workers Blender persistants (jobs.pool)")
+    r.add_argument("--max-jobs", type=int, default=50, help="recyclage d'un worker après N jobs")
+    r.add_argument("--max-rss-mb", type=float, default=4096.0, help="recyclage au-delà de ce RSS")
+
+    sub.add_parser("status")
+
+    args = ap.parse_args(argv)
+    queue = JobQueue(args.db)
+    try:
+        if args.cmd == "submit":
+            spec = JobSpec(target=args.target, output=args.output, preset=args.preset, obj=args.obj)
+            job_id = queue.submit(spec.normalized(), args.priority, args.max_attempts)
+            print(job_id)
+        elif args.cmd == "run":
+            if args.warm:
+                pool = WorkerPool(args.workers, max_jobs=args.max_jobs, max_rss_mb=args.max_rss_mb)
+                sched = Scheduler(queue, max_workers=args.workers, launcher=pool.launcher)
+            else:
+                pool, sched = None, Scheduler(queue, max_workers=args.workers)
+            try:
+                counts = sched.run(drain=not args.forever)
+            finally:
+                if pool is not None:
+                    pool.close()
+            print(json.dumps(counts))
+        else:
+            print(json.dumps(queue.counts()))
+    finally:
+        queue.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
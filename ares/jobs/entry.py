@@ -0,0 +1,91 @@
+"""
+Blade v13 — jobs.entry
+Script exécuté DANS Blender par le scheduler (mode froid) :
+    blender -b target.blend -P ares/jobs/entry.py -- '<payload json>'
+payload = {"spec": {...JobSpec...}, "settings": {seconds, fps, samples, ...}}
+Le worker chaud (jobs.worker) réutilise run_job() sans relancer Blender.
+"""
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+
+def _pick_object(bpy, name: str | None):
+    if name:
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            raise RuntimeError(f"Objet introuvable: {name!r}")
+        return obj
+    obj = bpy.context.view_layer.objects.active
+    if obj is not None and obj.type == "MESH":
+        return obj
+    return next((o for o in bpy.context.scene.objects if o.type == "MESH"), None)
+
+
+def run_payload(payload: dict) -> Path:
+    import bpy
+
+    from ares.blender.render import RenderPreset, render_turntable
+
+    spec, settings = payload["spec"], payload.get("settings", {})
+    obj = _pick_object(bpy, spec.get("obj"))
+    preset = RenderPreset(
+        res_x=int(settings.get("res_x", 1280)),
+        res_y=int(settings.get("res_y", 720)),
+        fps=int(settings.get("fps", 25)),
+        samples=int(settings.get("samples", 64)),
+    )
+    out = Path(spec["output"])
+    out.parent.mkdir(parents=True, exist_ok=True)
+    # dossier propre au job : deux jobs du même objet vers le même dossier
+    # (run --workers N) n'écrivent pas le même <objet>.mp4 intermédiaire
+    work = Path(tempfile.mkdtemp(prefix=f".{out.stem}_", dir=out.parent))
+    try:
+        rendered = render_turntable(
+            obj, preset, seconds=float(settings.get("seconds", 8)), out_dir=work
+        )
+        rendered.replace(out)
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+    return out
+
+
+def export_payload(payload: dict) -> Path:
+    import bpy
+
+    from ares.modules.asset_core.api import quick_export_glb
+
+    spec = payload["spec"]
+    obj = _pick_object(bpy, spec.get("obj"))
+    return quick_export_glb(obj, spec["output"])
+
+
+KINDS = {
+    "turntable": run_payload,
+    "export_glb": export_payload,
+}
+
+
+def run_job(payload: dict) -> Path:
+    kind = payload["spec"].get("kind", "turntable")
+    if kind not in KINDS:
+        raise ValueError(f"Type de job inconnu: {kind!r}")
+    return KINDS[kind](payload)
+
+
+def main(argv: list[str]) -> int:
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    if not args:
+        print("[JOBS] payload manquant")
+        return 2
+    out = run_job(json.loads(args[0]))
+    print("[JOBS] Output:", out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,175 @@
+"""
+Blade v13 — jobs.pool
+- Pool de workers Blender chauds (voir jobs.worker) : le démarrage de Blender et
+  l'import d'`ares` ne sont payés qu'une fois par worker, pas par job.
+- Recyclage automatique après `max_jobs` jobs ou au-delà de `max_rss_mb`.
+- Au plus `size` workers vivants (occupés + libres) ; `pool.launcher` est
+  compatible avec Scheduler(launcher=..., max_workers <= size).
+"""
+from __future__ import annotations
+
+import json
+import queue as _queue
+import subprocess
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+from ares.core.blender_proc import blender_cmd, child_env
+
+from .queue import Job
+from .runner import LauncherBusy, job_payload
+from .worker import PREFIX
+
+WORKER = Path(__file__).resolve().with_name("worker.py")
+
+
+class WarmWorker:
+    """Un process Blender persistant qui parle le protocole JSON-lines."""
+
+    def __init__(self, log_path: Path, cmd: Sequence[str] | None = None):
+        cmd = list(cmd) if cmd else blender_cmd(
+            "--python-exit-code", 1, script=WORKER, factory_startup=True
+        )
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(log_path, "a", encoding="utf-8")  # noqa: SIM115 (fermé dans _pump)
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+            env=child_env(),
+        )
+        self.replies: _queue.Queue = _queue.Queue()
+        self.jobs_done = 0
+        self.rss = 0
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self) -> None:
+        with self._log:
+            for line in self.proc.stdout:
+                if line.startswith(PREFIX):
+                    self.replies.put(json.loads(line[len(PREFIX):]))
+                else:
+                    self._log.write(line)
+        self.replies.put(None)  # EOF : le worker est mort
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def send(self, msg: dict) -> None:
+        self.proc.stdin.write(json.dumps(msg) + "\n")
+        self.proc.stdin.flush()
+
+    def close(self, timeout: float = 10.0) -> None:
+        if self.alive:
+            try:
+                self.send({"op": "quit"})
+                self.proc.stdin.close()
+                self.proc.wait(timeout=timeout)
+            except Exception:
+                self.proc.kill()
+                self.proc.wait()
+
+
+class PendingJob:
+    """Handle façon Popen (poll/terminate/returncode) pour un job envoyé à un worker."""
+
+    def __init__(self, pool: WorkerPool, worker: WarmWorker, job_id: int):
+        self.pool, self.worker, self.job_id = pool, worker, job_id
+        self.returncode: int | None = None
+        self.reply: dict | None = None
+
+    def poll(self) -> int | None:
+        while self.returncode is None:
+            try:
+                msg = self.worker.replies.get_nowait()
+            except _queue.Empty:
+                return None
+            if msg is None:
+                self.returncode = 1
+                self.pool._discard(self.worker)
+            elif msg.get("id") == self.job_id:
+                self.reply = msg
+                self.returncode = 0 if msg.get("ok") else 1
+                if not msg.get("ok"):
+                    print(f"[JOBS] worker #{self.job_id}: {msg.get('error')}")
+                self.worker.rss = int(msg.get("rss") or 0)
+                self.worker.jobs_done += 1
+                self.pool._release(self.worker)
+        return self.returncode
+
+    def terminate(self) -> None:
+        if self.returncode is None:
+            self.worker.proc.kill()
+            self.pool._discard(self.worker)
+            self.returncode = -9
+
+
+class WorkerPool:
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        max_jobs: int = 50,
+        max_rss_mb: float = 4096.0,
+        log_dir: Path | None = None,
+        cmd: Sequence[str] | None = None,
+    ):
+        from ares.core.paths import ROOT
+
+        self.size = max(1, int(size))
+        self.max_jobs = max_jobs
+        self.max_rss = int(max_rss_mb * 1024 * 1024)
+        self.log_dir = log_dir or ROOT / "renders" / "jobs" / "logs"
+        self.cmd = cmd
+        self.idle: list[WarmWorker] = []
+        self.busy: list[WarmWorker] = []
+        self.spawned = 0
+
+    def _spawn(self) -> WarmWorker:
+        self.spawned += 1
+        return WarmWorker(self.log_dir / f"worker_{self.spawned:03d}.log", cmd=self.cmd)
+
+    def _acquire(self) -> WarmWorker:
+        w = None
+        while self.idle and w is None:
+            w = self.idle.pop()
+            if not w.alive:
+                w = None
+        if w is None:
+            if len(self.busy) >= self.size:
+                raise LauncherBusy(f"pool plein : {self.size} workers occupés")
+            w = self._spawn()
+        self.busy.append(w)
+        return w
+
+    def _release(self, w: WarmWorker) -> None:
+        if w in self.busy:
+            self.busy.remove(w)
+        if w.jobs_done >= self.max_jobs or (self.max_rss and w.rss > self.max_rss):
+            w.close()
+        elif w.alive:
+            self.idle.append(w)
+
+    def _discard(self, w: WarmWorker) -> None:
+        for group in (self.idle, self.busy):
+            if w in group:
+                group.remove(w)
+        if w.alive:
+            w.proc.kill()
+
+    def launcher(self, job: Job, log_path: Path) -> PendingJob:
+        """Compatible Scheduler : envoie le job à un worker libre (ou neuf)."""
+        w = self._acquire()
+        w.send({"id": job.id, "op": "run", "payload": job_payload(job)})
+        return PendingJob(self, w, job.id)
+
+    def close(self) -> None:
+        for w in self.idle + self.busy:
+            w.close()
+        self.idle.clear()
+        self.busy.clear()
@@ -0,0 +1,209 @@
+"""
+Blade v13 — jobs.queue
+- Queue persistante (SQLite) : priorités, fusion des doublons, retries avec backoff.
+- Plusieurs schedulers peuvent partager le même fichier : claim() est atomique
+  (BEGIN IMMEDIATE).
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .spec import JobSpec
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL UNIQUE,
+    spec TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    not_before REAL NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_pick ON jobs (state, priority DESC, created);
+"""
+
+
+def default_db_path() -> Path:
+    from ares.core.paths import ROOT
+
+    return Path(os.environ.get("ARES_JOBS_DB") or ROOT / "renders" / "jobs" / "queue.sqlite")
+
+
+@dataclass(frozen=True)
+class Job:
+    id: int
+    spec: JobSpec
+    priority: int
+    state: str
+    attempts: int
+    max_attempts: int
+    error: str | None = None
+    result: str | None = None
+
+
+class JobQueue:
+    """File de jobs persistante. Priorité haute = servie en premier."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        backoff_base: float = 30.0,
+        backoff_max: float = 900.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path) if path is not None else default_db_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self._db = sqlite3.connect(str(self.path), isolation_level=None, timeout=30.0)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    # ---------- écriture ----------
+
+    def _tx(self):
+        self._db.execute("BEGIN IMMEDIATE")
+        return self._db
+
+    def submit(self, spec: JobSpec, priority: int = 0, max_attempts: int = 3) -> int:
+        """Ajoute un job ; un doublon en attente/en cours est fusionné (priorité max)."""
+        key, now = spec.key(), self.clock()
+        db = self._tx()
+        try:
+            row = db.execute("SELECT id, state, priority FROM jobs WHERE key=?", (key,)).fetchone()
+            if row is None:
+                cur = db.execute(
+                    "INSERT INTO jobs (key, spec, priority, state, max_attempts, created, updated)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, spec.to_json(), priority, QUEUED, max_attempts, now, now),
+                )
+                job_id = cur.lastrowid
+            elif row["state"] in (QUEUED, RUNNING):
+                db.execute(
+                    "UPDATE jobs SET priority=?, updated=? WHERE id=?",
+                    (max(priority, row["priority"]), now, row["id"]),
+                )
+                job_id = row["id"]
+            else:
+                # déjà terminé / abandonné : on le relance
+                db.execute(
+                    "UPDATE jobs SET state=?, priority=?, attempts=0, max_attempts=?,"
+                    " not_before=0, error=NULL, result=NULL, updated=? WHERE id=?",
+                    (QUEUED, priority, max_attempts, now, row["id"]),
+                )
+                job_id = row["id"]
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return int(job_id)
+
+    def claim(self) -> Job | None:
+        """Prend le job prêt le plus prioritaire et le passe en RUNNING."""
+        now = self.clock()
+        db = self._tx()
+        try:
+            row = db.execute(
+                "SELECT id FROM jobs WHERE state=? AND not_before<=?"
+                " ORDER BY priority DESC, created, id LIMIT 1",
+                (QUEUED, now),
+            ).fetchone()
+            if row is not None:
+                db.execute(
+                    "UPDATE jobs SET state=?, attempts=attempts+1, updated=? WHERE id=?",
+                    (RUNNING, now, row["id"]),
+                )
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return self.get(row["id"]) if row is not None else None
+
+    def complete(self, job_id: int, result: str | None = None) -> None:
+        self._db.execute(
+            "UPDATE jobs SET state=?, result=?, error=NULL, updated=? WHERE id=?",
+            (DONE, result, self.clock(), job_id),
+        )
+
+    def fail(self, job_id: int, error: str) -> str:
+        """Échec d'une tentative : re-queue avec backoff exponentiel, ou FAILED si épuisé."""
+        job = self.get(job_id)
+        now = self.clock()
+        if job is not None and job.attempts < job.max_attempts:
+            delay = min(self.backoff_max, self.backoff_base * 2 ** max(0, job.attempts - 1))
+            self._db.execute(
+                "UPDATE jobs SET state=?, not_before=?, error=?, updated=? WHERE id=?",
+                (QUEUED, now + delay, error, now, job_id),
+            )
+            return QUEUED
+        self._db.execute(
+            "UPDATE jobs SET state=?, error=?, updated=? WHERE id=?",
+            (FAILED, error, now, job_id),
+        )
+        return FAILED
+
+    def release(self, job_id: int) -> None:
+        """Rend un job RUNNING à la queue sans compter la tentative (arrêt volontaire)."""
+        self._db.execute(
+            "UPDATE jobs SET state=?, attempts=MAX(0, attempts-1), updated=?"
+            " WHERE id=? AND state=?",
+            (QUEUED, self.clock(), job_id, RUNNING),
+        )
+
+    def requeue_stale(self) -> int:
+        """Remet en QUEUED les jobs RUNNING orphelins (scheduler tué)."""
+        cur = self._db.execute(
+            "UPDATE jobs SET state=?, updated=? WHERE state=?", (QUEUED, self.clock(), RUNNING)
+        )
+        return cur.rowcount
+
+    # ---------- lecture ----------
+
+    def get(self, job_id: int) -> Job | None:
+        row = self._db.execute("SELECT * FROM jobs WHERE id=?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row["id"],
+            spec=JobSpec.from_json(row["spec"]),
+            priority=row["priority"],
+            state=row["state"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            error=row["error"],
+            result=row["result"],
+        )
+
+    def counts(self) -> dict[str, int]:
+        rows = self._db.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state")
+        out = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        out.update({r["state"]: r["n"] for r in rows})
+        return out
+
+    def next_ready_in(self) -> float | None:
+        """Secondes avant que le prochain job QUEUED soit prêt (None si aucun)."""
+        row = self._db.execute(
+            "SELECT MIN(not_before) AS t FROM jobs WHERE state=?", (QUEUED,)
+        ).fetchone()
+        if row is None or row["t"] is None:
+            return None
+        return max(0.0, row["t"] - self.clock())
@@ -0,0 +1,125 @@
+"""
+Blade v13 — jobs.runner
+- Scheduler : vide la queue avec au plus `max_workers` Blender en parallèle.
+- Un process qui sort en code != 0 (crash, exception) est re-tenté via la queue
+  (backoff exponentiel, voir JobQueue.fail).
+- Un lanceur sans place libre (LauncherBusy) rend le job sans compter la tentative.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from ares.core.blender_proc import blender_cmd, spawn_blender
+
+from .queue import Job, JobQueue
+from .spec import load_preset
+
+ENTRY = Path(__file__).resolve().with_name("entry.py")
+
+Launcher = Callable[[Job, Path], subprocess.Popen]
+
+
+class LauncherBusy(RuntimeError):
+    """Le lanceur n'a pas de place pour le job (ex. pool plein) : ce n'est pas un échec."""
+
+
+def job_payload(job: Job) -> dict:
+    spec = job.spec.normalized()
+    return {"spec": json.loads(spec.to_json()), "settings": load_preset(spec.preset)}
+
+
+def blender_launcher(job: Job, log_path: Path) -> subprocess.Popen:
+    """Lancement par défaut : un Blender froid par job."""
+    payload = job_payload(job)
+    cmd = blender_cmd(
+        "--python-exit-code", 1,
+        blend=payload["spec"]["target"],
+        script=ENTRY,
+        script_args=[json.dumps(payload)],
+    )
+    return spawn_blender(cmd, log_path=log_path)
+
+
+class Scheduler:
+    def __init__(
+        self,
+        queue: JobQueue,
+        *,
+        max_workers: int = 2,
+        launcher: Launcher = blender_launcher,
+        poll: float = 0.5,
+        log_dir: Path | None = None,
+    ):
+        self.queue = queue
+        self.max_workers = max(1, int(max_workers))
+        self.launcher = launcher
+        self.poll = poll
+        self.log_dir = log_dir or queue.path.parent / "logs"
+        self.running: dict[int, subprocess.Popen] = {}
+
+    def _start(self, job: Job) -> bool:
+        """Lance `job` ; False si le lanceur est plein (job rendu à la queue)."""
+        log_path = self.log_dir / f"job_{job.id:06d}_try{job.attempts}.log"
+        try:
+            self.running[job.id] = self.launcher(job, log_path)
+            print(f"[JOBS] start #{job.id} ({job.spec.preset}) try {job.attempts}")
+        except LauncherBusy:
+            self.queue.release(job.id)
+            return False
+        except Exception as e:
+            self.queue.fail(job.id, f"launch: {e}")
+        return True
+
+    def _reap(self) -> int:
+        finished = 0
+        for job_id, proc in list(self.running.items()):
+            rc = proc.poll()
+            if rc is None:
+                continue
+            del self.running[job_id]
+            finished += 1
+            if rc == 0:
+                self.queue.complete(job_id, result=self.queue.get(job_id).spec.output)
+                print(f"[JOBS] done #{job_id}")
+            else:
+                state = self.queue.fail(job_id, f"exit code {rc}")
+                print(f"[JOBS] fail #{job_id} (rc={rc}) -> {state}")
+        return finished
+
+    def step(self) -> bool:
+        """Un tour de boucle ; True tant qu'il reste du travail (en cours ou en attente)."""
+        self._reap()
+        while len(self.running) < self.max_workers:
+            job = self.queue.claim()
+            if job is None or not self._start(job):
+                break
+        return bool(self.running) or self.queue.next_ready_in() is not None
+
+    def run(self, drain: bool = True, recover: bool = True) -> dict[str, int]:
+        """Boucle principale. drain=True : s'arrête quand la queue est vide.
+
+        recover=True remet en queue les jobs RUNNING orphelins au démarrage
+        (à désactiver si plusieurs schedulers partagent la même base).
+        """
+        if recover:
+            self.queue.requeue_stale()
+        try:
+            while True:
+                busy = self.step()
+                if drain and not busy:
+                    break
+                wait = self.poll
+                if not self.running:
+                    ready = self.queue.next_ready_in()
+                    wait = self.poll if ready is None else min(max(ready, self.poll), 5.0)
+                time.sleep(wait)
+        except KeyboardInterrupt:
+            for job_id, proc in self.running.items():
+                proc.terminate()
+                self.queue.release(job_id)
+            raise
+        return self.queue.counts()
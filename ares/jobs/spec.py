@@ -0,0 +1,58 @@
+"""
+Blade v13 — jobs.spec
+- JobSpec : description figée d'un rendu (cible .blend, objet, preset, sortie).
+- key() : empreinte stable utilisée pour fusionner les doublons dans la queue.
+- Les presets sont résolus côté scheduler via ares.config (compilé, mis en cache).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from ares.config.schema import DEFAULTS
+
+DEFAULT_PRESETS = DEFAULTS["turntable_presets"]
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    target: str                 # fichier .blend à ouvrir
+    output: str                 # fichier de sortie (.mp4)
+    preset: str = "NORMAL"      # clé de config/turntable_presets.yaml
+    obj: str | None = None      # objet à cadrer (None = objet actif / premier mesh)
+    kind: str = "turntable"
+
+    def normalized(self) -> JobSpec:
+        return JobSpec(
+            target=str(Path(self.target).resolve()),
+            output=str(Path(self.output).resolve()),
+            preset=self.preset.upper(),
+            obj=self.obj or None,
+            kind=self.kind,
+        )
+
+    def key(self) -> str:
+        payload = json.dumps(asdict(self.normalized()), sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), sort_keys=True)
+
+    @classmethod
+    def from_json(cls, text: str) -> JobSpec:
+        return cls(**json.loads(text))
+
+
+def load_preset(name: str, path: str | Path | None = None) -> dict:
+    """Preset de turntable_presets.yaml via ares.config (fallback: DEFAULT_PRESETS).
+
+    path : dossier de config (ou un fichier de ce dossier) ; défaut config/.
+    """
+    from ares import config
+
+    if path is not None:
+        path = Path(path)
+        path = path if path.is_dir() else path.parent
+    return config.get(path).preset(name).as_dict()
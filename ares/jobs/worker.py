@@ -0,0 +1,96 @@
+"""
+Blade v13 — jobs.worker
+Worker "chaud" qui tourne DANS Blender et garde `ares` importé entre les jobs :
+    blender -b --factory-startup -P ares/jobs/worker.py
+Protocole JSON-lines sur stdin/stdout :
+    -> {"id": 12, "op": "run", "payload": {...}}    (payload: voir jobs.entry)
+    -> {"op": "quit"}
+    <- @@ARES {"id": 12, "ok": true, "result": "...", "rss": 123456, "seconds": 1.2}
+Les réponses sont préfixées (@@ARES) car Blender écrit aussi sur stdout.
+Entre deux jobs la scène est réinitialisée (open_mainfile / read_factory_settings).
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+
+PREFIX = "@@ARES "
+
+
+def rss_bytes() -> int:
+    """Mémoire résidente courante (Linux: /proc), sinon pic via resource."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+    except Exception:
+        return 0
+
+
+def _reply(msg: dict) -> None:
+    sys.stdout.write(PREFIX + json.dumps(msg) + "\n")
+    sys.stdout.flush()
+
+
+def _reset_scene(blend: str | None) -> None:
+    import bpy
+
+    if blend:
+        bpy.ops.wm.open_mainfile(filepath=blend, load_ui=False)
+    else:
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+
+
+def handle(msg: dict) -> str:
+    from ares.jobs.entry import run_job
+
+    payload = msg["payload"]
+    _reset_scene(payload["spec"].get("target"))
+    return str(run_job(payload))
+
+
+def serve(stream=None) -> int:
+    # imports chauds : payés une seule fois par worker
+    import ares.blender.render  # noqa: F401
+    import ares.jobs.entry  # noqa: F401
+
+    stream = stream or sys.stdin
+    done = 0
+    _reply({"ready": True, "pid": os.getpid(), "rss": rss_bytes()})
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        msg = json.loads(line)
+        if msg.get("op") == "quit":
+            break
+        t0 = time.perf_counter()
+        try:
+            out = {"id": msg.get("id"), "ok": True, "result": handle(msg)}
+        except Exception as e:
+            out = {
+                "id": msg.get("id"),
+                "ok": False,
+                "error": f"{type(e).__name__}: {e}",
+                "trace": traceback.format_exc(limit=8),
+            }
+        done += 1
+        out.update(rss=rss_bytes(), seconds=round(time.perf_counter() - t0, 3), jobs=done)
+        _reply(out)
+    return 0
+
+
+if __name__ == "__main__":
+    _root = str(Path(__file__).resolve().parents[2])
+    if _root not in sys.path:
+        sys.path.insert(0, _root)
+    sys.exit(serve())
@@ -1,3 +1,10 @@
-from . import turntable_gen
+# Sous-modules chargés à la demande : turntable_gen importe bpy.
 
 __all__ = ["turntable_gen"]
+
+
+def __getattr__(name):
+    if name == "turntable_gen":
+        from . import turntable_gen
+        return turntable_gen
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,13 @@
-﻿from .simple import create_lowpoly_dog
+﻿# Modules bpy chargés à la demande : animals.herd reste importable hors Blender.
 
-__all__ = ["create_lowpoly_dog"]
+__all__ = ["create_lowpoly_dog", "create_herd"]
 
+
+def __getattr__(name):
+    if name == "create_lowpoly_dog":
+        from .simple import create_lowpoly_dog
+        return create_lowpoly_dog
+    if name == "create_herd":
+        from .instancing import create_herd
+        return create_herd
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,102 @@
+"""
+Blade v13 — animals.herd
+Partie NumPy pure (sans bpy) du troupeau instancié :
+- géométrie du chien low-poly fusionnée en un seul maillage par pose
+  (mêmes pièces que simple.create_lowpoly_dog),
+- placement + variations par instance (échelle, couleur, orientation, pose),
+  reproductibles via une seed.
+La construction Blender (Geometry Nodes) est dans animals.instancing.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from ares.modules.gen.parametric import MeshArrays, box, merge
+
+# (nom, taille, centre) : repris de simple.create_lowpoly_dog
+DOG_PARTS = (
+    ("Body", 1.2, (0.0, 0.0, 0.6)),
+    ("Head", 0.6, (0.7, 0.0, 1.1)),
+    ("LegFL", 0.25, (0.35, 0.25, 0.25)),
+    ("LegFR", 0.25, (0.35, -0.25, 0.25)),
+    ("LegBL", 0.25, (-0.35, 0.25, 0.25)),
+    ("LegBR", 0.25, (-0.35, -0.25, 0.25)),
+    ("Tail", 0.15, (-0.7, 0.0, 1.0)),
+)
+HEAD_PIVOT = (0.45, 0.0, 1.1)
+TAIL_PIVOT = (-0.6, 0.0, 0.95)
+
+# (lacet de la tête, inclinaison de la queue) en degrés, une entrée par prototype
+DEFAULT_POSES = ((0.0, 0.0), (25.0, 20.0), (-25.0, -15.0), (10.0, 40.0))
+
+
+def _rotate(pts: np.ndarray, pivot, axis: str, deg: float) -> np.ndarray:
+    c, s = math.cos(math.radians(deg)), math.sin(math.radians(deg))
+    if axis == "z":
+        rot = np.array([(c, -s, 0.0), (s, c, 0.0), (0.0, 0.0, 1.0)])
+    else:  # y
+        rot = np.array([(c, 0.0, s), (0.0, 1.0, 0.0), (-s, 0.0, c)])
+    p = np.asarray(pivot, dtype=np.float64)
+    return (pts - p) @ rot.T + p
+
+
+def dog_arrays(head_yaw_deg: float = 0.0, tail_pitch_deg: float = 0.0) -> MeshArrays:
+    """Chien complet en un maillage (origine au sol), tête/queue tournées."""
+    parts = []
+    for name, size, center in DOG_PARTS:
+        part = box(size, center)
+        verts = part.verts.astype(np.float64)
+        if name == "Head" and head_yaw_deg:
+            verts = _rotate(verts, HEAD_PIVOT, "z", head_yaw_deg)
+        elif name == "Tail" and tail_pitch_deg:
+            verts = _rotate(verts, TAIL_PIVOT, "y", -tail_pitch_deg)
+        parts.append(MeshArrays(verts.astype(np.float32), part.loop_verts,
+                                part.loop_totals, part.uvs))
+    return merge(parts)
+
+
+@dataclass(frozen=True)
+class HerdLayout:
+    positions: np.ndarray  # (n, 3) float32
+    yaw: np.ndarray  # (n,) float32, radians
+    scale: np.ndarray  # (n,) float32
+    color: np.ndarray  # (n, 4) float32 RGBA linéaire
+    pose: np.ndarray  # (n,) int32, index dans les prototypes
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+def scatter_herd(
+    count: int,
+    seed: int = 0,
+    spacing: float = 2.5,
+    jitter: float = 0.35,
+    scale_range: tuple[float, float] = (0.8, 1.2),
+    base_color: tuple[float, float, float] = (0.45, 0.3, 0.18),
+    color_jitter: float = 0.25,
+    poses: int = len(DEFAULT_POSES),
+) -> HerdLayout:
+    """Grille carrée centrée + bruit ; même seed -> même troupeau."""
+    n = max(0, int(count))
+    rng = np.random.default_rng(seed)
+    side = max(1, math.ceil(math.sqrt(n)))
+    i = np.arange(n)
+    grid = np.stack([i % side, i // side], axis=1) - (side - 1) / 2.0
+    xy = (grid + rng.uniform(-jitter, jitter, (n, 2))) * spacing
+    positions = np.column_stack([xy, np.zeros(n)])
+
+    tint = 1.0 + rng.uniform(-color_jitter, color_jitter, (n, 1))  # clair/foncé
+    hue = 1.0 + rng.uniform(-color_jitter, color_jitter, (n, 3)) * 0.3  # léger décalage
+    rgb = np.clip(np.asarray(base_color) * tint * hue, 0.0, 1.0)
+
+    return HerdLayout(
+        positions=positions.astype(np.float32),
+        yaw=rng.uniform(0.0, 2.0 * math.pi, n).astype(np.float32),
+        scale=rng.uniform(*scale_range, n).astype(np.float32),
+        color=np.column_stack([rgb, np.ones(n)]).astype(np.float32),
+        pose=rng.integers(0, max(1, poses), n).astype(np.int32),
+    )
@@ -0,0 +1,147 @@
+"""
+Blade v13 — animals.instancing
+Troupeau de chiens en instances Geometry Nodes :
+- un maillage par pose (construit une seule fois, collection prototype hors scène),
+- un seul objet « nuage de points » portant les attributs yaw/scale/pose/color,
+- Instance on Points (Pick Instance sur l'attribut pose) : pas d'objet par chien,
+- couleur lue par le matériau variant de helpers.materials (Attribute INSTANCER).
+"""
+from __future__ import annotations
+
+import bpy
+import numpy as np
+
+from ares.helpers.lifecycle import tag
+from ares.helpers.materials import variant_material
+from ares.helpers.mesh import build_mesh, mesh_from_arrays
+from ares.helpers.objects import link_object
+
+from .herd import DEFAULT_POSES, HerdLayout, dog_arrays, scatter_herd
+
+PROTO_COLLECTION = "ARES_Dog_Proto"
+HERD_MATERIAL = "ARES_Herd_Mat"
+INSTANCER_GROUP = "ARES_Herd_Instancer"
+
+
+def ensure_herd_material(name: str = HERD_MATERIAL) -> bpy.types.Material:
+    """Matériau variant dont la Base Color vient de l'attribut d'instance `color`."""
+    return variant_material(name, attrs={"base_color": "color"})
+
+
+def ensure_dog_prototypes(poses=DEFAULT_POSES, name: str = PROTO_COLLECTION):
+    """Collection des prototypes Dog_Pose_00.. (non liée à la scène : jamais rendue seule)."""
+    coll = bpy.data.collections.get(name)
+    if coll is not None and len(coll.objects) == len(poses):
+        return coll
+    coll = coll or tag(bpy.data.collections.new(name))
+    mat = ensure_herd_material()
+    for i, (head, tail) in enumerate(poses):
+        obj_name = f"Dog_Pose_{i:02d}"
+        if obj_name in coll.objects:
+            continue
+        me = mesh_from_arrays(obj_name + "_Mesh", dog_arrays(head, tail))
+        me.materials.append(mat)
+        coll.objects.link(tag(bpy.data.objects.new(obj_name, me)))
+    return coll
+
+
+def _new_socket(ng, name: str, in_out: str, socket_type: str):
+    iface = getattr(ng, "interface", None)  # Blender 4.0+
+    if iface is not None:
+        return iface.new_socket(name, in_out=in_out, socket_type=socket_type)
+    return (ng.inputs if in_out == "INPUT" else ng.outputs).new(socket_type, name)
+
+
+def _named(nodes, name: str, data_type: str, x: int, y: int):
+    node = nodes.new("GeometryNodeInputNamedAttribute")
+    node.data_type = data_type
+    node.inputs["Name"].default_value = name
+    node.location = (x, y)
+    return node.outputs["Attribute"]
+
+
+def ensure_instancer_group(collection, name: str = INSTANCER_GROUP):
+    """Points -> instances des enfants de `collection` (index = attribut `pose`)."""
+    ng = bpy.data.node_groups.get(name)
+    if ng is not None:
+        info = next((n for n in ng.nodes if n.bl_idname == "GeometryNodeCollectionInfo"), None)
+        if info is not None:
+            info.inputs["Collection"].default_value = collection
+            return ng
+        bpy.data.node_groups.remove(ng)
+    ng = tag(bpy.data.node_groups.new(name, "GeometryNodeTree"))
+    _new_socket(ng, "Geometry", "INPUT", "NodeSocketGeometry")
+    _new_socket(ng, "Geometry", "OUTPUT", "NodeSocketGeometry")
+    nodes, links = ng.nodes, ng.links
+
+    gin = nodes.new("NodeGroupInput")
+    gin.location = (-600, 0)
+    gout = nodes.new("NodeGroupOutput")
+    gout.location = (400, 0)
+
+    info = nodes.new("GeometryNodeCollectionInfo")
+    info.location = (-300, -150)
+    info.transform_space = "ORIGINAL"
+    info.inputs["Collection"].default_value = collection
+    info.inputs["Separate Children"].default_value = True
+    info.inputs["Reset Children"].default_value = True
+
+    rot = nodes.new("ShaderNodeCombineXYZ")
+    rot.location = (-150, -350)
+    links.new(_named(nodes, "yaw", "FLOAT", -400, -350), rot.inputs["Z"])
+
+    inst = nodes.new("GeometryNodeInstanceOnPoints")
+    inst.location = (100, 0)
+    inst.inputs["Pick Instance"].default_value = True
+    links.new(gin.outputs[0], inst.inputs["Points"])
+    links.new(info.outputs[0], inst.inputs["Instance"])
+    links.new(_named(nodes, "pose", "INT", -150, -250), inst.inputs["Instance Index"])
+    links.new(rot.outputs[0], inst.inputs["Rotation"])
+    links.new(_named(nodes, "scale", "FLOAT", -150, -500), inst.inputs["Scale"])
+    links.new(inst.outputs[0], gout.inputs[0])
+    return ng
+
+
+def _set_attribute(me, name: str, attr_type: str, prop: str, values: np.ndarray):
+    attr = me.attributes.get(name) or me.attributes.new(name, attr_type, "POINT")
+    attr.data.foreach_set(prop, np.ascontiguousarray(values).reshape(-1))
+
+
+def points_mesh(name: str, layout: HerdLayout) -> bpy.types.Mesh:
+    """Maillage de sommets seuls : un point par chien + attributs de variation."""
+    me = build_mesh(name, layout.positions)
+    _set_attribute(me, "yaw", "FLOAT", "value", layout.yaw)
+    _set_attribute(me, "scale", "FLOAT", "value", layout.scale)
+    _set_attribute(me, "pose", "INT", "value", layout.pose)
+    _set_attribute(me, "color", "FLOAT_COLOR", "color", layout.color)
+    return me
+
+
+def create_herd(
+    count: int = 1000,
+    seed: int = 0,
+    *,
+    name: str = "Dog_Herd",
+    poses=DEFAULT_POSES,
+    collection=None,
+    **scatter_kw,
+) -> bpy.types.Object:
+    """Troupeau de `count` chiens : 1 objet, len(poses) maillages, quel que soit `count`.
+
+    scatter_kw : voir herd.scatter_herd (spacing, jitter, scale_range, base_color...).
+    """
+    layout = scatter_herd(count, seed=seed, poses=len(poses), **scatter_kw)
+    protos = ensure_dog_prototypes(poses)
+
+    old = bpy.data.objects.get(name)
+    old_mesh = old.data if old is not None and old.type == "MESH" else None
+    if old is not None:
+        bpy.data.objects.remove(old)
+    if old_mesh is not None and old_mesh.users == 0:
+        bpy.data.meshes.remove(old_mesh)
+
+    obj = tag(bpy.data.objects.new(name, points_mesh(name + "_Points", layout)))
+    mod = obj.modifiers.new("ARES_Herd", "NODES")
+    mod.node_group = ensure_instancer_group(protos)
+    link_object(obj, collection=collection)
+    return obj
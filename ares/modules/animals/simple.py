@@ -2,7 +2,7 @@
 Blade v13 — animals.simple
 - "Low-poly dog" composé de cubes, sans bpy.ops (data-first).
 """
-from ares.helpers import assign_material, create_cube, ensure_material
+from ares.helpers import assign_bulk, create_cube, ensure_material
 
 
 def _cube(name, size, loc):
@@ -26,7 +26,6 @@ def create_lowpoly_dog(root_name="Dog"):
 
     # mat simple
     mat = ensure_material("Dog_Mat")
-    for o in (body, head, legFL, legFR, legBL, legBR, tail):
-        assign_material(o, mat, 0)
+    assign_bulk((body, head, legFL, legFR, legBL, legBR, tail), mat)
 
     return body  # racine
@@ -0,0 +1,325 @@
+"""
+Blade v13 — asset_core.batch
+Export GLB en lot, non destructif :
+- objets et/ou collections -> un .glb par objet,
+- chaque export part d'une copie évaluée (modifiers, rotation/échelle
+  appliquées au maillage copié, comme transform_apply) : l'objet source,
+  la sélection et le .blend ne sont jamais modifiés ni renommés (noms des
+  nœuds et images rétablis dans le JSON du .glb),
+- empreinte par objet (géométrie évaluée, matériaux, réglages) : export
+  sauté si le .glb est à jour (core.export_manifest),
+- exports répartis sur N Blender headless ouvrant un snapshot du .blend,
+  jamais enregistré,
+- profil d'export (config/export_profiles.yaml) : chaîne de LOD décimés
+  (fichiers séparés ou MSFT_lod), compression draco/meshopt, textures
+  réduites ; rapport taille / triangles par LOD (core.gltf).
+Exécuté aussi comme script enfant :
+    blender -b snapshot.blend -P ares/modules/asset_core/batch.py -- '<payload json>'
+"""
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from ares.config import ExportProfile
+from ares.core.blender_proc import blender_cmd, find_blender, spawn_blender
+from ares.core.export_manifest import ExportManifest, partition
+from ares.core.gltf import (
+    add_msft_lod,
+    default_coverage,
+    format_report,
+    lod_name,
+    lod_paths,
+    meshopt_compress,
+    read_glb,
+    rename,
+    write_glb,
+)
+
+SCRIPT = Path(__file__).resolve()
+EXPORTABLE = {"MESH", "CURVE", "SURFACE", "META", "FONT"}
+SETTINGS = {"format": "GLB", "yup": True, "apply": "rotation+scale"}
+EXPORT_SUFFIX = "_ares_export"  # copies d'export ; nœuds renommés après coup
+EXPORT_JOB = "glb_export"  # copies, maillages et textures temporaires (helpers.lifecycle)
+
+
+def resolve(items: Iterable) -> list:
+    """Objets exportables (ordre conservé, sans doublon) : objets, collections ou noms."""
+    import bpy
+
+    found = {}
+    for item in items:
+        if isinstance(item, str):
+            name, item = item, bpy.data.objects.get(item) or bpy.data.collections.get(item)
+            if item is None:
+                raise KeyError(f"Objet ou collection introuvable: {name!r}")
+        objs = item.all_objects if isinstance(item, bpy.types.Collection) else [item]
+        for ob in objs:
+            if ob.type in EXPORTABLE:
+                found.setdefault(ob.name, ob)
+    return list(found.values())
+
+
+def get_profile(profile: str | ExportProfile | None) -> ExportProfile:
+    """Nom (config/export_profiles.yaml), profil, ou None : un .glb, maillage complet."""
+    if profile is None:
+        return ExportProfile()
+    if isinstance(profile, str):
+        from ares.config import get
+
+        return get().export_profile(profile)
+    return profile
+
+
+def export_digest(obj, profile: ExportProfile | None = None) -> str:
+    """Empreinte de ce qui finit dans le .glb : maillage évalué, matrice, matériaux."""
+    import bpy
+
+    from ares.blender.fingerprint import hash_mesh, material_signature
+
+    h = hashlib.sha256()
+    meta = {
+        "blender": bpy.app.version_string,
+        "name": obj.name,
+        "settings": SETTINGS,
+        "profile": (profile or ExportProfile()).as_dict(),
+        "materials": [material_signature(s.material) for s in obj.material_slots],
+    }
+    h.update(json.dumps(meta, sort_keys=True, default=str).encode("utf-8"))
+    hash_mesh(h, obj)
+    return h.hexdigest()
+
+
+def output_for(obj, folder: Path) -> Path:
+    import bpy
+
+    return folder / f"{bpy.path.clean_name(obj.name)}.glb"
+
+
+def outputs_for(out: Path, profile: ExportProfile) -> list[Path]:
+    """Fichiers écrits pour `out` : un par LOD (files) ou un seul (msft_lod)."""
+    return lod_paths(out, len(profile.lods)) if profile.lod_mode == "files" else [out]
+
+
+def _evaluated_copy(obj, depsgraph, collection, name: str):
+    """Copie `name` de `obj` : mesh évalué, rotation/échelle appliquées, même position."""
+    import bpy
+    from mathutils import Matrix
+
+    from ares.helpers.lifecycle import tag
+
+    ob_eval = obj.evaluated_get(depsgraph)
+    mesh = tag(bpy.data.meshes.new_from_object(
+        ob_eval, preserve_all_data_layers=True, depsgraph=depsgraph
+    ))
+    loc, rot, scale = obj.matrix_world.decompose()
+    mesh.transform(Matrix.LocRotScale(None, rot, scale))
+    if scale.x * scale.y * scale.z < 0:
+        mesh.flip_normals()
+    mesh.materials.clear()
+    for slot in obj.material_slots:  # slots objet ou data : mêmes matériaux visibles
+        mesh.materials.append(slot.material)
+    copy = tag(bpy.data.objects.new(name, mesh))
+    copy.location = loc
+    collection.objects.link(copy)
+    return copy
+
+
+def _gltf_options(profile: ExportProfile) -> dict:
+    opts = {
+        "export_format": "GLB",
+        "use_active_collection": True,
+        "export_apply": False,
+        "export_yup": True,
+    }
+    if profile.compression == "draco":
+        opts["export_draco_mesh_compression_enable"] = True
+        opts["export_draco_mesh_compression_level"] = profile.draco_level
+    return opts
+
+
+def _write_lods(obj, name: str, out: Path, levels: list[int], profile: ExportProfile) -> list:
+    """Copies décimées des LOD `levels` de `obj` dans un seul `out` ; lignes du rapport."""
+    import bpy
+
+    from ares.helpers.lifecycle import job, new
+    from ares.modules.asset_core.lod import decimate, downscaled_textures, triangles
+
+    scene, view_layer = bpy.context.scene, bpy.context.view_layer
+    coll = new("collections", "ARES_Export", job=EXPORT_JOB)
+    scene.collection.children.link(coll)
+    prev_active = view_layer.active_layer_collection
+    copies, rows, nodes = [], [], {}
+    try:
+        with job(EXPORT_JOB):  # copies, LOD et textures réduites marqués
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            for k in levels:
+                node = lod_name(name, k) if len(levels) > 1 else name
+                copy = _evaluated_copy(obj, depsgraph, coll, node + EXPORT_SUFFIX)
+                copies.append(copy)
+                nodes[copy.name] = node  # le nœud glTF prend le nom de la source
+                decimate(copy, profile.lods[k])
+                rows.append({"object": name, "file": out.name, "lod": k,
+                             "ratio": profile.lods[k], "triangles": triangles(copy), "bytes": 0})
+            view_layer.active_layer_collection = view_layer.layer_collection.children[coll.name]
+            with downscaled_textures(copies, profile.texture_max) as images:
+                bpy.ops.export_scene.gltf(filepath=str(out), **_gltf_options(profile))
+    finally:
+        view_layer.active_layer_collection = prev_active
+        bpy.data.batch_remove([coll] + copies + [c.data for c in copies])
+
+    if profile.compression == "meshopt":
+        meshopt_compress(out)
+    gltf, binary = read_glb(out)
+    rename(rename(gltf, "nodes", nodes), "images", images)
+    if len(levels) > 1:
+        coverage = profile.coverage or default_coverage(profile.lods)
+        add_msft_lod(gltf, {name: len(levels)}, coverage)
+    write_glb(out, gltf, binary)
+    rows[0]["bytes"] = out.stat().st_size
+    return rows
+
+
+def export_glb(obj, out: str | os.PathLike, profile: ExportProfile | None = None) -> list[dict]:
+    """Exporte `obj` en .glb depuis des copies évaluées ; la scène revient à l'identique.
+
+    profile : LOD, compression, textures (None : un .glb, maillage complet).
+    Retourne le rapport : une ligne {object, file, lod, ratio, triangles, bytes} par LOD.
+    """
+    profile = profile or ExportProfile()
+    out = Path(out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if profile.lod_mode == "msft_lod":
+        return _write_lods(obj, obj.name, out, list(range(len(profile.lods))), profile)
+    rows = []
+    for k, path in enumerate(outputs_for(out, profile)):
+        rows += _write_lods(obj, obj.name, path, [k], profile)
+    return rows
+
+
+def _child_cmd(snapshot: Path, payload: dict) -> list[str]:
+    return blender_cmd(
+        "--python-exit-code", 1,
+        blend=snapshot, script=SCRIPT, script_args=[json.dumps(payload)],
+    )
+
+
+def _export_in_workers(todo: list[tuple], workers: int, profile: ExportProfile) -> dict:
+    """(nom, sortie, poids) exportés par `workers` Blender ; retourne {nom: rapport}."""
+    import bpy
+
+    tmp = Path(tempfile.mkdtemp(prefix="ares_export_"))
+    snapshot = tmp / "snapshot.blend"
+    bpy.ops.wm.save_as_mainfile(filepath=str(snapshot), copy=True, check_existing=False)
+    lots = partition([w for _, _, w in todo], workers)
+    procs = []
+    for i, lot in enumerate(lots):
+        payload = {
+            "items": [[todo[k][0], str(todo[k][1])] for k in lot],
+            "profile": profile.as_dict(),
+            "result": str(tmp / f"lot_{i:02d}.json"),
+        }
+        log = tmp / f"lot_{i:02d}.log"
+        procs.append(spawn_blender(_child_cmd(snapshot, payload), log_path=log))
+    for p in procs:
+        p.wait()
+
+    done = {}
+    for i in range(len(lots)):
+        with contextlib.suppress(OSError, ValueError):  # worker mort : lot en échec
+            done.update(json.loads((tmp / f"lot_{i:02d}.json").read_text(encoding="utf-8")))
+    failed = [name for name, _, _ in todo if name not in done]
+    if failed:
+        print(f"[ARES] export: échecs {failed}, logs conservés dans {tmp}")
+    else:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return done
+
+
+def export_batch(
+    items: Iterable,
+    folder: str | os.PathLike,
+    workers: int | None = None,
+    force: bool = False,
+    profile: str | ExportProfile | None = None,
+) -> dict[str, list]:
+    """Exporte chaque objet de `items` (objets/collections) en <folder>/<nom>.glb.
+
+    workers : Blender headless en parallèle (None : selon les CPU ; 0 : dans ce
+    process). Les objets dont les .glb sont à jour sont sautés (force=True : tout).
+    profile : nom de config/export_profiles.yaml (LOD, compression, textures).
+    Retourne {"exported": [...], "skipped": [...], "report": [...]} (rapport : une
+    ligne par LOD exporté) ; RuntimeError si un export échoue.
+    """
+    folder = Path(folder)
+    profile = get_profile(profile)
+    manifest = ExportManifest(folder)
+    todo, skipped, digests = [], [], {}
+    for ob in resolve(items):
+        out = output_for(ob, folder)
+        digests[ob.name] = digest = export_digest(ob, profile)
+        if not force and all(manifest.current(p, digest) for p in outputs_for(out, profile)):
+            skipped.append(out)
+        else:
+            weight = len(ob.data.vertices) if ob.type == "MESH" else 1
+            todo.append((ob.name, out, weight))
+
+    if workers is None:
+        workers = min(len(todo), max(1, (os.cpu_count() or 2) // 2))
+    if todo and workers > 1 and find_blender() is not None:
+        done = _export_in_workers(todo, workers, profile)
+    else:
+        import bpy
+
+        done = {name: export_glb(bpy.data.objects[name], out, profile) for name, out, _ in todo}
+
+    exported, report = [], []
+    for name, out, _ in todo:
+        if name in done:
+            exported.append(out)
+            report += done[name]
+            for path in outputs_for(out, profile):
+                manifest.record(path, digests[name])
+    manifest.save()
+    print(f"[ARES] export: {len(exported)} exportés, {len(skipped)} à jour -> {folder}")
+    if report:
+        print(format_report(report))
+    failed = [name for name, _, _ in todo if name not in done]
+    if failed:
+        raise RuntimeError(f"Exports en échec: {failed}")
+    return {"exported": exported, "skipped": skipped, "report": report}
+
+
+# ---------- côté enfant ----------
+
+def run_items(payload: dict) -> None:
+    import bpy
+
+    profile = ExportProfile.parse(payload.get("profile") or {}, "payload.profile")
+    done = {}
+    for name, out in payload["items"]:
+        try:
+            done[name] = export_glb(bpy.data.objects[name], out, profile)
+        except Exception as e:  # un objet en échec n'arrête pas le lot
+            print(f"[ARES] export: {name} en échec: {e}")
+    Path(payload["result"]).write_text(json.dumps(done), encoding="utf-8")
+
+
+def main(argv: list[str]) -> int:
+    args = argv[argv.index("--") + 1:] if "--" in argv else []
+    if not args:
+        print("[ARES] export: payload manquant")
+        return 2
+    run_items(json.loads(args[0]))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
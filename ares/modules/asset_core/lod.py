@@ -0,0 +1,89 @@
+"""
+Blade v13 — asset_core.lod
+Briques des profils d'export (config/export_profiles.yaml) :
+- decimate : copie d'export réduite à un ratio de triangles (Decimate
+  collapse appliqué au maillage de la copie),
+- triangles : compte de triangles d'un maillage,
+- downscaled_textures : textures plus grandes que la limite remplacées
+  le temps de l'export par des copies réduites ; matériaux restaurés en
+  sortie, images sources jamais renommées (noms rétablis dans le glTF).
+Ne touche qu'aux copies créées par asset_core.batch.
+"""
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterable, Iterator, Mapping
+
+import bpy
+
+from ares.helpers.lifecycle import tag
+
+
+def decimate(obj, ratio: float):
+    """Remplace le maillage de la copie `obj` par sa version à `ratio` des triangles."""
+    if ratio >= 1.0:
+        return obj
+    mod = obj.modifiers.new("ARES_LOD", "DECIMATE")
+    mod.decimate_type = "COLLAPSE"
+    mod.ratio = ratio
+    mod.use_collapse_triangulate = True
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    depsgraph.update()
+    mesh = tag(bpy.data.meshes.new_from_object(
+        obj.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph
+    ))
+    old = obj.data
+    obj.modifiers.remove(mod)
+    obj.data = mesh
+    bpy.data.meshes.remove(old)
+    return obj
+
+
+def triangles(obj) -> int:
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    return len(mesh.loop_triangles)
+
+
+SCALED_SUFFIX = "_ares_lowres"
+
+
+def _scaled(img, max_size: int):
+    w, h = img.size
+    k = max_size / max(w, h)
+    small = img.copy()
+    small.name = img.name + SCALED_SUFFIX
+    small.scale(max(1, round(w * k)), max(1, round(h * k)))
+    return tag(small)
+
+
+@contextlib.contextmanager
+def downscaled_textures(
+    objects: Iterable, max_size: int | None
+) -> Iterator[Mapping[str, str]]:
+    """Textures > max_size px réduites (ratio conservé) dans les matériaux de `objects`.
+
+    Retourne {nom de la copie réduite -> nom de la source} (core.gltf.rename) ;
+    tout est restauré à la sortie du bloc.
+    """
+    swaps, images = [], {}
+    try:
+        if max_size:
+            mats = {s.material for ob in objects for s in ob.material_slots if s.material}
+            for mat in mats:
+                if mat.library is not None or not mat.use_nodes:
+                    continue
+                for node in mat.node_tree.nodes:
+                    img = node.image if node.type == "TEX_IMAGE" else None
+                    if img is None or max(img.size) <= max_size:  # 0x0 : image absente
+                        continue
+                    if img.name not in images:
+                        images[img.name] = (img, _scaled(img, max_size))
+                    swaps.append((node, img))
+                    node.image = images[img.name][1]
+        yield {small.name: name for name, (_, small) in images.items()}
+    finally:
+        for node, img in swaps:
+            node.image = img
+        for _, small in images.values():
+            bpy.data.images.remove(small)
@@ -0,0 +1,274 @@
+"""
+Blade v13 — gen.parametric
+Primitives paramétriques en NumPy pur (pas de bpy : testable hors Blender) :
+- topologie en tableaux plats (sommets, loops, polygones) prête pour
+  helpers.mesh.build_mesh (foreach_set, sans tuples Python),
+- UV par loop (coutures gérées en dupliquant la colonne u=1),
+- faces orientées vers l'extérieur.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MeshArrays:
+    verts: np.ndarray  # (n, 3) float32
+    loop_verts: np.ndarray  # (L,) int32 : sommet de chaque loop
+    loop_totals: np.ndarray  # (P,) int32 : nb de loops par polygone
+    uvs: np.ndarray | None = None  # (L, 2) float32
+
+    @property
+    def loop_starts(self) -> np.ndarray:
+        starts = np.zeros(len(self.loop_totals), dtype=np.int32)
+        np.cumsum(self.loop_totals[:-1], out=starts[1:])
+        return starts
+
+    def polygon_normals(self) -> np.ndarray:
+        """Normales (non normalisées) par la méthode de Newell, (P, 3)."""
+        p = self.verts[self.loop_verts].astype(np.float64)
+        starts = self.loop_starts
+        nxt = np.arange(1, len(p) + 1)
+        nxt[starts + self.loop_totals - 1] = starts  # dernier loop -> premier du polygone
+        q = p[nxt]
+        cross = np.stack([
+            (p[:, 1] - q[:, 1]) * (p[:, 2] + q[:, 2]),
+            (p[:, 2] - q[:, 2]) * (p[:, 0] + q[:, 0]),
+            (p[:, 0] - q[:, 0]) * (p[:, 1] + q[:, 1]),
+        ], axis=1)
+        return np.add.reduceat(cross, starts, axis=0)
+
+    def polygon_centers(self) -> np.ndarray:
+        p = self.verts[self.loop_verts].astype(np.float64)
+        return np.add.reduceat(p, self.loop_starts, axis=0) / self.loop_totals[:, None]
+
+
+def faces_to_loops(faces: Iterable[Sequence[int]]) -> tuple[np.ndarray, np.ndarray]:
+    """Liste de faces (tuples d'indices) -> (loop_verts, loop_totals)."""
+    faces = [tuple(f) for f in faces]
+    totals = np.fromiter((len(f) for f in faces), dtype=np.int32, count=len(faces))
+    loops = np.fromiter(
+        (i for f in faces for i in f), dtype=np.int32, count=int(totals.sum())
+    )
+    return loops, totals
+
+
+def _quads(idx: np.ndarray, uv: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Quads d'une grille d'indices (rows+1, cols+1) : (r,c) (r,c+1) (r+1,c+1) (r+1,c)."""
+    corners = (idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1])
+    uv_corners = (uv[:-1, :-1], uv[:-1, 1:], uv[1:, 1:], uv[1:, :-1])
+    loops = np.stack(corners, axis=-1).reshape(-1)
+    uvs = np.stack(uv_corners, axis=-2).reshape(-1, 2)
+    return loops.astype(np.int32), uvs
+
+
+def _uv_grid(rows: int, cols: int, v0: float = 0.0, v1: float = 1.0) -> np.ndarray:
+    u = np.linspace(0.0, 1.0, cols + 1)
+    v = np.linspace(v0, v1, rows + 1)
+    uu, vv = np.meshgrid(u, v)
+    return np.stack([uu, vv], axis=-1)
+
+
+def _wrap_columns(rows: int, cols: int, offset: int = 0) -> np.ndarray:
+    """Indices (rows+1, cols+1) d'anneaux fermés : la dernière colonne reprend la première."""
+    idx = np.arange((rows + 1) * cols).reshape(rows + 1, cols) + offset
+    return np.concatenate([idx, idx[:, :1]], axis=1)
+
+
+def _pack(verts, loops: Sequence[np.ndarray], totals: Sequence[np.ndarray], uvs) -> MeshArrays:
+    return MeshArrays(
+        verts=np.ascontiguousarray(verts, dtype=np.float32),
+        loop_verts=np.concatenate(loops).astype(np.int32),
+        loop_totals=np.concatenate(totals).astype(np.int32),
+        uvs=np.ascontiguousarray(np.concatenate(uvs), dtype=np.float32),
+    )
+
+
+# ---------- primitives ----------
+
+def grid(x_segments: int = 10, y_segments: int = 10, size_x: float = 2.0,
+         size_y: float | None = None) -> MeshArrays:
+    """Plan XY subdivisé, centré, normales +Z."""
+    nx, ny = max(1, int(x_segments)), max(1, int(y_segments))
+    size_y = size_x if size_y is None else size_y
+    xs = np.linspace(-size_x / 2.0, size_x / 2.0, nx + 1)
+    ys = np.linspace(-size_y / 2.0, size_y / 2.0, ny + 1)
+    xx, yy = np.meshgrid(xs, ys)
+    verts = np.stack([xx.ravel(), yy.ravel(), np.zeros(xx.size)], axis=1)
+    idx = np.arange((nx + 1) * (ny + 1)).reshape(ny + 1, nx + 1)
+    loops, uvs = _quads(idx, _uv_grid(ny, nx))
+    return _pack(verts, [loops], [np.full(nx * ny, 4)], [uvs])
+
+
+def uv_sphere(radius: float = 1.0, segments: int = 32, rings: int = 16) -> MeshArrays:
+    """Sphère UV : quads + éventails de triangles aux pôles (comme bmesh.ops.create_uvsphere)."""
+    s, r = max(3, int(segments)), max(2, int(rings))
+    theta = 2.0 * math.pi * np.arange(s) / s
+    phi = math.pi * np.arange(1, r) / r  # anneaux du bas vers le haut
+    rho, z = radius * np.sin(phi), -radius * np.cos(phi)
+    ring = np.stack([
+        np.outer(rho, np.cos(theta)).ravel(),
+        np.outer(rho, np.sin(theta)).ravel(),
+        np.repeat(z, s),
+    ], axis=1)
+    bottom, top = len(ring), len(ring) + 1
+    verts = np.vstack([ring, [(0.0, 0.0, -radius), (0.0, 0.0, radius)]])
+
+    idx = _wrap_columns(r - 2, s)
+    loops, uvs = [], []
+    totals = []
+    if r > 2:
+        q, quv = _quads(idx, _uv_grid(r - 2, s, 1.0 / r, (r - 1.0) / r))
+        loops.append(q)
+        uvs.append(quv)
+        totals.append(np.full(s * (r - 2), 4))
+
+    i = np.arange(s)
+    u0, u1, uc = i / s, (i + 1) / s, (i + 0.5) / s
+    first, last = idx[0], idx[-1]
+    loops.append(np.stack([first[1:], first[:-1], np.full(s, bottom)], axis=1).ravel())
+    uvs.append(np.stack([
+        np.stack([u1, np.full(s, 1.0 / r)], axis=1),
+        np.stack([u0, np.full(s, 1.0 / r)], axis=1),
+        np.stack([uc, np.zeros(s)], axis=1),
+    ], axis=1).reshape(-1, 2))
+    loops.append(np.stack([last[:-1], last[1:], np.full(s, top)], axis=1).ravel())
+    uvs.append(np.stack([
+        np.stack([u0, np.full(s, (r - 1.0) / r)], axis=1),
+        np.stack([u1, np.full(s, (r - 1.0) / r)], axis=1),
+        np.stack([uc, np.ones(s)], axis=1),
+    ], axis=1).reshape(-1, 2))
+    totals += [np.full(s, 3), np.full(s, 3)]
+    return _pack(verts, loops, totals, uvs)
+
+
+_T = (1.0 + math.sqrt(5.0)) / 2.0
+_ICO_VERTS = np.array([
+    (-1, _T, 0), (1, _T, 0), (-1, -_T, 0), (1, -_T, 0),
+    (0, -1, _T), (0, 1, _T), (0, -1, -_T), (0, 1, -_T),
+    (_T, 0, -1), (_T, 0, 1), (-_T, 0, -1), (-_T, 0, 1),
+], dtype=np.float64)
+_ICO_FACES = np.array([
+    (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+    (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+    (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+    (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1),
+], dtype=np.int64)
+
+
+def _spherical_uvs(p: np.ndarray) -> np.ndarray:
+    """UV équirectangulaires par loop (p : (F, 3, 3)), couture recollée par triangle."""
+    n = p / np.linalg.norm(p, axis=-1, keepdims=True)
+    u = 0.5 + np.arctan2(n[..., 1], n[..., 0]) / (2.0 * math.pi)
+    v = 0.5 + np.arcsin(np.clip(n[..., 2], -1.0, 1.0)) / math.pi
+    wrap = (u.max(axis=1, keepdims=True) - u) > 0.5
+    u = np.where(wrap, u + 1.0, u)
+    return np.stack([u, v], axis=-1).reshape(-1, 2)
+
+
+def ico_sphere(radius: float = 1.0, subdivisions: int = 2) -> MeshArrays:
+    """Icosphère : subdivision vectorisée (arêtes uniques via np.unique), triangles."""
+    verts = _ICO_VERTS / np.linalg.norm(_ICO_VERTS, axis=1, keepdims=True)
+    faces = _ICO_FACES
+    for _ in range(max(0, int(subdivisions))):
+        edges = np.sort(faces[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        uniq, inv = np.unique(edges, axis=0, return_inverse=True)
+        mids = verts[uniq].mean(axis=1)
+        mids /= np.linalg.norm(mids, axis=1, keepdims=True)
+        m = inv.reshape(-1, 3) + len(verts)  # milieux de (a,b) (b,c) (c,a)
+        a, b, c = faces.T
+        m01, m12, m20 = m.T
+        faces = np.concatenate([
+            np.stack([a, m01, m20], axis=1),
+            np.stack([b, m12, m01], axis=1),
+            np.stack([c, m20, m12], axis=1),
+            np.stack([m01, m12, m20], axis=1),
+        ])
+        verts = np.vstack([verts, mids])
+    uvs = _spherical_uvs(verts[faces])
+    return _pack(verts * radius, [faces.ravel()], [np.full(len(faces), 3)], [uvs])
+
+
+def cylinder(radius: float = 1.0, depth: float = 2.0, segments: int = 32,
+             rings: int = 1, caps: bool = True) -> MeshArrays:
+    """Cylindre axe Z centré ; bouchons en n-gones (un polygone par bouchon)."""
+    s, r = max(3, int(segments)), max(1, int(rings))
+    theta = 2.0 * math.pi * np.arange(s) / s
+    z = np.linspace(-depth / 2.0, depth / 2.0, r + 1)
+    verts = np.stack([
+        np.tile(radius * np.cos(theta), r + 1),
+        np.tile(radius * np.sin(theta), r + 1),
+        np.repeat(z, s),
+    ], axis=1)
+    idx = _wrap_columns(r, s)
+    side, side_uv = _quads(idx, _uv_grid(r, s))
+    loops, totals, uvs = [side], [np.full(r * s, 4)], [side_uv]
+    if caps:
+        cap_uv = np.stack([0.5 + 0.5 * np.cos(theta), 0.5 + 0.5 * np.sin(theta)], axis=1)
+        loops += [idx[0, :s][::-1], idx[-1, :s]]
+        uvs += [cap_uv[::-1], cap_uv]
+        totals += [np.array([s]), np.array([s])]
+    return _pack(verts, loops, totals, uvs)
+
+
+def torus(major_radius: float = 1.0, minor_radius: float = 0.25,
+          major_segments: int = 48, minor_segments: int = 12) -> MeshArrays:
+    """Tore autour de Z : colonnes = tour principal, lignes = section du tube."""
+    ms, ns = max(3, int(major_segments)), max(3, int(minor_segments))
+    theta = 2.0 * math.pi * np.arange(ms) / ms
+    phi = 2.0 * math.pi * np.arange(ns) / ns
+    rho = major_radius + minor_radius * np.cos(phi)
+    verts = np.stack([
+        np.outer(rho, np.cos(theta)).ravel(),
+        np.outer(rho, np.sin(theta)).ravel(),
+        np.repeat(minor_radius * np.sin(phi), ms),
+    ], axis=1)
+    idx = _wrap_columns(ns - 1, ms)
+    idx = np.concatenate([idx, idx[:1]], axis=0)  # fermeture de la section
+    loops, uvs = _quads(idx, _uv_grid(ns, ms))
+    return _pack(verts, [loops], [np.full(ns * ms, 4)], [uvs])
+
+
+_BOX_FACES = np.array([
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (2, 3, 7, 6), (1, 2, 6, 5), (3, 0, 4, 7),
+], dtype=np.int32)
+
+
+def box(size=1.0, center=(0.0, 0.0, 0.0)) -> MeshArrays:
+    """Pavé (8 sommets, 6 quads), même numérotation que helpers.objects.create_cube."""
+    h = np.broadcast_to(np.asarray(size, dtype=np.float64), (3,)) / 2.0
+    signs = np.array([
+        (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+        (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1),
+    ], dtype=np.float64)
+    uvs = np.tile([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], (6, 1))
+    verts = signs * h + np.asarray(center, dtype=np.float64)
+    return _pack(verts, [_BOX_FACES.ravel()], [np.full(6, 4)], [uvs])
+
+
+def merge(parts: Sequence[MeshArrays]) -> MeshArrays:
+    """Concatène plusieurs MeshArrays en un seul maillage (indices décalés)."""
+    offsets = np.cumsum([0] + [len(p.verts) for p in parts[:-1]])
+    with_uvs = all(p.uvs is not None for p in parts)
+    return MeshArrays(
+        verts=np.concatenate([p.verts for p in parts]).astype(np.float32),
+        loop_verts=np.concatenate(
+            [p.loop_verts + o for p, o in zip(parts, offsets, strict=True)]
+        ).astype(np.int32),
+        loop_totals=np.concatenate([p.loop_totals for p in parts]).astype(np.int32),
+        uvs=np.concatenate([p.uvs for p in parts]).astype(np.float32) if with_uvs else None,
+    )
+
+
+PRIMITIVES = {
+    "box": box,
+    "grid": grid,
+    "uv_sphere": uv_sphere,
+    "ico_sphere": ico_sphere,
+    "cylinder": cylinder,
+    "torus": torus,
+}
@@ -3,43 +3,59 @@ from pathlib import Path
 from typing import Sequence, Tuple
 
 import bpy
-import bmesh
+
+from ares.helpers.lifecycle import tag
+from ares.helpers.materials import create_principled_setup, get_material, set_variant, variant_material
+from ares.helpers.mesh import build_mesh, mesh_from_arrays
+from ares.helpers.mesh_registry import primitive_key, shared_mesh
+from ares.modules.gen import parametric
 
 # --- Materials ---
 def ensure_principled_material(name: str = "ARES_Prim_Mat",
                                base_color: Tuple[float, float, float, float] = (0.8,0.8,0.8,1.0)) -> bpy.types.Material:
-    mat = bpy.data.materials.get(name)
-    if not mat:
-        mat = bpy.data.materials.new(name)
+    """Matériau nommé à couleur fixe (préférer variant_material + set_variant)."""
+    mat = get_material(name)
+    if not mat.use_nodes:
         mat.use_nodes = True
-    nt = mat.node_tree
-    bsdf = next((n for n in nt.nodes if n.type == 'BSDF_PRINCIPLED'), None)
-    if bsdf is None:
-        bsdf = nt.nodes.new('ShaderNodeBsdfPrincipled')
-        nt.links.new(bsdf.outputs['BSDF'], next((n for n in nt.nodes if n.type == 'OUTPUT_MATERIAL'), nt.nodes.new('ShaderNodeOutputMaterial')).inputs['Surface'])
-    bsdf.inputs['Base Color'].default_value = base_color
+        create_principled_setup(mat)
+    bsdf = mat.node_tree.nodes.get("Principled BSDF")
+    if bsdf is not None:
+        bsdf.inputs['Base Color'].default_value = base_color
     return mat
 
 # --- Core mesh helper ---
 def _create_mesh_object(name: str,
                         verts: Sequence[Tuple[float,float,float]],
-                        faces: Sequence[Tuple[int,...]]) -> bpy.types.Object:
-    me = bpy.data.meshes.new(name + "Mesh")
-    me.from_pydata(list(verts), [], list(faces))
-    me.update()
-    obj = bpy.data.objects.new(name, me)
+                        faces: Sequence[Tuple[int,...]],
+                        key: str | None = None) -> bpy.types.Object:
+    """key : mesh partagé via helpers.mesh_registry (mêmes paramètres -> même datablock)."""
+    def build():
+        return build_mesh(name + "Mesh", verts, *parametric.faces_to_loops(faces))
+    me = shared_mesh(key, build) if key else build()
+    return _link_new_object(name, me)
+
+def _link_new_object(name: str, me: bpy.types.Mesh) -> bpy.types.Object:
+    obj = tag(bpy.data.objects.new(name, me))
     bpy.context.scene.collection.objects.link(obj)
     return obj
 
+def _assign_material(obj: bpy.types.Object, mat: bpy.types.Material) -> None:
+    # mesh partagé : le matériau est porté par l'objet, pas par le mesh
+    if not obj.data.materials:
+        obj.data.materials.append(None)
+    slot = obj.material_slots[0]
+    slot.link = 'OBJECT'
+    slot.material = mat
+
 # --- Primitives (data-first) ---
 def make_cube(name: str = "ARES_Cube", size: float = 1.0,
               color: Tuple[float,float,float,float] = (0.9,0.6,0.2,1.0)) -> bpy.types.Object:
     s = size * 0.5
     verts = [(-s,-s,-s),(s,-s,-s),(s,s,-s),(-s,s,-s),(-s,-s,s),(s,-s,s),(s,s,s),(-s,s,s)]
     faces = [(0,1,2,3),(4,5,6,7),(0,1,5,4),(2,3,7,6),(1,2,6,5),(0,3,7,4)]
-    obj = _create_mesh_object(name, verts, faces)
-    mat = ensure_principled_material("ARES_Prim_Mat_Cube", color)
-    obj.data.materials.clear(); obj.data.materials.append(mat)
+    obj = _create_mesh_object(name, verts, faces, key=primitive_key("cube", size=float(size)))
+    _assign_material(obj, variant_material())
+    set_variant(obj, base_color=color)
     return obj
 
 def make_plane(name: str = "ARES_Plane", size: float = 1.0,
@@ -47,22 +63,20 @@ def make_plane(name: str = "ARES_Plane", size: float = 1.0,
     s = size * 0.5
     verts = [(-s,-s,0),(s,-s,0),(s,s,0),(-s,s,0)]
     faces = [(0,1,2,3)]
-    obj = _create_mesh_object(name, verts, faces)
-    mat = ensure_principled_material("ARES_Prim_Mat_Plane", color)
-    obj.data.materials.clear(); obj.data.materials.append(mat)
+    obj = _create_mesh_object(name, verts, faces, key=primitive_key("plane", size=float(size)))
+    _assign_material(obj, variant_material())
+    set_variant(obj, base_color=color)
     return obj
 
 def make_uvsphere(name: str = "ARES_Sphere", radius: float = 0.5, segments: int = 16, rings: int = 8,
                   color: Tuple[float,float,float,float] = (0.3,0.6,0.9,1.0)) -> bpy.types.Object:
-    me = bpy.data.meshes.new(name + "Mesh")
-    bm = bmesh.new()
-    bmesh.ops.create_uvsphere(bm, u_segments=max(8, segments), v_segments=max(4, rings), radius=radius)
-    bm.to_mesh(me); bm.free()
-    me.update()
-    obj = bpy.data.objects.new(name, me)
-    bpy.context.scene.collection.objects.link(obj)
-    mat = ensure_principled_material("ARES_Prim_Mat_Sphere", color)
-    obj.data.materials.clear(); obj.data.materials.append(mat)
+    segments, rings = max(8, segments), max(4, rings)
+    key = primitive_key("uv_sphere", radius=float(radius), segments=segments, rings=rings)
+    me = shared_mesh(key, lambda: mesh_from_arrays(
+        name + "Mesh", parametric.uv_sphere(radius, segments=segments, rings=rings)))
+    obj = _link_new_object(name, me)
+    _assign_material(obj, variant_material())
+    set_variant(obj, base_color=color)
     return obj
 
 # --- Quick preview via core turntable shim ---
@@ -71,13 +85,20 @@ def quick_preview_turntable(obj: bpy.types.Object,
                             fps: int = 24,
                             radius: float = 2.5,
                             samples: int = 16,
-                            out_mp4: str | None = None) -> str:
+                            out_mp4: str | None = None,
+                            progressive: bool = False) -> str:
+    """progressive=True : palier FAST tout de suite, NORMAL/FULL remplacent le
+    fichier en arrière-plan (ares.blender.progressive ; seconds/fps/samples
+    viennent alors de turntable_presets.yaml)."""
     from ares.core import turntable as tt
     import os
     if out_mp4 is None:
         base = Path(bpy.path.abspath("//renders/preview"))
         base.mkdir(parents=True, exist_ok=True)
         out_mp4 = str(base / f"{obj.name}_preview.mp4")
+    if progressive:
+        from ares.blender.progressive import render_progressive
+        return str(render_progressive(obj, out_mp4).output)
     tt.create_turntable_rig(radius=radius)
     preset = tt.RenderPreset(res_x=1280, res_y=720, fps=fps, samples=samples)
     tt.render_turntable(target=obj, radius=radius, seconds=seconds, fps=fps, mp4_path=out_mp4, samples=samples, preset=preset)
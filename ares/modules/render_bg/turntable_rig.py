@@ -8,12 +8,14 @@ from math import radians
 
 import bpy
 
+from ares.helpers.lifecycle import new, tag
+
 # ---------- Utils: collections / linking ----------
 
 def _ensure_collection(name: str) -> bpy.types.Collection:
     coll = bpy.data.collections.get(name)
     if coll is None:
-        coll = bpy.data.collections.new(name)
+        coll = new("collections", name)
         bpy.context.scene.collection.children.link(coll)
     return coll
 
@@ -30,6 +32,8 @@ def _link_only_to_collection(obj: bpy.types.Object, collection: bpy.types.Collec
 def cleanup_turntable(preserve_demo: bool = False) -> None:
     """Supprime l'ancien rig ARES_Turntable (pivot/carrier/camera/path/focus).
        Si preserve_demo=False, supprime aussi l'Empty focus ARES_Turntable_Focus.
+       Objets, données propres (camera, courbe, action) et collection partent
+       en un seul bpy.data.batch_remove.
     """
     names = {
         "coll": "ARES_Turntable",
@@ -40,23 +44,29 @@ def cleanup_turntable(preserve_demo: bool = False) -> None:
         "focus": "ARES_Turntable_Focus",
     }
 
+    objs = set()
     coll = bpy.data.collections.get(names["coll"])
     if coll:
-        for parent in list(coll.users_scene):
-            parent.collection.children.unlink(coll)
-        for obj in list(coll.objects):
-            bpy.data.objects.remove(obj, do_unlink=True)
-        bpy.data.collections.remove(coll)
-
+        objs.update(coll.objects)
     for key in ("path", "pivot", "carrier", "camera"):
         obj = bpy.data.objects.get(names[key])
         if obj:
-            bpy.data.objects.remove(obj, do_unlink=True)
-
-    if not preserve_demo:
-        foc = bpy.data.objects.get(names["focus"])
-        if foc:
-            bpy.data.objects.remove(foc, do_unlink=True)
+            objs.add(obj)
+    foc = bpy.data.objects.get(names["focus"])
+    if foc and not preserve_demo:
+        objs.add(foc)
+
+    doomed = set(objs)
+    for obj in objs:
+        # données utilisées par ce seul objet : orphelines sinon
+        anim = obj.animation_data
+        for data in (obj.data, anim.action if anim else None):
+            if data is not None and data.users == 1 and data.library is None:
+                doomed.add(data)
+    if coll:
+        doomed.add(coll)
+    if doomed:
+        bpy.data.batch_remove(doomed)
 
 
 def cleanup_new_scene_elements() -> None:
@@ -81,11 +91,11 @@ def make_demo_cube_sun() -> bpy.types.Object:
 
     sun = bpy.data.lights.get("ARES_Sun")
     if sun is None:
-        sun = bpy.data.lights.new(name="ARES_Sun", type="SUN")
+        sun = new("lights", "ARES_Sun", "SUN")
     sun.energy = 3.0
     sun_obj = bpy.data.objects.get("ARES_Sun")
     if sun_obj is None:
-        sun_obj = bpy.data.objects.new("ARES_Sun", sun)
+        sun_obj = tag(bpy.data.objects.new("ARES_Sun", sun))
         bpy.context.scene.collection.objects.link(sun_obj)
     sun_obj.location = (8.0, -6.0, 6.0)
     sun_obj.rotation_euler = (radians(45), 0.0, radians(30))
@@ -195,9 +205,12 @@ def create_turntable(
     camera_height: float = 5.0,
     set_as_active_camera: bool = True,
     focus_obj: bpy.types.Object | None = None,
+    baked: bool = True,
 ) -> dict[str, str]:
-    """Pivot (0,0,0) > Carrier (child, follow-path) > Camera (child, local 0,0,Z).
-       Camera: TrackTo + DOF vers un focus fiable (focus_obj si donné).
+    """Caméra en orbite autour de (0,0,0), DOF vers un focus fiable (focus_obj si donné).
+       baked=True (défaut) : caméra seule, trajectoire cuite en fcurves
+       (turntable.bake), sans path ni contrainte à évaluer par frame.
+       baked=False : ancien rig Pivot > Carrier (follow-path) > Camera (TrackTo).
     """
     scn = scene
     frame_start = 1
@@ -205,6 +218,33 @@ def create_turntable(
 
     coll = _ensure_collection("ARES_Turntable")
 
+    if baked:
+        from ares.modules.turntable.bake import create_baked_camera
+
+        focus = focus_obj or _choose_focus_object(scn)
+        cam = create_baked_camera(
+            scn,
+            "circle",
+            frame_end - frame_start + 1,
+            radius,
+            camera_height,
+            name="ARES_Turntable_Camera",
+            target=tuple(focus.matrix_world.translation),
+            frame_start=frame_start,
+            collection=coll,
+            set_as_active_camera=set_as_active_camera,
+        )
+        _apply_dof(cam, focus)
+        return {
+            "collection": coll.name,
+            "pivot": "",
+            "carrier": "",
+            "camera": cam.name,
+            "focus": focus.name,
+            "path": "",
+            "frames": f"{frame_start}-{frame_end}",
+        }
+
     path = _add_circle_path(radius=radius, collection=coll)
     pivot = _add_empty("ARES_Turntable_Pivot", coll, loc=(0.0, 0.0, 0.0))
     carrier = _add_empty("ARES_Turntable_Carrier", coll, loc=(0.0, 0.0, 0.0))
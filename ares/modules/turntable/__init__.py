@@ -1,3 +1,10 @@
-﻿from .turntable import render_turntable
+﻿# render_turntable importe bpy : chargé à la demande (orbit/framing restent purs).
 
 __all__ = ["render_turntable"]
+
+
+def __getattr__(name):
+    if name == "render_turntable":
+        from .turntable import render_turntable
+        return render_turntable
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
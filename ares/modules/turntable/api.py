@@ -8,27 +8,14 @@ class OrbitSpec:
     fov_deg: float
     start_deg: float = 0.0
     end_deg: float = 360.0
-
-def _bbox_world(obj):
-    import mathutils
-    ws = obj.matrix_world
-    return [ws @ mathutils.Vector(c) for c in obj.bound_box]
+    center: tuple[float, float, float] | None = None  # centre bbox monde (groupes)
 
 def compute_orbit_for_object(obj, margin: float = 0.15) -> OrbitSpec:
-    """Calcule un orbit cam simple à partir de la bbox de l'objet."""
-    pts = _bbox_world(obj)
-    xs = [p.x for p in pts]
-    ys = [p.y for p in pts]
-    zs = [p.z for p in pts]
-
-    # centre uniquement en Z (on garde la cam orientée via constraint)
-    cz = (max(zs) + min(zs)) / 2.0
+    """Calcule un orbit cam simple à partir de la bbox de l'objet.
 
-    sx = max(xs) - min(xs)
-    sy = max(ys) - min(ys)
-    sz = max(zs) - min(zs)
+    Délègue au moteur vectorisé (turntable.framing) ; pour un groupe ou une
+    collection, utiliser directement compute_orbit_for_objects.
+    """
+    from .framing import compute_orbit_for_objects
 
-    radius = max(sx, sy) * (0.6 + margin) + 0.001
-    height = cz + sz * 0.15
-    fov_deg = 50.0
-    return OrbitSpec(radius=radius, height=height, fov_deg=fov_deg)
+    return compute_orbit_for_objects([obj], margin=margin)
@@ -0,0 +1,97 @@
+"""
+Blade v13 — turntable.bake
+Écrit une trajectoire (turntable.orbit) en fcurves location/rotation_euler :
+- keyframe_points.add(n) + foreach_set("co") : nombre d'appels Python constant,
+- pas de contrainte ni de courbe à évaluer à chaque frame,
+- caméra créée via bpy.data (pas de bpy.ops).
+"""
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Sequence
+
+import bpy
+
+from ares.helpers.lifecycle import new, tag
+
+from .orbit import CameraPose, orbit_poses
+
+# enum eBezTriple_Interpolation : CONSTANT=0, LINEAR=1, BEZIER=2
+_LINEAR = 1
+
+
+def _fcurve(action: bpy.types.Action, obj: bpy.types.Object, data_path: str, index: int):
+    ensure = getattr(action, "fcurve_ensure_for_datablock", None)  # Blender 4.4+
+    if ensure is not None:
+        return ensure(obj, data_path, index=index)
+    fc = action.fcurves.find(data_path, index=index)
+    return fc or action.fcurves.new(data_path, index=index)
+
+
+def bake_poses(
+    obj: bpy.types.Object,
+    poses: Sequence[CameraPose],
+    frame_start: int = 1,
+    action_name: str | None = None,
+) -> bpy.types.Action:
+    """Remplace l'animation de `obj` par les poses (une clé par frame, LINEAR)."""
+    n = len(poses)
+    obj.parent = None
+    obj.constraints.clear()
+    obj.rotation_mode = "XYZ"
+    if n:
+        obj.location = poses[0].location
+        obj.rotation_euler = poses[0].rotation_euler
+
+    anim = obj.animation_data or obj.animation_data_create()
+    action = new("actions", action_name or f"{obj.name}_Orbit")
+    anim.action = action
+
+    frames = [float(frame_start + i) for i in range(n)]
+    channels = [("location", i, [p.location[i] for p in poses]) for i in range(3)]
+    channels += [("rotation_euler", i, [p.rotation_euler[i] for p in poses]) for i in range(3)]
+    for data_path, index, values in channels:
+        fc = _fcurve(action, obj, data_path, index)
+        kp = fc.keyframe_points
+        kp.clear()
+        kp.add(n)
+        co = [0.0] * (2 * n)
+        co[0::2] = frames
+        co[1::2] = values
+        kp.foreach_set("co", co)
+        kp.foreach_set("interpolation", [_LINEAR] * n)  # enum lu/écrit en entier par RNA
+        fc.update()
+    return action
+
+
+def create_baked_camera(
+    scene: bpy.types.Scene,
+    kind: str = "circle",
+    *args,
+    name: str = "ARES_Baked_Camera",
+    target=(0.0, 0.0, 0.0),
+    frame_start: int = 1,
+    collection: bpy.types.Collection | None = None,
+    set_as_active_camera: bool = True,
+    **kw,
+) -> bpy.types.Object:
+    """Caméra sans contrainte qui suit l'orbite `kind` (voir turntable.orbit.ORBITS)."""
+    poses = orbit_poses(kind, *args, target=tuple(target), **kw)
+    cam = bpy.data.objects.get(name)
+    if cam is None or cam.type != "CAMERA":
+        cam = tag(bpy.data.objects.new(name, new("cameras", name)))
+    coll = collection or scene.collection
+    if cam.name not in coll.objects:
+        coll.objects.link(cam)
+
+    old = cam.animation_data.action if cam.animation_data else None
+    bake_poses(cam, poses, frame_start=frame_start)
+    if old is not None and old.users == 0:
+        with contextlib.suppress(Exception):
+            bpy.data.actions.remove(old)
+
+    if set_as_active_camera:
+        scene.camera = cam
+    scene.frame_start = frame_start
+    scene.frame_end = frame_start + max(1, len(poses)) - 1
+    return cam
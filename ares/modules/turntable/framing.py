@@ -0,0 +1,132 @@
+"""
+Blade v13 — turntable.framing
+Cadrage orbit pour un groupe d'objets (liste ou Collection), calculé avec NumPy :
+- mode bbox : bound_box + matrix_world de tous les objets en bloc
+  (foreach_get quand on reçoit une Collection),
+- mode exact : sommets évalués (modifiers inclus) via foreach_get, pour un rayon
+  au plus juste autour de l'axe d'orbite.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+import numpy as np
+
+from .api import OrbitSpec
+
+GEOMETRY_TYPES = {"MESH", "CURVE", "SURFACE", "META", "FONT", "CURVES", "POINTCLOUD", "VOLUME"}
+
+
+def _as_objects(objects) -> list:
+    """Collection : objets géométriques seulement ; liste explicite : prise telle quelle."""
+    if hasattr(objects, "all_objects"):  # bpy.types.Collection
+        return [o for o in objects.all_objects if o.type in GEOMETRY_TYPES]
+    return list(objects)
+
+
+def _matrices(objects: list, source=None) -> np.ndarray:
+    """(n, 4, 4) matrices monde, convention ligne (M @ [x, y, z, 1])."""
+    n = len(objects)
+    if source is not None and len(source) == n:
+        buf = np.empty(n * 16, dtype=np.float32)
+        source.foreach_get("matrix_world", buf)
+        # stockage Blender colonne-major -> transpose
+        return buf.reshape(n, 4, 4).transpose(0, 2, 1)
+    return np.array([o.matrix_world for o in objects], dtype=np.float32).reshape(n, 4, 4)
+
+
+def _local_boxes(objects: list, source=None) -> np.ndarray:
+    n = len(objects)
+    if source is not None and len(source) == n:
+        buf = np.empty(n * 24, dtype=np.float32)
+        source.foreach_get("bound_box", buf)
+        return buf.reshape(n, 8, 3)
+    return np.array([o.bound_box for o in objects], dtype=np.float32).reshape(n, 8, 3)
+
+
+def bbox_corners_world(objects: Iterable) -> np.ndarray:
+    """Coins des bound_box en espace monde, (n*8, 3)."""
+    source = objects.all_objects if hasattr(objects, "all_objects") else None
+    objs = _as_objects(objects)
+    if not objs:
+        return np.zeros((0, 3), dtype=np.float32)
+    # on ne garde la voie foreach_get que si la Collection ne contient que de la géométrie
+    if source is not None and len(source) != len(objs):
+        source = None
+    mats = _matrices(objs, source)
+    boxes = _local_boxes(objs, source)
+    pts = np.einsum("nij,nkj->nki", mats[:, :3, :3], boxes) + mats[:, None, :3, 3]
+    return pts.reshape(-1, 3)
+
+
+def _iter_evaluated_points(objects: list, depsgraph):
+    """Sommets monde par objet (maillage évalué), bbox en fallback."""
+    for obj in objects:
+        ob_eval = obj.evaluated_get(depsgraph)
+        mw = np.array(ob_eval.matrix_world, dtype=np.float64)
+        mesh = ob_eval.to_mesh() if obj.type == "MESH" else None
+        try:
+            if mesh is not None and len(mesh.vertices):
+                co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+                mesh.vertices.foreach_get("co", co)
+                local = co.reshape(-1, 3)
+            else:
+                local = np.array(obj.bound_box, dtype=np.float32)
+        finally:
+            if mesh is not None:
+                ob_eval.to_mesh_clear()
+        yield local @ mw[:3, :3].T + mw[:3, 3]
+
+
+def world_bounds(objects: Iterable, exact: bool = False, depsgraph=None):
+    """Retourne (lo, hi, r_xy) : min/max monde et rayon max autour de l'axe Z du centre."""
+    corners = bbox_corners_world(objects)
+    if not len(corners):
+        raise ValueError("Aucun objet géométrique à cadrer")
+    if not exact:
+        lo, hi = corners.min(axis=0), corners.max(axis=0)
+        r_xy = float(np.hypot(*(hi[:2] - lo[:2])) * 0.5)
+        return lo, hi, r_xy
+
+    if depsgraph is None:
+        import bpy
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    clouds = list(_iter_evaluated_points(_as_objects(objects), depsgraph))
+    lo = np.min([pts.min(axis=0) for pts in clouds], axis=0)
+    hi = np.max([pts.max(axis=0) for pts in clouds], axis=0)
+    # rayon mesuré autour du pivot de l'orbite : centre des points exacts, pas des bbox
+    center = (lo + hi) * 0.5
+    r2 = 0.0
+    for pts in clouds:
+        d = pts[:, :2] - center[:2]
+        r2 = max(r2, float(np.einsum("ij,ij->i", d, d).max()))
+    return lo, hi, math.sqrt(r2)
+
+
+def compute_orbit_for_objects(
+    objects: Iterable,
+    margin: float = 0.15,
+    exact: bool = False,
+    fov_deg: float = 50.0,
+    depsgraph=None,
+) -> OrbitSpec:
+    """OrbitSpec pour un groupe.
+
+    exact=False : même heuristique que compute_orbit_for_object (bbox globale).
+    exact=True  : distance minimale pour que le groupe tienne dans le FOV à tout angle.
+    """
+    lo, hi, r_xy = world_bounds(objects, exact=exact, depsgraph=depsgraph)
+    sx, sy, sz = (hi - lo).tolist()
+    cz = float(lo[2] + hi[2]) / 2.0
+    height = cz + sz * 0.15
+    center = tuple(float(c) for c in (lo + hi) / 2.0)
+
+    if not exact:
+        radius = max(sx, sy) * (0.6 + margin) + 0.001
+    else:
+        t = math.tan(math.radians(fov_deg) / 2.0)
+        # point le plus proche de la caméra à (d - r_xy) ; largeur et hauteur doivent tenir
+        radius = r_xy + max(r_xy, sz / 2.0) / t
+        radius = radius * (1.0 + margin) + 0.001
+    return OrbitSpec(radius=radius, height=height, fov_deg=fov_deg, center=center)
@@ -0,0 +1,166 @@
+"""
+Blade v13 — turntable.orbit
+Trajectoires caméra en maths pures (ni bpy ni mathutils, testable hors Blender) :
+cercle, ellipse, hélice, multi-élévation. Chaque frame donne une CameraPose
+(location, rotation_euler XYZ, matrice 4x4) qui vise la cible ; la caméra
+regarde -Z local avec +Y en haut (convention Blender).
+Les angles sont répartis sur [start, end[ : la boucle est sans frame dupliquée.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+Vec3 = tuple[float, float, float]
+
+
+@dataclass(frozen=True)
+class CameraPose:
+    location: Vec3
+    rotation_euler: Vec3
+    matrix: tuple[tuple[float, ...], ...]  # 4x4, lignes
+
+
+# ---------- petites opérations vectorielles ----------
+
+def _sub(a, b):
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+
+def _cross(a, b):
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+
+def _norm(a):
+    n = math.sqrt(a[0] * a[0] + a[1] * a[1] + a[2] * a[2])
+    if n < 1e-12:
+        raise ValueError("vecteur nul")
+    return (a[0] / n, a[1] / n, a[2] / n)
+
+
+def look_at(eye: Sequence[float], target: Sequence[float], up: Vec3 = (0.0, 0.0, 1.0)):
+    """Matrice 3x3 (lignes) d'une caméra en `eye` qui vise `target`."""
+    f = _norm(_sub(target, eye))
+    if abs(f[0] * up[0] + f[1] * up[1] + f[2] * up[2]) > 1.0 - 1e-9:
+        up = (0.0, 1.0, 0.0)  # visée verticale : up de secours
+    x = _norm(_cross(f, up))
+    y = _cross(x, f)
+    z = (-f[0], -f[1], -f[2])
+    return ((x[0], y[0], z[0]), (x[1], y[1], z[1]), (x[2], y[2], z[2]))
+
+
+def matrix_to_euler_xyz(m) -> Vec3:
+    """Euler XYZ (R = Rz·Ry·Rx) depuis une matrice 3x3 en lignes."""
+    b = math.atan2(-m[2][0], math.hypot(m[0][0], m[1][0]))
+    if math.hypot(m[0][0], m[1][0]) > 1e-9:
+        a = math.atan2(m[2][1], m[2][2])
+        c = math.atan2(m[1][0], m[0][0])
+    else:  # gimbal lock
+        a = math.atan2(-m[1][2], m[1][1])
+        c = 0.0
+    return (a, b, c)
+
+
+def _compatible(angle: float, prev: float) -> float:
+    """Ramène `angle` à ±π de `prev` (pas de saut de 2π entre deux frames)."""
+    return angle + 2.0 * math.pi * round((prev - angle) / (2.0 * math.pi))
+
+
+def poses_from_positions(
+    positions: Sequence[Sequence[float]], target: Sequence[float]
+) -> list[CameraPose]:
+    poses: list[CameraPose] = []
+    prev = None
+    for p in positions:
+        rot = look_at(p, target)
+        eul = matrix_to_euler_xyz(rot)
+        if prev is not None:
+            eul = tuple(_compatible(e, q) for e, q in zip(eul, prev, strict=True))
+        prev = eul
+        loc = (float(p[0]), float(p[1]), float(p[2]))
+        mat = tuple((*rot[i], loc[i]) for i in range(3)) + ((0.0, 0.0, 0.0, 1.0),)
+        poses.append(CameraPose(location=loc, rotation_euler=eul, matrix=mat))
+    return poses
+
+
+# ---------- trajectoires ----------
+
+def _angles(frames: int, start_deg: float, end_deg: float) -> list[float]:
+    frames = max(1, int(frames))
+    span = math.radians(end_deg - start_deg)
+    return [math.radians(start_deg) + span * i / frames for i in range(frames)]
+
+
+def ellipse_positions(
+    frames: int,
+    rx: float,
+    ry: float,
+    height: float = 0.0,
+    center: Vec3 = (0.0, 0.0, 0.0),
+    start_deg: float = 0.0,
+    end_deg: float = 360.0,
+) -> list[Vec3]:
+    cx, cy, cz = center
+    return [
+        (cx + rx * math.cos(t), cy + ry * math.sin(t), cz + height)
+        for t in _angles(frames, start_deg, end_deg)
+    ]
+
+
+def circle_positions(frames: int, radius: float, height: float = 0.0, **kw) -> list[Vec3]:
+    return ellipse_positions(frames, radius, radius, height, **kw)
+
+
+def helix_positions(
+    frames: int,
+    radius: float,
+    z_start: float,
+    z_end: float,
+    turns: float = 1.0,
+    center: Vec3 = (0.0, 0.0, 0.0),
+    start_deg: float = 0.0,
+) -> list[Vec3]:
+    cx, cy, cz = center
+    frames = max(1, int(frames))
+    out = []
+    for i, t in enumerate(_angles(frames, start_deg, start_deg + 360.0 * turns)):
+        k = i / max(1, frames - 1)
+        out.append((cx + radius * math.cos(t), cy + radius * math.sin(t),
+                    cz + z_start + (z_end - z_start) * k))
+    return out
+
+
+def multi_elevation_positions(
+    frames_per_ring: int,
+    distance: float,
+    elevations_deg: Sequence[float] = (0.0, 30.0, 60.0),
+    center: Vec3 = (0.0, 0.0, 0.0),
+    start_deg: float = 0.0,
+) -> list[Vec3]:
+    """Un tour complet par élévation (distance constante au centre), anneaux enchaînés."""
+    cx, cy, cz = center
+    out = []
+    for el in elevations_deg:
+        e = math.radians(el)
+        r, z = distance * math.cos(e), distance * math.sin(e)
+        out += [
+            (cx + r * math.cos(t), cy + r * math.sin(t), cz + z)
+            for t in _angles(frames_per_ring, start_deg, start_deg + 360.0)
+        ]
+    return out
+
+
+ORBITS = {
+    "circle": circle_positions,
+    "ellipse": ellipse_positions,
+    "helix": helix_positions,
+    "multi_elevation": multi_elevation_positions,
+}
+
+
+def orbit_poses(kind: str, *args, target: Vec3 = (0.0, 0.0, 0.0), **kw) -> list[CameraPose]:
+    """ex: orbit_poses("circle", 96, 5.0, height=2.0, target=(0, 0, 1))"""
+    if kind not in ORBITS:
+        raise ValueError(f"Orbit inconnue: {kind!r} (dispo: {sorted(ORBITS)})")
+    return poses_from_positions(ORBITS[kind](*args, **kw), target)
@@ -13,6 +13,8 @@ def render_turntable(
     fps: int = 24,
     mp4_path: str = "renders/turntable.mp4",
     samples: int = 32,
+    shards: int = 1,
+    background: bool = False,
 ):
     scn = bpy.context.scene
     select_engine(scn)
@@ -28,7 +30,19 @@ def render_turntable(
     scn.frame_start = 1
     scn.frame_end = seconds * fps
 
-    with bpy.context.temp_override(area=None, region=None, window=None):
-        bpy.ops.render.render(animation=True)
+    if background:
+        # non bloquant : l'appelant suit job.progress() puis job.finish()
+        from ares.blender.background import start_background_render
+        return start_background_render(scn)
+
+    from ares.blender.trace import trace_render
+    with trace_render("turntable", scn):
+        if shards > 1:
+            from ares.blender.shard import render_sharded
+            render_sharded(scn, shards)
+            return ct
+
+        with bpy.context.temp_override(area=None, region=None, window=None):
+            bpy.ops.render.render(animation=True)
 
     return ct
@@ -4,6 +4,11 @@ import contextlib
 import bpy
 
 from ares import link_object, make_curve_circle
+from ares.helpers.lifecycle import new, tag
+from ares.modules.turntable.bake import bake_poses
+from ares.modules.turntable.orbit import orbit_poses
+
+RIG_JOB = "tt_rig"  # propriétaire des datablocks du rig (ares.helpers.lifecycle)
 
 
 def set_render_engine(scene: bpy.types.Scene, engine: str = "BLENDER_EEVEE"):
@@ -11,40 +16,40 @@ def set_render_engine(scene: bpy.types.Scene, engine: str = "BLENDER_EEVEE"):
         scene.render.engine = engine
 
 
-def create_turntable(radius: float = 2.5, cam_height: float = 1.6):
-    """Generate a minimal turntable rig and return its components."""
+def create_turntable(
+    radius: float = 2.5,
+    cam_height: float = 1.6,
+    frames: int = 90,
+    frame_start: int = 1,
+    target=(0.0, 0.0, 0.0),
+):
+    """Generate a minimal turntable rig and return its components.
+
+    La caméra n'a ni parent ni contrainte : son orbite est cuite en fcurves
+    (turntable.bake.bake_poses), une clé par frame. TT_Path et TT_Rig restent
+    des repères (chemin de l'orbite, pivot).
+    """
     scene = bpy.context.scene
     path = bpy.data.objects.get("TT_Path") or make_curve_circle("TT_Path", radius=radius)
     rig_col = scene.collection
 
-    rig = bpy.data.objects.get("TT_Rig") or bpy.data.objects.new("TT_Rig", None)
+    rig = bpy.data.objects.get("TT_Rig") or tag(bpy.data.objects.new("TT_Rig", None), RIG_JOB)
     link_object(rig, rig_col)
-
-    cam_data = bpy.data.cameras.new("TT_Camera")
-    cam = link_object(bpy.data.objects.new("TT_Camera", cam_data), rig_col)
-    cam.location = (radius, 0.0, cam_height)
-    cam.parent = rig
-
-    with contextlib.suppress(Exception):
-        follow = rig.constraints.get("Follow Path") or rig.constraints.new(type="FOLLOW_PATH")
-        follow.target = path
-        follow.use_fixed_location = False
-
-    with contextlib.suppress(Exception):
-        track = cam.constraints.get("Track To") or cam.constraints.new(type="TRACK_TO")
-        track.target = path
-        track.track_axis = "TRACK_NEGATIVE_Z"
-        track.up_axis = "UP_Y"
-
-    # Animate curve
-    curve = path.data
-    curve.path_duration = 90
-    curve.use_path = True
-    curve.use_path_follow = True
-    curve.eval_time = 1
-    curve.keyframe_insert(data_path="eval_time", frame=1)
-    curve.eval_time = 90
-    curve.keyframe_insert(data_path="eval_time", frame=90)
+    rig.location = target
+
+    # caméra réutilisée d'un appel à l'autre (plus un datablock camera par appel)
+    cam = bpy.data.objects.get("TT_Camera")
+    if cam is None or cam.type != "CAMERA":
+        cam = tag(bpy.data.objects.new("TT_Camera", new("cameras", "TT_Camera", job=RIG_JOB)),
+                  RIG_JOB)
+    link_object(cam, rig_col)
+
+    poses = orbit_poses("circle", frames, radius, height=cam_height,
+                        center=tuple(target), target=tuple(target))
+    old = cam.animation_data.action if cam.animation_data else None
+    tag(bake_poses(cam, poses, frame_start=frame_start, action_name="TT_Camera_Orbit"), RIG_JOB)
+    if old is not None and old.users == 0:
+        bpy.data.actions.remove(old)
 
     with contextlib.suppress(Exception):
         scene.camera = cam
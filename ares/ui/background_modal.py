@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: MIT
+# Path: ares/ui/background_modal.py
+"""
+Blade v13 — rendus non bloquants (UI)
+- BackgroundRenderModal : base des opérateurs modaux ; start_job() prépare la
+  scène et lance ares.blender.background, un timer suit la progression
+  (frames faites, ETA, aperçu de la dernière frame), Échap annule,
+- ARES_OT_BackgroundRenderCancel : annule un rendu précis (frames conservées),
+- draw_jobs() : liste des rendus en cours pour les panneaux.
+"""
+import contextlib
+
+import bpy
+
+PREVIEW_IMAGE = "ARES_BG_Preview"
+POLL_SECONDS = 0.5
+
+
+def _update_preview(path) -> None:
+    """Charge/recharge la dernière frame dans l'image ARES_BG_Preview."""
+    img = bpy.data.images.get(PREVIEW_IMAGE)
+    with contextlib.suppress(RuntimeError):  # PNG illisible : aperçu suivant
+        if img is None:
+            img = bpy.data.images.load(str(path))
+            img.name = PREVIEW_IMAGE
+        elif img.filepath != str(path):
+            img.filepath = str(path)
+        else:
+            return
+        img.reload()
+        img.preview_ensure()
+
+
+def _redraw(context) -> None:
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type in {"PROPERTIES", "VIEW_3D", "IMAGE_EDITOR"}:
+                area.tag_redraw()
+
+
+class BackgroundRenderModal:
+    """Mixin d'opérateur : sous-classes -> start_job(context) -> BackgroundRender."""
+
+    bl_options = {"REGISTER"}
+
+    def start_job(self, context):
+        raise NotImplementedError
+
+    def execute(self, context):
+        try:
+            job = self.start_job(context)
+        except Exception as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+        self._job_id = job.id
+        if context.window is None:  # pas d'UI (blender -b) : on attend simplement
+            job.wait()
+            return self._finish(context, job)
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(POLL_SECONDS, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({"INFO"}, f"Rendu d'arrière-plan {job.id} lancé ({len(job.frames)} frames)")
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        from ares.blender.background import RUNNING, get_job
+
+        job = get_job(self._job_id)
+        if job is None or job.state != RUNNING:  # annulé via ARES_OT_BackgroundRenderCancel
+            self._stop(context)
+            return {"CANCELLED"}
+        if event.type == "ESC" and event.value == "PRESS":
+            salvaged = job.cancel()
+            self._stop(context)
+            self.report({"WARNING"}, f"Rendu {job.id} annulé ({len(salvaged)} frames conservées)")
+            return {"CANCELLED"}
+        if event.type != "TIMER" or event.timer is not self._timer:
+            return {"PASS_THROUGH"}
+
+        progress = job.progress()
+        if progress.last_frame is not None:
+            _update_preview(progress.last_frame)
+        if context.workspace is not None:
+            context.workspace.status_text_set(f"ARES {job.id} : {progress.describe()}")
+        _redraw(context)
+        if job.running:
+            return {"PASS_THROUGH"}
+        self._stop(context)
+        return self._finish(context, job)
+
+    def _finish(self, context, job):
+        try:
+            result = job.finish()
+        except Exception as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+        self.report({"INFO"}, f"Rendu terminé : {result}")
+        return {"FINISHED"}
+
+    def _stop(self, context) -> None:
+        timer = getattr(self, "_timer", None)
+        if timer is not None:
+            context.window_manager.event_timer_remove(timer)
+            self._timer = None
+        if context.workspace is not None:
+            context.workspace.status_text_set(None)
+        _redraw(context)
+
+    def cancel(self, context):  # appelé par Blender (fermeture de fichier...)
+        from ares.blender.background import get_job
+
+        job = get_job(getattr(self, "_job_id", ""))
+        if job is not None:
+            job.cancel()
+        self._stop(context)
+
+
+class ARES_OT_BackgroundRenderCancel(bpy.types.Operator):
+    """Annule un rendu d'arrière-plan (les frames terminées sont conservées)."""
+    bl_idname = "ares.background_render_cancel"
+    bl_label = "Cancel Background Render"
+    bl_options = {"REGISTER"}
+
+    job_id: bpy.props.StringProperty(name="Job")
+
+    def execute(self, context):
+        from ares.blender.background import get_job
+
+        job = get_job(self.job_id)
+        if job is None:
+            self.report({"WARNING"}, f"Rendu {self.job_id} introuvable")
+            return {"CANCELLED"}
+        salvaged = job.cancel()
+        self.report({"INFO"}, f"Rendu {job.id} annulé ({len(salvaged)} frames conservées)")
+        return {"FINISHED"}
+
+
+def draw_jobs(layout) -> None:
+    """Progression des rendus d'arrière-plan en cours (rien si aucun)."""
+    import sys
+
+    background = sys.modules.get("ares.blender.background")  # pas d'import au draw
+    running = background.jobs() if background is not None else []
+    if not running:
+        return
+    box = layout.box()
+    for job in running:
+        row = box.row(align=True)
+        row.label(text=f"{job.id} • {job.progress().describe()}", icon="RENDER_ANIMATION")
+        op = row.operator("ares.background_render_cancel", text="", icon="CANCEL")
+        op.job_id = job.id
+    img = bpy.data.images.get(PREVIEW_IMAGE)
+    if img is not None and img.preview is not None:
+        box.template_icon(icon_value=img.preview.icon_id, scale=6.0)
+
+
+CLASSES = (ARES_OT_BackgroundRenderCancel,)
+
+
+def register():
+    for c in CLASSES:
+        bpy.utils.register_class(c)
+
+
+def unregister():
+    for c in reversed(CLASSES):
+        bpy.utils.unregister_class(c)
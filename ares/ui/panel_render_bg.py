@@ -2,16 +2,13 @@
 # Path: ares/ui/panel_render_bg.py
 
 import contextlib
-import importlib
 
 import bpy
-from bpy.props import IntProperty, PointerProperty, StringProperty
+from bpy.props import BoolProperty, IntProperty, PointerProperty, StringProperty
 
-from ares.modules.render_bg import preset as PR
-from ares.modules.render_bg import turntable_rig as TR
+from ares.ui.background_modal import BackgroundRenderModal, draw_jobs
 
-importlib.reload(PR)
-importlib.reload(TR)
+# Backends (render_bg.preset, render_bg.turntable_rig...) importés au premier execute()
 
 # --- Property Group (module-level, fiable) -------------------------------------
 
@@ -36,6 +33,39 @@ class ARES_RenderBG_Props(bpy.types.PropertyGroup):
         max=600,
         default=4,
     )
+    resumable: BoolProperty(
+        name="Resumable",
+        description="Rendu en séquence PNG avec reprise ; MP4 assemblé à la fin",
+        default=False,
+    )
+    stream: BoolProperty(
+        name="Stream to ffmpeg",
+        description="Frames encodées en flux par un ffmpeg externe pendant le rendu",
+        default=False,
+    )
+    deliverables: BoolProperty(
+        name="All deliverables",
+        description="Une passe de rendu, livrables de render_output (mp4, webm, gif, poster...)",
+        default=False,
+    )
+
+def _render_animation(scn) -> None:
+    """Rendu animation ; livrables, séquence reprenable ou flux ffmpeg selon l'UI."""
+    from ares.blender.trace import trace_render
+
+    ui = getattr(scn, "ares_renderbg", None)
+    with trace_render("render_bg", scn):
+        if ui is not None and ui.deliverables:
+            from ares.blender.deliverables import render_deliverables
+            render_deliverables(scn)
+        elif ui is not None and ui.resumable:
+            from ares.blender.resume import render_animation_resumable
+            render_animation_resumable(scn)
+        elif ui is not None and ui.stream:
+            from ares.blender.stream import render_animation_streamed
+            render_animation_streamed(scn)
+        else:
+            bpy.ops.render.render(animation=True)
 
 # --- Operators -----------------------------------------------------------------
 
@@ -46,6 +76,8 @@ class ARES_OT_RenderBGCreateTurntable(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
+        from ares.modules.render_bg import turntable_rig as TR
+
         scn = context.scene
         ui = getattr(scn, "ares_renderbg", None)
         fps = int(ui.fps) if ui and ui.fps else int(scn.render.fps or 24)
@@ -79,6 +111,8 @@ class ARES_OT_RenderBGApplyPreset(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
+        from ares.modules.render_bg import preset as PR
+
         scn = context.scene
         d = PR.apply_mp4_preset(scn)
 
@@ -105,10 +139,19 @@ class ARES_OT_RenderBGRender(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context):
-        bpy.ops.render.render(animation=True)
+        _render_animation(context.scene)
         self.report({"INFO"}, "Render MP4 terminé")
         return {"FINISHED"}
 
+class ARES_OT_RenderBGRenderBackground(BackgroundRenderModal, bpy.types.Operator):
+    """Render de l'animation par un Blender d'arrière-plan (session libre, Échap annule)."""
+    bl_idname = "ares.render_bg_render_background"
+    bl_label = "Render Animation (Background)"
+
+    def start_job(self, context):
+        from ares.blender.background import start_background_render
+        return start_background_render(context.scene)
+
 class ARES_OT_RenderBGRenderQuick(bpy.types.Operator):
     """Render rapide ~1 seconde (utile pour les tests)."""
     bl_idname = "ares.render_bg_render_quick"
@@ -116,17 +159,39 @@ class ARES_OT_RenderBGRenderQuick(bpy.types.Operator):
     bl_options = {"REGISTER"}
 
     def execute(self, context):
+        from ares.blender.trace import trace_render
+
         scn = context.scene
         fps = max(1, int(scn.render.fps))
         orig_end = scn.frame_end
         scn.frame_end = scn.frame_start + fps - 1
         try:
-            bpy.ops.render.render(animation=True)
+            with trace_render("preview", scn):
+                bpy.ops.render.render(animation=True)
         finally:
             scn.frame_end = orig_end
         self.report({"INFO"}, "Preview 1s terminé")
         return {"FINISHED"}
 
+class ARES_OT_RenderBGRenderProgressive(bpy.types.Operator):
+    """Turntable de l'objet actif : FAST tout de suite, NORMAL/FULL en arrière-plan."""
+    bl_idname = "ares.render_bg_render_progressive"
+    bl_label = "Render Progressive"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        from ares.blender.progressive import render_progressive
+
+        obj = context.active_object
+        if obj is None:
+            self.report({"ERROR"}, "Aucun objet actif")
+            return {"CANCELLED"}
+        ui = getattr(context.scene, "ares_renderbg", None)
+        out = getattr(ui, "output_path", "") or "//renders/out.mp4"
+        job = render_progressive(obj, out)
+        self.report({"INFO"}, f"FAST prêt : {job.output} (NORMAL/FULL en arrière-plan)")
+        return {"FINISHED"}
+
 class ARES_OT_RenderBGRenderStill(bpy.types.Operator):
     """Render d'une seule image — force temporairement PNG puis restaure."""
     bl_idname = "ares.render_bg_render_still"
@@ -177,6 +242,9 @@ class ARES_PT_RenderBG(bpy.types.Panel):
         row = col.row(align=True)
         row.prop(ui, "radius")
         row.prop(ui, "camera_z")
+        col.prop(ui, "resumable")
+        col.prop(ui, "stream")
+        col.prop(ui, "deliverables")
 
         layout.separator()
 
@@ -187,8 +255,12 @@ class ARES_PT_RenderBG(bpy.types.Panel):
         row = layout.row(align=True)
         row.operator("ares.render_bg_render_still", icon="RENDER_STILL")
         row.operator("ares.render_bg_render_quick", icon="RENDER_ANIMATION")
+        layout.operator("ares.render_bg_render_progressive", icon="SORTTIME")
         row = layout.row(align=True)
         row.operator("ares.render_bg_render_mp4", icon="RENDER_ANIMATION")
+        row.operator("ares.render_bg_render_mp4_background", icon="TIME")
+        layout.operator("ares.render_bg_render_background", icon="TIME")
+        draw_jobs(layout)
 
 class ARES_OT_RenderBGRenderMp4(bpy.types.Operator):
     """Create demo scene + turntable rig and render MP4 (H.264)"""
@@ -197,39 +269,55 @@ class ARES_OT_RenderBGRenderMp4(bpy.types.Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     def execute(self, context):
-        scn = context.scene
-        ui = getattr(scn, "ares_renderbg", None)
-
-        fps = int(getattr(ui, "fps", scn.render.fps or 24) or 24)
-        seconds = int(getattr(ui, "seconds", 4) or 4)
-        radius = float(getattr(ui, "radius", 5.0) or 5.0)
-        cam_z = float(getattr(ui, "camera_z", 5.0) or 5.0)
-        out = getattr(ui, "output_path", "//renders/out.mp4") or "//renders/out.mp4"
-
-        TR.cleanup_turntable(preserve_demo=False)
-        TR.cleanup_new_scene_elements()
-        cube = TR.make_demo_cube_sun()
+        out = _setup_demo_turntable(context.scene)
+        _render_animation(context.scene)
+        self.report({"INFO"}, f"Rendered to {out}")
+        return {"FINISHED"}
 
-        TR.create_turntable(
-            scn,
-            seconds=seconds,
-            fps=fps,
-            radius=radius,
-            camera_height=cam_z,
-            focus_obj=cube,
-        )
+class ARES_OT_RenderBGRenderMp4Background(BackgroundRenderModal, bpy.types.Operator):
+    """Demo scene + turntable rig, MP4 rendu par un Blender d'arrière-plan"""
+    bl_idname = "ares.render_bg_render_mp4_background"
+    bl_label = "Render MP4 (Background)"
+    bl_options = {"REGISTER", "UNDO"}
 
-        scn.render.fps = fps
-        scn.frame_start = 1
-        scn.frame_end = 1 + (seconds * fps) - 1
-        scn.render.image_settings.file_format = "FFMPEG"
-        scn.render.ffmpeg.format = "MPEG4"
-        scn.render.ffmpeg.codec = "H264"
-        scn.render.filepath = out
+    def start_job(self, context):
+        from ares.blender.background import start_background_render
+        _setup_demo_turntable(context.scene)
+        return start_background_render(context.scene)
+
+def _setup_demo_turntable(scn) -> str:
+    """Demo Cube+Sun, rig turntable et sortie MP4 (H.264) ; retourne le chemin."""
+    from ares.modules.render_bg import turntable_rig as TR
+
+    ui = getattr(scn, "ares_renderbg", None)
+
+    fps = int(getattr(ui, "fps", scn.render.fps or 24) or 24)
+    seconds = int(getattr(ui, "seconds", 4) or 4)
+    radius = float(getattr(ui, "radius", 5.0) or 5.0)
+    cam_z = float(getattr(ui, "camera_z", 5.0) or 5.0)
+    out = getattr(ui, "output_path", "//renders/out.mp4") or "//renders/out.mp4"
+
+    TR.cleanup_turntable(preserve_demo=False)
+    TR.cleanup_new_scene_elements()
+    cube = TR.make_demo_cube_sun()
+
+    TR.create_turntable(
+        scn,
+        seconds=seconds,
+        fps=fps,
+        radius=radius,
+        camera_height=cam_z,
+        focus_obj=cube,
+    )
 
-        bpy.ops.render.render(animation=True)
-        self.report({"INFO"}, f"Rendered to {out}")
-        return {"FINISHED"}
+    scn.render.fps = fps
+    scn.frame_start = 1
+    scn.frame_end = 1 + (seconds * fps) - 1
+    scn.render.image_settings.file_format = "FFMPEG"
+    scn.render.ffmpeg.format = "MPEG4"
+    scn.render.ffmpeg.codec = "H264"
+    scn.render.filepath = out
+    return out
 
 # --- Registration --------------------------------------------------------------
 
@@ -238,10 +326,13 @@ CLASSES = (
     ARES_OT_RenderBGCreateTurntable,
     ARES_OT_RenderBGApplyPreset,
     ARES_OT_RenderBGRender,
+    ARES_OT_RenderBGRenderBackground,
     ARES_OT_RenderBGRenderQuick,
+    ARES_OT_RenderBGRenderProgressive,
     ARES_OT_RenderBGRenderStill,
     ARES_PT_RenderBG,
-    ARES_OT_RenderBGRenderMp4
+    ARES_OT_RenderBGRenderMp4,
+    ARES_OT_RenderBGRenderMp4Background,
 )
 
 def _safe_register(cls):
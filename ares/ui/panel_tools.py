@@ -1,8 +1,8 @@
 import bpy
 
-from ares.blender.render import RenderPreset, render_turntable
-from ares.core.paths import ROOT
-from ares.modules.asset_core.api import quick_export_glb
+from ares.ui.background_modal import BackgroundRenderModal, draw_jobs
+
+# Backends importés au premier execute() (enregistrement de l'add-on sans numpy/render)
 
 
 class ARES_OT_TurntableQuick(bpy.types.Operator):
@@ -13,6 +13,8 @@ class ARES_OT_TurntableQuick(bpy.types.Operator):
     fps: bpy.props.IntProperty(name="FPS", default=25, min=1, max=120)
 
     def execute(self, ctx):
+        from ares.blender.render import RenderPreset, render_turntable
+
         obj = ctx.active_object
         if not obj:
             self.report({"ERROR"}, "No active object")
@@ -22,11 +24,29 @@ class ARES_OT_TurntableQuick(bpy.types.Operator):
         self.report({"INFO"}, "Turntable started")
         return {"FINISHED"}
 
+class ARES_OT_TurntableQuickBackground(BackgroundRenderModal, bpy.types.Operator):
+    bl_idname = "ares.turntable_quick_background"
+    bl_label = "Turntable (720p, background)"
+
+    seconds: bpy.props.IntProperty(name="Seconds", default=8, min=1, max=60)
+    fps: bpy.props.IntProperty(name="FPS", default=25, min=1, max=120)
+
+    def start_job(self, ctx):
+        from ares.blender.render import AresRenderError, RenderPreset, render_turntable
+
+        if not ctx.active_object:
+            raise AresRenderError("No active object")
+        preset = RenderPreset(res_x=1280, res_y=720, fps=self.fps)
+        return render_turntable(ctx.active_object, preset, seconds=self.seconds, background=True)
+
 class ARES_OT_ExportGLB(bpy.types.Operator):
     bl_idname = "ares.export_glb"
     bl_label = "Export .glb (selected)"
 
     def execute(self, ctx):
+        from ares.core.paths import ROOT
+        from ares.modules.asset_core.api import quick_export_glb
+
         obj = ctx.active_object
         if not obj:
             self.report({"ERROR"}, "No active object")
@@ -37,6 +57,35 @@ class ARES_OT_ExportGLB(bpy.types.Operator):
         self.report({"INFO"}, f"Exported: {out}")
         return {"FINISHED"}
 
+class ARES_OT_ExportGLBBatch(bpy.types.Operator):
+    """Un .glb par objet sélectionné (sinon collection active), sources intactes"""
+    bl_idname = "ares.export_glb_batch"
+    bl_label = "Export .glb (batch)"
+
+    force: bpy.props.BoolProperty(name="Force", description="Réexporter même à jour")
+    profile: bpy.props.StringProperty(
+        name="Profile", description="config/export_profiles.yaml (vide : maillage complet)"
+    )
+
+    def execute(self, ctx):
+        from ares.core.paths import ROOT
+        from ares.modules.asset_core.batch import export_batch
+
+        items = list(ctx.selected_objects) or [ctx.view_layer.active_layer_collection.collection]
+        out = ROOT / "renders" / "exports"
+        try:
+            res = export_batch(items, out, force=self.force, profile=self.profile or None)
+        except (RuntimeError, KeyError, OSError) as e:
+            self.report({"ERROR"}, str(e))
+            return {"CANCELLED"}
+        size = sum(r["bytes"] for r in res["report"]) / 1024
+        self.report(
+            {"INFO"},
+            f"Exported {len(res['exported'])} ({size:.0f} KB), "
+            f"up to date {len(res['skipped'])}: {out}",
+        )
+        return {"FINISHED"}
+
 class ARES_PT_Tools(bpy.types.Panel):
     bl_label = "ARES Tools"
     bl_idname = "ARES_PT_tools"
@@ -47,14 +96,21 @@ class ARES_PT_Tools(bpy.types.Panel):
     def draw(self, ctx):
         col = self.layout.column(align=True)
         col.operator("ares.turntable_quick", icon="RENDER_ANIMATION", text="Turntable (720p)")
+        col.operator("ares.turntable_quick_background", icon="TIME", text="Turntable (background)")
         col.operator("ares.export_glb", icon="EXPORT", text="Export .glb")
+        col.operator("ares.export_glb_batch", icon="EXPORT", text="Export .glb (batch)")
+        draw_jobs(self.layout)
 
 def register():
     bpy.utils.register_class(ARES_OT_TurntableQuick)
+    bpy.utils.register_class(ARES_OT_TurntableQuickBackground)
     bpy.utils.register_class(ARES_OT_ExportGLB)
+    bpy.utils.register_class(ARES_OT_ExportGLBBatch)
     bpy.utils.register_class(ARES_PT_Tools)
 
 def unregister():
     bpy.utils.unregister_class(ARES_PT_Tools)
+    bpy.utils.unregister_class(ARES_OT_ExportGLBBatch)
     bpy.utils.unregister_class(ARES_OT_ExportGLB)
+    bpy.utils.unregister_class(ARES_OT_TurntableQuickBackground)
     bpy.utils.unregister_class(ARES_OT_TurntableQuick)
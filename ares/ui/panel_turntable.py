@@ -11,6 +11,7 @@ from bpy.types import Operator, Panel, PropertyGroup
 
 # Import stable shim (core)
 from ares.core import turntable as tt
+from ares.ui.background_modal import BackgroundRenderModal, draw_jobs
 
 
 # ------------------------------------------------------------------------
@@ -51,32 +52,51 @@ class ARES_OT_RenderTurntable(Operator):
         fps = props.fps
         seconds = props.seconds
 
-        # Output path
-        import os
-        base_dir = bpy.path.abspath("//renders")
-        os.makedirs(base_dir, exist_ok=True)
-        out_path = os.path.join(base_dir, "turntable_ui.mp4")
+        self.report({"INFO"}, f"Rendering turntable ({seconds}s @ {fps}fps)")
+        out_path = _run_turntable(obj, fps, seconds)
+        self.report({"INFO"}, f"Saved to: {out_path}")
+        return {"FINISHED"}
 
-        # Create preset
-        preset = tt.RenderPreset(res_x=1280, res_y=720, fps=fps, samples=32)
 
-        # Ensure rig/collection exist
-        tt.create_turntable_rig(radius=3.0)
+class ARES_OT_RenderTurntableBackground(BackgroundRenderModal, Operator):
+    """Render the turntable in a background Blender (session stays responsive, Esc cancels)"""
 
-        # Run render
-        self.report({"INFO"}, f"Rendering turntable ({seconds}s @ {fps}fps)")
-        tt.render_turntable(
-            target=obj,
-            radius=3.0,
-            seconds=seconds,
-            fps=fps,
-            mp4_path=out_path,
-            samples=32,
-            preset=preset,
-        )
+    bl_idname = "ares.render_turntable_background"
+    bl_label = "Render Turntable (Background)"
 
-        self.report({"INFO"}, f"Saved to: {out_path}")
-        return {"FINISHED"}
+    def start_job(self, context):
+        obj = context.active_object
+        if obj is None:
+            raise RuntimeError("No active object to render")
+        props = context.scene.ares_turntable
+        return _run_turntable(obj, props.fps, props.seconds, background=True)
+
+
+def _run_turntable(obj, fps, seconds, background=False):
+    # Output path
+    import os
+    base_dir = bpy.path.abspath("//renders")
+    os.makedirs(base_dir, exist_ok=True)
+    out_path = os.path.join(base_dir, "turntable_ui.mp4")
+
+    # Create preset
+    preset = tt.RenderPreset(res_x=1280, res_y=720, fps=fps, samples=32)
+
+    # Ensure rig/collection exist
+    tt.create_turntable_rig(radius=3.0)
+
+    # Run render (background=True : BackgroundRender retourné tout de suite)
+    job = tt.render_turntable(
+        target=obj,
+        radius=3.0,
+        seconds=seconds,
+        fps=fps,
+        mp4_path=out_path,
+        samples=32,
+        preset=preset,
+        background=background,
+    )
+    return job if background else out_path
 
 
 # ------------------------------------------------------------------------
@@ -100,6 +120,8 @@ class ARES_PT_TurntablePanel(Panel):
         col.prop(props, "fps")
 
         layout.operator("ares.render_turntable", icon="RENDER_ANIMATION")
+        layout.operator("ares.render_turntable_background", icon="TIME")
+        draw_jobs(layout)
 
 
 # ------------------------------------------------------------------------
@@ -108,6 +130,7 @@ class ARES_PT_TurntablePanel(Panel):
 classes = (
     ARES_PT_TurntableProps,
     ARES_OT_RenderTurntable,
+    ARES_OT_RenderTurntableBackground,
     ARES_PT_TurntablePanel,
 )
 
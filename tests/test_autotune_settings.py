@@ -0,0 +1,43 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.blender.autotune import _preserved, apply_sampling
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+scene = bpy.context.scene
+scene.render.engine = "CYCLES"
+cy = scene.cycles
+cy.samples, cy.use_adaptive_sampling, cy.use_denoising = 300, False, False
+keys = ("samples", "use_adaptive_sampling", "use_denoising", "denoiser")
+if hasattr(cy, "denoising_use_gpu"):
+    cy.denoising_use_gpu = True
+    keys += ("denoising_use_gpu",)
+before = {k: getattr(cy, k) for k in keys}
+with _preserved(scene):
+    apply_sampling(scene, 8, denoise=True)  # ce que calibrate écrit à chaque essai
+    during = {k: getattr(cy, k) for k in keys}
+after = {k: getattr(cy, k) for k in keys}
+(out / "tune.json").write_text(json.dumps({"before": before, "during": during, "after": after}))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_calibration_restores_cycles_sampling(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "tune.json").read_text(encoding="utf-8"))
+    assert res["during"] != res["before"]
+    assert res["after"] == res["before"]
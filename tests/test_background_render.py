@@ -0,0 +1,48 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys, time
+from pathlib import Path
+
+import bpy
+
+from ares.blender.background import DONE, jobs, start_background_render
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+scene = bpy.context.scene
+scene.render.resolution_x, scene.render.resolution_y = 64, 48
+scene.render.image_settings.file_format = "PNG"
+scene.render.filepath = str(out / "seq" / "f_")
+scene.frame_start, scene.frame_end = 1, 3
+
+a = start_background_render(scene)
+b = start_background_render(scene, output=out / "other" / "g_")
+res = {"concurrent": len(jobs())}
+while a.running or b.running:
+    time.sleep(0.2)
+res["progress"] = a.progress().describe()
+a.finish()
+b.finish()
+res["state"] = a.state == DONE and b.state == DONE
+res["frames"] = sorted(p.name for p in (out / "seq").iterdir())
+res["left"] = len(jobs())
+(out / "bg.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_background_renders_run_concurrently(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "bg.json").read_text(encoding="utf-8"))
+    assert res["concurrent"] == 2 and res["state"] and res["left"] == 0
+    assert res["frames"] == ["f_0001.png", "f_0002.png", "f_0003.png"]
+    assert res["progress"].startswith("3/3 frames")
@@ -0,0 +1,55 @@
+import json
+import os
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.blender import capabilities as caps
+from ares.core.capabilities import profile_path
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+scene = bpy.context.scene
+prof = caps.profile()
+res = {"engine": caps.select_engine(scene), "engines": list(prof.engines)}
+res["cached"] = profile_path(prof.build).exists()
+
+preset = {
+    "render": {
+        "fps": 30,
+        "image_settings": {"file_format": "FFMPEG"},
+        "ffmpeg": {"codec": "H264", "gopsize": 60, "not_a_prop": 1},
+    },
+    "eevee": {"taa_render_samples": 12},
+}
+first = caps.apply_settings(scene, preset)
+second = caps.apply_settings(scene, preset)
+res["first"] = sorted(first["changed"])
+res["skipped"] = first["skipped"]
+res["second"] = second["changed"]
+res["fps"] = scene.render.fps
+(out / "caps.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_profile_cached_and_only_changes_written(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    env = child_env({"ARES_CAPABILITIES_CACHE": tmp_path / "caps"})
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=env, check=True, timeout=300)
+
+    res = json.loads((tmp_path / "caps.json").read_text(encoding="utf-8"))
+    assert res["engine"] in res["engines"] and res["cached"]
+    assert "render.fps" in res["first"] and "render.ffmpeg.gopsize" in res["first"]
+    assert "render.ffmpeg.not_a_prop" in res["skipped"]
+    assert res["second"] == {} and res["fps"] == 30
+    assert os.listdir(tmp_path / "caps")
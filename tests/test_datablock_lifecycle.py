@@ -0,0 +1,78 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+import ares
+from ares.helpers import lifecycle
+from ares.helpers.mesh import build_mesh
+from ares.modules.turntable_gen import RIG_JOB, create_turntable
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+
+
+def handlers():
+    return sum(h.__name__ == "_reset_registry" for h in bpy.app.handlers.load_post)
+
+
+handlers_at_import = handlers()  # pas d'effet de bord à l'import
+bpy.ops.curve.primitive_bezier_circle_add(radius=2.5)
+bpy.context.active_object.name = "TT_Path"  # chemin existant : réutilisé par create_turntable
+res = {"leaks": lifecycle.leak_report(create_turntable, repeats=3)}
+res["tt_cameras"] = sum(c.name.startswith("TT_Camera") for c in bpy.data.cameras)
+cam = bpy.data.objects["TT_Camera"]
+xs = []
+for frame in (1, 46):  # orbite cuite : demi-tour en 45 frames sur 90
+    bpy.context.scene.frame_set(frame)
+    xs.append(round(cam.matrix_world.translation.x, 3))
+res["baked"] = [len(cam.constraints), cam.parent is None, xs]
+
+with lifecycle.job("demo"):
+    me = lifecycle.new("meshes", "Demo_Mesh")
+    ob = lifecycle.tag(bpy.data.objects.new("Demo", me))
+    bpy.context.scene.collection.objects.link(ob)
+    mat = bpy.data.materials.new("Demo_Mat")  # non marqué : orphelin après release
+    me.materials.append(mat)
+    build_mesh("Demo_Built", [(0.0, 0.0, 0.0)])  # helpers ares : marqué aussi
+res["owned"] = sorted(i.name for i in lifecycle.owned("demo"))
+res["removed"] = lifecycle.release("demo")
+res["left"] = [n for n in ("Demo", "Demo_Mesh", "Demo_Built")
+               if bpy.data.objects.get(n) or bpy.data.meshes.get(n)]
+with lifecycle.job("renamed"):
+    lifecycle.new("meshes", "Before")
+bpy.data.meshes["Before"].name = "After"  # registre par nom : retrouvé après rescan()
+res["renamed"] = [len(lifecycle.owned("renamed"))]
+lifecycle.rescan()
+res["renamed"].append([i.name for i in lifecycle.owned("renamed")])
+res["mat_purged"] = bpy.data.materials.get("Demo_Mat") is None
+lifecycle.release(RIG_JOB)
+res["handlers"] = [handlers_at_import, handlers()]
+ares.unregister()
+res["handlers"].append(handlers())
+res["rig_left"] = bpy.data.objects.get("TT_Camera") is not None
+(out / "life.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_tagged_datablocks_are_released(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "life.json").read_text(encoding="utf-8"))
+    assert res["leaks"] == {} and res["tt_cameras"] == 1
+    assert res["baked"] == [0, True, [2.5, -2.5]]
+    assert res["owned"] == ["Demo", "Demo_Built", "Demo_Mesh"] and res["removed"] >= 4
+    assert res["left"] == [] and res["mat_purged"] and not res["rig_left"]
+    assert res["renamed"] == [0, ["After"]]
+    assert res["handlers"] == [0, 1, 0]
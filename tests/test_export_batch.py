@@ -0,0 +1,67 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.core.gltf import read_glb
+from ares.modules.asset_core.batch import export_batch
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+cube = bpy.data.objects["Cube"]
+cube.rotation_euler = (0.3, 0.0, 0.7)
+cube.scale = (2.0, 1.0, 1.0)
+cube.modifiers.new("Bevel", "BEVEL")
+bpy.ops.mesh.primitive_uv_sphere_add(location=(3, 0, 0))
+mat = bpy.data.materials.new("Stone")
+mat.use_nodes = True
+tex = mat.node_tree.nodes.new("ShaderNodeTexImage")
+tex.image = bpy.data.images.new("Albedo", 32, 32)
+bpy.context.active_object.data.materials.append(mat)
+bpy.ops.object.select_all(action="DESELECT")
+cube.select_set(True)
+before = (tuple(cube.rotation_euler), tuple(cube.scale), len(cube.data.vertices),
+          len(cube.modifiers), [o.name for o in bpy.context.selected_objects])
+
+res = {}
+first = export_batch([bpy.context.scene.collection], out / "glb", workers=2)
+res["first"] = sorted(p.name for p in first["exported"])
+after = (tuple(cube.rotation_euler), tuple(cube.scale), len(cube.data.vertices),
+         len(cube.modifiers), [o.name for o in bpy.context.selected_objects])
+res["untouched"] = list(before) == list(after) and not bpy.data.collections.get("ARES_Export")
+res["names"] = sorted(o.name for o in bpy.data.objects)
+
+second = export_batch(["Cube", "Sphere"], out / "glb", workers=0)
+res["second"] = [len(second["exported"]), len(second["skipped"])]
+cube.location.x = 1.0
+third = export_batch(["Cube", "Sphere"], out / "glb", workers=0)
+res["third"] = sorted(p.name for p in third["exported"])
+tex.image = bpy.data.images.new("Moss", 32, 32)  # seule l'image du matériau change
+fourth = export_batch(["Cube", "Sphere"], out / "glb", workers=0)
+res["fourth"] = sorted(p.name for p in fourth["exported"])
+doc, _ = read_glb(out / "glb" / "Sphere.glb")
+res["gltf_names"] = [[n["name"] for n in doc["nodes"]], [i["name"] for i in doc["images"]]]
+(out / "export.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_batch_export_is_parallel_incremental_and_non_destructive(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "export.json").read_text(encoding="utf-8"))
+    assert res["first"] == ["Cube.glb", "Sphere.glb"] and res["untouched"]
+    assert res["names"] == ["Camera", "Cube", "Light", "Sphere"]
+    assert res["second"] == [0, 2] and res["third"] == ["Cube.glb"]
+    assert res["fourth"] == ["Sphere.glb"] and res["gltf_names"] == [["Sphere"], ["Moss"]]
+    assert (tmp_path / "glb" / "Cube.glb").stat().st_size > 0
@@ -0,0 +1,64 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.config import ExportProfile
+from ares.core.gltf import read_glb
+from ares.modules.asset_core.batch import export_batch
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+bpy.ops.mesh.primitive_uv_sphere_add(segments=64, ring_count=32)
+sphere = bpy.context.active_object
+img = bpy.data.images.new("Albedo", 256, 128)
+mat = bpy.data.materials.new("Stone")
+mat.use_nodes = True
+tex = mat.node_tree.nodes.new("ShaderNodeTexImage")
+tex.image = img
+sphere.data.materials.append(mat)
+counts = (len(bpy.data.meshes), len(bpy.data.images), len(bpy.data.objects))
+
+res = {}
+msft = ExportProfile.parse({"lods": [1.0, 0.5, 0.25], "lod_mode": "msft_lod",
+                            "texture_max": 64}, "test")
+first = export_batch(["Sphere"], out / "msft", workers=0, profile=msft)
+res["msft_tris"] = [r["triangles"] for r in first["report"]]
+doc, _ = read_glb(out / "msft" / "Sphere.glb")
+base = next(n for n in doc["nodes"] if n["name"] == "Sphere")
+res["lod_ids"] = base["extensions"]["MSFT_lod"]["ids"]
+res["roots"] = [doc["nodes"][i]["name"] for i in doc["scenes"][0]["nodes"]]
+res["image"] = [doc["images"][0].get("name"), tex.image.name, tuple(img.size)]
+
+files = ExportProfile.parse({"lods": [1.0, 0.1]}, "test")
+second = export_batch(["Sphere"], out / "files", workers=2, profile=files)
+res["files"] = sorted(p.name for p in (out / "files").glob("*.glb"))
+res["files_tris"] = [r["triangles"] for r in second["report"]]
+res["again"] = len(export_batch(["Sphere"], out / "files", workers=0, profile=files)["skipped"])
+res["clean"] = counts == (len(bpy.data.meshes), len(bpy.data.images), len(bpy.data.objects))
+(out / "lods.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_export_profile_writes_lod_chain(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "lods.json").read_text(encoding="utf-8"))
+    full, half, quarter = res["msft_tris"]
+    assert full > half > quarter and half <= full * 0.55
+    assert len(res["lod_ids"]) == 2 and "Sphere_LOD1" not in res["roots"]
+    assert res["image"] == ["Albedo", "Albedo", [256, 128]]
+    assert res["files"] == ["Sphere.glb", "Sphere_LOD1.glb"]
+    assert res["files_tris"][1] < res["files_tris"][0] * 0.15
+    assert res["again"] == 1 and res["clean"]
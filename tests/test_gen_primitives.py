@@ -1,18 +1,37 @@
-import sys
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
 from pathlib import Path
 
-def test_primitives_cube_preview(tmp_path=None):
-    root = Path(r'D:\V13\workspace_v13')
-    sys.path.insert(0, str(root))
+from ares.modules.gen import primitives as gen
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+
+# Sujet: cube data-first + matériau
+obj = gen.make_cube(name='TestCube', size=1.2)
+
+# Preview TT 1s @24fps
+mp4 = gen.quick_preview_turntable(obj, seconds=1, fps=24, radius=2.5, samples=8,
+                                  out_mp4=str(out / "preview.mp4"))
+(out / "result.json").write_text(json.dumps({"mp4": str(mp4)}))
+'''
 
-    import bpy
-    from ares.modules.gen import primitives as gen
 
-    # Sujet: cube data-first + matériau
-    obj = gen.make_cube(name='TestCube', size=1.2)
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_primitives_cube_preview(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
 
-    # Preview TT 1s @24fps
-    out = gen.quick_preview_turntable(obj, seconds=1, fps=24, radius=2.5, samples=8)
-    p = Path(out)
+    res = json.loads((tmp_path / "result.json").read_text(encoding="utf-8"))
+    p = tmp_path / "preview.mp4"
+    assert res["mp4"] == str(p)
     assert p.exists(), f"preview not created: {p}"
     assert p.stat().st_size > 0, "preview is empty"
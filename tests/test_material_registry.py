@@ -0,0 +1,48 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.helpers import assign_bulk, create_cube, get_material
+from ares.modules.gen import primitives as gen
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+res = {}
+
+m = get_material("Reg_Mat")
+res["same"] = get_material("Reg_Mat") == m
+bpy.data.materials.remove(m)
+res["recreated"] = get_material("Reg_Mat").name == "Reg_Mat"
+
+cubes = [create_cube(f"C{i}", 1.0, shared=True) for i in range(50)]
+res["writes"] = assign_bulk(cubes, get_material("Reg_Mat"))
+
+before = len(bpy.data.materials)
+objs = [gen.make_cube(f"P{i}", color=(i / 10, 0.2, 0.3, 1.0)) for i in range(10)]
+res["new_materials"] = len(bpy.data.materials) - before
+res["one_shader"] = len({o.active_material.name for o in objs}) == 1
+res["colors"] = [round(o["ares_color"][0], 3) for o in objs]
+(out / "materials.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_registry_bulk_assign_and_variants(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "materials.json").read_text(encoding="utf-8"))
+    assert res["same"] and res["recreated"]
+    assert res["writes"] == 1  # 50 cubes, un seul mesh partagé
+    assert res["new_materials"] == 1 and res["one_shader"]
+    assert res["colors"] == [i / 10 for i in range(10)]
@@ -0,0 +1,61 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.helpers import create_cube
+from ares.helpers import mesh_registry as reg
+from ares.modules.gen import primitives as gen
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+res = {}
+
+a, b, c = (create_cube(n, s, shared=True) for n, s in (("A", 1.0), ("B", 1.0), ("C", 2.0)))
+res["default_unshared"] = create_cube("D", 1.0).data != a.data
+res["cube_shared"] = a.data == b.data and a.data != c.data
+s1 = gen.make_uvsphere("S1", color=(1, 0, 0, 1))
+s2 = gen.make_uvsphere("S2", color=(0, 1, 0, 1))
+res["sphere_shared"] = s1.data == s2.data and s1.active_material == s2.active_material
+
+# doublons "importés" : deux copies du même mesh + une variante
+base = bpy.data.meshes.new("Imported")
+base.from_pydata([(0, 0, 0), (1, 0, 0), (0, 1, 0)], [], [(0, 1, 2)])
+other = base.copy()
+variant = base.copy()
+variant.vertices[0].co.z = 0.5
+objs = [bpy.data.objects.new(f"I{i}", me) for i, me in enumerate((base, other, variant))]
+for o in objs:
+    bpy.context.scene.collection.objects.link(o)
+remap = reg.dedupe_meshes([base, other, variant])
+res["remap"] = remap
+res["dedupe_users"] = objs[0].data == objs[1].data and objs[2].data == variant
+res["dup_removed"] = "Imported.001" not in bpy.data.meshes
+
+for o in (a, b):
+    bpy.data.objects.remove(o)
+res["collected"] = reg.collect()
+res["stats"] = reg.stats()
+(out / "registry.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_shared_primitives_and_dedupe(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "registry.json").read_text(encoding="utf-8"))
+    assert res["cube_shared"] and res["sphere_shared"] and res["default_unshared"]
+    assert res["remap"] == {"Imported.001": "Imported"}
+    assert res["dedupe_users"] and res["dup_removed"]
+    assert res["collected"] == 1  # mesh du cube 1.0, plus utilisé
@@ -0,0 +1,54 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.blender.fingerprint import render_fingerprint
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+cube = bpy.data.objects["Cube"]
+mat = bpy.data.materials.new("Paint")
+mat.use_nodes = True
+nodes = mat.node_tree.nodes
+tex = nodes.new("ShaderNodeTexImage")
+tex.image = bpy.data.images.new("A", 64, 64)
+mix = nodes.new("ShaderNodeMixRGB")
+ramp = nodes.new("ShaderNodeValToRGB")
+cube.data.materials.append(mat)
+
+keys = {"base": render_fingerprint(cube, "p")}
+keys["again"] = render_fingerprint(cube, "p")
+tex.image = bpy.data.images.new("B", 64, 64)
+keys["image"] = render_fingerprint(cube, "p")
+tex.image.generated_color = (1.0, 0.0, 0.0, 1.0)
+keys["pixels"] = render_fingerprint(cube, "p")
+mix.blend_type = "MULTIPLY"
+keys["blend"] = render_fingerprint(cube, "p")
+ramp.color_ramp.elements[1].position = 0.5
+keys["ramp"] = render_fingerprint(cube, "p")
+bpy.data.objects["Light"].data.energy *= 2
+keys["light"] = render_fingerprint(cube, "p")
+bpy.context.scene.world.color = (0.2, 0.3, 0.4)
+keys["world"] = render_fingerprint(cube, "p")
+(out / "keys.json").write_text(json.dumps(keys))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_fingerprint_tracks_textures_nodes_and_lighting(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    keys = json.loads((tmp_path / "keys.json").read_text(encoding="utf-8"))
+    assert keys.pop("again") == keys["base"]
+    assert len(set(keys.values())) == len(keys)
@@ -0,0 +1,57 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.blender.shard import split_frames
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+# Rendu PNG_SEQ mono-process puis shardé (3 process) ; on compare les pixels frame à frame.
+DRIVER = r'''
+import hashlib, json, sys
+from array import array
+from pathlib import Path
+
+import bpy
+
+from ares.blender.render import RenderPreset, render_turntable
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+obj = bpy.data.objects["Cube"]
+preset = RenderPreset(res_x=64, res_y=36, fps=4, samples=1, codec="PNG_SEQ")
+
+def digests(folder):
+    res = {}
+    for f in sorted(folder.glob("*.png")):
+        img = bpy.data.images.load(str(f))
+        px = array("f", [0.0]) * len(img.pixels)
+        img.pixels.foreach_get(px)
+        res[f.name] = hashlib.sha256(px.tobytes()).hexdigest()
+        bpy.data.images.remove(img)
+    return res
+
+render_turntable(obj, preset, seconds=2, out_dir=out / "single")
+render_turntable(obj, preset, seconds=2, shards=3, out_dir=out / "sharded")
+(out / "digests.json").write_text(json.dumps({
+    "single": digests(out / "single"),
+    "sharded": digests(out / "sharded"),
+}))
+'''
+
+
+def test_split_frames():
+    assert split_frames(1, 10, 3) == [(1, 4), (5, 7), (8, 10)]
+    assert split_frames(1, 2, 8) == [(1, 1), (2, 2)]
+    assert split_frames(5, 4, 2) == []
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_sharded_frames_match_single_process(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=900)
+
+    d = json.loads((tmp_path / "digests.json").read_text(encoding="utf-8"))
+    assert len(d["single"]) == 8, d["single"]
+    assert d["sharded"] == d["single"]
@@ -0,0 +1,23 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+from ares.core.paths import ROOT
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_register_within_budget(tmp_path):
+    out = tmp_path / "startup.json"
+    cmd = blender_cmd(
+        script=ROOT / "tools" / "bench_startup.py",
+        script_args=["--out", out, "--import-ms", 150, "--register-ms", 300],
+        factory_startup=True,
+    )
+    rc = subprocess.run(cmd, env=child_env(), timeout=300, check=False).returncode
+
+    res = json.loads(out.read_text(encoding="utf-8"))
+    assert res["heavy_imports"] == []
+    assert "register_ms" in res
+    assert rc == 0, f"budget dépassé: {res['over_budget']}"
@@ -0,0 +1,61 @@
+import json
+import subprocess
+
+import pytest
+
+from ares.core.blender_proc import blender_cmd, child_env, find_blender
+
+DRIVER = r'''
+import json, sys
+from pathlib import Path
+
+import bpy
+
+from ares.blender.symmetry import analyze, render_symmetric
+
+out = Path(sys.argv[sys.argv.index("--") + 1])
+scene = bpy.context.scene
+cam, light = bpy.data.objects["Camera"], bpy.data.objects["Light"]
+res = {"fixed_light": analyze(scene, (0, 0), rig=(cam,)).order}
+light.parent = cam  # lumière attachée au rig : tourne avec la vue
+res["rig_light"] = analyze(scene, (0, 0), rig=(cam,)).order
+bpy.data.objects["Cube"].location.x = 0.5
+res["off_axis"] = analyze(scene, (0, 0), rig=(cam,)).order
+bpy.data.objects["Cube"].location.x = 0.0
+
+# contenu asymétrique visible seulement via une instance de collection
+props = bpy.data.collections.new("Props")
+mesh = bpy.data.meshes.new("Wedge")
+mesh.from_pydata([(1, 0, 0), (2, 0, 0), (1, 0.5, 0.5)], [], [(0, 1, 2)])
+props.objects.link(bpy.data.objects.new("Wedge", mesh))
+holder = bpy.data.objects.new("Holder", None)
+holder.instance_type = "COLLECTION"
+holder.instance_collection = props
+scene.collection.objects.link(holder)
+res["instanced"] = analyze(scene, (0, 0), rig=(cam,)).order
+bpy.data.objects.remove(holder)
+
+scene.render.resolution_x, scene.render.resolution_y = 32, 24
+scene.render.image_settings.file_format = "PNG"
+scene.render.filepath = str(out / "seq" / "f_")
+scene.frame_start, scene.frame_end = 1, 8
+render_symmetric(scene, period=8, order=4)
+files = sorted((out / "seq").iterdir())
+res["frames"] = [p.name for p in files]
+res["reused"] = files[2].read_bytes() == files[0].read_bytes()
+(out / "sym.json").write_text(json.dumps(res))
+'''
+
+
+@pytest.mark.skipif(find_blender() is None, reason="Blender introuvable (BLENDER_EXE/PATH)")
+def test_symmetry_analysis_and_reuse(tmp_path):
+    driver = tmp_path / "driver.py"
+    driver.write_text(DRIVER, encoding="utf-8")
+    cmd = blender_cmd(script=driver, script_args=[tmp_path], factory_startup=True)
+    subprocess.run(cmd, env=child_env(), check=True, timeout=300)
+
+    res = json.loads((tmp_path / "sym.json").read_text(encoding="utf-8"))
+    assert res["fixed_light"] == 1 and res["rig_light"] == 4 and res["off_axis"] == 1
+    assert res["instanced"] == 1  # instance asymétrique : pas de réutilisation
+    assert res["frames"] == [f"f_{i:04d}.png" for i in range(1, 9)]
+    assert res["reused"]  # frame 3 : hard-link (ou copie) de la frame 1
@@ -0,0 +1,55 @@
+from math import comb
+
+import pytest
+
+from ares.core.bench import (
+    comparable,
+    compare,
+    fingerprint,
+    load_results,
+    mann_whitney,
+    save_results,
+    summarize,
+)
+
+
+def _run(runs, **fp):
+    return {"fingerprint": {"machine": "x86_64", **fp}, "results": {"w": summarize(runs)}}
+
+
+def test_mann_whitney_exact():
+    # séparation totale 5 vs 5 : p = 1 / C(10, 5)
+    slower, faster = mann_whitney([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+    assert slower == pytest.approx(1 / comb(10, 5))
+    assert faster == pytest.approx(1.0)
+    assert mann_whitney([1, 2, 3], [1, 2, 3])[0] > 0.4
+
+
+def test_significant_slowdown_is_a_regression():
+    base = _run([1.00, 1.01, 0.99, 1.02, 1.00])
+    cur = _run([1.20, 1.22, 1.19, 1.21, 1.20])
+    (row,) = compare(base, cur)
+    assert row["status"] == "regression" and row["ratio"] == pytest.approx(1.2)
+
+
+def test_noise_and_small_gaps_are_not_flagged():
+    base = _run([1.00, 1.05, 0.95, 1.02, 0.98])
+    noisy = _run([0.97, 1.06, 1.01, 0.96, 1.03])
+    tiny = _run([1.01, 1.011, 1.012, 1.013, 1.014])  # significatif mais < 5 %
+    assert compare(base, noisy)[0]["status"] == "ok"
+    assert compare(_run([1.0] * 5), tiny)[0]["status"] == "ok"
+
+
+def test_improvement_new_and_missing():
+    base = {"results": {"w": summarize([2.0, 2.1, 2.0, 1.9, 2.0]), "old": summarize([1.0])}}
+    cur = {"results": {"w": summarize([1.0, 1.1, 1.0, 0.9, 1.0]), "extra": summarize([3.0])}}
+    status = {r["name"]: r["status"] for r in compare(base, cur)}
+    assert status == {"w": "improvement", "extra": "new", "old": "missing"}
+
+
+def test_fingerprint_and_storage(tmp_path):
+    fp = fingerprint(blender="4.5.3 LTS")
+    assert fp["blender"] == "4.5.3 LTS" and fp["cpu_count"]
+    assert comparable(_run([1.0], blender="4.5"), _run([1.0], blender="4.2")) == ["blender"]
+    path = save_results(_run([1.0, 2.0]), tmp_path, "baseline.json")
+    assert load_results(path)["results"]["w"]["median"] == 1.5
@@ -0,0 +1,31 @@
+from ares.core.checkpoint import FrameCheckpoint
+
+SETTINGS = {"res": [64, 36, 100], "frames": [1, 4, 1]}
+
+
+def _frame(folder, n, data=b"png"):
+    p = folder / f"frame_{n:04d}.png"
+    p.write_bytes(data * n)
+    return p
+
+
+def test_resume_skips_verified_frames(tmp_path):
+    ck = FrameCheckpoint(tmp_path, SETTINGS)
+    for n in (1, 2, 3):
+        ck.mark(n, _frame(tmp_path, n))
+
+    # frame 2 tronquée après coup (process tué pendant une réécriture)
+    (tmp_path / "frame_0002.png").write_bytes(b"p")
+
+    again = FrameCheckpoint(tmp_path, SETTINGS)
+    assert again.verify() == {1, 3}
+    assert again.missing(1, 4) == [2, 4]
+
+
+def test_settings_change_resets_manifest(tmp_path):
+    ck = FrameCheckpoint(tmp_path, SETTINGS)
+    ck.mark(1, _frame(tmp_path, 1))
+
+    other = FrameCheckpoint(tmp_path, {**SETTINGS, "res": [128, 72, 100]})
+    assert other.verify() == set()
+    assert other.missing(1, 2) == [1, 2]
@@ -0,0 +1,74 @@
+import os
+import shutil
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from ares import config
+from ares.config import loader
+from ares.core.paths import ROOT
+
+
+@pytest.fixture
+def cfg_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARES_CONFIG_CACHE", str(tmp_path / "cache"))
+    d = tmp_path / "config"
+    shutil.copytree(ROOT / "config", d)
+    config.clear()
+    return d
+
+
+def test_deep_merge():
+    base = {"a": {"x": 1, "y": 2}, "b": 1}
+    assert config.deep_merge(base, {"a": {"y": 3}, "c": 4}) == {
+        "a": {"x": 1, "y": 3}, "b": 1, "c": 4,
+    }
+    assert base["a"]["y"] == 2
+
+
+def test_defaults_and_overrides_compiled(cfg_dir):
+    cfg = config.load(cfg_dir)
+    assert (cfg.output.resolution.x, cfg.output.resolution.y, cfg.output.fps) == (1280, 720, 24)
+    assert cfg.output.ffmpeg["codec"] == "H264"
+    assert cfg.preset("full").samples == 64
+    assert cfg.eevee.eevee["shadow_cube_size"] == "1024"  # enum RNA
+    assert "fixbook_rules" in cfg.sections
+    with pytest.raises(FrozenInstanceError):
+        cfg.output.fps = 30
+    with pytest.raises(TypeError):
+        cfg.output.ffmpeg["codec"] = "HEVC"
+    with pytest.raises(KeyError):
+        cfg.preset("ULTRA")
+
+
+def test_cache_skips_yaml_until_content_changes(cfg_dir, monkeypatch):
+    first = config.load(cfg_dir)
+    calls = []
+    parse = loader._parse
+    monkeypatch.setattr(loader, "_parse", lambda files: calls.append(1) or parse(files))
+
+    assert config.load(cfg_dir).digest == first.digest and not calls
+    f = cfg_dir / "turntable_presets.yaml"
+    st = f.stat()
+    os.utime(f, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))  # touché, identique
+    assert config.load(cfg_dir).digest == first.digest and not calls
+
+    f.write_text(f.read_text(encoding="utf-8-sig").replace("samples: 64", "samples: 128"),
+                 encoding="utf-8")
+    assert config.load(cfg_dir).preset("FULL").samples == 128 and calls == [1]
+
+
+def test_get_is_memoized_and_validates(cfg_dir):
+    a = config.get(cfg_dir)
+    assert config.get(cfg_dir) is a
+    (cfg_dir / "turntable_presets.yaml").write_text("FAST: {seconds: 1, fps: 0}\n")
+    with pytest.raises(config.ConfigError):
+        config.get(cfg_dir)
+
+
+def test_load_preset_goes_through_config(cfg_dir):
+    from ares.jobs.spec import load_preset
+
+    assert load_preset("normal", cfg_dir) == {
+        "seconds": 2.0, "fps": 24, "radius": 2.5, "samples": 32,
+    }
@@ -0,0 +1,17 @@
+from ares.core.datablocks import format_report, growth, leaks
+
+
+def _snaps(*counts):
+    return [{"objects": o, "cameras": c, "meshes": 5} for o, c in counts]
+
+
+def test_growth_and_leaks():
+    snaps = _snaps((10, 1), (11, 2), (11, 3), (12, 4))
+    assert growth(snaps) == {"cameras": [1, 1, 1], "objects": [1, 0, 1]}
+    assert leaks(snaps) == {"cameras": 3}  # objects ne grossit pas à chaque appel
+
+
+def test_report():
+    assert format_report(_snaps((3, 1), (3, 1))).startswith("aucune croissance")
+    report = format_report(_snaps((3, 1), (3, 2), (3, 3)))
+    assert "cameras" in report and "FUITE" in report and "objects" not in report
@@ -0,0 +1,105 @@
+import json
+import struct
+import threading
+import time
+import zlib
+
+import pytest
+
+from ares.config import ConfigError, Deliverable, OutputConfig
+from ares.core import deliverables
+from ares.core.deliverables import plan, png_size, produce
+
+
+def _png(path, w, h):
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    ihdr = struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0)
+    raw = b"".join(b"\x00" + bytes(w * 3) for _ in range(h))
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", ihdr)
+                     + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+    return path
+
+
+@pytest.fixture
+def frames(tmp_path):
+    folder = tmp_path / "dog_frames"
+    folder.mkdir()
+    return [_png(folder / f"frame_{i:04d}.png", 64, 36) for i in range(1, 49)]
+
+
+def test_png_size(frames):
+    assert png_size(frames[0]) == (64, 36)
+
+
+def test_plan_commands(frames, tmp_path):
+    base = tmp_path / "dog"
+    mp4 = plan("mp4", {"crf": 18}, frames, base, 24, exe="ff")
+    assert mp4.output.name == "dog.mp4" and mp4.cmd[0] == "ff"
+    assert mp4.cmd[mp4.cmd.index("-i") + 1].endswith("frame_%04d.png")
+    assert mp4.cmd[mp4.cmd.index("-crf") + 1] == "18"
+    gif = plan("gif", {"fps": 10}, frames, base, 24)
+    assert gif.output.name == "dog_preview.gif"
+    assert "palettegen" in gif.cmd[gif.cmd.index("-vf") + 1]
+    poster = plan("poster", {"frame": "last"}, frames, base, 24)
+    assert poster.cmd is None and poster.copy == frames[-1]
+    assert poster.output.name == "dog_poster.png"
+
+
+def test_sprite_sheet_layout(frames, tmp_path):
+    options = {"count": 12, "columns": 5, "width": 100}
+    job = plan("sprite_sheet", options, frames, tmp_path / "d", 24)
+    assert job.meta["step"] == 4 and job.meta["frames"] == 12
+    assert (job.meta["columns"], job.meta["rows"]) == (5, 3)
+    assert (job.meta["frame_width"], job.meta["frame_height"]) == (100, 56)
+    assert job.meta["fps"] == 6 and "tile=5x3" in job.cmd[job.cmd.index("-vf") + 1]
+
+
+def test_produce_runs_jobs_in_parallel(frames, tmp_path, monkeypatch):
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def fake_run(cmd):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.2)
+        open(cmd[-1], "wb").close()
+        with lock:
+            running[0] -= 1
+
+    monkeypatch.setattr(deliverables, "_run", fake_run)
+    specs = [Deliverable(k) for k in ("mp4", "webm", "gif", "poster", "sprite_sheet")]
+    out = produce(frames, tmp_path / "dog.mp4", 24, specs, workers=4, exe="ffmpeg")
+    assert sorted(out) == ["dog.mp4", "dog.webm", "dog_poster.png", "dog_preview.gif",
+                           "dog_sprites.jpg"]
+    assert all(p.exists() for p in out.values()) and peak[0] > 1
+    assert json.loads((tmp_path / "dog_sprites.json").read_text())["image"] == "dog_sprites.jpg"
+
+
+def test_produce_reports_failures(frames, tmp_path, monkeypatch):
+    def fake_run(cmd):
+        if cmd[-1].endswith(".webm"):
+            raise RuntimeError("libvpx absent")
+        open(cmd[-1], "wb").close()
+
+    monkeypatch.setattr(deliverables, "_run", fake_run)
+    with pytest.raises(RuntimeError, match="webm"):
+        produce(frames, tmp_path / "dog", 24, [Deliverable("mp4"), Deliverable("webm")],
+                exe="ffmpeg")
+    assert (tmp_path / "dog.mp4").exists()
+
+
+def test_config_parsing():
+    cfg = OutputConfig.parse({"deliverables": ["mp4", {"kind": "gif", "width": 320}]}, "o")
+    assert [d.kind for d in cfg.deliverables] == ["mp4", "gif"]
+    assert cfg.deliverables[1].options["width"] == 320
+    for bad in (["avi"], [{"kind": "gif", "crf": 3}], [{"kind": "poster", "frame": "end"}],
+                [{"kind": "gif", "fps": 0}], ["gif", {"kind": "gif", "width": 200}],
+                [{"kind": "mp4", "crf": 52}], [{"kind": "webp", "quality": -1}]):
+        with pytest.raises(ConfigError):
+            OutputConfig.parse({"deliverables": bad}, "o")
+    lossless = OutputConfig.parse({"deliverables": [{"kind": "mp4", "crf": 0}]}, "o")
+    assert lossless.deliverables[0].options["crf"] == 0
+    cfg = OutputConfig.parse({"deliverables": ["gif", {"kind": "gif", "suffix": "_anim"}]}, "o")
+    assert cfg.deliverables[1].suffix == "_anim"
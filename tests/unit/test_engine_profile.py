@@ -0,0 +1,46 @@
+from ares.core.capabilities import (
+    MISSING,
+    RENDER_ENGINES,
+    EngineProfile,
+    flatten,
+    load_profile,
+    profile_path,
+    same,
+    save_profile,
+)
+
+PROFILE = EngineProfile(
+    build="4.2.0-abc123",
+    engines=("BLENDER_EEVEE_NEXT", "BLENDER_WORKBENCH", "CYCLES"),
+    props={"ffmpeg": {"codec": ("H264", "HEVC"), "gopsize": None}},
+)
+
+
+def test_engine_preference_and_props():
+    assert PROFILE.pick_engine() == "BLENDER_EEVEE_NEXT"
+    assert PROFILE.pick_engine(("CYCLES", "BLENDER_EEVEE")) == "CYCLES"
+    assert PROFILE.pick_engine(("BLENDER_EEVEE",)) is None
+    assert PROFILE.accepts("ffmpeg", "codec", "H264")
+    assert not PROFILE.accepts("ffmpeg", "codec", "AV2")
+    assert PROFILE.accepts("ffmpeg", "gopsize", 50)
+    assert not PROFILE.accepts("eevee", "use_bloom", True)
+    assert "BLENDER_WORKBENCH" not in RENDER_ENGINES
+
+
+def test_profile_cache_is_per_build(tmp_path):
+    path = profile_path(PROFILE.build, tmp_path)
+    assert path.parent == tmp_path and path.suffix == ".json"
+    assert load_profile(path) is None
+    save_profile(path, PROFILE)
+    assert load_profile(path, PROFILE.build) == PROFILE
+    assert load_profile(path, "4.3.0-def456") is None
+
+
+def test_flatten_keeps_order_and_same_is_tolerant():
+    preset = {"render": {"image_settings": {"file_format": "FFMPEG"}, "fps": 25}, "eevee": {}}
+    assert list(flatten(preset)) == [("render", "image_settings", "file_format"), ("render", "fps")]
+    assert same(0.10000000149011612, 0.1)  # float32 RNA
+    assert same((1.0, 0.5, 0.25), [1.0, 0.5, 0.25])
+    assert not same((1.0, 0.5), (1.0, 0.5, 0.0))
+    assert not same(MISSING, 0)
+    assert same("H264", "H264") and not same(24, 25)
@@ -0,0 +1,26 @@
+from ares.core.export_manifest import ExportManifest, partition
+
+
+def test_manifest_tracks_digest_and_file(tmp_path):
+    out = tmp_path / "Cube.glb"
+    out.write_bytes(b"glb" * 10)
+    m = ExportManifest(tmp_path)
+    assert not m.current(out, "abc")
+    m.record(out, "abc")
+    m.save()
+
+    again = ExportManifest(tmp_path)
+    assert again.current(out, "abc") and not again.current(out, "def")
+    out.write_bytes(b"x")  # fichier remplacé depuis
+    assert not again.current(out, "abc")
+    out.unlink()
+    assert not again.current(out, "abc")
+
+
+def test_partition_balances_load():
+    lots = partition([100, 1, 1, 60, 40, 1], 2)
+    assert sorted(i for lot in lots for i in lot) == list(range(6))
+    loads = sorted(sum([100, 1, 1, 60, 40, 1][i] for i in lot) for lot in lots)
+    assert loads == [101, 102]
+    assert partition([5, 5], 8) == [[0], [1]]
+    assert partition([], 3) == []
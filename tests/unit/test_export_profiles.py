@@ -0,0 +1,97 @@
+import pytest
+
+from ares import config
+from ares.config import ConfigError, ExportProfile
+from ares.core import gltf
+from ares.core.paths import ROOT
+
+
+def test_shipped_profiles_compile(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARES_CONFIG_CACHE", str(tmp_path / "cache"))
+    cfg = config.load(ROOT / "config")
+    web = cfg.export_profile("web")
+    assert web.lods == (1.0, 0.5, 0.25, 0.1) and web.lod_mode == "msft_lod"
+    assert (web.compression, web.texture_max) == ("draco", 1024)
+    assert cfg.export_profile("FULL") == ExportProfile()
+    with pytest.raises(KeyError):
+        cfg.export_profile("ULTRA")
+
+
+@pytest.mark.parametrize("data", [
+    {"lods": [1.0, 0.5, 0.5]},
+    {"lods": [1.5]},
+    {"lods": []},
+    {"lod_mode": "atlas"},
+    {"compression": "zip"},
+    {"draco_level": 11},
+    {"texture_max": 0},
+    {"lods": [1.0, 0.5], "coverage": [0.3]},
+])
+def test_invalid_profiles_rejected(data):
+    with pytest.raises(ConfigError):
+        ExportProfile.parse(data, "export_profiles.X")
+
+
+def test_parse_roundtrips_through_payload():
+    prof = ExportProfile.parse({"lods": [1, 0.25], "compression": "meshopt",
+                                "texture_max": 512}, "x")
+    assert ExportProfile.parse(prof.as_dict(), "payload") == prof
+
+
+def _sample() -> dict:
+    return {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0, 1, 2, 3]}],
+        "nodes": [{"name": "Rock", "mesh": 0}, {"name": "Rock_LOD1", "mesh": 1},
+                  {"name": "Rock_LOD2", "mesh": 2}, {"name": "Tree", "mesh": 3}],
+    }
+
+
+def test_glb_roundtrip_and_msft_lod(tmp_path):
+    path = gltf.write_glb(tmp_path / "a.glb", _sample(), b"\x01\x02\x03")
+    assert path.stat().st_size % 4 == 0
+    doc, binary = gltf.read_glb(path)
+    assert binary[:3] == b"\x01\x02\x03" and doc == _sample()
+
+    cover = gltf.default_coverage([1.0, 0.5, 0.25])
+    gltf.add_msft_lod(doc, {"Rock": 3, "Tree": 1}, cover)
+    assert doc["nodes"][0]["extensions"]["MSFT_lod"] == {"ids": [1, 2]}
+    assert doc["nodes"][0]["extras"]["MSFT_screencoverage"] == [0.25, 0.125, 0.0]
+    assert doc["scenes"][0]["nodes"] == [0, 3] and doc["extensionsUsed"] == ["MSFT_lod"]
+    assert "extensions" not in doc["nodes"][3]
+    with pytest.raises(KeyError):
+        gltf.add_msft_lod(doc, {"Bush": 2})
+
+
+def test_rename_maps_exported_names():
+    doc = _sample()
+    doc["nodes"][0]["name"] = "Rock_ares_export"
+    doc["images"] = [{"name": "Albedo_ares_lowres"}, {"name": "Normal"}]
+    gltf.rename(doc, "nodes", {"Rock_ares_export": "Rock"})
+    gltf.rename(doc, "images", {"Albedo_ares_lowres": "Albedo"})
+    assert [n["name"] for n in doc["nodes"]] == ["Rock", "Rock_LOD1", "Rock_LOD2", "Tree"]
+    assert [i["name"] for i in doc["images"]] == ["Albedo", "Normal"]
+
+
+def test_lod_paths_and_report(tmp_path):
+    assert [p.name for p in gltf.lod_paths(tmp_path / "Rock.glb", 3)] == [
+        "Rock.glb", "Rock_LOD1.glb", "Rock_LOD2.glb",
+    ]
+    rows = [
+        {"object": "Rock", "file": "Rock.glb", "lod": 0, "ratio": 1.0,
+         "triangles": 1000, "bytes": 2048},
+        {"object": "Rock", "file": "Rock.glb", "lod": 1, "ratio": 0.5,
+         "triangles": 500, "bytes": 0},
+    ]
+    text = gltf.format_report(rows)
+    assert "1000" in text and "500" in text
+    assert text.splitlines()[-1].split() == ["total", "2.0"]
+
+
+def test_meshopt_needs_gltfpack(tmp_path, monkeypatch):
+    monkeypatch.delenv("ARES_GLTFPACK", raising=False)
+    monkeypatch.setenv("PATH", str(tmp_path))
+    with pytest.raises(FileNotFoundError):
+        gltf.meshopt_compress(tmp_path / "a.glb")
+    assert gltf.gltfpack_cmd("a.glb", "b.glb")[-4:] == ["-cc", "-kn", "-km", "-ke"]
@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from ares.modules.turntable.framing import compute_orbit_for_objects  # noqa: E402
+
+UNIT_BOX = [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+
+
+class FakeObject:
+    type = "MESH"
+    bound_box = UNIT_BOX
+
+    def __init__(self, tx=0.0, ty=0.0, tz=0.0):
+        self.matrix_world = [[1, 0, 0, tx], [0, 1, 0, ty], [0, 0, 1, tz], [0, 0, 0, 1]]
+
+
+def test_group_bbox_orbit_matches_single_object_heuristic():
+    spec = compute_orbit_for_objects([FakeObject(), FakeObject(tx=4, tz=2)])
+    # bornes monde : x [-1, 5], y [-1, 1], z [-1, 3]
+    assert spec.center == pytest.approx((2.0, 0.0, 1.0))
+    assert spec.radius == pytest.approx(6 * 0.75 + 0.001)
+    assert spec.height == pytest.approx(1.0 + 4 * 0.15)
+    assert spec.fov_deg == 50.0
+
+
+class FakeVertices:
+    def __init__(self, co):
+        self.co = co
+
+    def __len__(self):
+        return len(self.co)
+
+    def foreach_get(self, attr, buf):
+        buf[:] = [c for v in self.co for c in v]
+
+
+class FakeMesh:
+    def __init__(self, co):
+        self.vertices = FakeVertices(co)
+
+
+class FakeEvaluated(FakeObject):
+    """bbox centrée sur l'origine, sommets évalués seulement côté x >= 0."""
+
+    def __init__(self, co):
+        super().__init__()
+        self.mesh = FakeMesh(co)
+
+    def evaluated_get(self, depsgraph):
+        return self
+
+    def to_mesh(self):
+        return self.mesh
+
+    def to_mesh_clear(self):
+        pass
+
+
+def test_exact_radius_is_measured_around_orbit_center():
+    co = [(x, y, z) for x in (0, 1) for y in (-1, 1) for z in (-1, 1)]
+    spec = compute_orbit_for_objects(
+        [FakeEvaluated(co)], exact=True, margin=0.0, depsgraph=object()
+    )
+    assert spec.center == pytest.approx((0.5, 0.0, 0.0))
+    r_xy = 1.25 ** 0.5  # autour de (0.5, 0), pas sqrt(2) autour du centre des bbox
+    t = math.tan(math.radians(50.0) / 2.0)
+    assert spec.radius == pytest.approx(r_xy + max(r_xy, 1.0) / t + 0.001)
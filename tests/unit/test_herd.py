@@ -0,0 +1,34 @@
+import numpy as np
+
+from ares.modules.animals.herd import DEFAULT_POSES, DOG_PARTS, dog_arrays, scatter_herd
+from ares.modules.gen import parametric as pm
+
+
+def test_box_faces_outward_and_merge_offsets():
+    b = pm.box((1.0, 2.0, 3.0), center=(0.0, 0.0, 1.5))
+    dots = np.einsum("ij,ij->i", b.polygon_normals(), b.polygon_centers() - (0.0, 0.0, 1.5))
+    assert (dots > 0).all()
+    m = pm.merge([b, b])
+    assert len(m.verts) == 16 and m.loop_verts[24:].min() == 8
+
+
+def test_dog_is_one_mesh_per_pose():
+    dog = dog_arrays()
+    assert len(dog.verts) == 8 * len(DOG_PARTS) and len(dog.loop_totals) == 6 * len(DOG_PARTS)
+    posed = dog_arrays(*DEFAULT_POSES[1])
+    moved = np.any(np.abs(posed.verts - dog.verts) > 1e-6, axis=1).reshape(len(DOG_PARTS), 8)
+    # seules la tête et la queue bougent
+    names = [p[0] for p in DOG_PARTS]
+    assert [n for n, row in zip(names, moved, strict=True) if row.any()] == ["Head", "Tail"]
+
+
+def test_scatter_is_seeded_and_bounded():
+    a = scatter_herd(10_000, seed=7, scale_range=(0.8, 1.2))
+    b = scatter_herd(10_000, seed=7, scale_range=(0.8, 1.2))
+    assert len(a) == 10_000
+    for field in ("positions", "yaw", "scale", "color", "pose"):
+        assert np.array_equal(getattr(a, field), getattr(b, field))
+    assert a.scale.min() >= 0.8 and a.scale.max() <= 1.2
+    assert set(np.unique(a.pose)) == set(range(len(DEFAULT_POSES)))
+    assert a.color[:, :3].min() >= 0.0 and (a.color[:, 3] == 1.0).all()
+    assert not np.array_equal(a.positions, scatter_herd(10_000, seed=8).positions)
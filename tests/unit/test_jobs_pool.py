@@ -0,0 +1,60 @@
+import sys
+import textwrap
+import time
+
+import pytest
+
+from ares.jobs import DONE, FAILED, JobQueue, JobSpec, LauncherBusy, Scheduler, WorkerPool
+
+# Faux worker qui parle le protocole de jobs.worker (sans Blender).
+FAKE_WORKER = textwrap.dedent('''
+    import json, os, sys
+    print("Blender noise on stdout", flush=True)
+    print("@@ARES " + json.dumps({"ready": True, "pid": os.getpid()}), flush=True)
+    for line in sys.stdin:
+        msg = json.loads(line)
+        if msg.get("op") == "quit":
+            break
+        ok = not msg["payload"]["spec"]["target"].endswith("ko.blend")
+        out = {"id": msg["id"], "ok": ok, "result": str(os.getpid()), "rss": 1}
+        print("@@ARES " + json.dumps(out), flush=True)
+''')
+
+
+def test_pool_reuses_and_recycles_workers(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER, encoding="utf-8")
+    q = JobQueue(tmp_path / "q.sqlite", backoff_base=0)
+    ids = [q.submit(JobSpec(f"a{i}.blend", f"a{i}.mp4", preset="FAST")) for i in range(5)]
+    ko = q.submit(JobSpec("ko.blend", "ko.mp4", preset="FAST"), max_attempts=1)
+
+    pool = WorkerPool(1, max_jobs=2, log_dir=tmp_path / "logs", cmd=[sys.executable, str(script)])
+    try:
+        Scheduler(q, max_workers=1, launcher=pool.launcher, poll=0.01).run()
+    finally:
+        pool.close()
+
+    assert all(q.get(i).state == DONE for i in ids)
+    assert q.get(ko).state == FAILED
+    # 6 jobs, recyclage tous les 2 jobs -> 3 workers successifs
+    assert pool.spawned == 3
+    assert "Blender noise" in (tmp_path / "logs" / "worker_001.log").read_text(encoding="utf-8")
+
+
+def test_pool_never_exceeds_size(tmp_path):
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER, encoding="utf-8")
+    q = JobQueue(tmp_path / "q.sqlite")
+    for i in range(2):
+        q.submit(JobSpec(f"a{i}.blend", f"a{i}.mp4", preset="FAST"))
+    pool = WorkerPool(1, log_dir=tmp_path / "logs", cmd=[sys.executable, str(script)])
+    try:
+        first = pool.launcher(q.claim(), tmp_path / "a.log")
+        with pytest.raises(LauncherBusy):
+            pool.launcher(q.claim(), tmp_path / "b.log")
+        while first.poll() is None:
+            time.sleep(0.01)
+        assert first.returncode == 0 and len(pool.idle) == 1 and not pool.busy
+    finally:
+        pool.close()
+    assert pool.spawned == 1
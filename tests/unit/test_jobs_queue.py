@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+from ares.jobs import DONE, FAILED, QUEUED, JobQueue, JobSpec, LauncherBusy, Scheduler
+
+
+class Clock:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+def _spec(name, preset="FAST"):
+    return JobSpec(target=f"{name}.blend", output=f"{name}.mp4", preset=preset)
+
+
+def test_priority_order_and_dedupe(tmp_path):
+    q = JobQueue(tmp_path / "q.sqlite", clock=Clock())
+    low = q.submit(_spec("a"), priority=0)
+    high = q.submit(_spec("b"), priority=5)
+    # doublon (chemins/preset normalisés) : fusionné, priorité relevée
+    assert q.submit(JobSpec("a.blend", "a.mp4", preset="fast"), priority=9) == low
+    assert q.counts()[QUEUED] == 2
+
+    assert q.claim().id == low
+    assert q.claim().id == high
+    assert q.claim() is None
+
+
+def test_retry_backoff_then_failed(tmp_path):
+    clock = Clock()
+    q = JobQueue(tmp_path / "q.sqlite", backoff_base=10, clock=clock)
+    job_id = q.submit(_spec("a"), max_attempts=2)
+
+    q.claim()
+    assert q.fail(job_id, "boom") == QUEUED
+    assert q.claim() is None            # backoff en cours
+    clock.t += 10
+    assert q.claim().attempts == 2
+    assert q.fail(job_id, "boom") == FAILED
+    assert q.get(job_id).error == "boom"
+
+
+def test_scheduler_caps_concurrency_and_retries(tmp_path):
+    q = JobQueue(tmp_path / "q.sqlite", backoff_base=0)
+    ok = q.submit(_spec("ok"))
+    ko = q.submit(_spec("ko"), max_attempts=2)
+    peak = []
+
+    def launcher(job, log_path):
+        code = 1 if job.spec.target.endswith("ko.blend") else 0
+        peak.append(len(sched.running) + 1)
+        return subprocess.Popen([sys.executable, "-c", f"raise SystemExit({code})"])
+
+    sched = Scheduler(q, max_workers=1, launcher=launcher, poll=0.01)
+    counts = sched.run()
+    assert max(peak) == 1
+    assert q.get(ok).state == DONE
+    assert q.get(ko).state == FAILED and q.get(ko).attempts == 2
+    assert counts[DONE] == 1 and counts[FAILED] == 1
+
+
+def test_busy_launcher_requeues_without_attempt(tmp_path):
+    q = JobQueue(tmp_path / "q.sqlite")
+    first = q.submit(_spec("a"), priority=1)
+    second = q.submit(_spec("b"))
+    calls = []
+
+    def launcher(job, log_path):
+        calls.append(job.id)
+        raise LauncherBusy("pool plein")
+
+    sched = Scheduler(q, max_workers=2, launcher=launcher, poll=0.01)
+    assert sched.step()
+    assert calls == [first]             # plus de claim tant que le lanceur est plein
+    assert q.get(first).state == QUEUED and q.get(first).attempts == 0
+    assert q.get(second).attempts == 0
@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from ares.modules.turntable.orbit import look_at, matrix_to_euler_xyz, orbit_poses
+
+
+def test_circle_first_pose_matches_blender_convention():
+    poses = orbit_poses("circle", 8, 5.0, height=0.0)
+    p0 = poses[0]
+    assert p0.location == pytest.approx((5.0, 0.0, 0.0))
+    # caméra sur +X qui vise l'origine : (90°, 0, 90°) dans Blender
+    assert p0.rotation_euler == pytest.approx((math.pi / 2, 0.0, math.pi / 2), abs=1e-9)
+    assert p0.matrix[0][3] == 5.0 and p0.matrix[3] == (0.0, 0.0, 0.0, 1.0)
+
+
+def test_circle_is_seamless_and_continuous():
+    poses = orbit_poses("circle", 24, 3.0, height=1.0, target=(0, 0, 0.5))
+    assert len(poses) == 24
+    assert poses[-1].location != pytest.approx(poses[0].location)
+    zs = [p.rotation_euler[2] for p in poses]
+    # pas de saut de 2π : l'angle Z croît de façon monotone
+    assert all(b - a == pytest.approx(2 * math.pi / 24) for a, b in zip(zs, zs[1:], strict=False))
+
+
+def test_helix_and_multi_elevation():
+    helix = orbit_poses("helix", 10, 2.0, 0.0, 3.0, turns=2)
+    assert helix[0].location[2] == pytest.approx(0.0)
+    assert helix[-1].location[2] == pytest.approx(3.0)
+
+    rings = orbit_poses("multi_elevation", 6, 4.0, elevations_deg=(0, 45))
+    assert len(rings) == 12
+    for p in rings:
+        assert math.dist(p.location, (0, 0, 0)) == pytest.approx(4.0)
+
+
+def test_look_at_is_orthonormal():
+    m = look_at((1.0, -2.0, 3.0), (0.0, 0.0, 0.0))
+    for i in range(3):
+        for j in range(3):
+            dot = sum(m[k][i] * m[k][j] for k in range(3))
+            assert dot == pytest.approx(1.0 if i == j else 0.0, abs=1e-12)
+    # aller-retour euler cohérent
+    a, b, c = matrix_to_euler_xyz(m)
+    assert all(math.isfinite(v) for v in (a, b, c))
+
+
+def test_unknown_orbit():
+    with pytest.raises(ValueError):
+        orbit_poses("spiral", 4, 1.0)
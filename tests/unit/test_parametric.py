@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from ares.modules.gen import parametric as pm
+
+
+def _check(arrays: pm.MeshArrays):
+    assert arrays.verts.dtype == np.float32 and arrays.verts.shape[1] == 3
+    assert arrays.loop_verts.dtype == np.int32
+    assert int(arrays.loop_totals.sum()) == len(arrays.loop_verts) == len(arrays.uvs)
+    assert arrays.loop_verts.min() >= 0 and arrays.loop_verts.max() < len(arrays.verts)
+    # chaque sommet est utilisé
+    assert len(np.unique(arrays.loop_verts)) == len(arrays.verts)
+
+
+@pytest.mark.parametrize(
+    "name,kw",
+    [
+        ("uv_sphere", {"segments": 16, "rings": 8}),
+        ("ico_sphere", {"subdivisions": 2}),
+        ("cylinder", {"segments": 12, "rings": 3}),
+    ],
+)
+def test_closed_primitives_face_outward(name, kw):
+    arrays = pm.PRIMITIVES[name](**kw)
+    _check(arrays)
+    dots = np.einsum("ij,ij->i", arrays.polygon_normals(), arrays.polygon_centers())
+    assert (dots > 0).all()
+
+
+def test_counts_match_blender_primitives():
+    s = pm.uv_sphere(segments=32, rings=16)
+    assert len(s.verts) == 32 * 15 + 2 and len(s.loop_totals) == 32 * 16
+    ico = pm.ico_sphere(subdivisions=2)
+    assert len(ico.verts) == 162 and len(ico.loop_totals) == 320
+    assert np.allclose(np.linalg.norm(ico.verts, axis=1), 1.0, atol=1e-6)
+
+
+def test_grid_and_torus():
+    g = pm.grid(4, 3, size_x=2.0)
+    _check(g)
+    assert len(g.verts) == 5 * 4 and len(g.loop_totals) == 12
+    assert (g.polygon_normals()[:, 2] > 0).all()
+    assert g.uvs.min() == 0.0 and g.uvs.max() == 1.0
+
+    t = pm.torus(1.0, 0.25, 24, 8)
+    _check(t)
+    c = t.polygon_centers()
+    ring = c.copy()
+    ring[:, 2] = 0.0
+    ring *= (1.0 / np.linalg.norm(ring, axis=1))[:, None]
+    dots = np.einsum("ij,ij->i", t.polygon_normals(), c - ring)
+    assert (dots > 0).all()
+
+
+def test_faces_to_loops():
+    loops, totals = pm.faces_to_loops([(0, 1, 2, 3), (3, 2, 4)])
+    assert loops.tolist() == [0, 1, 2, 3, 3, 2, 4]
+    assert totals.tolist() == [4, 3]
@@ -0,0 +1,55 @@
+import pytest
+
+from ares.core import progressive as pg
+from ares.jobs.spec import DEFAULT_PRESETS
+
+
+def test_publish_only_upgrades_current_request(tmp_path):
+    out = tmp_path / "dog.mp4"
+    token = pg.start(out)
+
+    def rendered(tier):
+        p = tmp_path / f"{tier}.mp4"
+        p.write_text(tier)
+        return p
+
+    assert pg.publish(out, token, "FAST", rendered("FAST"))
+    assert pg.publish(out, token, "FULL", rendered("FULL"))
+    # un NORMAL tardif n'écrase pas FULL
+    late = rendered("NORMAL")
+    assert not pg.publish(out, token, "NORMAL", late)
+    assert out.read_text() == "FULL" and late.exists()
+    assert pg.read_state(pg.state_path(out))["tier"] == "FULL"
+
+
+def test_new_request_or_cancel_blocks_old_tiers(tmp_path):
+    out = tmp_path / "dog.mp4"
+    old = pg.start(out)
+    new = pg.start(out)
+    assert not pg.is_current(out, old) and pg.is_current(out, new)
+    p = tmp_path / "n.mp4"
+    p.write_text("x")
+    assert not pg.publish(out, old, "NORMAL", p) and not out.exists()
+    pg.cancel(out)
+    assert not pg.publish(out, new, "NORMAL", p)
+
+
+def test_publish_waits_for_lock_held_by_cancel(tmp_path):
+    out = tmp_path / "dog.mp4"
+    token = pg.start(out)
+    p = tmp_path / "f.mp4"
+    p.write_text("x")
+    with pg.locked(pg.state_path(out)):
+        with pytest.raises(TimeoutError), pg.locked(pg.state_path(out), timeout=0.05):
+            pass
+        pg.write_state(pg.state_path(out), {"token": pg.CANCELLED, "tier": None})
+    assert not pg.publish(out, token, "FAST", p) and not out.exists()
+    assert not (tmp_path / "dog.mp4.progressive.json.lock").exists()
+
+
+def test_plan_orders_tiers():
+    steps = pg.plan(DEFAULT_PRESETS, ("FULL", "FAST", "NORMAL"))
+    assert [s["tier"] for s in steps] == ["FAST", "NORMAL", "FULL"]
+    assert steps[0]["samples"] < steps[-1]["samples"]
+    with pytest.raises(KeyError):
+        pg.plan({"FAST": {}}, ("FAST", "FULL"))
@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+import pytest
+
+from ares.core.quality import (
+    QualityTarget,
+    Trial,
+    TuningCache,
+    pick,
+    psnr,
+    representative_frames,
+    ssim,
+)
+
+
+def _image(seed=0, size=64):
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:size, 0:size] / size
+    base = 0.5 + 0.4 * np.sin(6 * x) * np.cos(4 * y)
+    return np.dstack([base, base * 0.8, base * 0.6]) + rng.normal(0, 0.01, (size, size, 3))
+
+
+def test_identical_images():
+    img = _image()
+    assert ssim(img, img) == pytest.approx(1.0)
+    assert psnr(img, img) == math.inf
+
+
+def test_more_noise_scores_lower():
+    ref = _image()
+    rng = np.random.default_rng(1)
+    low = ref + rng.normal(0, 0.02, ref.shape)
+    high = ref + rng.normal(0, 0.1, ref.shape)
+    assert ssim(low, ref) > ssim(high, ref)
+    assert psnr(low, ref) > psnr(high, ref)
+    with pytest.raises(ValueError):
+        ssim(ref, ref[:32])
+
+
+TRIALS = [
+    Trial(8, False, 0.5, ssim=0.90),
+    Trial(8, True, 0.7, ssim=0.985),
+    Trial(32, False, 1.5, ssim=0.97),
+    Trial(64, False, 3.0, ssim=0.99),
+]
+
+
+def test_pick_quality_target_is_fastest_passing():
+    assert pick(TRIALS, QualityTarget(min_ssim=0.98)) == TRIALS[1]
+    # rien ne passe : meilleure qualité
+    assert pick(TRIALS, QualityTarget(min_ssim=0.999)) == TRIALS[3]
+
+
+def test_pick_time_budget_is_best_within_budget():
+    budget = QualityTarget(min_ssim=None, max_frame_seconds=2.0)
+    assert not budget.needs_reference
+    assert pick(TRIALS, budget) == TRIALS[1]
+    assert pick(TRIALS, QualityTarget(min_ssim=None, max_frame_seconds=0.1)) == TRIALS[0]
+    with pytest.raises(ValueError):
+        pick([], budget)
+
+
+def test_representative_frames():
+    assert representative_frames(1, 100, 3) == [1, 50, 100]
+    assert representative_frames(1, 2, 5) == [1, 2]
+    assert representative_frames(10, 10) == [10]
+
+
+def test_tuning_cache_roundtrip(tmp_path):
+    cache = TuningCache(tmp_path / "tuning.json")
+    assert cache.get("k") is None
+    cache.put("k", TRIALS[1])
+    assert TuningCache(tmp_path / "tuning.json").get("k") == TRIALS[1]
@@ -0,0 +1,56 @@
+import sys
+
+import pytest
+
+from ares.core.ffmpeg import RawVideoEncoder, rawvideo_cmd
+
+# faux encodeur : lit stdin (lentement si demandé) et écrit ce qu'il a reçu
+CONSUMER = r'''
+import sys, time
+out, delay = sys.argv[1], float(sys.argv[2])
+time.sleep(delay)
+data = sys.stdin.buffer.read()
+open(out, "wb").write(data)
+'''
+
+
+def _consumer(tmp_path, delay=0.0):
+    return [sys.executable, "-c", CONSUMER, str(tmp_path / "out.raw"), str(delay)]
+
+
+def test_frames_arrive_in_order(tmp_path):
+    size = 4 * 2 * 4
+    with RawVideoEncoder(_consumer(tmp_path), size, depth=2) as enc:
+        for i in range(10):
+            enc.write(bytes([i]) * size)
+    data = (tmp_path / "out.raw").read_bytes()
+    assert len(data) == 10 * size and enc.frames == 10
+    assert [data[i * size] for i in range(10)] == list(range(10))
+
+
+def test_bounded_queue_applies_backpressure(tmp_path):
+    size = 1 << 20  # > tampon du pipe : l'écriture bloque tant que le lecteur dort
+    with RawVideoEncoder(_consumer(tmp_path, delay=0.5), size, depth=1) as enc:
+        for _ in range(3):
+            enc.write(bytes(size))
+    assert enc.wait_seconds > 0.2
+    assert (tmp_path / "out.raw").stat().st_size == 3 * size
+
+
+def test_encoder_failure_is_raised(tmp_path):
+    enc = RawVideoEncoder([sys.executable, "-c", "import sys; sys.exit(3)"], 16)
+    with pytest.raises(RuntimeError):
+        for _ in range(100):
+            enc.write(bytes(16))
+        enc.close()
+
+
+def test_wrong_frame_size_rejected(tmp_path):
+    with RawVideoEncoder(_consumer(tmp_path), 16) as enc, pytest.raises(ValueError):
+        enc.submit(bytearray(8))
+
+
+def test_rawvideo_cmd():
+    cmd = rawvideo_cmd("out.mp4", 320, 180, 24, flip=True, exe="ffmpeg")
+    assert cmd[cmd.index("-s") + 1] == "320x180" and cmd[cmd.index("-i") + 1] == "-"
+    assert cmd[cmd.index("-vf") + 1].startswith("vflip,")
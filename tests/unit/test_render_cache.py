@@ -0,0 +1,49 @@
+import os
+
+from ares.core.cache import RenderCache, detach
+
+
+def _blob(path, size):
+    path.write_bytes(os.urandom(size))
+    return path
+
+
+def test_hit_miss_and_hardlink(tmp_path):
+    cache = RenderCache(tmp_path / "cache", quota_bytes=10_000)
+    src = _blob(tmp_path / "a.mp4", 100)
+    out = tmp_path / "out" / "a.mp4"
+
+    assert not cache.get("k1", out)
+    cache.put("k1", src)
+    assert cache.get("k1", out)
+    assert out.read_bytes() == src.read_bytes()
+
+    # une sortie hard-linkée est détachée avant tout nouveau rendu
+    detach(out)
+    assert not out.exists()
+    assert cache.get("k1", out)
+
+    st = cache.stats()
+    assert (st.hits, st.misses, st.entries, st.bytes) == (2, 1, 1, 100)
+    assert not list((tmp_path / "cache").rglob(".tmp_*"))
+
+
+def test_lru_eviction_respects_quota(tmp_path):
+    cache = RenderCache(tmp_path / "cache", quota_bytes=250)
+    for key in ("a", "b"):
+        cache.put(key, _blob(tmp_path / f"{key}.mp4", 100))
+    assert cache.get("a", tmp_path / "touch.mp4")   # "a" devient le plus récent
+    cache.put("c", _blob(tmp_path / "c.mp4", 100))
+
+    assert not cache.get("b", tmp_path / "b_out.mp4")
+    assert cache.get("a", tmp_path / "a_out.mp4")
+    st = cache.stats()
+    assert st.evictions == 1 and st.bytes == 200
+
+
+def test_corrupted_object_is_a_miss(tmp_path):
+    cache = RenderCache(tmp_path / "cache")
+    obj = cache.put("k", _blob(tmp_path / "k.mp4", 64))
+    obj.write_bytes(b"short")
+    assert not cache.get("k", tmp_path / "k_out.mp4")
+    assert cache.stats().entries == 0
@@ -0,0 +1,43 @@
+import pytest
+
+from ares.core.render_progress import Progress, completed, format_duration, scan
+
+
+def _frames(tmp_path, n, written):
+    paths = [tmp_path / f"frame_{i:04d}.png" for i in range(1, n + 1)]
+    for p in paths[:written]:
+        p.write_bytes(b"png")
+    return paths
+
+
+def test_running_ignores_frame_being_written(tmp_path):
+    paths = _frames(tmp_path, 10, 4)
+    assert completed(paths, running=True) == paths[:3]
+    assert completed(paths, running=False) == paths[:4]
+
+
+def test_empty_file_is_not_done(tmp_path):
+    paths = _frames(tmp_path, 3, 1)
+    paths[1].touch()
+    assert completed(paths, running=False) == paths[:1]
+
+
+def test_scan_eta_and_preview(tmp_path):
+    paths = _frames(tmp_path, 10, 5)
+    p = scan(paths, elapsed=20.0, running=False)
+    assert (p.done, p.total, p.last_frame) == (5, 10, paths[4])
+    assert p.eta == pytest.approx(20.0)
+    assert p.describe() == "5/10 frames (50%) • ETA 20s"
+
+
+def test_no_eta_before_first_frame(tmp_path):
+    p = scan(_frames(tmp_path, 4, 1), elapsed=3.0, running=True)
+    assert p.done == 0 and p.eta is None and p.last_frame is None
+    assert "ETA --" in p.describe()
+
+
+def test_format_duration():
+    assert format_duration(9.4) == "9s"
+    assert format_duration(80) == "1m20s"
+    assert format_duration(3 * 3600 + 125) == "3h02m"
+    assert Progress(total=0, done=0, elapsed=0).fraction == 1.0
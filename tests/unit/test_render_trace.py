@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from ares.core.render_trace import FrameTimeline, enabled, format_summary, write_report
+
+
+def _render(tl, frames, t=0.0):
+    """Séquence d'évènements d'un rendu d'animation : 1s eval, 3s render, 0.5s write."""
+    tl.begin_pass(t)
+    for f in frames:
+        tl.event("render_pre", f, t)
+        tl.event("frame_change_pre", f, t)
+        tl.event("frame_change_post", f, t + 1.0)
+        tl.event("render_post", f, t + 4.0)
+        tl.event("render_write", f, t + 4.5)
+        t += 5.0
+    tl.end_pass()
+    return t
+
+
+def test_phases_split_per_frame():
+    tl = FrameTimeline("tt", clock=lambda: 100.0)
+    _render(tl, [1, 2, 3])
+    recs = tl.records()
+    assert [r["frame"] for r in recs] == [1, 2, 3]
+    assert recs[0]["phases"] == {"eval": 1.0, "render": 3.0, "write": 0.5, "other": 0.0}
+    # le trou entre deux frames va dans `other` de la frame suivante
+    assert recs[1]["phases"]["other"] == pytest.approx(0.5)
+    assert recs[1]["wall"] == pytest.approx(5.0)
+
+
+def test_events_outside_render_are_ignored():
+    tl = FrameTimeline()
+    assert tl.event("frame_change_pre", 1, 0.0) is None
+    end = _render(tl, [1])
+    assert tl.event("frame_change_post", 1, end + 10) is None
+    assert len(tl.records()) == 1
+
+
+def test_summary_and_report(tmp_path):
+    tl = FrameTimeline("tt", clock=lambda: 20.0)
+    tl.started = 0.0
+    _render(tl, [1, 2])
+    for rec, size in zip(tl.frames.values(), (100, 300), strict=True):
+        rec["bytes"], rec["peak_rss_mb"] = size, 512.0
+    tl.add_phase("encode", 2.0)
+    s = tl.summary()
+    assert s["frames"] == 2 and s["total"] == 20.0
+    assert s["mean"]["render"] == pytest.approx(3.0)
+    assert s["slowest"]["frame"] == 2 and s["frame_bytes"] == 400
+    assert s["extra"] == {"encode": 2.0} and s["peak_rss_mb"] == 512.0
+    assert "encode 2.0s" in format_summary(s)
+
+    lines = write_report(tl, tmp_path).read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["frame"] == 1
+    assert json.loads(lines[-1])["summary"]["frames"] == 2
+
+
+def test_enabled_from_env(monkeypatch):
+    monkeypatch.delenv("ARES_TRACE", raising=False)
+    assert not enabled()
+    monkeypatch.setenv("ARES_TRACE", "1")
+    assert enabled()
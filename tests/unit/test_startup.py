@@ -0,0 +1,39 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from ares.core.paths import ROOT
+
+PROBE = r'''
+import json, pathlib, sys, time
+made = []
+pathlib.Path.mkdir = lambda self, *a, **k: made.append(str(self))
+t0 = time.perf_counter()
+import ares
+import ares.core.paths
+ms = (time.perf_counter() - t0) * 1000
+print(json.dumps({"ms": ms, "made": made, "modules": sorted(sys.modules)}))
+'''
+
+
+def test_import_is_light_and_side_effect_free():
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    res = json.loads(out.strip().splitlines()[-1])
+    assert res["made"] == []
+    heavy = [m for m in res["modules"] if m.split(".")[0] in ("bpy", "numpy", "yaml")]
+    assert heavy == []
+    lazy = ("ares.ui", "ares.modules.", "ares.blender")
+    assert not any(m.startswith(lazy) for m in res["modules"])
+    assert res["ms"] < 150  # budget (tools/bench_startup.py)
+
+
+def test_module_table_and_lazy_attributes():
+    import ares
+
+    assert all(name.startswith("ares.ui.") for name in ares.MODULES)
+    with pytest.raises(AttributeError):
+        ares.not_an_attribute  # noqa: B018
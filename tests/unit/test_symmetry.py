@@ -0,0 +1,44 @@
+import math
+
+import numpy as np
+
+from ares.core.symmetry import frame_sources, is_invariant, rotation_order, usable_order
+
+
+def _ring(n, radius=1.0, z=0.0, phase=0.0):
+    a = phase + np.arange(n) * 2 * math.pi / n
+    return np.column_stack((radius * np.cos(a), radius * np.sin(a), np.full(n, z)))
+
+
+def _cube():
+    return np.array([[x, y, z] for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)], float)
+
+
+def test_rotation_order():
+    assert rotation_order(_cube()) == 4
+    assert rotation_order(_ring(6)) == 6
+    assert rotation_order(_ring(5, z=1.0) + [2.0, -1.0, 0.0], center=(2.0, -1.0)) == 5
+    assert rotation_order(_cube() + [0.3, 0.0, 0.0]) == 1  # axe décentré
+
+
+def test_labels_break_symmetry():
+    pts = _ring(4)
+    assert rotation_order(pts, np.array([1, 1, 1, 1])) == 4
+    assert rotation_order(pts, np.array([1, 2, 1, 2])) == 2
+    # lumière fixe hors axe : repère étiqueté à part
+    with_light = np.vstack((_cube(), [[3.0, 1.0, 2.0]]))
+    assert rotation_order(with_light, np.array([0] * 8 + [9])) == 1
+
+
+def test_tolerance():
+    noisy = _ring(8) + np.random.default_rng(0).normal(scale=1e-6, size=(8, 3))
+    assert rotation_order(noisy) == 8
+    assert not is_invariant(_ring(8), np.zeros(8, int), math.radians(45.5))
+
+
+def test_frame_sources():
+    assert usable_order(4, 200) == 4 and usable_order(4, 199) == 1 and usable_order(6, 100) == 2
+    src = frame_sources(1, 200, 200, 4)
+    assert min(src) == 51 and len(src) == 150
+    assert src[51] == 1 and src[100] == 50 and src[200] == 50
+    assert frame_sources(1, 199, 199, 4) == {}
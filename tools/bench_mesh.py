@@ -0,0 +1,95 @@
+"""
+Blade v13 — bench build_mesh vs from_pydata vs bmesh
+Usage : blender -b --factory-startup -P tools/bench_mesh.py -- [10000 100000 1000000]
+Même grille (quads) construite par les trois voies ; temps médian sur 3 essais.
+Résultat aussi écrit dans reports/bench_mesh.json.
+"""
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+import bmesh
+import bpy
+
+BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BASE not in sys.path:
+    sys.path.insert(0, BASE)
+
+# après l'ajout de BASE à sys.path : tools/ lancé par blender -P, hors package
+from ares.helpers.mesh import mesh_from_arrays  # noqa: E402
+from ares.modules.gen import parametric  # noqa: E402
+
+REPEAT = 3
+
+
+def _sizes():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    return [int(a) for a in argv] or [10_000, 100_000, 1_000_000]
+
+
+def _clear():
+    for me in list(bpy.data.meshes):
+        bpy.data.meshes.remove(me)
+
+
+def _time(fn):
+    runs = []
+    for _ in range(REPEAT):
+        _clear()
+        t0 = time.perf_counter()
+        fn()
+        runs.append(time.perf_counter() - t0)
+    return statistics.median(runs)
+
+
+def bench(n_verts):
+    seg = max(1, int(math.sqrt(n_verts)) - 1)
+    arrays = parametric.grid(seg, seg)  # générée hors chrono, partagée par les builders
+
+    def numpy_builder():
+        mesh_from_arrays("bench_np", arrays)
+
+    def from_pydata():
+        # même coût de préparation que le code historique : tuples Python
+        verts = [tuple(v) for v in arrays.verts.tolist()]
+        faces = [tuple(f) for f in arrays.loop_verts.reshape(-1, 4).tolist()]
+        me = bpy.data.meshes.new("bench_py")
+        me.from_pydata(verts, [], faces)
+        me.update()
+
+    def with_bmesh():
+        me = bpy.data.meshes.new("bench_bm")
+        bm = bmesh.new()
+        bmesh.ops.create_grid(bm, x_segments=seg, y_segments=seg, size=1.0)
+        bm.to_mesh(me)
+        bm.free()
+        me.update()
+
+    row = {"verts": len(arrays.verts), "polys": len(arrays.loop_totals)}
+    for label, fn in (("build_mesh", numpy_builder), ("from_pydata", from_pydata),
+                      ("bmesh", with_bmesh)):
+        row[label] = _time(fn)
+    row["speedup_vs_from_pydata"] = row["from_pydata"] / row["build_mesh"]
+    row["speedup_vs_bmesh"] = row["bmesh"] / row["build_mesh"]
+    return row
+
+
+def main():
+    rows = [bench(n) for n in _sizes()]
+    print(f"{'verts':>9} {'build_mesh':>11} {'from_pydata':>12} {'bmesh':>9}  x_pydata  x_bmesh")
+    for r in rows:
+        print(f"{r['verts']:>9} {r['build_mesh']:>10.3f}s {r['from_pydata']:>11.3f}s "
+              f"{r['bmesh']:>8.3f}s  {r['speedup_vs_from_pydata']:>7.1f}x "
+              f"{r['speedup_vs_bmesh']:>7.1f}x")
+    out = os.path.join(BASE, "reports", "bench_mesh.json")
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump({"blender": bpy.app.version_string, "rows": rows}, f, indent=2)
+    print("[BENCH] Wrote:", out)
+    _clear()
+
+
+main()
@@ -0,0 +1,75 @@
+"""
+Blade v13 — bench démarrage de l'add-on
+Usage : blender -b --factory-startup -P tools/bench_startup.py -- [--import-ms 150]
+                [--register-ms 300]
+        python tools/bench_startup.py   (sans Blender : import seul)
+Mesure `import ares` (process neuf) puis register()/unregister() ; liste les
+modules lourds tirés par l'import. Résultat dans reports/bench_startup.json ;
+code de sortie 1 si un budget est dépassé (budgets aussi via ARES_BUDGET_IMPORT_MS
+/ ARES_BUDGET_REGISTER_MS).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BASE not in sys.path:
+    sys.path.insert(0, BASE)
+
+HEAVY = ("numpy", "yaml", "sqlite3", "ares.blender", "ares.modules", "ares.helpers")
+
+
+def _args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    ap = argparse.ArgumentParser(prog="bench_startup")
+    ap.add_argument("--import-ms", type=float,
+                    default=float(os.environ.get("ARES_BUDGET_IMPORT_MS", 150)))
+    ap.add_argument("--register-ms", type=float,
+                    default=float(os.environ.get("ARES_BUDGET_REGISTER_MS", 300)))
+    ap.add_argument("--out", default=os.path.join(BASE, "reports", "bench_startup.json"))
+    return ap.parse_args(argv)
+
+
+def main() -> int:
+    args = _args()
+    before = set(sys.modules)
+    t0 = time.perf_counter()
+    import ares
+    import_ms = (time.perf_counter() - t0) * 1000
+    pulled = sorted(
+        m for m in set(sys.modules) - before
+        if any(m == h or m.startswith(h + ".") for h in HEAVY)
+    )
+
+    report = {"import_ms": round(import_ms, 2), "heavy_imports": pulled,
+              "budget": {"import_ms": args.import_ms, "register_ms": args.register_ms}}
+    try:
+        import bpy
+    except ImportError:
+        bpy = None
+    if bpy is not None:
+        t0 = time.perf_counter()
+        ares.register()
+        report["register_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        t0 = time.perf_counter()
+        ares.unregister()
+        report["unregister_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        report["blender"] = bpy.app.version_string
+
+    over = [k for k in ("import_ms", "register_ms") if report.get(k, 0) > getattr(args, k)]
+    report["over_budget"] = over
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps(report, indent=2))
+    if over:
+        print(f"[ARES] bench_startup: budget dépassé ({', '.join(over)})")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    code = main()
+    if code:
+        sys.exit(code)
@@ -0,0 +1,230 @@
+"""
+Blade v13 — suite de benchmarks reproductible
+Usage : python tools/bench_suite.py [--repeat 5] [--only grid_1k,dog_turntable]
+                [--save-baseline] [--alpha 0.05] [--threshold 0.05]
+        python tools/bench_suite.py --compare baseline.json run.json
+Hors Blender, le script se relance dans `blender -b --factory-startup` (BLENDER_EXE
+ou PATH). Workloads : démarrage de l'add-on (import, register), grilles de
+primitives 1k/10k/100k objets, turntable du chien low-poly, export GLB,
+application du preset de sortie. Cycles CPU, seeds fixes, scène d'usine
+remise à zéro avant chaque essai (hors chrono).
+Résultats : reports/bench/run_<date>.json (empreinte d'environnement comprise),
+comparés à reports/bench/baseline.json ; code de sortie 1 si une régression
+significative est détectée (ares.core.bench.compare).
+"""
+import argparse
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BASE not in sys.path:
+    sys.path.insert(0, BASE)
+
+from ares.core.bench import (  # noqa: E402
+    comparable,
+    compare,
+    default_bench_dir,
+    fingerprint,
+    format_table,
+    load_results,
+    save_results,
+    summarize,
+)
+
+SEED = 0
+IMPORT_PROBE = (
+    "import time; t = time.perf_counter(); import ares; print(time.perf_counter() - t)"
+)
+
+
+def _args():
+    if "--" in sys.argv:
+        argv = sys.argv[sys.argv.index("--") + 1:]
+    else:  # dans Blender sans "--", sys.argv porte les arguments de Blender
+        argv = [] if "bpy" in sys.modules else sys.argv[1:]
+    ap = argparse.ArgumentParser(prog="bench_suite")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--only", default="", help="workloads séparés par des virgules")
+    ap.add_argument("--baseline", default=str(default_bench_dir() / "baseline.json"))
+    ap.add_argument("--save-baseline", action="store_true")
+    ap.add_argument("--alpha", type=float, default=0.05)
+    ap.add_argument("--threshold", type=float, default=0.05)
+    ap.add_argument("--compare", nargs=2, metavar=("BASELINE", "RUN"))
+    return ap.parse_args(argv), argv
+
+
+# --- Workloads (Blender) -------------------------------------------------------
+# setup(tmp) -> ctx hors chrono ; run(ctx) chronométré (ou retourne sa propre mesure)
+
+def _reset():
+    import bpy
+
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    random.seed(SEED)
+    scene = bpy.context.scene
+    scene.render.engine = "CYCLES"
+    scene.cycles.device = "CPU"
+    scene.cycles.seed = SEED
+    scene.cycles.use_animated_seed = False
+    return scene
+
+
+def _dog(tmp):
+    from ares.modules.animals import create_lowpoly_dog
+
+    _reset()
+    return {"dog": create_lowpoly_dog(), "tmp": tmp}
+
+
+def _startup_import(ctx):
+    from ares.core.blender_proc import child_env
+
+    out = subprocess.run([sys.executable, "-c", IMPORT_PROBE], env=child_env(),
+                         capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def _startup_register(ctx):
+    import ares
+
+    ares.register()
+    ares.unregister()
+
+
+def _grid(n):
+    def run(ctx):
+        from ares.modules.gen.primitives import make_cube
+
+        side = math.ceil(math.sqrt(n))
+        for i in range(n):
+            obj = make_cube(f"Grid_{i:06d}", size=0.8)
+            obj.location = (i % side, i // side, 0.0)
+    return run
+
+
+def _dog_turntable(ctx):
+    from ares.blender.render import RenderPreset, render_turntable
+
+    preset = RenderPreset(res_x=320, res_y=180, fps=12, samples=8, engine="CYCLES")
+    render_turntable(ctx["dog"], preset, seconds=2, out_dir=ctx["tmp"])
+
+
+def _glb_export(ctx):
+    from ares.modules.asset_core.api import quick_export_glb
+
+    quick_export_glb(ctx["dog"], ctx["tmp"] / "dog.glb")
+
+
+def _preset_apply(ctx):
+    import bpy
+
+    from ares.modules.render_bg.render_bg import apply_output_preset
+
+    scene = bpy.context.scene
+    for _ in range(20):  # une application seule est sous la milliseconde
+        scene.render.fps = 1
+        apply_output_preset()
+
+
+def _fresh(tmp):
+    _reset()
+    return {"tmp": tmp}
+
+
+WORKLOADS = {
+    "startup_import": (None, _startup_import),
+    "startup_register": (None, _startup_register),
+    "grid_1k": (_fresh, _grid(1_000)),
+    "grid_10k": (_fresh, _grid(10_000)),
+    "grid_100k": (_fresh, _grid(100_000)),
+    "dog_turntable": (_dog, _dog_turntable),
+    "glb_export": (_dog, _glb_export),
+    "preset_apply": (_fresh, _preset_apply),
+}
+
+
+def _measure(name, repeat, tmp):
+    setup, run = WORKLOADS[name]
+    runs = []
+    for _ in range(repeat):
+        ctx = setup(tmp) if setup else None
+        t0 = time.perf_counter()
+        own = run(ctx)
+        runs.append(own if own is not None else time.perf_counter() - t0)
+    return summarize(runs)
+
+
+def run_suite(args) -> int:
+    import bpy
+
+    names = [n for n in args.only.split(",") if n] or list(WORKLOADS)
+    unknown = [n for n in names if n not in WORKLOADS]
+    if unknown:
+        print(f"[BENCH] workloads inconnus : {unknown} (dispo : {', '.join(WORKLOADS)})")
+        return 2
+
+    results = {
+        "fingerprint": fingerprint(blender=bpy.app.version_string, engine="CYCLES",
+                                   device="CPU"),
+        "config": {"repeat": args.repeat, "seed": SEED},
+        "results": {},
+    }
+    tmp = Path(tempfile.mkdtemp(prefix="ares_bench_"))
+    try:
+        for name in names:
+            stats = results["results"][name] = _measure(name, args.repeat, tmp)
+            print(f"[BENCH] {name:<18} median {stats['median']:.4f}s "
+                  f"(± {stats['stdev']:.4f}, n={args.repeat})")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+        _reset()
+
+    out = save_results(results)
+    print("[BENCH] Wrote:", out)
+    if args.save_baseline:
+        baseline = save_results(results, Path(args.baseline).parent, Path(args.baseline).name)
+        print("[BENCH] Baseline:", baseline)
+        return 0
+    if not Path(args.baseline).is_file():
+        print("[BENCH] pas de baseline (--save-baseline pour en créer une)")
+        return 0
+    return _report(load_results(args.baseline), results, args)
+
+
+def _report(baseline, current, args) -> int:
+    diff = comparable(baseline, current)
+    if diff:
+        print(f"[BENCH] attention : environnement différent de la baseline ({', '.join(diff)})")
+    rows = compare(baseline, current, alpha=args.alpha, threshold=args.threshold)
+    print(format_table(rows))
+    regressions = [r["name"] for r in rows if r["status"] == "regression"]
+    if regressions:
+        print(f"[BENCH] régressions : {', '.join(regressions)}")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    args, argv = _args()
+    if args.compare:
+        return _report(load_results(args.compare[0]), load_results(args.compare[1]), args)
+    try:
+        import bpy  # noqa: F401
+    except ImportError:
+        from ares.core.blender_proc import blender_cmd, child_env
+
+        cmd = blender_cmd(script=__file__, script_args=argv, factory_startup=True)
+        return subprocess.run(cmd, env=child_env()).returncode
+    return run_suite(args)
+
+
+if __name__ == "__main__":
+    code = main()
+    if code:
+        sys.exit(code)